@@ -0,0 +1,334 @@
+"""Load test Cirrus against a stand-in Remote Settings server.
+
+Starts the Cirrus app with uvicorn, serves synthetic recipe collections of
+configurable sizes from a local HTTP server, drives the features endpoints at a
+fixed concurrency and writes throughput, latency percentiles and per stage
+timings as JSON so runs can be compared between commits.
+
+Usage: python benchmarks/benchmark.py --recipes 10 100 1000 --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+SERVER_PATH = Path(__file__).parent.parent.absolute()
+DEFAULT_FML_PATH = SERVER_PATH / "feature_manifest" / "sample.yml"
+CHANGESET_PATH = "/v1/buckets/main/collections/nimbus-web-experiments/changeset"
+APP_ID = "benchmark-app"
+APP_NAME = "benchmark_app"
+FEATURE_ID = "example-feature"
+STAGE_METRICS = {
+    "enrollment": "cirrus_enrollment_duration_seconds",
+    "merge": "cirrus_fml_merge_duration_seconds",
+    "ping": "cirrus_ping_duration_seconds",
+}
+
+
+def create_recipe(index: int, channel: str) -> dict[str, Any]:
+    slug = f"benchmark-{index}"
+    return {
+        "slug": slug,
+        "appId": APP_ID,
+        "appName": APP_NAME,
+        "channel": channel,
+        "endDate": None,
+        "locales": None,
+        "branches": [
+            {
+                "slug": branch,
+                "ratio": 1,
+                "features": [
+                    {
+                        "value": {"enabled": True, "something": f"{slug}-{branch}"},
+                        "featureId": FEATURE_ID,
+                    }
+                ],
+            }
+            for branch in ("control", "treatment")
+        ],
+        "outcomes": [],
+        "arguments": {},
+        "isRollout": index % 2 == 0,
+        "probeSets": [],
+        "startDate": "2023-07-05",
+        "targeting": "true",
+        "featureIds": [FEATURE_ID],
+        "application": APP_ID,
+        "bucketConfig": {
+            "count": 100 + (index * 37) % 9900,
+            "start": 0,
+            "total": 10000,
+            "namespace": f"{FEATURE_ID}-{slug}",
+            "randomizationUnit": "user_id",
+        },
+        "localizations": None,
+        "schemaVersion": "1.12.0",
+        "userFacingName": "",
+        "referenceBranch": "control",
+        "proposedDuration": 28,
+        "enrollmentEndDate": None,
+        "isEnrollmentPaused": False,
+        "proposedEnrollment": 7,
+        "userFacingDescription": "",
+        "featureValidationOptOut": False,
+        "id": slug,
+        "last_modified": 1689000336881 + index,
+    }
+
+
+def create_changeset(recipe_count: int, channel: str, timestamp: int) -> bytes:
+    return json.dumps(
+        {
+            "changes": [create_recipe(index, channel) for index in range(recipe_count)],
+            "timestamp": timestamp,
+        }
+    ).encode()
+
+
+def create_remote_settings_server() -> ThreadingHTTPServer:
+    class RemoteSettingsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            changeset: bytes = self.server.changeset  # type: ignore
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(changeset)))
+            self.end_headers()
+            self.wfile.write(changeset)
+
+        def log_message(self, *args: Any):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RemoteSettingsHandler)
+    server.changeset = create_changeset(0, "release", 0)  # type: ignore
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[round(fraction * (len(sorted_values) - 1))]
+
+
+def summarize_latencies(latencies: list[float]) -> dict[str, float]:
+    sorted_latencies = sorted(latencies)
+    return {
+        "mean_ms": statistics.fmean(sorted_latencies) * 1000 if sorted_latencies else 0,
+        "p50_ms": percentile(sorted_latencies, 0.50) * 1000,
+        "p95_ms": percentile(sorted_latencies, 0.95) * 1000,
+        "p99_ms": percentile(sorted_latencies, 0.99) * 1000,
+        "max_ms": sorted_latencies[-1] * 1000 if sorted_latencies else 0,
+    }
+
+
+def histogram_quantile(buckets: dict[str, int], fraction: float) -> float | None:
+    # Upper bound in milliseconds of the bucket holding the requested quantile,
+    # None when it falls above the largest bucket
+    total = buckets.get("+Inf", 0)
+    if not total:
+        return 0.0
+    for bound, cumulative in buckets.items():
+        if cumulative >= fraction * total and bound != "+Inf":
+            return float(bound) * 1000
+    return None
+
+
+def summarize_stages(
+    before: dict[str, Any], after: dict[str, Any]
+) -> dict[str, dict[str, float | None]]:
+    stages: dict[str, dict[str, float | None]] = {}
+    for stage, metric_name in STAGE_METRICS.items():
+        if metric_name not in after:
+            continue
+        start = before.get(metric_name, {"count": 0, "sum": 0, "buckets": {}})
+        end = after[metric_name]
+        count = end["count"] - start["count"]
+        buckets = {
+            bound: cumulative - start["buckets"].get(bound, 0)
+            for bound, cumulative in end["buckets"].items()
+        }
+        stages[stage] = {
+            "count": count,
+            "mean_ms": (end["sum"] - start["sum"]) / count * 1000 if count else 0,
+            "p50_le_ms": histogram_quantile(buckets, 0.50),
+            "p95_le_ms": histogram_quantile(buckets, 0.95),
+            "p99_le_ms": histogram_quantile(buckets, 0.99),
+        }
+    return stages
+
+
+async def drive_endpoint(
+    base_url: str, endpoint: str, concurrency: int, total_requests: int
+) -> dict[str, Any]:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(total_requests))
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal errors
+        for _ in remaining:
+            request_data = {"client_id": str(uuid.uuid4()), "context": {}}
+            start = time.perf_counter()
+            response = await client.post(endpoint, json=request_data)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        before = (await client.get("/__metrics__")).json()
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        after = (await client.get("/__metrics__")).json()
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "duration_s": elapsed,
+        "rps": len(latencies) / elapsed if elapsed else 0,
+        "latency": summarize_latencies(latencies),
+        "stages": summarize_stages(before, after),
+    }
+
+
+def get_git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=SERVER_PATH, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    remote_settings_server = create_remote_settings_server()
+    remote_settings_url = (
+        f"http://127.0.0.1:{remote_settings_server.server_port}"
+        f"{CHANGESET_PATH}?_expected=0"
+    )
+
+    # cirrus.settings reads the environment on import
+    os.environ.update(
+        {
+            "CIRRUS_REMOTE_SETTING_URL": remote_settings_url,
+            "CIRRUS_REMOTE_SETTING_PREVIEW_URL": "",
+            "CIRRUS_REMOTE_SETTING_REFRESH_RATE_IN_SECONDS": "3600",
+            "CIRRUS_APP_ID": APP_ID,
+            "CIRRUS_APP_NAME": APP_NAME,
+            "CIRRUS_CHANNEL": args.channel,
+            "CIRRUS_FML_PATH": str(args.fml_path),
+            "CIRRUS_SENTRY_DSN": "",
+        }
+    )
+    sys.path.insert(0, str(SERVER_PATH))
+    import uvicorn
+
+    from cirrus.main import app
+
+    port = get_free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    scenarios: list[dict[str, Any]] = []
+    try:
+        for timestamp, recipe_count in enumerate(args.recipes, start=1):
+            remote_settings_server.changeset = create_changeset(  # type: ignore
+                recipe_count, args.channel, timestamp
+            )
+            app.state.remote_setting_live.fetch_recipes()
+            app.state.fml.clear_merge_cache()
+
+            for endpoint in args.endpoints:
+                print(
+                    f"Benchmarking {endpoint} with {recipe_count} recipes",
+                    file=sys.stderr,
+                )
+                result = asyncio.run(
+                    drive_endpoint(
+                        f"http://127.0.0.1:{port}",
+                        endpoint,
+                        args.concurrency,
+                        args.requests,
+                    )
+                )
+                scenarios.append(
+                    {
+                        "endpoint": endpoint,
+                        "recipes": recipe_count,
+                        "concurrency": args.concurrency,
+                        **result,
+                    }
+                )
+    finally:
+        server.should_exit = True
+        remote_settings_server.shutdown()
+
+    return {
+        "revision": get_git_revision(),
+        "fml_path": str(args.fml_path),
+        "channel": args.channel,
+        "scenarios": scenarios,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the Cirrus features API")
+    parser.add_argument(
+        "--recipes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Sizes of the synthetic recipe collections",
+    )
+    parser.add_argument(
+        "--endpoints",
+        nargs="+",
+        default=["/v1/features/", "/v2/features/"],
+        help="Endpoints to benchmark",
+    )
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--requests", type=int, default=1000, help="Requests per scenario"
+    )
+    parser.add_argument("--fml-path", type=Path, default=DEFAULT_FML_PATH)
+    parser.add_argument("--channel", default="release")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("cirrus_benchmark.json"),
+        help="File to write the JSON results to",
+    )
+    args = parser.parse_args()
+
+    # Glean pings are logged to stdout, so results always go to a file
+    args.output.write_text(json.dumps(run(args), indent=2))
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from typing import TypeVar
+
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ExecutorMode(StrEnum):
+    INLINE = "inline"
+    THREAD = "thread"
+
+
+class ExecutorSaturatedError(Exception):
+    pass
+
+
+class EnrollmentExecutor:
+    # In thread mode at most max_workers tasks run while max_queue_depth more
+    # wait for a worker, anything beyond that is rejected so that callers can
+    # apply backpressure instead of queueing without bound.
+    def __init__(self, mode: ExecutorMode, max_workers: int, max_queue_depth: int):
+        self.mode = mode
+        self.max_pending = max_workers + max_queue_depth
+        self.pending = 0
+        self.executor: ThreadPoolExecutor | None = None
+        if mode == ExecutorMode.THREAD:
+            self.executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="cirrus-enrollment"
+            )
+        self.pending_gauge = registry.gauge(
+            "cirrus_executor_pending",
+            "Number of enrollment tasks running or waiting for a worker",
+        )
+        self.rejected_counter = registry.counter(
+            "cirrus_executor_rejected_total",
+            "Number of enrollment tasks rejected because the executor was saturated",
+        )
+
+    async def run(self, func: Callable[..., T], *args: object) -> T:
+        if self.executor is None:
+            return func(*args)
+
+        # Only ever touched from the event loop thread, so no lock is needed
+        if self.pending >= self.max_pending:
+            self.rejected_counter.inc()
+            raise ExecutorSaturatedError(
+                f"Enrollment executor is saturated ({self.pending} pending tasks)"
+            )
+
+        self.pending += 1
+        self.pending_gauge.set(self.pending)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self.pending -= 1
+            self.pending_gauge.set(self.pending)
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            logger.info("Shutting down enrollment executor")
+            self.executor.shutdown(wait=True)
@@ -1,12 +1,16 @@
+import hashlib
 import json
 import logging
+from collections.abc import Mapping
 from enum import Enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 from requests import Session
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 
+from .metrics import registry
 from .sdk import SDK
 
 logger = logging.getLogger(__name__)
@@ -18,45 +22,135 @@ class RecipeType(Enum):
     EMPTY = ""
 
 
+class RecipeSnapshot(NamedTuple):
+    generation: int
+    recipes: dict[str, list[Any]]
+    recipe_types: Mapping[str, str]
+    content_hash: str
+
+    @classmethod
+    def create(
+        cls, recipes: dict[str, list[Any]], generation: int, content_hash: str = ""
+    ) -> "RecipeSnapshot":
+        recipe_types = {
+            recipe["slug"]: (
+                RecipeType.ROLLOUT.value
+                if recipe.get("isRollout", False)
+                else RecipeType.EXPERIMENT.value
+            )
+            for recipe in recipes["data"]
+            if "slug" in recipe
+        }
+        return cls(
+            generation=generation,
+            recipes=recipes,
+            recipe_types=MappingProxyType(recipe_types),
+            content_hash=content_hash,
+        )
+
+    def get_recipe_type(self, experiment_slug: str) -> str:
+        return self.recipe_types.get(experiment_slug, RecipeType.EMPTY.value)
+
+
 class RemoteSettings:
-    def __init__(self, url: str, sdk: SDK, retry: Retry | None = None):
-        self.recipes: dict[str, list[Any]] = {"data": []}
+    def __init__(
+        self, url: str, sdk: SDK, retry: Retry | None = None, name: str = "live"
+    ):
+        # Replaced as a whole by update_recipes so readers always see a
+        # consistent set of recipes and their index
+        self.snapshot = RecipeSnapshot.create({"data": []}, generation=0)
         if url.endswith("/records"):
             raise ValueError("cirrus no longer supports remote settings records api")
         self.url: str = url
         self.sdk = sdk
+        self.recipes_count_gauge = registry.gauge(
+            f"cirrus_{name}_recipes_count", f"Number of {name} recipes loaded"
+        )
+        self.recipes_generation_gauge = registry.gauge(
+            f"cirrus_{name}_recipes_generation",
+            f"Number of times the {name} recipes have been replaced",
+        )
+        self.fetch_bytes_counter = registry.counter(
+            f"cirrus_{name}_fetch_bytes_total",
+            f"Number of bytes downloaded when fetching {name} recipes",
+        )
+        self.fetch_unchanged_counter = registry.counter(
+            f"cirrus_{name}_fetch_unchanged_total",
+            f"Number of {name} recipe fetches skipped because nothing changed",
+        )
+        self.parse_duration = registry.histogram(
+            f"cirrus_{name}_parse_duration_seconds",
+            f"Time spent parsing fetched {name} recipes",
+        )
+        self.apply_duration = registry.histogram(
+            f"cirrus_{name}_apply_duration_seconds",
+            f"Time spent applying {name} recipes to the SDK",
+        )
+        # Validators of the last applied response, used to skip unchanged polls
+        self.etag: str | None = None
+        self.timestamp: int | None = None
         self.session = Session()
         if retry is not None:
             adapter = HTTPAdapter(max_retries=retry)
             self.session.mount("http://", adapter)
             self.session.mount("https://", adapter)
 
+    @property
+    def recipes(self) -> dict[str, list[Any]]:
+        return self.snapshot.recipes
+
     def get_recipes(self) -> dict[str, list[Any]]:
-        return self.recipes
+        return self.snapshot.recipes
 
     def get_recipe_type(self, experiment_slug: str) -> str:
-        experiment = {
-            experiment["slug"]: experiment for experiment in self.recipes["data"]
-        }.get(experiment_slug)
-        if experiment is not None:
-            return (
-                RecipeType.ROLLOUT.value
-                if experiment.get("isRollout", False)
-                else RecipeType.EXPERIMENT.value
-            )
-        return RecipeType.EMPTY.value
+        return self.snapshot.get_recipe_type(experiment_slug)
 
-    def update_recipes(self, new_recipes: dict[str, list[Any]]) -> None:
-        self.recipes = new_recipes
-        self.sdk.set_experiments(json.dumps(self.recipes))
+    def update_recipes(self, new_recipes: dict[str, list[Any]]) -> bool:
+        recipes_json = json.dumps(new_recipes)
+        content_hash = hashlib.sha256(recipes_json.encode()).hexdigest()
+        if content_hash == self.snapshot.content_hash:
+            return False
 
-    def fetch_recipes(self) -> None:
-        response = self.session.get(self.url)
+        with self.apply_duration.time():
+            snapshot = RecipeSnapshot.create(
+                new_recipes,
+                generation=self.snapshot.generation + 1,
+                content_hash=content_hash,
+            )
+            self.sdk.set_experiments(recipes_json)
+            self.snapshot = snapshot
+        self.recipes_count_gauge.set(len(snapshot.recipes["data"]))
+        self.recipes_generation_gauge.set(snapshot.generation)
+        return True
+
+    def fetch_recipes(self) -> bool:
+        headers = {"If-None-Match": self.etag} if self.etag else {}
+        response = self.session.get(self.url, headers=headers)
         response.raise_for_status()
-        response_json = response.json()
+        if response.status_code == 304:
+            self.fetch_unchanged_counter.inc()
+            logger.debug("Recipes not modified since the last fetch")
+            return False
+
+        self.fetch_bytes_counter.inc(len(response.content))
+        with self.parse_duration.time():
+            response_json = response.json()
         data = response_json.get("changes")
-        if data is not None:
-            self.update_recipes({"data": data})
-            logger.info(f"Fetched resources: {data}")
-        else:
+        if data is None:
             logger.warning("No recipes found in the response")
+            return False
+
+        updated = False
+        timestamp = response_json.get("timestamp")
+        if timestamp is not None and timestamp == self.timestamp:
+            self.fetch_unchanged_counter.inc()
+            logger.debug(f"Recipes unchanged at timestamp {timestamp}")
+        elif updated := self.update_recipes({"data": data}):
+            logger.info(f"Fetched {len(data)} recipes at timestamp {timestamp}")
+        else:
+            self.fetch_unchanged_counter.inc()
+            logger.debug("Fetched recipes are identical to the current recipes")
+
+        self.etag = response.headers.get("ETag")
+        self.timestamp = timestamp
+        return updated
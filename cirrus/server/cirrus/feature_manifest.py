@@ -1,38 +1,110 @@
 import json
 import logging
-from typing import Any
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple
 
-from fml_sdk import FmlClient, FmlError, MergedJsonWithErrors  # type: ignore
+from fml_sdk import FmlClient, FmlError  # type: ignore
+
+from .metrics import registry
+from .settings import fml_merge_cache_size
 
 logger = logging.getLogger(__name__)
 
 
+class MergedFeatureConfigurations(NamedTuple):
+    features: dict[str, Any]
+    errors: list[FmlError]
+
+
 class FeatureManifestLanguage:
-    def __init__(self, fml_path: str, channel: str):
+    def __init__(
+        self, fml_path: str, channel: str, merge_cache_size: int = fml_merge_cache_size
+    ):
         self.fml_client = FmlClient(fml_path, channel)
-        self.merge_errors: list[FmlError] = []
+        # Within a recipe generation the feature values of a client only depend
+        # on the branches it is enrolled in, so the merges are memoized by the
+        # sorted (slug, branch, featureId) tuples of the enrolled features and
+        # the cache is cleared whenever new recipes are installed. The decoded
+        # features are cached and shared between callers, which must not mutate
+        # the feature values.
+        self.merge_cache: OrderedDict[
+            tuple[tuple[str, str | None, str], ...], MergedFeatureConfigurations
+        ] = OrderedDict()
+        self.merge_cache_size = merge_cache_size
+        self.merge_cache_lock = threading.Lock()
+        self.merge_cache_hits = registry.counter(
+            "cirrus_fml_merge_cache_hits_total",
+            "Number of FML merges served from the cache",
+        )
+        self.merge_cache_misses = registry.counter(
+            "cirrus_fml_merge_cache_misses_total",
+            "Number of FML merges computed because they were not cached",
+        )
+        self.merge_cache_evictions = registry.counter(
+            "cirrus_fml_merge_cache_evictions_total",
+            "Number of FML merges evicted from the cache",
+        )
+
+    def clear_merge_cache(self) -> None:
+        with self.merge_cache_lock:
+            self.merge_cache.clear()
+
+    def merge_feature_configurations(
+        self, enrolled_feature_config_map: dict[str, Any]
+    ) -> MergedFeatureConfigurations:
+        cache_key = tuple(
+            sorted(
+                (config["slug"], config.get("branch"), config["featureId"])
+                for config in enrolled_feature_config_map.values()
+            )
+        )
+        with self.merge_cache_lock:
+            merged = self.merge_cache.get(cache_key)
+            if merged is not None:
+                self.merge_cache.move_to_end(cache_key)
+                self.merge_cache_hits.inc()
+
+        if merged is None:
+            self.merge_cache_misses.inc()
+            merged_res = self.fml_client.merge(
+                {
+                    key: value["feature"]["value"]
+                    for key, value in enrolled_feature_config_map.items()
+                }
+            )
+            merged = MergedFeatureConfigurations(
+                features=json.loads(merged_res.json), errors=list(merged_res.errors)
+            )
+
+            with self.merge_cache_lock:
+                self.merge_cache[cache_key] = merged
+                while len(self.merge_cache) > self.merge_cache_size:
+                    self.merge_cache.popitem(last=False)
+                    self.merge_cache_evictions.inc()
+
+        return MergedFeatureConfigurations(
+            features=dict(merged.features), errors=list(merged.errors)
+        )
 
     def compute_feature_configurations(
         self,
         enrolled_partial_configuration: dict[str, Any],
     ) -> dict[str, Any]:
-        feature_configs = {
-            key: value["feature"]["value"]
-            for key, value in enrolled_partial_configuration[
+        merged = self.merge_feature_configurations(
+            enrolled_partial_configuration[
                 "enrolledFeatureConfigMap"  # slug, featureid, value,
-            ].items()
-        }
-        merged_res: MergedJsonWithErrors = self.fml_client.merge(feature_configs)
-        self.merge_errors = merged_res.errors
+            ]
+        )
 
-        if self.merge_errors:
+        if merged.errors:
             logger.error(
                 "An error occurred during enrolled partial, "
                 "config and FML: "
-                f"{self.merge_errors}"
+                f"{merged.errors}"
             )
 
-        return json.loads(merged_res.json)
+        return merged.features
 
     def get_coenrolling_feature_ids(self) -> list[str]:
         return self.fml_client.get_coenrolling_feature_ids()
@@ -1,7 +1,8 @@
 import logging
 import sys
+from collections.abc import Callable
 from contextlib import asynccontextmanager
-from typing import Any, NamedTuple, TypedDict
+from typing import Any, NamedTuple, TypedDict, TypeVar
 
 import sentry_sdk
 from apscheduler.schedulers.asyncio import AsyncIOScheduler  # type: ignore
@@ -11,6 +12,7 @@ from fml_sdk import FmlError  # type: ignore
 from pydantic import BaseModel
 from urllib3.util import Retry
 
+from .executor import EnrollmentExecutor, ExecutorMode, ExecutorSaturatedError
 from .experiment_recipes import RemoteSettings
 from .feature_manifest import FeatureManifestLanguage
 from .glean.server_events import (
@@ -18,7 +20,9 @@ from .glean.server_events import (
     create_enrollment_status_server_event_logger,
     create_startup_server_event_logger,
 )
-from .sdk import SDK, CirrusMetricsHandler, EnrollmentResponse
+from .metrics import registry
+from .ping_emitter import PingEmitter, QueueFullPolicy
+from .sdk import SDK, CirrusMetricsHandler, EnrollmentRequest, EnrollmentResponse
 from .settings import (
     app_id,
     channel,
@@ -27,7 +31,15 @@ from .settings import (
     cirrus_sentry_traces_sample_rate,
     context,
     env_name,
+    executor_max_queue_depth,
+    executor_max_workers,
+    executor_mode,
+    features_batch_max_size,
     fml_path,
+    glean_flush_interval_in_seconds,
+    glean_max_events_buffer,
+    glean_max_queue_size,
+    glean_queue_full_policy,
     instance_name,
     remote_setting_preview_url,
     remote_setting_refresh_jitter_in_seconds,
@@ -40,6 +52,21 @@ from .settings import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+enrollment_duration = registry.histogram(
+    "cirrus_enrollment_duration_seconds",
+    "Time spent computing enrollments with the Cirrus SDK",
+)
+merge_duration = registry.histogram(
+    "cirrus_fml_merge_duration_seconds",
+    "Time spent merging enrolled feature configurations with the FML",
+)
+ping_duration = registry.histogram(
+    "cirrus_ping_duration_seconds",
+    "Time spent recording the enrollment ping",
+)
+
 
 class FeatureRequest(BaseModel):
     client_id: str
@@ -51,15 +78,21 @@ async def lifespan(app: FastAPI):
     initialize_sentry()
     verify_settings()
 
-    app.state.enrollment_ping = create_enrollment_server_event_logger(
-        application_id=app_id,
-        app_display_version="1.0",
-        channel=channel,
+    app.state.enrollment_ping = create_ping_emitter(
+        create_enrollment_server_event_logger(
+            application_id=app_id,
+            app_display_version="1.0",
+            channel=channel,
+        ),
+        name="enrollment",
     )
-    app.state.enrollment_status_ping = create_enrollment_status_server_event_logger(
-        application_id=app_id,
-        app_display_version="1.0",
-        channel=channel,
+    app.state.enrollment_status_ping = create_ping_emitter(
+        create_enrollment_status_server_event_logger(
+            application_id=app_id,
+            app_display_version="1.0",
+            channel=channel,
+        ),
+        name="enrollment_status",
     )
     app.state.startup_ping = create_startup_server_event_logger(
         application_id=app_id,
@@ -67,6 +100,7 @@ async def lifespan(app: FastAPI):
         channel=channel,
     )
     app.state.fml = create_fml()
+    app.state.executor = create_executor()
     app.state.sdk_live = create_sdk(
         app.state.fml.get_coenrolling_feature_ids(),
         CirrusMetricsHandler(app.state.enrollment_status_ping),
@@ -87,7 +121,7 @@ async def lifespan(app: FastAPI):
         remote_setting_url, app.state.sdk_live, retry
     )
     app.state.remote_setting_preview = RemoteSettings(
-        remote_setting_preview_url, app.state.sdk_preview, retry
+        remote_setting_preview_url, app.state.sdk_preview, retry, name="preview"
     )
 
     if remote_setting_require_fetch_before_start:
@@ -102,6 +136,9 @@ async def lifespan(app: FastAPI):
     yield
     if app.state.scheduler:
         app.state.scheduler.shutdown()
+    app.state.executor.shutdown()
+    app.state.enrollment_ping.close()
+    app.state.enrollment_status_ping.close()
 
 
 def send_instance_name_metric():
@@ -155,6 +192,27 @@ def create_sdk(coenrolling_feature_ids: list[str], metrics_handler: CirrusMetric
         sys.exit(1)
 
 
+def create_ping_emitter(ping: Any, name: str):
+    ping_emitter = PingEmitter(
+        ping,
+        name=name,
+        max_queue_size=glean_max_queue_size,
+        max_events_per_ping=glean_max_events_buffer,
+        flush_interval_in_seconds=glean_flush_interval_in_seconds,
+        queue_full_policy=QueueFullPolicy(glean_queue_full_policy),
+    )
+    ping_emitter.start()
+    return ping_emitter
+
+
+def create_executor():
+    return EnrollmentExecutor(
+        mode=ExecutorMode(executor_mode),
+        max_workers=executor_max_workers,
+        max_queue_depth=executor_max_queue_depth,
+    )
+
+
 def create_scheduler():
     return AsyncIOScheduler(
         job_defaults={
@@ -257,10 +315,7 @@ def read_root():
     return {"Hello": "World"}
 
 
-async def compute_features_enrollments(
-    request_data: FeatureRequest,
-    nimbus_preview: bool = Query(default=False, alias="nimbus_preview"),
-) -> ComputeFeaturesEnrollmentResult:
+def validate_feature_request(request_data: FeatureRequest, nimbus_preview: bool):
     if not request_data.client_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -272,34 +327,148 @@ async def compute_features_enrollments(
             detail="This Cirrus doesn't support preview mode",
         )
 
-    enrollment_request = {
+
+def create_enrollment_request(request_data: FeatureRequest) -> EnrollmentRequest:
+    return {
         "clientId": request_data.client_id,
         "requestContext": request_data.context,
     }
 
-    sdk = app.state.sdk_preview if nimbus_preview else app.state.sdk_live
-    enrolled_partial_configuration = sdk.compute_enrollments(enrollment_request)
 
-    client_feature_configuration: dict[str, Any] = (
-        app.state.fml.compute_feature_configurations(enrolled_partial_configuration)
-    )
+def compute_features_enrollments_result(
+    enrolled_partial_configuration: EnrollmentResponse,
+    client_id: str,
+    nimbus_preview: bool,
+) -> ComputeFeaturesEnrollmentResult:
+    with merge_duration.time():
+        client_feature_configuration: dict[str, Any] = (
+            app.state.fml.compute_feature_configurations(enrolled_partial_configuration)
+        )
 
     # Enrollments data
     enrollment_data = collate_enrollment_metric_data(
         enrolled_partial_configuration,
-        client_id=request_data.client_id,
+        client_id=client_id,
         nimbus_preview_flag=nimbus_preview,
     )
 
-    # Record metrics
-    await record_metrics(enrollment_data, request_data.client_id)
-
     return {
         "features": client_feature_configuration,
         "enrollments": enrollment_data,
     }
 
 
+def format_features_enrollments_v2(
+    result: ComputeFeaturesEnrollmentResult,
+) -> dict[str, Any]:
+    return {
+        "Features": result["features"],
+        "Enrollments": [
+            {
+                "nimbus_user_id": enrollment.nimbus_user_id,
+                "app_id": enrollment.app_id,
+                "experiment": enrollment.experiment_slug,
+                "branch": enrollment.branch_slug,
+                "experiment_type": enrollment.experiment_type,
+                "is_preview": enrollment.is_preview,
+            }
+            for enrollment in result["enrollments"]
+        ],
+    }
+
+
+def evaluate_features_enrollments(
+    request_data: FeatureRequest, nimbus_preview: bool
+) -> ComputeFeaturesEnrollmentResult:
+    sdk = app.state.sdk_preview if nimbus_preview else app.state.sdk_live
+    with enrollment_duration.time():
+        enrolled_partial_configuration = sdk.compute_enrollments(
+            create_enrollment_request(request_data)
+        )
+
+    return compute_features_enrollments_result(
+        enrolled_partial_configuration,
+        client_id=request_data.client_id,
+        nimbus_preview=nimbus_preview,
+    )
+
+
+def evaluate_features_enrollments_batch(
+    request_data: list[FeatureRequest], nimbus_preview: bool
+) -> list[ComputeFeaturesEnrollmentResult]:
+    sdk = app.state.sdk_preview if nimbus_preview else app.state.sdk_live
+    with enrollment_duration.time():
+        enrolled_partial_configurations = sdk.compute_enrollments_batch(
+            [
+                create_enrollment_request(feature_request)
+                for feature_request in request_data
+            ]
+        )
+
+    return [
+        compute_features_enrollments_result(
+            enrolled_partial_configuration,
+            client_id=feature_request.client_id,
+            nimbus_preview=nimbus_preview,
+        )
+        for feature_request, enrolled_partial_configuration in zip(
+            request_data, enrolled_partial_configurations
+        )
+    ]
+
+
+async def run_in_executor(func: Callable[..., T], *args: object) -> T:
+    try:
+        return await app.state.executor.run(func, *args)
+    except ExecutorSaturatedError as e:
+        logger.warning(f"Rejecting request: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Cirrus is over capacity, please retry later",
+        ) from e
+
+
+async def compute_features_enrollments(
+    request_data: FeatureRequest,
+    nimbus_preview: bool = Query(default=False, alias="nimbus_preview"),
+) -> ComputeFeaturesEnrollmentResult:
+    validate_feature_request(request_data, nimbus_preview)
+
+    result = await run_in_executor(
+        evaluate_features_enrollments, request_data, nimbus_preview
+    )
+
+    # Record metrics
+    with ping_duration.time():
+        await record_metrics(result["enrollments"], request_data.client_id)
+
+    return result
+
+
+async def compute_features_enrollments_batch(
+    request_data: list[FeatureRequest],
+    nimbus_preview: bool = Query(default=False, alias="nimbus_preview"),
+) -> list[ComputeFeaturesEnrollmentResult]:
+    if len(request_data) > features_batch_max_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch size exceeds the maximum of {features_batch_max_size}",
+        )
+    for feature_request in request_data:
+        validate_feature_request(feature_request, nimbus_preview)
+
+    results = await run_in_executor(
+        evaluate_features_enrollments_batch, request_data, nimbus_preview
+    )
+
+    # Record metrics for each client, the ping emitter coalesces them
+    with ping_duration.time():
+        for feature_request, result in zip(request_data, results, strict=True):
+            await record_metrics(result["enrollments"], feature_request.client_id)
+
+    return results
+
+
 @app.post("/v1/features/", status_code=status.HTTP_200_OK)
 async def compute_features_v1(
     request_data: FeatureRequest,
@@ -315,27 +484,24 @@ async def compute_features_enrollments_v2(
     nimbus_preview: bool = Query(default=False, alias="nimbus_preview"),
 ):
     result = await compute_features_enrollments(request_data, nimbus_preview)
-    return {
-        "Features": result["features"],
-        "Enrollments": [
-            {
-                "nimbus_user_id": enrollment.nimbus_user_id,
-                "app_id": enrollment.app_id,
-                "experiment": enrollment.experiment_slug,
-                "branch": enrollment.branch_slug,
-                "experiment_type": enrollment.experiment_type,
-                "is_preview": enrollment.is_preview,
-            }
-            for enrollment in result["enrollments"]
-        ],
-    }
+    return format_features_enrollments_v2(result)
+
+
+@app.post("/v2/features/batch", status_code=status.HTTP_200_OK)
+async def compute_features_enrollments_v2_batch(
+    request_data: list[FeatureRequest],
+    nimbus_preview: bool = Query(default=False, alias="nimbus_preview"),
+):
+    results = await compute_features_enrollments_batch(request_data, nimbus_preview)
+    return [format_features_enrollments_v2(result) for result in results]
 
 
 def fetch_recipes_live():
     # This function blocks on requests, so it must be a synchronous function to make the
     # scheduler execute it in a thread and not block main event loop
     try:
-        app.state.remote_setting_live.fetch_recipes()
+        if app.state.remote_setting_live.fetch_recipes():
+            app.state.fml.clear_merge_cache()
     except Exception as e:
         logger.error(f"Failed to fetch live recipes: {e}")
 
@@ -344,7 +510,8 @@ def fetch_recipes_preview():
     # This function blocks on requests, so it must be a synchronous function to make the
     # scheduler execute it in a thread and not block main event loop
     try:
-        app.state.remote_setting_preview.fetch_recipes()
+        if app.state.remote_setting_preview.fetch_recipes():
+            app.state.fml.clear_merge_cache()
     except Exception as e:
         logger.error(f"Failed to fetch preview recipes: {e}")
 
@@ -357,3 +524,8 @@ async def health_check_lbheartbeat():
 @app.get("/__heartbeat__")
 async def health_check_heartbeat():
     return {"status": "ok"}
+
+
+@app.get("/__metrics__")
+async def metrics():
+    return registry.snapshot()
@@ -0,0 +1,125 @@
+import bisect
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+DEFAULT_BUCKETS_IN_SECONDS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Counter:
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.value = 0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self.lock:
+            self.value += amount
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"type": "counter", "description": self.description, "value": self.value}
+
+
+class Gauge:
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.value: float = 0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"type": "gauge", "description": self.description, "value": self.value}
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS_IN_SECONDS,
+    ):
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        # One extra slot for observations above the largest bucket
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum: float = 0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            self.bucket_counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self.lock:
+            cumulative = 0
+            buckets: dict[str, int] = {}
+            for bound, bucket_count in zip(
+                [*map(str, self.buckets), "+Inf"], self.bucket_counts
+            ):
+                cumulative += bucket_count
+                buckets[bound] = cumulative
+            return {
+                "type": "histogram",
+                "description": self.description,
+                "count": self.count,
+                "sum": self.sum,
+                "buckets": buckets,
+            }
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics: dict[str, Counter | Gauge | Histogram] = {}
+
+    def counter(self, name: str, description: str) -> Counter:
+        metric = self.metrics.setdefault(name, Counter(name, description))
+        assert isinstance(metric, Counter)
+        return metric
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        metric = self.metrics.setdefault(name, Gauge(name, description))
+        assert isinstance(metric, Gauge)
+        return metric
+
+    def histogram(self, name: str, description: str) -> Histogram:
+        metric = self.metrics.setdefault(name, Histogram(name, description))
+        assert isinstance(metric, Histogram)
+        return metric
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {name: metric.snapshot() for name, metric in sorted(self.metrics.items())}
+
+
+registry = MetricsRegistry()
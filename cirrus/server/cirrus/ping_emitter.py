@@ -0,0 +1,136 @@
+import logging
+import queue
+import threading
+import time
+from enum import StrEnum
+from typing import Any, NamedTuple
+
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullPolicy(StrEnum):
+    DROP = "drop"
+    BLOCK = "block"
+
+
+class PendingRecord(NamedTuple):
+    nimbus_user_id: str
+    events: list[dict[str, Any]]
+
+
+class PingEmitter:
+    # Drop-in replacement for a glean server event logger that moves recording
+    # off the request path. Records are queued and a background thread
+    # coalesces the events of many requests into a single ping once
+    # max_events_per_ping events are pending or flush_interval_in_seconds has
+    # passed.
+    def __init__(
+        self,
+        ping: Any,
+        name: str,
+        max_queue_size: int,
+        max_events_per_ping: int,
+        flush_interval_in_seconds: float,
+        queue_full_policy: QueueFullPolicy,
+    ):
+        self.ping = ping
+        self.name = name
+        self.max_events_per_ping = max_events_per_ping
+        self.flush_interval_in_seconds = flush_interval_in_seconds
+        self.queue_full_policy = queue_full_policy
+        self.queue: queue.Queue[PendingRecord | None] = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self.thread = threading.Thread(
+            target=self.run, name=f"cirrus-{name}-ping-emitter", daemon=True
+        )
+        self.queue_depth_gauge = registry.gauge(
+            f"cirrus_{name}_ping_queue_depth",
+            f"Number of {name} ping records waiting to be emitted",
+        )
+        self.dropped_events_counter = registry.counter(
+            f"cirrus_{name}_ping_dropped_events_total",
+            f"Number of {name} ping events dropped because the queue was full",
+        )
+        self.emitted_pings_counter = registry.counter(
+            f"cirrus_{name}_pings_emitted_total",
+            f"Number of {name} pings emitted",
+        )
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def record(
+        self,
+        user_agent: str | None,
+        ip_address: str | None,
+        nimbus_nimbus_user_id: str,
+        events: list[dict[str, Any]],
+    ) -> None:
+        if not events:
+            return
+
+        pending_record = PendingRecord(nimbus_nimbus_user_id, events)
+        try:
+            self.queue.put(
+                pending_record, block=self.queue_full_policy == QueueFullPolicy.BLOCK
+            )
+        except queue.Full:
+            self.dropped_events_counter.inc(len(events))
+            logger.warning(f"Dropped {len(events)} {self.name} events, queue is full")
+        self.queue_depth_gauge.set(self.queue.qsize())
+
+    def run(self) -> None:
+        stopping = False
+        while not stopping:
+            pending_records: list[PendingRecord] = []
+            pending_events = 0
+            deadline = time.monotonic() + self.flush_interval_in_seconds
+            while pending_events < self.max_events_per_ping:
+                try:
+                    pending_record = self.queue.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+                if pending_record is None:
+                    stopping = True
+                    break
+                pending_records.append(pending_record)
+                pending_events += len(pending_record.events)
+
+            self.queue_depth_gauge.set(self.queue.qsize())
+            if pending_records:
+                self.emit(pending_records)
+
+    def emit(self, pending_records: list[PendingRecord]) -> None:
+        # Every event identifies its client with its own nimbus_user_id extra.
+        # The ping level nimbus_user_id is only set when every coalesced event
+        # belongs to the same client, and is empty otherwise
+        nimbus_user_ids = {
+            pending_record.nimbus_user_id for pending_record in pending_records
+        }
+        try:
+            self.ping.record(
+                user_agent=None,
+                ip_address=None,
+                nimbus_nimbus_user_id=(
+                    nimbus_user_ids.pop() if len(nimbus_user_ids) == 1 else ""
+                ),
+                events=[
+                    event
+                    for pending_record in pending_records
+                    for event in pending_record.events
+                ],
+            )
+            self.emitted_pings_counter.inc()
+        except Exception as e:
+            logger.error(f"Failed to emit {self.name} ping: {e}")
+
+    def close(self, timeout: float | None = None) -> None:
+        if self.thread.is_alive():
+            logger.info(f"Flushing {self.name} ping emitter")
+            self.queue.put(None)
+            self.thread.join(timeout)
@@ -1,5 +1,6 @@
 import json
 import logging
+import threading
 from enum import StrEnum
 from typing import Any, NotRequired, TypedDict
 
@@ -99,21 +100,56 @@ class SDK:
         coenrolling_feature_ids: list[str],
         metrics_handler: CirrusMetricsHandler,
     ):
-        self.client = CirrusClient(context, metrics_handler, coenrolling_feature_ids)
+        self.context = context
+        self.coenrolling_feature_ids = coenrolling_feature_ids
+        self.metrics_handler = metrics_handler
+        # Replaced as a whole by set_experiments, so that a batch evaluated with
+        # one client sees the same recipes for every request in it without
+        # holding a lock that would serialize concurrent batches.
+        self.client = self.create_client()
+        # Held while new recipes are loaded so that concurrent updates are
+        # applied one at a time.
+        self.recipes_lock = threading.Lock()
+
+    def create_client(self) -> CirrusClient:
+        return CirrusClient(
+            self.context, self.metrics_handler, self.coenrolling_feature_ids
+        )
 
     def compute_enrollments(
         self,
         enrollment_request: EnrollmentRequest,
+    ) -> EnrollmentResponse:
+        return self.compute_enrollments_with_client(self.client, enrollment_request)
+
+    def compute_enrollments_batch(
+        self,
+        enrollment_requests: list[EnrollmentRequest],
+    ) -> list[EnrollmentResponse]:
+        client = self.client
+        return [
+            self.compute_enrollments_with_client(client, enrollment_request)
+            for enrollment_request in enrollment_requests
+        ]
+
+    @staticmethod
+    def compute_enrollments_with_client(
+        client: CirrusClient,
+        enrollment_request: EnrollmentRequest,
     ) -> EnrollmentResponse:
         try:
-            res = self.client.handle_enrollment(json.dumps(enrollment_request))
+            res = client.handle_enrollment(json.dumps(enrollment_request))
             return json.loads(res)
         except (NimbusError, Exception) as e:  # type: ignore
             logger.error(f"An error occurred during compute_enrollments: {e}")
             return {}
 
     def set_experiments(self, recipes: str):
-        try:
-            self.client.set_experiments(recipes)
-        except NimbusError as e:  # type: ignore
-            logger.error(f"An error occurred during set_experiments: {e}")
+        with self.recipes_lock:
+            client = self.create_client()
+            try:
+                client.set_experiments(recipes)
+            except NimbusError as e:  # type: ignore
+                logger.error(f"An error occurred during set_experiments: {e}")
+                return
+            self.client = client
@@ -36,6 +36,21 @@ context: str = json.dumps(
     }
 )
 fml_path: str = cast(str, config("CIRRUS_FML_PATH", default=""))
+fml_merge_cache_size: int = int(
+    config("CIRRUS_FML_MERGE_CACHE_SIZE", default=1024)  # type: ignore
+)
+
+executor_mode: str = cast(str, config("CIRRUS_EXECUTOR_MODE", default="inline"))
+executor_max_workers: int = int(
+    config("CIRRUS_EXECUTOR_MAX_WORKERS", default=4)  # type: ignore
+)
+executor_max_queue_depth: int = int(
+    config("CIRRUS_EXECUTOR_MAX_QUEUE_DEPTH", default=64)  # type: ignore
+)
+
+features_batch_max_size: int = int(
+    config("CIRRUS_FEATURES_BATCH_MAX_SIZE", default=1000)  # type: ignore
+)
 
 cirrus_sentry_dsn: str = cast(str, config("CIRRUS_SENTRY_DSN", default=""))
 cirrus_sentry_traces_sample_rate: float = float(
@@ -45,6 +60,19 @@ cirrus_sentry_profiles_sample_rate: float = float(
     config("CIRRUS_SENTRY_PROFILES_SAMPLE_RATE", default=0.25)  # type: ignore
 )
 
+glean_max_events_buffer: int = int(
+    config("CIRRUS_GLEAN_MAX_EVENTS_BUFFER", default=10)  # type: ignore
+)
+glean_flush_interval_in_seconds: float = float(
+    config("CIRRUS_GLEAN_FLUSH_INTERVAL_IN_SECONDS", default=1)  # type: ignore
+)
+glean_max_queue_size: int = int(
+    config("CIRRUS_GLEAN_MAX_QUEUE_SIZE", default=10000)  # type: ignore
+)
+glean_queue_full_policy: str = cast(
+    str, config("CIRRUS_GLEAN_QUEUE_FULL_POLICY", default="drop")
+)
+
 instance_name: str = cast(
     str, config("CIRRUS_INSTANCE_NAME", default="instance name not defined")
 )
@@ -0,0 +1,62 @@
+from mozilla_nimbus_shared import check_schema
+
+from benchmarks.benchmark import (
+    create_recipe,
+    histogram_quantile,
+    summarize_latencies,
+    summarize_stages,
+)
+
+
+def test_synthetic_recipes_are_valid():
+    for index in range(3):
+        check_schema("experiments/NimbusExperiment", create_recipe(index, "release"))
+
+
+def test_summarize_latencies():
+    latencies = [i / 1000 for i in range(1, 101)]
+
+    summary = summarize_latencies(latencies)
+
+    assert summary["p50_ms"] == 51
+    assert summary["p95_ms"] == 95
+    assert summary["p99_ms"] == 99
+    assert summary["max_ms"] == 100
+
+
+def test_histogram_quantile():
+    buckets = {"0.001": 50, "0.01": 95, "+Inf": 100}
+
+    assert histogram_quantile(buckets, 0.5) == 1
+    assert histogram_quantile(buckets, 0.95) == 10
+    assert histogram_quantile(buckets, 0.99) is None
+    assert histogram_quantile({"+Inf": 0}, 0.5) == 0
+
+
+def test_summarize_stages_uses_deltas():
+    before = {
+        "cirrus_enrollment_duration_seconds": {
+            "count": 10,
+            "sum": 1.0,
+            "buckets": {"0.1": 10, "+Inf": 10},
+        }
+    }
+    after = {
+        "cirrus_enrollment_duration_seconds": {
+            "count": 20,
+            "sum": 3.0,
+            "buckets": {"0.1": 15, "+Inf": 20},
+        }
+    }
+
+    stages = summarize_stages(before, after)
+
+    assert stages == {
+        "enrollment": {
+            "count": 10,
+            "mean_ms": 200.0,
+            "p50_le_ms": 100.0,
+            "p95_le_ms": None,
+            "p99_le_ms": None,
+        }
+    }
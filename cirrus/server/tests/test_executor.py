@@ -0,0 +1,56 @@
+import asyncio
+import threading
+
+import pytest
+
+from cirrus.executor import EnrollmentExecutor, ExecutorMode, ExecutorSaturatedError
+
+
+@pytest.mark.asyncio
+async def test_inline_executor_runs_on_event_loop_thread():
+    executor = EnrollmentExecutor(ExecutorMode.INLINE, max_workers=1, max_queue_depth=0)
+
+    result = await executor.run(threading.get_ident)
+
+    assert executor.executor is None
+    assert result == threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_runs_on_worker_thread():
+    executor = EnrollmentExecutor(ExecutorMode.THREAD, max_workers=2, max_queue_depth=0)
+
+    result = await executor.run(lambda a, b: (a + b, threading.get_ident()), 1, 2)
+
+    assert result[0] == 3
+    assert result[1] != threading.get_ident()
+    assert executor.pending == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_rejects_when_saturated():
+    executor = EnrollmentExecutor(ExecutorMode.THREAD, max_workers=1, max_queue_depth=1)
+    release = threading.Event()
+
+    running = [
+        asyncio.ensure_future(executor.run(release.wait)),
+        asyncio.ensure_future(executor.run(release.wait)),
+    ]
+    await asyncio.sleep(0)
+    assert executor.pending == 2
+
+    rejected_before = executor.rejected_counter.value
+    with pytest.raises(ExecutorSaturatedError):
+        await executor.run(release.wait)
+    assert executor.rejected_counter.value == rejected_before + 1
+
+    release.set()
+    assert await asyncio.gather(*running) == [True, True]
+    assert executor.pending == 0
+    executor.shutdown()
+
+
+def test_invalid_executor_mode():
+    with pytest.raises(ValueError):
+        ExecutorMode("process")
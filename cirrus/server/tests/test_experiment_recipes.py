@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -6,7 +7,7 @@ from requests.exceptions import RequestException
 from responses.registries import OrderedRegistry
 from urllib3.util import Retry
 
-from cirrus.experiment_recipes import RecipeType, RemoteSettings
+from cirrus.experiment_recipes import RecipeSnapshot, RecipeType, RemoteSettings
 
 
 def test_remote_settings_url_check():
@@ -94,7 +95,7 @@ def test_successful_response(remote_settings):
         remote_settings.fetch_recipes()
 
     assert mock_get.call_count == 1
-    mock_get.assert_any_call(remote_settings.url)
+    mock_get.assert_any_call(remote_settings.url, headers={})
 
 
 @pytest.mark.parametrize(
@@ -171,6 +172,38 @@ def test_get_recipe_type_with_actual_recipes(
     assert experiment_type == expected_type
 
 
+def test_recipe_snapshot_indexes_recipe_types(recipes):
+    snapshot = RecipeSnapshot.create(recipes, generation=3)
+
+    assert snapshot.generation == 3
+    assert snapshot.recipes is recipes
+    assert snapshot.get_recipe_type("cirrus-test-1") == RecipeType.ROLLOUT.value
+    assert snapshot.get_recipe_type("cirrus-test-2") == RecipeType.EXPERIMENT.value
+    assert snapshot.get_recipe_type("non-existent-slug") == RecipeType.EMPTY.value
+    with pytest.raises(TypeError):
+        snapshot.recipe_types["cirrus-test-1"] = RecipeType.EXPERIMENT.value
+
+
+@pytest.mark.parametrize(
+    "remote_settings",
+    ["remote_settings_live", "remote_settings_preview"],
+    indirect=True,
+)
+def test_update_recipes_replaces_snapshot(remote_settings, recipes):
+    previous_snapshot = remote_settings.snapshot
+
+    remote_settings.update_recipes(recipes)
+
+    assert remote_settings.snapshot is not previous_snapshot
+    assert remote_settings.snapshot.generation == previous_snapshot.generation + 1
+    assert previous_snapshot.get_recipe_type("cirrus-test-1") == RecipeType.EMPTY.value
+    assert remote_settings.recipes_count_gauge.value == len(recipes["data"])
+    assert (
+        remote_settings.recipes_generation_gauge.value
+        == remote_settings.snapshot.generation
+    )
+
+
 @responses.activate
 @pytest.mark.parametrize("protocol", ["http", "https"])
 def test_fetch_recipes_with_retry_failure(sdk_live, protocol):
@@ -204,3 +237,64 @@ def test_fetch_recipes_with_retry_success(sdk_live, protocol):
     rs = RemoteSettings(url, sdk_live, retry)
     rs.fetch_recipes()
     assert [r.call_count for r in _responses] == [1, 1, 1]
+
+
+@responses.activate(registry=OrderedRegistry)
+def test_fetch_recipes_sends_etag_and_skips_not_modified(sdk_live, recipes):
+    url = "http://example.com/changeset?_expected=0"
+    _responses = [
+        responses.get(
+            url,
+            json={"changes": recipes["data"], "timestamp": 1},
+            headers={"ETag": '"1"'},
+        ),
+        responses.get(
+            url,
+            status=304,
+            match=[responses.matchers.header_matcher({"If-None-Match": '"1"'})],
+        ),
+    ]
+    rs = RemoteSettings(url, sdk_live)
+    unchanged_before = rs.fetch_unchanged_counter.value
+    bytes_before = rs.fetch_bytes_counter.value
+
+    with patch.object(sdk_live, "set_experiments") as mock_set_experiments:
+        rs.fetch_recipes()
+        rs.fetch_recipes()
+
+    assert [r.call_count for r in _responses] == [1, 1]
+    mock_set_experiments.assert_called_once()
+    assert rs.get_recipes() == recipes
+    assert rs.snapshot.generation == 1
+    assert rs.fetch_unchanged_counter.value == unchanged_before + 1
+    assert rs.fetch_bytes_counter.value == bytes_before + len(_responses[0].body)
+
+
+@responses.activate
+def test_fetch_recipes_skips_unchanged_timestamp(sdk_live, recipes):
+    url = "http://example.com/changeset?_expected=0"
+    responses.get(url, json={"changes": recipes["data"], "timestamp": 1})
+    rs = RemoteSettings(url, sdk_live)
+    unchanged_before = rs.fetch_unchanged_counter.value
+
+    with patch.object(sdk_live, "set_experiments") as mock_set_experiments:
+        rs.fetch_recipes()
+        rs.fetch_recipes()
+
+    mock_set_experiments.assert_called_once()
+    assert rs.snapshot.generation == 1
+    assert rs.fetch_unchanged_counter.value == unchanged_before + 1
+
+
+@pytest.mark.parametrize(
+    "remote_settings",
+    ["remote_settings_live", "remote_settings_preview"],
+    indirect=True,
+)
+def test_update_recipes_skips_identical_content(remote_settings, recipes):
+    with patch.object(remote_settings.sdk, "set_experiments") as mock_set_experiments:
+        assert remote_settings.update_recipes(recipes)
+        assert not remote_settings.update_recipes(json.loads(json.dumps(recipes)))
+
+    mock_set_experiments.assert_called_once_with(json.dumps(recipes))
+    assert remote_settings.snapshot.generation == 1
@@ -107,8 +107,11 @@ def test_compute_feature_configurations_invalid_key_merge_errors(fml):
     result = fml.compute_feature_configurations(enrolled_partial_configuration)
 
     assert result == {"example-feature": {"enabled": False, "something": "wicked"}}
-    assert len(fml.merge_errors) == 1
-    assert isinstance(fml.merge_errors[0], FmlError)
+    merged = fml.merge_feature_configurations(
+        enrolled_partial_configuration["enrolledFeatureConfigMap"]
+    )
+    assert len(merged.errors) == 1
+    assert isinstance(merged.errors[0], FmlError)
 
 
 def test_compute_feature_configurations_targeting_doesnt_match(fml_setup):
@@ -180,7 +183,12 @@ def test_compute_feature_configurations_targeting_doesnt_match(fml_setup):
     result = fml.compute_feature_configurations(enrolled_partial_configuration)
 
     assert result == {"example-feature": {"enabled": False, "something": "wicked"}}
-    assert len(fml.merge_errors) == 0
+    assert (
+        fml.merge_feature_configurations(
+            enrolled_partial_configuration["enrolledFeatureConfigMap"]
+        ).errors
+        == []
+    )
 
 
 @pytest.mark.parametrize(
@@ -293,9 +301,123 @@ def test_compute_feature_configurations_targeting_locale(
     assert result == {
         "example-feature": {"enabled": False, "something": "You are enrolled"}
     }
-    assert len(fml.merge_errors) == 0
+    assert (
+        fml.merge_feature_configurations(
+            enrolled_partial_configuration["enrolledFeatureConfigMap"]
+        ).errors
+        == []
+    )
 
 
 def test_coenrolling_feature_ids(fml_with_coenrolling_features):
     fml = fml_with_coenrolling_features
     assert fml.get_coenrolling_feature_ids() == ["coenrolling-feature"]
+
+
+def test_compute_feature_configurations_memoizes_merge(fml, mocker):
+    enrolled_partial_configuration = {
+        "enrolledFeatureConfigMap": {
+            "example-feature": {
+                "branch": "treatment",
+                "feature": {
+                    "featureId": "example-feature",
+                    "value": {"enabled": True},
+                },
+                "featureId": "example-feature",
+                "slug": "experiment-slug",
+            }
+        },
+        "enrollments": [],
+        "events": [],
+    }
+    merge_spy = mocker.spy(fml.fml_client, "merge")
+    hits_before = fml.merge_cache_hits.value
+    misses_before = fml.merge_cache_misses.value
+
+    first = fml.compute_feature_configurations(enrolled_partial_configuration)
+    second = fml.compute_feature_configurations(enrolled_partial_configuration)
+
+    assert (
+        first == second == {"example-feature": {"enabled": True, "something": "wicked"}}
+    )
+    merge_spy.assert_called_once_with({"example-feature": {"enabled": True}})
+    assert fml.merge_cache_hits.value == hits_before + 1
+    assert fml.merge_cache_misses.value == misses_before + 1
+
+
+def enrolled_feature_config_map(value, branch="treatment"):
+    return {
+        "example-feature": {
+            "branch": branch,
+            "feature": {"featureId": "example-feature", "value": value},
+            "featureId": "example-feature",
+            "slug": "experiment-slug",
+        }
+    }
+
+
+def test_merge_cache_is_keyed_by_enrolled_branches(fml, mocker):
+    merge_spy = mocker.spy(fml.fml_client, "merge")
+
+    first = fml.merge_feature_configurations(
+        enrolled_feature_config_map({"enabled": True})
+    )
+    second = fml.merge_feature_configurations(
+        enrolled_feature_config_map({"enabled": True})
+    )
+    other_branch = fml.merge_feature_configurations(
+        enrolled_feature_config_map({"enabled": False}, branch="control")
+    )
+
+    assert merge_spy.call_count == 2
+    assert first.features == second.features
+    assert other_branch.features == {
+        "example-feature": {"enabled": False, "something": "wicked"}
+    }
+
+
+def test_merge_cache_returns_a_copy_of_the_features(fml):
+    first = fml.merge_feature_configurations(
+        enrolled_feature_config_map({"enabled": True})
+    )
+    first.features.clear()
+    first.errors.append("error")
+
+    second = fml.merge_feature_configurations(
+        enrolled_feature_config_map({"enabled": True})
+    )
+
+    assert second.features == {
+        "example-feature": {"enabled": True, "something": "wicked"}
+    }
+    assert second.errors == []
+
+
+def test_merge_cache_evicts_least_recently_used(fml, mocker):
+    fml.merge_cache_size = 2
+    merge_spy = mocker.spy(fml.fml_client, "merge")
+    evictions_before = fml.merge_cache_evictions.value
+
+    fml.merge_feature_configurations(enrolled_feature_config_map({"enabled": True}))
+    fml.merge_feature_configurations(
+        enrolled_feature_config_map({"enabled": False}, branch="control")
+    )
+    fml.merge_feature_configurations(enrolled_feature_config_map({"enabled": True}))
+    fml.merge_feature_configurations({})
+    fml.merge_feature_configurations(
+        enrolled_feature_config_map({"enabled": False}, branch="control")
+    )
+
+    assert merge_spy.call_count == 4
+    assert fml.merge_cache_evictions.value == evictions_before + 2
+    assert len(fml.merge_cache) == 2
+
+
+def test_clear_merge_cache(fml, mocker):
+    merge_spy = mocker.spy(fml.fml_client, "merge")
+
+    fml.merge_feature_configurations({})
+    fml.clear_merge_cache()
+    fml.merge_feature_configurations({})
+
+    assert merge_spy.call_count == 2
@@ -8,8 +8,10 @@ from cirrus_sdk import NimbusError
 from fastapi import status
 from fml_sdk import FmlError
 
+from cirrus.executor import ExecutorMode, ExecutorSaturatedError
 from cirrus.main import (
     EnrollmentMetricData,
+    create_executor,
     create_fml,
     create_scheduler,
     create_sdk,
@@ -257,6 +259,24 @@ def test_fetch_recipes_live(
     remote_setting_live_mock.fetch_recipes.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    "fetch_recipes, remote_setting_name",
+    [
+        (fetch_recipes_live, "remote_setting_live"),
+        (fetch_recipes_preview, "remote_setting_preview"),
+    ],
+)
+@pytest.mark.parametrize("updated", [True, False])
+def test_fetch_recipes_clears_merge_cache_when_updated(
+    app_state_mock, fetch_recipes, remote_setting_name, updated
+):
+    getattr(app_state_mock, remote_setting_name).fetch_recipes.return_value = updated
+
+    fetch_recipes()
+
+    assert app_state_mock.fml.clear_merge_cache.called == updated
+
+
 def test_fetch_recipes_preview(
     remote_setting_preview_mock,
 ):
@@ -865,3 +885,144 @@ def test_verify_settings_logs_error_and_exits(caplog):
 
         mock_exit.assert_called_once_with(1)
         assert "Remote setting URL is required but not provided." in caplog.text
+
+
+def test_get_features_v2_batch(client):
+    request_data = [
+        {"client_id": "client-1", "context": {}},
+        {"client_id": "client-2", "context": {"key1": "value1"}},
+    ]
+
+    response = client.post("/v2/features/batch", json=request_data)
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "Features": {
+                "example-feature": {"enabled": False, "something": "wicked"},
+            },
+            "Enrollments": [],
+        },
+        {
+            "Features": {
+                "example-feature": {"enabled": False, "something": "wicked"},
+            },
+            "Enrollments": [],
+        },
+    ]
+
+
+@pytest.mark.parametrize("nimbus_preview", [False, True])
+def test_get_features_v2_batch_preserves_request_order(client, nimbus_preview):
+    request_data = [{"client_id": f"client-{i}", "context": {}} for i in ("a", "b", "c")]
+    sdk_name = "sdk_preview" if nimbus_preview else "sdk_live"
+
+    def compute_enrollments_batch(enrollment_requests):
+        return [
+            {
+                "enrolledFeatureConfigMap": {
+                    "example-feature": {
+                        "feature": {
+                            "featureId": "example-feature",
+                            "value": {"something": enrollment_request["clientId"]},
+                        },
+                        "branch": enrollment_request["clientId"],
+                        "featureId": "example-feature",
+                        "slug": "experiment_slug_1",
+                    }
+                },
+                "enrollments": [],
+                "events": [],
+            }
+            for enrollment_request in enrollment_requests
+        ]
+
+    with patch(
+        f"cirrus.main.app.state.{sdk_name}.compute_enrollments_batch",
+        side_effect=compute_enrollments_batch,
+    ) as mock_compute_enrollments_batch:
+        response = client.post(
+            f"/v2/features/batch?nimbus_preview={str(nimbus_preview).lower()}",
+            json=request_data,
+        )
+
+    mock_compute_enrollments_batch.assert_called_once()
+    assert response.status_code == 200
+    assert [
+        result["Features"]["example-feature"]["something"] for result in response.json()
+    ] == ["client-a", "client-b", "client-c"]
+
+
+def test_get_features_v2_batch_empty_client_id(client):
+    request_data = [
+        {"client_id": "client-1", "context": {}},
+        {"client_id": "", "context": {}},
+    ]
+
+    response = client.post("/v2/features/batch", json=request_data)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Client ID value is missing or empty"}
+
+
+def test_get_features_v2_batch_exceeds_max_size(client):
+    request_data = [
+        {"client_id": "client-1", "context": {}},
+        {"client_id": "client-2", "context": {}},
+    ]
+
+    with patch("cirrus.main.features_batch_max_size", 1):
+        response = client.post("/v2/features/batch", json=request_data)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Batch size exceeds the maximum of 1"}
+
+
+def test_get_features_v2_batch_preview_url_not_provided(client):
+    request_data = [{"client_id": "client-1", "context": {}}]
+
+    with patch("cirrus.main.remote_setting_preview_url", ""):
+        response = client.post(
+            "/v2/features/batch?nimbus_preview=true", json=request_data
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": "This Cirrus doesn't support preview mode"}
+
+
+def test_metrics_endpoint(client):
+    request_data = {"client_id": "client-1", "context": {}}
+    client.post("/v2/features/", json=request_data)
+
+    response = client.get("/__metrics__")
+    assert response.status_code == 200
+    metrics = response.json()
+    for name in (
+        "cirrus_enrollment_duration_seconds",
+        "cirrus_fml_merge_duration_seconds",
+        "cirrus_ping_duration_seconds",
+    ):
+        assert metrics[name]["type"] == "histogram"
+        assert metrics[name]["count"] > 0
+
+
+@pytest.mark.parametrize("endpoint", ["/v1/features/", "/v2/features/"])
+def test_get_features_executor_saturated(client, endpoint):
+    request_data = {"client_id": "client-1", "context": {}}
+
+    with patch(
+        "cirrus.main.app.state.executor.run",
+        side_effect=ExecutorSaturatedError("saturated"),
+    ):
+        response = client.post(endpoint, json=request_data)
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json() == {"detail": "Cirrus is over capacity, please retry later"}
+
+
+def test_create_executor():
+    with (
+        patch("cirrus.main.executor_mode", "thread"),
+        patch("cirrus.main.executor_max_workers", 2),
+        patch("cirrus.main.executor_max_queue_depth", 3),
+    ):
+        executor = create_executor()
+
+    assert executor.mode == ExecutorMode.THREAD
+    assert executor.max_pending == 5
+    executor.shutdown()
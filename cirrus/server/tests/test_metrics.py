@@ -0,0 +1,58 @@
+from cirrus.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_counter():
+    counter = Counter("test_total", "A test counter")
+    counter.inc()
+    counter.inc(2)
+
+    assert counter.snapshot() == {
+        "type": "counter",
+        "description": "A test counter",
+        "value": 3,
+    }
+
+
+def test_gauge():
+    gauge = Gauge("test_gauge", "A test gauge")
+    gauge.set(5)
+    gauge.set(2)
+
+    assert gauge.snapshot() == {
+        "type": "gauge",
+        "description": "A test gauge",
+        "value": 2,
+    }
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("test_seconds", "A test histogram", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    assert histogram.snapshot() == {
+        "type": "histogram",
+        "description": "A test histogram",
+        "count": 4,
+        "sum": 5.65,
+        "buckets": {"0.1": 2, "1.0": 3, "+Inf": 4},
+    }
+
+
+def test_histogram_time():
+    histogram = Histogram("test_seconds", "A test histogram")
+    with histogram.time():
+        pass
+
+    assert histogram.count == 1
+
+
+def test_registry_returns_existing_metric():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "A test counter")
+    counter.inc()
+
+    assert registry.counter("test_total", "A test counter") is counter
+    assert registry.snapshot() == {"test_total": counter.snapshot()}
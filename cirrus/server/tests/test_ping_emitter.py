@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock
+
+from cirrus.ping_emitter import PingEmitter, QueueFullPolicy
+
+
+def create_event(nimbus_user_id):
+    return {
+        "category": "cirrus_events",
+        "name": "enrollment",
+        "extra": {"nimbus_user_id": nimbus_user_id},
+    }
+
+
+def create_ping_emitter(ping, **kwargs):
+    options = {
+        "name": "test",
+        "max_queue_size": 100,
+        "max_events_per_ping": 10,
+        "flush_interval_in_seconds": 0.01,
+        "queue_full_policy": QueueFullPolicy.DROP,
+        **kwargs,
+    }
+    return PingEmitter(ping, **options)
+
+
+def test_records_are_coalesced_into_one_ping():
+    ping = MagicMock()
+    ping_emitter = create_ping_emitter(ping)
+
+    ping_emitter.record(None, None, "user-1", [create_event("user-1")])
+    ping_emitter.record(None, None, "user-2", [create_event("user-2")])
+    ping_emitter.start()
+    ping_emitter.close()
+
+    ping.record.assert_called_once_with(
+        user_agent=None,
+        ip_address=None,
+        nimbus_nimbus_user_id="",
+        events=[create_event("user-1"), create_event("user-2")],
+    )
+
+
+def test_requests_of_many_clients_are_emitted_in_fewer_pings():
+    ping = MagicMock()
+    ping_emitter = create_ping_emitter(ping, max_events_per_ping=4)
+
+    for i in range(10):
+        ping_emitter.record(None, None, f"user-{i}", [create_event(f"user-{i}")])
+    ping_emitter.start()
+    ping_emitter.close()
+
+    assert ping.record.call_count == 3
+    assert [
+        event for call in ping.record.call_args_list for event in call.kwargs["events"]
+    ] == [create_event(f"user-{i}") for i in range(10)]
+
+
+def test_ping_keeps_nimbus_user_id_when_shared():
+    ping = MagicMock()
+    ping_emitter = create_ping_emitter(ping)
+
+    ping_emitter.record(None, None, "user-1", [create_event("user-1")])
+    ping_emitter.record(None, None, "user-1", [create_event("user-1")])
+    ping_emitter.start()
+    ping_emitter.close()
+
+    assert ping.record.call_args.kwargs["nimbus_nimbus_user_id"] == "user-1"
+
+
+def test_pings_are_split_at_max_events_per_ping():
+    ping = MagicMock()
+    ping_emitter = create_ping_emitter(ping, max_events_per_ping=2)
+
+    for i in range(5):
+        ping_emitter.record(None, None, f"user-{i}", [create_event(f"user-{i}")])
+    ping_emitter.start()
+    ping_emitter.close()
+
+    assert [len(call.kwargs["events"]) for call in ping.record.call_args_list] == [
+        2,
+        2,
+        1,
+    ]
+    assert ping_emitter.queue.empty()
+
+
+def test_records_without_events_are_skipped():
+    ping = MagicMock()
+    ping_emitter = create_ping_emitter(ping)
+
+    ping_emitter.record(None, None, "user-1", [])
+    ping_emitter.start()
+    ping_emitter.close()
+
+    ping.record.assert_not_called()
+
+
+def test_events_are_dropped_when_queue_is_full():
+    ping = MagicMock()
+    ping_emitter = create_ping_emitter(ping, max_queue_size=1)
+    dropped_before = ping_emitter.dropped_events_counter.value
+
+    ping_emitter.record(None, None, "user-1", [create_event("user-1")])
+    ping_emitter.record(
+        None, None, "user-2", [create_event("user-2"), create_event("user-2")]
+    )
+
+    assert ping_emitter.dropped_events_counter.value == dropped_before + 2
+    assert ping_emitter.queue_depth_gauge.value == 1
+
+
+def test_emit_errors_are_logged(caplog):
+    ping = MagicMock()
+    ping.record.side_effect = ValueError("boom")
+    ping_emitter = create_ping_emitter(ping)
+
+    ping_emitter.record(None, None, "user-1", [create_event("user-1")])
+    ping_emitter.start()
+    ping_emitter.close()
+
+    assert "Failed to emit test ping: boom" in caplog.text
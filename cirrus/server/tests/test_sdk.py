@@ -1,4 +1,6 @@
 import json
+import threading
+from unittest.mock import MagicMock
 
 import pytest
 from cirrus_sdk import NimbusError
@@ -128,3 +130,72 @@ def test_coenrolling_feature_recipes(recipes_with_coenrolling_features, metrics_
             "experiment-2": "experiment-2",
         }
     }
+
+
+def test_compute_enrollments_batch(sdk_live, recipes):
+    sdk_live.set_experiments(json.dumps(recipes))
+    targeting_contexts = [
+        {"clientId": "test-1", "requestContext": {}},
+        {"clientId": None, "requestContext": {}},
+        {"clientId": "test-2", "requestContext": {}},
+    ]
+
+    results = sdk_live.compute_enrollments_batch(targeting_contexts)
+
+    assert results == [
+        sdk_live.compute_enrollments(targeting_context)
+        for targeting_context in targeting_contexts
+    ]
+    assert results[1] == {}
+
+
+def test_compute_enrollments_batches_run_concurrently(sdk_live):
+    batch_started = threading.Event()
+    release_batch = threading.Event()
+
+    def handle_enrollment(enrollment_request):
+        if json.loads(enrollment_request)["clientId"] == "blocked":
+            batch_started.set()
+            release_batch.wait(timeout=5)
+        return "{}"
+
+    sdk_live.client = MagicMock(handle_enrollment=handle_enrollment)
+    blocked_batch = threading.Thread(
+        target=sdk_live.compute_enrollments_batch,
+        args=([{"clientId": "blocked", "requestContext": {}}],),
+    )
+    blocked_batch.start()
+    batch_started.wait(timeout=5)
+
+    try:
+        assert sdk_live.compute_enrollments_batch(
+            [{"clientId": "test", "requestContext": {}}]
+        ) == [{}]
+        assert blocked_batch.is_alive()
+    finally:
+        release_batch.set()
+        blocked_batch.join()
+
+
+def test_compute_enrollments_batch_keeps_its_recipes(sdk_live, mocker):
+    old_client = MagicMock()
+    new_client = MagicMock()
+    sdk_live.client = old_client
+    mocker.patch.object(sdk_live, "create_client", return_value=new_client)
+
+    def handle_enrollment(enrollment_request):
+        sdk_live.set_experiments(json.dumps({"data": []}))
+        return "{}"
+
+    old_client.handle_enrollment.side_effect = handle_enrollment
+
+    sdk_live.compute_enrollments_batch(
+        [
+            {"clientId": "test-1", "requestContext": {}},
+            {"clientId": "test-2", "requestContext": {}},
+        ]
+    )
+
+    assert old_client.handle_enrollment.call_count == 2
+    new_client.handle_enrollment.assert_not_called()
+    assert sdk_live.client is new_client
@@ -223,6 +223,47 @@ async def test_enrollment_metrics_recorded_with_compute_features_v2(
     assert events[1]["extra"]["is_preview"] == "true"
 
 
+@pytest.mark.asyncio
+async def test_enrollment_metrics_recorded_per_client_with_compute_features_v2_batch(
+    client, mocker, recipes
+):
+    record_spy = mocker.spy(app.state.enrollment_ping, "record")
+    context = json.dumps(
+        {
+            "app_id": "org.mozilla.test",
+            "app_name": "test_app",
+            "channel": "release",
+        }
+    )
+    sdk = SDK(
+        context=context,
+        coenrolling_feature_ids=[],
+        metrics_handler=CirrusMetricsHandler(app.state.enrollment_status_ping),
+    )
+
+    request_data = [
+        {"client_id": "test_client_id_1", "context": {}},
+        {"client_id": "test_client_id_2", "context": {}},
+    ]
+
+    app.state.remote_setting_live.update_recipes(recipes)
+    sdk.set_experiments(json.dumps(recipes))
+
+    mocker.patch.object(app.state, "sdk_live", sdk)
+
+    response = client.post("/v2/features/batch", json=request_data)
+    assert response.status_code == 200
+    assert record_spy.call_count == 2
+    for call, client_id in zip(
+        record_spy.mock_calls, ["test_client_id_1", "test_client_id_2"], strict=True
+    ):
+        assert call.kwargs.get("nimbus_nimbus_user_id") == client_id
+        assert [event["extra"]["nimbus_user_id"] for event in call.kwargs["events"]] == [
+            client_id,
+            client_id,
+        ]
+
+
 @pytest.mark.asyncio
 async def test_enrollment_status_metrics_recorded_with_metrics_handler_v1(
     client, mocker, recipes
@@ -4,13 +4,14 @@ from django import forms
 from django.contrib import admin
 from django.contrib.auth.models import User
 from django.contrib.postgres import forms as pgforms
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
 from django.template.loader import render_to_string
 from django.utils.encoding import force_str
 from django.utils.safestring import mark_safe
 from import_export import fields, resources
 from import_export.admin import ExportActionMixin, ImportMixin
-from import_export.widgets import DecimalWidget, ForeignKeyWidget
+from import_export.widgets import DecimalWidget, ForeignKeyWidget, JSONWidget
 
 from experimenter.experiments.changelog_utils import (
     NimbusBranchChangeLogSerializer,
@@ -27,6 +28,7 @@ from experimenter.experiments.models import (
     NimbusChangeLog,
     NimbusDocumentationLink,
     NimbusExperiment,
+    NimbusExperimentPayload,
     NimbusFeatureConfig,
     NimbusFeatureVersion,
     NimbusIsolationGroup,
@@ -103,6 +105,16 @@ class NimbusExperimentResource(resources.ModelResource):
     # - the default handling for these turns nulls into empty strings,
     #   which breaks the Nimbus UI type validation
     status_next = fields.Field()
+    # payloads are stored outside of the experiment row
+    published_dto = fields.Field(
+        attribute="published_dto", column_name="published_dto", widget=JSONWidget()
+    )
+    results_data = fields.Field(
+        attribute="results_data", column_name="results_data", widget=JSONWidget()
+    )
+    monitoring_data = fields.Field(
+        attribute="monitoring_data", column_name="monitoring_data", widget=JSONWidget()
+    )
 
     # TODO: remove get_diff_class when we upgrade to django-import-export >= 4.0.0
     # https://github.com/mozilla/experimenter/issues/10416
@@ -119,7 +131,13 @@ class NimbusExperimentResource(resources.ModelResource):
 
     class Meta:
         model = NimbusExperiment
-        exclude = ("id", "reference_branch", "parent")
+        exclude = (
+            "id",
+            "reference_branch",
+            "parent",
+            "_has_displayable_results",
+            "_has_changelog_entries",
+        )
         import_id_fields = ("slug",)
 
     def dehydrate_changes(self, experiment):
@@ -193,10 +211,10 @@ class NimbusExperimentResource(resources.ModelResource):
                 new_status_next=change.get("new_status_next"),
                 new_publish_status=change.get("new_publish_status"),
                 message=change.get("message"),
-                experiment_data=change.get("experiment_data"),
                 published_dto_changed=change.get("published_dto_changed"),
                 changed_by=experiment.owner,
                 experiment=experiment,
+                defaults={"experiment_data": change.get("experiment_data")},
             )
 
 
@@ -307,9 +325,14 @@ class NimbusExperimentAdminForm(forms.ModelForm):
         required=False,
         initial=NimbusExperiment.QAStatus.NOT_SET,
     )
+    published_dto = forms.JSONField(required=False, encoder=DjangoJSONEncoder)
+    results_data = forms.JSONField(required=False, encoder=DjangoJSONEncoder)
+    monitoring_data = forms.JSONField(required=False, encoder=DjangoJSONEncoder)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        for kind in NimbusExperimentPayload.Kind.values:
+            self.initial.setdefault(kind, getattr(self.instance, kind))
         if "instance" in kwargs:
             instance = kwargs["instance"]
             self.fields["reference_branch"].queryset = self.fields[
@@ -320,10 +343,21 @@ class NimbusExperimentAdminForm(forms.ModelForm):
                 "reference_branch"
             ].queryset.none()
 
+    def save(self, commit=True):
+        for kind in NimbusExperimentPayload.Kind.values:
+            if kind in self.changed_data:
+                setattr(self.instance, kind, self.cleaned_data[kind])
+        return super().save(commit=commit)
+
     class Meta:
         model = NimbusExperiment
         exclude = ("id",)
-        readonly_fields = ("_firefox_min_version_parsed",)
+        readonly_fields = (
+            "_firefox_min_version_parsed",
+            "_kinto_collection",
+            "_has_displayable_results",
+            "_has_changelog_entries",
+        )
 
 
 class NimbusExperimentAdmin(
@@ -361,7 +395,13 @@ class NimbusExperimentAdmin(
     form = NimbusExperimentAdminForm
     actions = [force_fetch_jetstream_data, force_resync_published_dto]
     resource_class = NimbusExperimentResource
-    readonly_fields = ("_firefox_min_version_parsed", "changelog_display")
+    readonly_fields = (
+        "_firefox_min_version_parsed",
+        "_kinto_collection",
+        "_has_displayable_results",
+        "_has_changelog_entries",
+        "changelog_display",
+    )
 
     @admin.display(description="Change History")
     def changelog_display(self, obj):
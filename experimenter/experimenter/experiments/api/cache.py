@@ -1,18 +1,29 @@
+import gzip
 import hashlib
 import logging
+import re
+import zlib
 from urllib.parse import urlencode
 
 from django.conf import settings
 from django.core.cache import cache
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
 from rest_framework.compat import SHORT_SEPARATORS
 from rest_framework.renderers import JSONRenderer
 from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
 
+from experimenter.experiments.cache_utils import get_fragment_cache_keys
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_STREAM_CHUNK_SIZE = 25
 
+ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+
+# zlib window bits that make it write a gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
 
 def get_api_cache_key(view_name, query_params=None):
     """Build a deterministic cache key from the view name and query parameters."""
@@ -24,31 +35,9 @@ def get_api_cache_key(view_name, query_params=None):
     return f"nimbus:api:{view_name}"
 
 
-class _StreamArray(list[object]):
-    """Lets ``stream_render_queryset`` actually stream the queryset, rather than
-    holding the whole serialised graph in memory.
-    """
-
-    def __init__(self, gen):
-        super().__init__()
-        self._iter = iter(gen)
-        try:
-            self._first = next(self._iter)
-            self._empty = False
-        except StopIteration:
-            self._empty = True
-
-    def __iter__(self):
-        yield self._first
-        yield from self._iter
-
-    def __len__(self):
-        return 0 if self._empty else 1
-
-
 def _drf_compatible_encoder():
-    """Keeps the warm cache and a fresh on-miss render byte-identical for the
-    same data.
+    """Keeps the cached fragments and a fresh render byte-identical for the same
+    data.
     """
     return DRFJSONEncoder(
         ensure_ascii=JSONRenderer.ensure_ascii,
@@ -57,61 +46,246 @@ def _drf_compatible_encoder():
     )
 
 
-def stream_render_queryset(
-    queryset,
-    serializer_class,
-    chunk_size=DEFAULT_STREAM_CHUNK_SIZE,
+def get_experiment_fragment_keys(queryset, serializer_class):
+    """Map the id of each experiment of the queryset, in order, to the cache key of
+    its fragment.
+    """
+    experiment_ids = queryset.prefetch_related(None).values_list("id", flat=True)
+    return get_fragment_cache_keys(serializer_class, experiment_ids)
+
+
+def get_experiment_fragments(
+    queryset, serializer_class, cache_keys=None, chunk_size=DEFAULT_STREAM_CHUNK_SIZE
 ):
-    """Streams the warm-cache JSON in bounded memory — materialising it all at
-    once OOM-kills the worker (#15621).
+    """Return the rendered JSON of each experiment of the queryset, in order.
+    Only the experiments whose fragment is not cached are serialized.
     """
-    items = (
-        serializer_class(obj).data for obj in queryset.iterator(chunk_size=chunk_size)
-    )
-    encoder = _drf_compatible_encoder()
-    return b"".join(
-        chunk.encode("utf-8") for chunk in encoder.iterencode(_StreamArray(items))
+    if cache_keys is None:
+        cache_keys = get_experiment_fragment_keys(queryset, serializer_class)
+    fragments = cache.get_many(cache_keys.values())
+
+    missing_ids = [
+        experiment_id
+        for experiment_id, cache_key in cache_keys.items()
+        if cache_key not in fragments
+    ]
+    if missing_ids:
+        encoder = _drf_compatible_encoder()
+        rendered = {}
+        for experiment in queryset.filter(id__in=missing_ids).iterator(
+            chunk_size=chunk_size
+        ):
+            # Escaped like JSONRenderer does
+            fragment = (
+                encoder.encode(serializer_class(experiment).data)
+                .replace("\u2028", "\\u2028")
+                .replace("\u2029", "\\u2029")
+            )
+            rendered[cache_keys[experiment.id]] = fragment.encode("utf-8")
+
+        cache.set_many(rendered, timeout=settings.API_CACHE_WARMING_TTL)
+        fragments.update(rendered)
+        logger.info("Rendered %d fragments", len(rendered))
+
+    return [
+        fragments[cache_key]
+        for cache_key in cache_keys.values()
+        if cache_key in fragments
+    ]
+
+
+def stream_experiment_fragments(
+    queryset, serializer_class, cache_keys=None, chunk_size=DEFAULT_STREAM_CHUNK_SIZE
+):
+    """Yield the experiments of the queryset as a JSON list from their cached
+    fragments, a chunk of experiments at a time, so that only one chunk is held in
+    memory.
+    """
+    if cache_keys is None:
+        cache_keys = get_experiment_fragment_keys(queryset, serializer_class)
+    cache_key_items = list(cache_keys.items())
+
+    yield b"["
+    separator = b""
+    for start in range(0, len(cache_key_items), chunk_size):
+        fragments = get_experiment_fragments(
+            queryset,
+            serializer_class,
+            dict(cache_key_items[start : start + chunk_size]),
+            chunk_size,
+        )
+        if fragments:
+            yield separator + b",".join(fragments)
+            separator = b","
+    yield b"]"
+
+
+def render_experiment_fragments(queryset, serializer_class, cache_keys=None):
+    """Render the experiments of the queryset as a JSON list from their cached
+    fragments.
+    """
+    return b"".join(stream_experiment_fragments(queryset, serializer_class, cache_keys))
+
+
+def get_etag(parts):
+    """Strong ETag of the content, or of the cache keys it is assembled from."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else part.encode())
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def get_fragments_response_cache_key(etag):
+    digest = etag.strip('"')
+    return f"nimbus:api:response:{digest}"
+
+
+def compress_response(content):
+    """Compress a rendered response to store it in the cache along with its ETag."""
+    return {"etag": get_etag([content]), "gzip": gzip.compress(content, mtime=0)}
+
+
+def stream_compressed_fragments(queryset, serializer_class, cache_keys, gzipped):
+    """Yield the experiments of the queryset as a JSON list, gzipped or not, while
+    compressing it into the cache under its ETag once complete.
+    """
+    etag = get_etag(cache_keys.values())
+    compressor = zlib.compressobj(wbits=GZIP_WBITS)
+    compressed = []
+    for chunk in stream_experiment_fragments(queryset, serializer_class, cache_keys):
+        compressed_chunk = compressor.compress(chunk)
+        compressed.append(compressed_chunk)
+        yield compressed_chunk if gzipped else chunk
+
+    compressed_chunk = compressor.flush()
+    compressed.append(compressed_chunk)
+    if gzipped:
+        yield compressed_chunk
+
+    cache.set(
+        get_fragments_response_cache_key(etag),
+        {"etag": etag, "gzip": b"".join(compressed)},
+        timeout=settings.API_CACHE_DURATION,
     )
 
 
+def serve_compressed_response(
+    request, etag, content_type, get_compressed, stream_content=None, streaming=False
+):
+    """Answer 304 Not Modified if the client has the response with that ETag, or
+    else the compressed response from get_compressed(), decompressed if the client
+    does not accept gzip. When it is not cached, get_compressed() returns None and
+    the response is read from stream_content(gzipped), streamed if streaming.
+    """
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        gzipped = bool(ACCEPTS_GZIP.search(request.headers.get("Accept-Encoding", "")))
+        compressed = get_compressed()
+        if compressed is None:
+            response_class = StreamingHttpResponse if streaming else HttpResponse
+            response = response_class(stream_content(gzipped), content_type=content_type)
+        elif gzipped:
+            response = HttpResponse(compressed["gzip"], content_type=content_type)
+        else:
+            response = HttpResponse(
+                gzip.decompress(compressed["gzip"]), content_type=content_type
+            )
+
+        if gzipped:
+            response["Content-Encoding"] = "gzip"
+
+    response["ETag"] = etag
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
 def warm_api_cache(key_prefix, queryset, serializer_class, renderer=None, sort_key=None):
-    """Query the DB, serialize, and store the rendered response in the cache."""
+    """Render the fragments of the experiments that are missing from the cache,
+    and compress the unfiltered response. Endpoints with their own renderer have
+    their whole response stored instead.
+    """
     if renderer is None:
-        renderer = JSONRenderer()
+        cache_keys = get_experiment_fragment_keys(queryset, serializer_class)
+        compressed_size = sum(
+            len(chunk)
+            for chunk in stream_compressed_fragments(
+                queryset, serializer_class, cache_keys, gzipped=True
+            )
+        )
+        logger.info(
+            "Warmed fragments for %s (%d, %d compressed bytes)",
+            key_prefix,
+            len(cache_keys),
+            compressed_size,
+        )
+        return
 
+    experiments = queryset.all()
     if sort_key is not None:
-        qs = sorted(queryset.all(), key=sort_key, reverse=True)
-        data = serializer_class(qs, many=True).data
-        rendered = renderer.render(data)
-    else:
-        rendered = stream_render_queryset(queryset, serializer_class)
+        experiments = sorted(experiments, key=sort_key, reverse=True)
+    rendered = renderer.render(serializer_class(experiments, many=True).data)
+    compressed = compress_response(rendered)
 
     cache_key = get_api_cache_key(key_prefix)
-    cache.set(cache_key, rendered, timeout=settings.API_CACHE_WARMING_TTL)
-    logger.info("Warmed cache for %s (%d bytes)", key_prefix, len(rendered))
+    cache.set(cache_key, compressed, timeout=settings.API_CACHE_WARMING_TTL)
+    logger.info(
+        "Warmed cache for %s (%d bytes, %d compressed)",
+        key_prefix,
+        len(rendered),
+        len(compressed["gzip"]),
+    )
 
 
 class CachedListMixin:
     """Mixin that serves list responses from an application-level Redis cache.
 
-    Set ``cache_key_prefix`` on each viewset (e.g. "v6:experiments").
-    The Celery task ``warm_api_caches`` pre-populates the cache for unfiltered
-    requests.  Filtered requests are cached on first hit.
+    JSON list responses are assembled from a cached fragment per experiment, which
+    is invalidated whenever the experiment or its change log is saved, so only
+    changed experiments are serialized again. Responses of other renderers are
+    cached whole: set ``cache_fragments = False`` and ``cache_key_prefix`` (e.g.
+    "v5:csv") on the view. The Celery task ``warm_api_caches`` pre-populates the
+    cache for unfiltered requests, and filtered requests are cached on first hit.
+
+    Responses are cached gzipped with a strong ETag, and served gzipped to clients
+    that accept it or as 304 Not Modified to clients that send a matching
+    If-None-Match. A JSON list that is not cached yet is streamed a chunk of
+    experiments at a time, and cached once complete.
     """
 
     cache_key_prefix = ""
     cache_content_type = "application/json"
+    cache_fragments = True
 
     def list(self, request, *args, **kwargs):
+        if self.cache_fragments:
+            queryset = self.filter_queryset(self.get_queryset())
+            serializer_class = self.get_serializer_class()
+            cache_keys = get_experiment_fragment_keys(queryset, serializer_class)
+            etag = get_etag(cache_keys.values())
+            return serve_compressed_response(
+                request,
+                etag,
+                self.cache_content_type,
+                lambda: cache.get(get_fragments_response_cache_key(etag)),
+                lambda gzipped: stream_compressed_fragments(
+                    queryset, serializer_class, cache_keys, gzipped
+                ),
+                # A list of up to one chunk is as small as a streaming one would be
+                streaming=len(cache_keys) > DEFAULT_STREAM_CHUNK_SIZE,
+            )
+
         cache_key = get_api_cache_key(self.cache_key_prefix, request.query_params)
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return HttpResponse(cached, content_type=self.cache_content_type)
-
-        response = super().list(request, *args, **kwargs)
-        renderer = self.renderer_classes[0]()
-        rendered = renderer.render(response.data)
-        if isinstance(rendered, str):
-            rendered = rendered.encode("utf-8")
-        cache.set(cache_key, rendered, timeout=settings.API_CACHE_WARMING_TTL)
-        return response
+        compressed = cache.get(cache_key)
+        if compressed is None:
+            response = super().list(request, *args, **kwargs)
+            renderer = self.renderer_classes[0]()
+            rendered = renderer.render(response.data)
+            if isinstance(rendered, str):
+                rendered = rendered.encode("utf-8")
+            compressed = compress_response(rendered)
+            cache.set(cache_key, compressed, timeout=settings.API_CACHE_WARMING_TTL)
+
+        return serve_compressed_response(
+            request, compressed["etag"], self.cache_content_type, lambda: compressed
+        )
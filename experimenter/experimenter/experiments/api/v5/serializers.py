@@ -6,6 +6,7 @@ import logging
 import re
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, NotRequired, Optional, Self, TypedDict
 from urllib.parse import urlparse
 
@@ -72,6 +73,35 @@ class NestedRefResolver(jsonschema.RefResolver):
                     self.store[dfn["$id"]] = dfn
 
 
+class SchemaValidator:
+    """A JSON schema that has been parsed and checked against its metaschema."""
+
+    def __init__(self, schema: str):
+        self.schema = json.loads(schema)
+        self.validator_cls = jsonschema.validators.validator_for(self.schema)
+        self.validator_cls.check_schema(self.schema)
+
+    def best_match(self, obj: Any) -> Optional[jsonschema.ValidationError]:
+        """The error jsonschema.validate() would raise for obj, if any."""
+        # A ref resolver tracks its scope while validating, so each validation
+        # gets its own.
+        validator = self.validator_cls(
+            self.schema, resolver=NestedRefResolver(self.schema)
+        )
+        return jsonschema.exceptions.best_match(validator.iter_errors(obj))
+
+
+@lru_cache(maxsize=256)
+def get_schema_validator(schema: str) -> SchemaValidator:
+    """The validator for a schema, shared by every validation against that schema.
+
+    Checking a large schema against its metaschema takes far longer than
+    validating a value against it, so it is only done the first time the schema
+    is used.
+    """
+    return SchemaValidator(schema)
+
+
 class NimbusBranchScreenshotSerializer(serializers.ModelSerializer):
     id = serializers.IntegerField(required=False, allow_null=True)
     description = serializers.CharField(max_length=1024, required=False, allow_blank=True)
@@ -959,11 +989,11 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
         for schema_str, schemas in schema_versions.items():
             if schema_str is None:
                 continue
-            json_schema = json.loads(schema_str)
+            schema_validator = get_schema_validator(schema_str)
             versions = [s.version for s in schemas]
             if not localizations:
                 result.extend(
-                    self._validate_schema(json_value, json_schema, versions),
+                    self._validate_schema(json_value, schema_validator, versions),
                     suppress_errors,
                 )
             else:
@@ -977,7 +1007,7 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
                         continue
 
                     if schema_errors := self._validate_schema(
-                        substituted_value, json_schema, versions
+                        substituted_value, schema_validator, versions
                     ):
                         for schema_error, version in zip(schema_errors, versions):
                             err_msg = (
@@ -1144,11 +1174,13 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
     ) -> list[str]:
         errors = []
         schema_errors_versions = defaultdict(set)
-        for schema in schemas_in_range.schemas:
-            for fml_error in loader.get_fml_errors(
-                value, feature_config.slug, schema.version
-            ):
-                schema_errors_versions[fml_error.message].add(schema.version)
+        for versions, fml_errors in loader.get_fml_errors_by_manifest(
+            value,
+            feature_config.slug,
+            [schema.version for schema in schemas_in_range.schemas],
+        ):
+            for fml_error in fml_errors:
+                schema_errors_versions[fml_error.message].update(versions)
 
         if feature_config.slug == NimbusConstants.MOBILE_MESSAGING_SLUG:
             errors.extend(cls._validate_mobile_messaging(value))
@@ -1169,13 +1201,11 @@ class NimbusReviewSerializer(serializers.ModelSerializer):
     def _validate_schema(
         cls,
         obj: Any,
-        schema: dict[str, Any],
+        schema_validator: SchemaValidator,
         versions: list[Optional[NimbusFeatureVersion]],
     ) -> list[str]:
-        try:
-            jsonschema.validate(obj, schema, resolver=NestedRefResolver(schema))
-        except jsonschema.ValidationError as e:
-            err_msg = e.message
+        if (error := schema_validator.best_match(obj)) is not None:
+            err_msg = error.message
             return [
                 f"{err_msg} at version {version}" if version is not None else err_msg
                 for version in versions
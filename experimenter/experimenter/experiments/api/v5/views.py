@@ -19,7 +19,11 @@ from experimenter.experiments.api.v5.serializers import (
     NimbusExperimentCsvSerializer,
     NimbusExperimentYamlSerializer,
 )
-from experimenter.experiments.models import NimbusChangeLog, NimbusExperiment
+from experimenter.experiments.models import (
+    NimbusChangeLog,
+    NimbusExperiment,
+    NimbusExperimentPayload,
+)
 
 
 class NimbusExperimentCsvRenderer(CSVRenderer):
@@ -29,6 +33,7 @@ class NimbusExperimentCsvRenderer(CSVRenderer):
 
 class NimbusExperimentCsvListView(CachedListMixin, ListAPIView):
     cache_key_prefix = "v5:csv"
+    cache_fragments = False
     cache_content_type = "text/csv; charset=utf-8"
     queryset = (
         NimbusExperiment.objects.select_related("owner")
@@ -180,6 +185,7 @@ class YamlExportPagination(PageNumberPagination):
 
 class NimbusExperimentYamlListView(CachedListMixin, ListAPIView):
     cache_key_prefix = "v5:yaml"
+    cache_fragments = False
     cache_content_type = "text/yaml; charset=utf-8"
     queryset = (
         NimbusExperiment.objects.select_related("owner", "reference_branch", "parent")
@@ -195,6 +201,7 @@ class NimbusExperimentYamlListView(CachedListMixin, ListAPIView):
             "tags",
             "required_experiments",
             "excluded_experiments",
+            NimbusExperimentPayload.prefetch(NimbusExperimentPayload.Kind.RESULTS_DATA),
         )
         .filter(is_archived=False, status=NimbusExperiment.Status.COMPLETE)
         .order_by(F("_start_date").desc(nulls_last=True), "-id")
@@ -0,0 +1,44 @@
+"""
+Cache keys of the JSON fragment that the API renders for each experiment. They
+live outside the API package so that the models and change logs can invalidate
+the fragments of the experiments they save.
+"""
+
+import uuid
+
+from django.core.cache import cache
+
+
+def _get_fragment_version_key(experiment_id):
+    return f"nimbus:api:fragment-version:{experiment_id}"
+
+
+def get_fragment_cache_keys(serializer_class, experiment_ids):
+    """Map each experiment id to the cache key of its fragment rendered with
+    serializer_class. The keys change whenever the experiment is invalidated.
+    """
+    version_keys = {
+        experiment_id: _get_fragment_version_key(experiment_id)
+        for experiment_id in experiment_ids
+    }
+    versions = cache.get_many(version_keys.values())
+    new_versions = {
+        key: uuid.uuid4().hex for key in version_keys.values() if key not in versions
+    }
+    if new_versions:
+        cache.set_many(new_versions, timeout=None)
+        versions.update(new_versions)
+
+    serializer_name = f"{serializer_class.__module__}.{serializer_class.__name__}"
+    return {
+        experiment_id: (
+            f"nimbus:api:fragment:{serializer_name}:{experiment_id}:{versions[key]}"
+        )
+        for experiment_id, key in version_keys.items()
+    }
+
+
+def invalidate_experiment_fragments(experiment_ids):
+    cache.delete_many(
+        [_get_fragment_version_key(experiment_id) for experiment_id in experiment_ids]
+    )
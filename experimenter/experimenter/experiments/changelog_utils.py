@@ -1,21 +1,30 @@
 import json
 import uuid
 
+import markus
 from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import FieldDoesNotExist
-from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, models, transaction
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from rest_framework import serializers
 
+from experimenter.experiments.cache_utils import invalidate_experiment_fragments
 from experimenter.experiments.constants import ChangeEventType, RelationalFields
 from experimenter.experiments.models import (
     NimbusBranch,
     NimbusBranchFeatureValue,
     NimbusChangeLog,
+    NimbusChangeLogEntry,
     NimbusExperiment,
+    NimbusExperimentPayload,
     NimbusFeatureConfig,
+    NimbusVersionedSchema,
 )
 
+metrics = markus.get_metrics("experiments.changelog")
+
 
 class NimbusFeatureConfigChangeLogSerializer(serializers.ModelSerializer):
     schema = serializers.SerializerMethodField()
@@ -25,6 +34,9 @@ class NimbusFeatureConfigChangeLogSerializer(serializers.ModelSerializer):
         exclude = ("id",)
 
     def get_schema(self, obj):
+        # Prefetched by generate_nimbus_changelogs
+        if hasattr(obj, "unversioned_schemas"):
+            return obj.unversioned_schemas[0].schema
         return obj.schemas.get(version=None).schema
 
 
@@ -43,9 +55,11 @@ class NimbusBranchChangeLogSerializer(serializers.ModelSerializer):
 
 
 class NimbusChangeLogSerializer(serializers.ModelSerializer):
+    experiment_data = serializers.JSONField(read_only=True)
+
     class Meta:
         model = NimbusChangeLog
-        exclude = ("id", "experiment")
+        exclude = ("id", "experiment", "_experiment_data", "checkpoint", "removed_fields")
 
 
 class NimbusExperimentChangeLogSerializer(serializers.ModelSerializer):
@@ -59,19 +73,47 @@ class NimbusExperimentChangeLogSerializer(serializers.ModelSerializer):
         many=True, read_only=True, slug_field="email"
     )
     tags = serializers.SlugRelatedField(many=True, read_only=True, slug_field="name")
+    published_dto = serializers.JSONField(read_only=True)
+    results_data = serializers.JSONField(read_only=True)
+    monitoring_data = serializers.JSONField(read_only=True)
 
     class Meta:
         model = NimbusExperiment
-        exclude = ("id",)
+        exclude = (
+            "id",
+            "_kinto_collection",
+            "_has_displayable_results",
+            "_has_changelog_entries",
+        )
 
 
-def generate_nimbus_changelog(experiment, changed_by, message, changed_on=None):
-    latest_change = experiment.changes.latest_change()
-    experiment_data = dict(NimbusExperimentChangeLogSerializer(experiment).data)
+# Everything NimbusExperimentChangeLogSerializer reads from related tables
+CHANGELOG_PREFETCH_LOOKUPS = (
+    "parent",
+    "owner",
+    "reference_branch__feature_values",
+    "branches__feature_values",
+    "feature_configs__subscribers",
+    models.Prefetch(
+        "feature_configs__schemas",
+        queryset=NimbusVersionedSchema.objects.filter(version=None),
+        to_attr="unversioned_schemas",
+    ),
+    "projects",
+    "subscribers",
+    "tags",
+    "locales",
+    "countries",
+    "languages",
+    "required_experiments",
+    "excluded_experiments",
+    *(NimbusExperimentPayload.prefetch(kind) for kind in NimbusExperimentPayload.Kind),
+)
 
-    if not changed_on:
-        changed_on = timezone.now()
 
+def get_nimbus_changelog(
+    experiment, experiment_data, latest_change, changed_by, message, changed_on
+):
     old_status = None
     old_status_next = None
     old_publish_status = None
@@ -84,7 +126,7 @@ def generate_nimbus_changelog(experiment, changed_by, message, changed_on=None):
             "published_dto"
         ) != experiment_data.get("published_dto")
 
-    return NimbusChangeLog.objects.create(
+    return NimbusChangeLog(
         experiment=experiment,
         old_status=old_status,
         old_status_next=old_status_next,
@@ -100,6 +142,212 @@ def generate_nimbus_changelog(experiment, changed_by, message, changed_on=None):
     )
 
 
+def generate_nimbus_changelog(experiment, changed_by, message, changed_on=None):
+    latest_change = experiment.changes.latest_change()
+    experiment_data = dict(NimbusExperimentChangeLogSerializer(experiment).data)
+
+    if not changed_on:
+        changed_on = timezone.now()
+
+    changelog = get_nimbus_changelog(
+        experiment, experiment_data, latest_change, changed_by, message, changed_on
+    )
+    changelog.save()
+    return changelog
+
+
+def generate_nimbus_changelogs(experiments, changed_by, message):
+    """Create a change log for each of the experiments, as generate_nimbus_changelog
+    does, in a number of queries that does not grow with the number of experiments.
+    The number of queries is recorded as a metric.
+    """
+    # One change per experiment, so that none is diffed against another of the batch
+    experiments = list({experiment.id: experiment for experiment in experiments}.values())
+    if not experiments:
+        return []
+
+    num_queries = 0
+
+    def count_queries(execute, sql, params, many, context):
+        nonlocal num_queries
+        num_queries += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_queries), transaction.atomic():
+        changelogs = _create_nimbus_changelogs(experiments, changed_by, message)
+
+    # bulk_create does not send the post_save signal that invalidates them
+    experiment_ids = [experiment.id for experiment in experiments]
+    invalidate_experiment_fragments(experiment_ids)
+    transaction.on_commit(lambda: invalidate_experiment_fragments(experiment_ids))
+
+    metrics.histogram("generate_nimbus_changelogs.experiments", len(experiments))
+    metrics.histogram("generate_nimbus_changelogs.queries", num_queries)
+    return changelogs
+
+
+def _create_nimbus_changelogs(experiments, changed_by, message):
+    models.prefetch_related_objects(experiments, *CHANGELOG_PREFETCH_LOOKUPS)
+
+    experiment_ids = [experiment.id for experiment in experiments]
+    latest_changes = {
+        change.experiment_id: change
+        for change in NimbusChangeLog.objects.filter(experiment_id__in=experiment_ids)
+        .select_related("checkpoint")
+        .order_by("experiment_id", "-changed_on", "-id")
+        .distinct("experiment_id")
+    }
+    checkpoints = {
+        checkpoint.experiment_id: checkpoint
+        for checkpoint in NimbusChangeLog.objects.filter(
+            experiment_id__in=experiment_ids,
+            checkpoint=None,
+            _experiment_data__isnull=False,
+        )
+        .annotate(
+            num_deltas=Coalesce(
+                models.Subquery(
+                    NimbusChangeLog.objects.filter(checkpoint=models.OuterRef("pk"))
+                    .order_by()
+                    .values("checkpoint")
+                    .annotate(count=models.Count("id"))
+                    .values("count")
+                ),
+                0,
+            )
+        )
+        .order_by("experiment_id", "-changed_on", "-id")
+        .distinct("experiment_id")
+    }
+
+    changed_on = timezone.now()
+    changelogs = []
+    for experiment in experiments:
+        # Compare the values as they will be loaded from the database
+        experiment_data = json.loads(
+            json.dumps(
+                NimbusExperimentChangeLogSerializer(experiment).data,
+                cls=DjangoJSONEncoder,
+            )
+        )
+        changelog = get_nimbus_changelog(
+            experiment,
+            experiment_data,
+            latest_changes.get(experiment.id),
+            changed_by,
+            message,
+            changed_on,
+        )
+        changelog.store_as_delta_of(checkpoints.get(experiment.id))
+        changelogs.append(changelog)
+
+    NimbusChangeLog.objects.bulk_create(changelogs)
+
+    previous_changes = [latest_changes.get(experiment.id) for experiment in experiments]
+    related_names = get_related_names(
+        *(
+            get_changed_fields(changelog, previous)
+            for changelog, previous in zip(changelogs, previous_changes, strict=True)
+            if previous is not None
+        )
+    )
+    NimbusChangeLogEntry.objects.bulk_create(
+        entry
+        for changelog, previous in zip(changelogs, previous_changes, strict=True)
+        for entry in changelog.get_entries(previous, related_names)
+    )
+
+    return changelogs
+
+
+# Fields of the experiment data that are not shown in the history
+HIDDEN_CHANGE_FIELDS = ("_updated_date_time", "published_dto", "status_next")
+
+
+def get_formatted_changes(changelog, previous_changelog, related_names=None):
+    """Return the formatted changes that changelog made since previous_changelog,
+    or its creation when there is no previous change log. Names of related objects
+    are fetched with one query per related model, unless related_names is given.
+    """
+    if previous_changelog is None:
+        experiment = changelog.experiment
+        if experiment.parent:
+            message = (
+                f"{changelog.changed_by} "
+                f"cloned this experiment from {experiment.parent.name}"
+            )
+        else:
+            message = f"{changelog.changed_by} created this experiment"
+        return [
+            {
+                "event": ChangeEventType.CREATION.name,
+                "field_name": "",
+                "event_message": message,
+                "old_value": None,
+                "new_value": None,
+            }
+        ]
+
+    diff_fields = get_changed_fields(changelog, previous_changelog)
+    if related_names is None:
+        related_names = get_related_names(diff_fields)
+
+    changes = []
+    for field, field_diff in diff_fields.items():
+        change = get_formatted_change_object(
+            field, field_diff, changelog, None, related_names
+        )
+        if change is not None:
+            changes.append(
+                {
+                    "event": change["event"],
+                    "field_name": field,
+                    "event_message": change["event_message"],
+                    "old_value": change["old_value"],
+                    "new_value": change["new_value"],
+                }
+            )
+    return changes
+
+
+def get_changed_fields(changelog, previous_changelog):
+    current_data = changelog.experiment_data or {}
+    previous_data = previous_changelog.experiment_data or {}
+    return {
+        field: {
+            "old_value": previous_data.get(field),
+            "new_value": current_data.get(field),
+        }
+        for field in current_data
+        if (
+            field not in HIDDEN_CHANGE_FIELDS
+            and current_data[field] != previous_data.get(field)
+        )
+    }
+
+
+def get_related_names(*diff_fields):
+    # Maps the fields whose values are stored as reference keys to the (pk, name)
+    # pairs of the objects they reference, in the related model's ordering
+    related_pks = {}
+    for changed_fields in diff_fields:
+        for field_name, field_diff in changed_fields.items():
+            if field_name in RelationalFields.NATIVE_MODELS:
+                related_pks.setdefault(field_name, set()).update(
+                    field_diff.get("old_value") or [],
+                    field_diff.get("new_value") or [],
+                )
+
+    return {
+        field_name: list(
+            NimbusExperiment._meta.get_field(field_name)
+            .related_model.objects.filter(pk__in=pks)
+            .values_list("pk", "name")
+        )
+        for field_name, pks in related_pks.items()
+    }
+
+
 # This method generates a formatted change dictionary based on the provided field name,
 # field difference, changelog, and timestamp. It determines the event type based on the
 # field type and generates an appropriate event message.
@@ -108,7 +356,9 @@ def generate_nimbus_changelog(experiment, changed_by, message, changed_on=None):
 # human-readable values for relational fields, JSON fields, and arrays.
 
 
-def get_formatted_change_object(field_name, field_diff, changelog, timestamp):
+def get_formatted_change_object(
+    field_name, field_diff, changelog, timestamp, related_names=None
+):
     event_name = ChangeEventType.GENERAL.name
     try:
         field_instance = NimbusExperiment._meta.get_field(field_name)
@@ -132,18 +382,13 @@ def get_formatted_change_object(field_name, field_diff, changelog, timestamp):
         # to query the actual values of those fields using the reference keys
 
         if field_name in RelationalFields.NATIVE_MODELS:
-            field_model = field_instance.related_model
-            data = field_model.objects.all()
-            if old_value is not None:
-                values = list(
-                    data.filter(pk__in=old_value).values_list("name", flat=True)
-                )
-                old_value = values
-            else:
-                old_value = []
+            if related_names is None:
+                related_names = get_related_names({field_name: field_diff})
 
-            values = list(data.filter(pk__in=new_value).values_list("name", flat=True))
-            new_value = values
+            old_pks = set(old_value or [])
+            new_pks = set(new_value or [])
+            old_value = [name for pk, name in related_names[field_name] if pk in old_pks]
+            new_value = [name for pk, name in related_names[field_name] if pk in new_pks]
 
         old_value = json.dumps(old_value, indent=2)
         new_value = json.dumps(new_value, indent=2)
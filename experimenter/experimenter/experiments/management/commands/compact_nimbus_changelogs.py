@@ -0,0 +1,65 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from experimenter.experiments.models import NimbusChangeLog
+
+logger = logging.getLogger()
+
+
+class Command(BaseCommand):
+    help = "Store Nimbus change logs as checkpoints and deltas"
+
+    def handle(self, *args, **options):
+        experiment_ids = (
+            NimbusChangeLog.objects.order_by("experiment_id")
+            .values_list("experiment_id", flat=True)
+            .distinct()
+        )
+        for experiment_id in experiment_ids.iterator():
+            num_deltas = self.compact_changes(experiment_id)
+            logger.info(
+                f"Stored {num_deltas} change logs of experiment {experiment_id} as deltas"
+            )
+
+    @transaction.atomic
+    def compact_changes(self, experiment_id):
+        changes = list(
+            NimbusChangeLog.objects.filter(experiment_id=experiment_id)
+            .select_related("checkpoint")
+            .select_for_update(of=("self",))
+            .order_by("changed_on", "id")
+        )
+        experiment_data = [change.experiment_data for change in changes]
+
+        checkpoint = None
+        num_checkpoint_deltas = 0
+        num_deltas = 0
+        for change, data in zip(changes, experiment_data, strict=True):
+            change.checkpoint = None
+            change._experiment_data = data
+            change.removed_fields = []
+
+            if data is None:
+                continue
+
+            if (
+                checkpoint is not None
+                and num_checkpoint_deltas + 1 < NimbusChangeLog.CHECKPOINT_INTERVAL
+                and (
+                    delta := NimbusChangeLog.get_delta(checkpoint._experiment_data, data)
+                )
+            ):
+                change.checkpoint = checkpoint
+                change._experiment_data, change.removed_fields = delta
+                num_checkpoint_deltas += 1
+                num_deltas += 1
+            else:
+                checkpoint = change
+                num_checkpoint_deltas = 0
+
+        NimbusChangeLog.objects.bulk_update(
+            changes, ["checkpoint", "_experiment_data", "removed_fields"], batch_size=100
+        )
+        return num_deltas
@@ -0,0 +1,25 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from experimenter.experiments.models import NimbusChangeLog, NimbusExperiment
+
+logger = logging.getLogger()
+
+
+class Command(BaseCommand):
+    help = "Generate the history entries of existing Nimbus change logs"
+
+    def handle(self, *args, **options):
+        experiments = (
+            NimbusExperiment.objects.filter(
+                id__in=NimbusChangeLog.objects.values("experiment_id")
+            )
+            .select_related("parent")
+            .order_by("id")
+        )
+        for experiment in experiments.iterator():
+            num_entries = experiment.generate_changelog_entries()
+            logger.info(
+                f"Generated {num_entries} history entries of experiment {experiment.id}"
+            )
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+from experimenter.experiments.constants import (
+    NimbusConstants,
+    TargetingMultipleKintoCollectionsError,
+)
+
+
+def populate_kinto_collection(apps, schema_editor):
+    NimbusExperiment = apps.get_model("experiments", "NimbusExperiment")
+
+    experiments_to_update = []
+    for experiment in NimbusExperiment.objects.prefetch_related("feature_configs"):
+        application_config = NimbusConstants.APPLICATION_CONFIGS.get(
+            experiment.application
+        )
+        if application_config is None:
+            continue
+
+        try:
+            experiment._kinto_collection = (
+                application_config.get_kinto_collection_for_feature_ids(
+                    [fc.slug for fc in experiment.feature_configs.all()],
+                    experiment.firefox_min_version,
+                )
+            )
+        except TargetingMultipleKintoCollectionsError:
+            continue
+        experiments_to_update.append(experiment)
+
+    if experiments_to_update:
+        NimbusExperiment.objects.bulk_update(
+            experiments_to_update, ["_kinto_collection"], batch_size=500
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiments', '0337_nimbusexperiment_sizing_data'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='nimbusexperiment',
+            name='_kinto_collection',
+            field=models.CharField(blank=True, max_length=255, null=True, verbose_name='Kinto Collection'),
+        ),
+        migrations.RunPython(populate_kinto_collection, migrations.RunPython.noop),
+    ]
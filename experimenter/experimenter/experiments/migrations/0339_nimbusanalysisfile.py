@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiments', '0338_nimbusexperiment_kinto_collection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NimbusAnalysisFile',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Path of the file in the analysis bucket', max_length=1024)),
+                ('generation', models.BigIntegerField(help_text='Storage generation of the file when it was last ingested')),
+                ('etag', models.CharField(help_text='ETag of the ingested file', max_length=255)),
+                ('updated', models.DateTimeField(help_text='When the ingested file was last modified in the analysis bucket')),
+                ('experiment', models.ForeignKey(help_text='Experiment the analysis file belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='analysis_files', to='experiments.nimbusexperiment')),
+            ],
+            options={
+                'verbose_name': 'Nimbus Analysis File',
+                'verbose_name_plural': 'Nimbus Analysis Files',
+                'unique_together': {('experiment', 'name')},
+            },
+        ),
+    ]
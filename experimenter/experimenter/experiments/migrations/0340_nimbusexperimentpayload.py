@@ -0,0 +1,113 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:45
+
+import hashlib
+import json
+import zlib
+
+import django.db.models.deletion
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import migrations, models
+
+PAYLOAD_FIELDS = ("published_dto", "results_data", "monitoring_data")
+
+
+def has_displayable_results(results_data):
+    if results_data and "v3" in results_data:
+        results_data = results_data["v3"]
+        for window in ["overall", "weekly", "daily"]:
+            if results_data.get(window):
+                for base in ["enrollments", "exposures"]:
+                    if results_data[window].get(base, {}).get("all") is not None:
+                        return True
+    return False
+
+
+def move_payloads(apps, schema_editor):
+    NimbusExperiment = apps.get_model("experiments", "NimbusExperiment")
+    NimbusExperimentPayload = apps.get_model("experiments", "NimbusExperimentPayload")
+
+    payloads = []
+    displayable_ids = []
+    for experiment_id, *values in NimbusExperiment.objects.values_list(
+        "id", *PAYLOAD_FIELDS
+    ).iterator(chunk_size=100):
+        for kind, data in zip(PAYLOAD_FIELDS, values, strict=True):
+            if data is None:
+                continue
+            encoded = json.dumps(
+                data, cls=DjangoJSONEncoder, sort_keys=True, separators=(",", ":")
+            ).encode()
+            payloads.append(
+                NimbusExperimentPayload(
+                    experiment_id=experiment_id,
+                    kind=kind,
+                    data=zlib.compress(encoded),
+                    content_hash=hashlib.sha256(encoded).hexdigest(),
+                )
+            )
+
+        if has_displayable_results(values[PAYLOAD_FIELDS.index("results_data")]):
+            displayable_ids.append(experiment_id)
+
+        if len(payloads) >= 100:
+            NimbusExperimentPayload.objects.bulk_create(payloads)
+            payloads = []
+
+    NimbusExperimentPayload.objects.bulk_create(payloads)
+    NimbusExperiment.objects.filter(id__in=displayable_ids).update(
+        _has_displayable_results=True
+    )
+
+
+def restore_payloads(apps, schema_editor):
+    NimbusExperiment = apps.get_model("experiments", "NimbusExperiment")
+    NimbusExperimentPayload = apps.get_model("experiments", "NimbusExperimentPayload")
+
+    for payload in NimbusExperimentPayload.objects.iterator(chunk_size=100):
+        NimbusExperiment.objects.filter(id=payload.experiment_id).update(
+            **{payload.kind: json.loads(zlib.decompress(payload.data))}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiments', '0339_nimbusanalysisfile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='nimbusexperiment',
+            name='_has_displayable_results',
+            field=models.BooleanField(default=False, help_text='Whether the stored results have data to show, for list views', verbose_name='Has Displayable Results'),
+        ),
+        migrations.CreateModel(
+            name='NimbusExperimentPayload',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('published_dto', 'Published Dto'), ('results_data', 'Results Data'), ('monitoring_data', 'Monitoring Data')], max_length=255)),
+                ('data', models.BinaryField(help_text='zlib compressed JSON')),
+                ('content_hash', models.CharField(help_text='SHA-256 of the canonical JSON', max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('experiment', models.ForeignKey(help_text='Experiment the payload belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='payloads', to='experiments.nimbusexperiment')),
+            ],
+            options={
+                'verbose_name': 'Nimbus Experiment Payload',
+                'verbose_name_plural': 'Nimbus Experiment Payloads',
+                'unique_together': {('experiment', 'kind')},
+            },
+        ),
+        migrations.RunPython(move_payloads, restore_payloads),
+        migrations.RemoveField(
+            model_name='nimbusexperiment',
+            name='monitoring_data',
+        ),
+        migrations.RemoveField(
+            model_name='nimbusexperiment',
+            name='published_dto',
+        ),
+        migrations.RemoveField(
+            model_name='nimbusexperiment',
+            name='results_data',
+        ),
+    ]
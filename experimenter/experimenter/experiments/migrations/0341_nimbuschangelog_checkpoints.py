@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:53
+
+import django.contrib.postgres.fields
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiments', '0340_nimbusexperimentpayload'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='nimbuschangelog',
+            old_name='experiment_data',
+            new_name='_experiment_data',
+        ),
+        migrations.AlterField(
+            model_name='nimbuschangelog',
+            name='_experiment_data',
+            field=models.JSONField(blank=True, db_column='experiment_data', encoder=django.core.serializers.json.DjangoJSONEncoder, help_text="The serialized experiment, or only the fields that differ from the checkpoint's when a checkpoint is set", null=True, verbose_name='Experiment Data'),
+        ),
+        migrations.AddField(
+            model_name='nimbuschangelog',
+            name='checkpoint',
+            field=models.ForeignKey(blank=True, help_text='Change log holding the full experiment data this change is based on', null=True, on_delete=django.db.models.deletion.RESTRICT, related_name='deltas', to='experiments.nimbuschangelog'),
+        ),
+        migrations.AddField(
+            model_name='nimbuschangelog',
+            name='removed_fields',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, help_text="Fields of the checkpoint's experiment data that this change lacks", size=None),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:56
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiments', '0341_nimbuschangelog_checkpoints'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NimbusChangeLogEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('changed_on', models.DateTimeField(help_text='When the change log was made')),
+                ('event', models.CharField(choices=[('GENERAL', 'GENERAL'), ('CREATION', 'CREATION'), ('DETAILED', 'DETAILED'), ('STATE', 'STATE'), ('BOOLEAN', 'BOOLEAN')], max_length=255)),
+                ('field_name', models.CharField(blank=True, max_length=255)),
+                ('event_message', models.TextField()),
+                ('old_value', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('new_value', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('changelog', models.ForeignKey(help_text='Change log this entry describes', on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='experiments.nimbuschangelog')),
+                ('experiment', models.ForeignKey(help_text='Experiment of the change log, to page through its history', on_delete=django.db.models.deletion.CASCADE, related_name='changelog_entries', to='experiments.nimbusexperiment')),
+            ],
+            options={
+                'verbose_name': 'Nimbus Experiment Change Log Entry',
+                'verbose_name_plural': 'Nimbus Experiment Change Log Entries',
+                'ordering': ('-changed_on', '-id'),
+                'indexes': [models.Index(fields=['experiment', '-changed_on', '-id'], name='changelog_entry_history_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiments', '0342_nimbuschangelogentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NimbusFeatureManifestFile',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(help_text='Path of the manifest or schema file under the feature manifests', max_length=1024, unique=True)),
+                ('content_hash', models.CharField(help_text='SHA-256 of the file when it was last loaded', max_length=64)),
+                ('schema_paths', models.JSONField(blank=True, default=list, help_text='Paths of the schema files the features of a manifest reference')),
+            ],
+            options={
+                'verbose_name': 'Nimbus Feature Manifest File',
+                'verbose_name_plural': 'Nimbus Feature Manifest Files',
+            },
+        ),
+    ]
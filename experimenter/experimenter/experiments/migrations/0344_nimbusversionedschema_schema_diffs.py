@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiments', '0343_nimbusfeaturemanifestfile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='nimbusversionedschema',
+            name='previous_schema',
+            field=models.ForeignKey(blank=True, help_text='Schema of the previous version of the feature', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='experiments.nimbusversionedschema'),
+        ),
+        migrations.AddField(
+            model_name='nimbusversionedschema',
+            name='schema_change_size',
+            field=models.CharField(blank=True, help_text="Size label of the changes from the previous version's schema", max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='nimbusversionedschema',
+            name='schema_changes',
+            field=models.IntegerField(blank=True, help_text="Number of changes from the previous version's schema", null=True),
+        ),
+    ]
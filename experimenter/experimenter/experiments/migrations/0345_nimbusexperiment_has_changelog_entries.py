@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiments', '0344_nimbusversionedschema_schema_diffs'),
+    ]
+
+    operations = [
+        # Existing experiments may have change logs from before their entries
+        # were stored, new experiments store them as each change log is saved
+        migrations.AddField(
+            model_name='nimbusexperiment',
+            name='_has_changelog_entries',
+            field=models.BooleanField(default=False, help_text='Whether the history entries of every change log are stored, false for experiments whose change logs predate the entries until they are generated', verbose_name='Has Change Log Entries'),
+        ),
+        migrations.AlterField(
+            model_name='nimbusexperiment',
+            name='_has_changelog_entries',
+            field=models.BooleanField(default=True, help_text='Whether the history entries of every change log are stored, false for experiments whose change logs predate the entries until they are generated', verbose_name='Has Change Log Entries'),
+        ),
+    ]
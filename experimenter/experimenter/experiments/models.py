@@ -1,6 +1,10 @@
+import contextlib
 import copy
 import datetime
+import hashlib
 import json
+import logging
+import zlib
 from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -12,6 +16,7 @@ from urllib.parse import urlencode, urljoin
 from uuid import uuid4
 
 import packaging
+from deepdiff import DeepDiff
 from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.models import User
@@ -20,9 +25,11 @@ from django.contrib.postgres.fields import ArrayField
 from django.core.files.base import ContentFile
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Case, F, Prefetch, Q, QuerySet, When
 from django.db.models.constraints import UniqueConstraint
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -30,6 +37,7 @@ from django.utils.text import slugify
 from prose.fields import RichTextField
 
 from experimenter.base.models import Country, Language, Locale
+from experimenter.experiments.cache_utils import invalidate_experiment_fragments
 from experimenter.experiments.constants import (
     ENROLLMENT_FUNNEL_STAGES,
     BucketRandomizationUnit,
@@ -43,17 +51,39 @@ from experimenter.experiments.monitoring_utils import (
     check_unenrollment_spike,
 )
 from experimenter.jetstream.results_manager import ExperimentResultsManager
-from experimenter.nimbus_ui.constants import NimbusUIConstants
+from experimenter.nimbus_ui.constants import SCHEMA_DIFF_SIZE_CONFIG, NimbusUIConstants
 from experimenter.projects.models import Project
 from experimenter.targeting.constants import TargetingConstants
 
+logger = logging.getLogger(__name__)
+
 
 class FilterMixin:
     def has_filter(self, query_filter):
         return type(self).objects.filter(id=self.id).filter(query_filter).exists()
 
 
-class NimbusExperimentManager(models.Manager["NimbusExperiment"]):
+class NimbusExperimentQuerySet(QuerySet["NimbusExperiment"]):
+    def update(self, **kwargs):
+        if not set(self.model.KINTO_COLLECTION_FIELDS).intersection(kwargs):
+            return super().update(**kwargs)
+
+        # The stored collection is computed in Python, so it is refreshed for
+        # the updated experiments afterwards
+        with transaction.atomic(using=self.db):
+            experiment_ids = list(self.values_list("id", flat=True))
+            updated = super().update(**kwargs)
+            self.model.objects.filter(id__in=experiment_ids).update_kinto_collections()
+        return updated
+
+    def update_kinto_collections(self):
+        experiments = list(self.prefetch_related("feature_configs"))
+        for experiment in experiments:
+            experiment._kinto_collection = experiment.get_stored_kinto_collection()
+        self.model.objects.bulk_update(experiments, ["_kinto_collection"])
+
+
+class NimbusExperimentManager(models.Manager.from_queryset(NimbusExperimentQuerySet)):
     def with_related(self):
         return (
             super()
@@ -82,6 +112,9 @@ class NimbusExperimentManager(models.Manager["NimbusExperiment"]):
                 "feature_configs",
                 "documentation_links",
                 "tags",
+                NimbusExperimentPayload.prefetch(
+                    NimbusExperimentPayload.Kind.PUBLISHED_DTO
+                ),
             )
         )
 
@@ -89,7 +122,7 @@ class NimbusExperimentManager(models.Manager["NimbusExperiment"]):
         return super().get_queryset().order_by("-_updated_date_time")
 
     def for_collection(self, query, collection):
-        return (e for e in query if e.kinto_collection == collection)
+        return query.filter(_kinto_collection=collection)
 
     def launch_queue(self, applications, collection):
         return self.for_collection(
@@ -375,22 +408,6 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
         on_delete=models.SET_NULL,
         verbose_name="Reference Branch",
     )
-    published_dto = models.JSONField[dict[str, Any]](
-        "Published DTO", encoder=DjangoJSONEncoder, blank=True, null=True
-    )
-    results_data = models.JSONField[dict[str, Any]](
-        "Results Data", encoder=DjangoJSONEncoder, blank=True, null=True
-    )
-    monitoring_data = models.JSONField[dict[str, Any]](
-        "Monitoring Data",
-        encoder=DjangoJSONEncoder,
-        blank=True,
-        null=True,
-        help_text=(
-            "JSON data from ETL for monitoring "
-            "(enrollment/unenrollment counts, reasons, branches)"
-        ),
-    )
     monitoring_data_updated_at = models.DateTimeField(
         "Monitoring Data Last Updated",
         blank=True,
@@ -454,6 +471,22 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
     _enrollment_end_date = models.DateField("Enrollment End Date", blank=True, null=True)
     _computed_end_date = models.DateField("Computed End Date", blank=True, null=True)
     _end_date = models.DateField("End Date", blank=True, null=True)
+    _kinto_collection = models.CharField(
+        "Kinto Collection", max_length=255, blank=True, null=True
+    )
+    _has_displayable_results = models.BooleanField(
+        "Has Displayable Results",
+        default=False,
+        help_text="Whether the stored results have data to show, for list views",
+    )
+    _has_changelog_entries = models.BooleanField(
+        "Has Change Log Entries",
+        default=True,
+        help_text=(
+            "Whether the history entries of every change log are stored, false for "
+            "experiments whose change logs predate the entries until they are generated"
+        ),
+    )
 
     prevent_pref_conflicts = models.BooleanField(
         "Prevent Preference Conflicts Flag", blank=True, null=True, default=False
@@ -555,6 +588,10 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
         default=None,
     )
 
+    # The fields besides feature_configs that the stored kinto collection
+    # depends on
+    KINTO_COLLECTION_FIELDS = ("application", "firefox_min_version")
+
     class Meta:
         verbose_name = "Nimbus Experiment"
         verbose_name_plural = "Nimbus Experiments"
@@ -647,7 +684,139 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
             except Exception:
                 pass
 
-        super().save(*args, **kwargs)
+        # Changes to the feature configs are handled by
+        # update_stored_kinto_collection
+        update_fields = kwargs.get("update_fields")
+        kinto_collection_fields = {
+            field: value
+            for field, value in self._get_kinto_collection_fields().items()
+            if update_fields is None or field in update_fields
+        }
+        stored_kinto_collection_fields = self.__dict__.get(
+            "_stored_kinto_collection_fields", {}
+        )
+        if self.pk is None or any(
+            field not in stored_kinto_collection_fields
+            or stored_kinto_collection_fields[field] != value
+            for field, value in kinto_collection_fields.items()
+        ):
+            self._kinto_collection = self.get_stored_kinto_collection()
+            if update_fields is not None:
+                update_fields = [*update_fields, "_kinto_collection"]
+                kwargs["update_fields"] = update_fields
+
+        # Payloads live in their own table, so they are written after the row
+        changed_payloads = self.__dict__.get("_changed_payloads", set())
+        if update_fields is not None:
+            payload_kinds = changed_payloads.intersection(update_fields)
+            kwargs["update_fields"] = [
+                field
+                for field in update_fields
+                if field not in NimbusExperimentPayload.Kind.values
+            ]
+            if NimbusExperimentPayload.Kind.RESULTS_DATA in payload_kinds:
+                kwargs["update_fields"].append("_has_displayable_results")
+        else:
+            payload_kinds = set(changed_payloads)
+
+        # A new experiment has no stored payloads to clear
+        stored_kinds = {
+            kind
+            for kind in payload_kinds
+            if not self._state.adding or self._get_payload(kind) is not None
+        }
+
+        if stored_kinds:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                NimbusExperimentPayload.objects.save_payloads([self], stored_kinds)
+        else:
+            super().save(*args, **kwargs)
+
+        changed_payloads.difference_update(payload_kinds)
+        self._stored_kinto_collection_fields = {
+            **stored_kinto_collection_fields,
+            **kinto_collection_fields,
+        }
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._stored_kinto_collection_fields = instance._get_kinto_collection_fields()
+        return instance
+
+    def _get_kinto_collection_fields(self):
+        return {
+            field: self.__dict__[field]
+            for field in self.KINTO_COLLECTION_FIELDS
+            if field in self.__dict__
+        }
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        payload_kinds = NimbusExperimentPayload.Kind.values
+        if fields is not None:
+            payload_kinds = [kind for kind in payload_kinds if kind in fields]
+            fields = [field for field in fields if field not in payload_kinds]
+
+        for kind in payload_kinds:
+            self.__dict__.get("_payloads", {}).pop(kind, None)
+            self.__dict__.get("_changed_payloads", set()).discard(kind)
+            self.__dict__.pop(f"prefetched_{kind}", None)
+
+        if fields is None or fields:
+            super().refresh_from_db(
+                using=using, fields=fields, from_queryset=from_queryset
+            )
+            self._stored_kinto_collection_fields = {
+                **self.__dict__.get("_stored_kinto_collection_fields", {}),
+                **{
+                    field: value
+                    for field, value in self._get_kinto_collection_fields().items()
+                    if fields is None or field in fields
+                },
+            }
+
+    def _get_payload(self, kind):
+        payloads = self.__dict__.setdefault("_payloads", {})
+        if kind not in payloads:
+            payloads[kind] = NimbusExperimentPayload.objects.load_payload(self, kind)
+        return payloads[kind]
+
+    def _set_payload(self, kind, data):
+        self.__dict__.setdefault("_payloads", {})[kind] = data
+        self.__dict__.setdefault("_changed_payloads", set()).add(kind)
+
+    def get_payload_hash(self, kind):
+        return NimbusExperimentPayload.objects.load_content_hash(self, kind)
+
+    @property
+    def published_dto(self):
+        return self._get_payload(NimbusExperimentPayload.Kind.PUBLISHED_DTO)
+
+    @published_dto.setter
+    def published_dto(self, published_dto):
+        self._set_payload(NimbusExperimentPayload.Kind.PUBLISHED_DTO, published_dto)
+
+    @property
+    def results_data(self):
+        return self._get_payload(NimbusExperimentPayload.Kind.RESULTS_DATA)
+
+    @results_data.setter
+    def results_data(self, results_data):
+        self._set_payload(NimbusExperimentPayload.Kind.RESULTS_DATA, results_data)
+        self._has_displayable_results = self.get_has_displayable_results(results_data)
+
+    @property
+    def results_data_hash(self):
+        return self.get_payload_hash(NimbusExperimentPayload.Kind.RESULTS_DATA)
+
+    @property
+    def monitoring_data(self):
+        return self._get_payload(NimbusExperimentPayload.Kind.MONITORING_DATA)
+
+    @monitoring_data.setter
+    def monitoring_data(self, monitoring_data):
+        self._set_payload(NimbusExperimentPayload.Kind.MONITORING_DATA, monitoring_data)
 
     def apply_lifecycle_state(self, lifecycle_state):
         for name, value in lifecycle_state.value.items():
@@ -1240,8 +1409,8 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
                     new_status=self.Status.LIVE,
                     new_status_next=None,
                     new_publish_status=self.PublishStatus.IDLE,
-                    experiment_data__isnull=False,
-                    experiment_data__is_paused=True,
+                    _experiment_data__isnull=False,
+                    _experiment_data__is_paused=True,
                 )
                 .order_by("changed_on")
                 .values_list("changed_on")
@@ -2408,9 +2577,15 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
 
     @property
     def has_displayable_results(self):
-        # True if self.results_data has weekly or overall results
-        if self.results_data and "v3" in self.results_data:
-            results_data = self.results_data["v3"]
+        # Kept up to date when results_data is set so that list views don't have
+        # to load the results
+        return self._has_displayable_results
+
+    @staticmethod
+    def get_has_displayable_results(results_data):
+        # True if results_data has weekly or overall results
+        if results_data and "v3" in results_data:
+            results_data = results_data["v3"]
             for window in ["overall", "weekly", "daily"]:
                 if results_data.get(window):
                     for base in ["enrollments", "exposures"]:
@@ -2660,6 +2835,8 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
         from experimenter.experiments.changelog_utils import generate_nimbus_changelog
 
         cloned = copy.copy(self)
+        cloned._payloads = {}
+        cloned._changed_payloads = set()
 
         cloned.id = None
         cloned.name = name
@@ -2769,72 +2946,50 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
 
         return cloned
 
-    def get_changelogs_by_date(self):
-        # Inline import to prevent circular import
-        from experimenter.experiments.changelog_utils import get_formatted_change_object
+    def get_changelog_entries(self, before=None):
+        # Newest first, only those older than the entry before when it is given
+        entries = self.changelog_entries.select_related("changelog__changed_by")
+        if before is not None:
+            entries = entries.filter(
+                Q(changed_on__lt=before.changed_on)
+                | Q(changed_on=before.changed_on, id__lt=before.id)
+            )
+        return entries
+
+    @transaction.atomic
+    def generate_changelog_entries(self):
+        # Replaces the history entries of every change log, each diffed against the
+        # change log before it
+        changes = self.changes.select_related("checkpoint", "changed_by").order_by(
+            "changed_on", "id"
+        )
 
-        changes_by_date = defaultdict(list)
-        date_option = "%I:%M %p %Z"
-        date_option = "%I:%M %p %Z"
-        changelogs = list(
-            self.changes.order_by("-changed_on").prefetch_related("changed_by")
-        )
-
-        for index, changelog in enumerate(changelogs[:-1]):
-            current_data = changelog.experiment_data
-            previous_data = changelogs[index + 1].experiment_data
-            local_timestamp = timezone.localtime(changelog.changed_on)
-            timestamp = local_timestamp.strftime(date_option)
-            local_timestamp = timezone.localtime(changelog.changed_on)
-            timestamp = local_timestamp.strftime(date_option)
-
-            diff_fields = {
-                field: {
-                    "old_value": previous_data.get(field),
-                    "new_value": current_data.get(field),
-                }
-                for field in current_data
-                if (
-                    field != "_updated_date_time"
-                    and field != "published_dto"
-                    and field != "status_next"
-                    and current_data[field] != previous_data.get(field)
-                )
-            }
+        entries = []
+        previous = None
+        for change in changes:
+            entries.extend(change.get_entries(previous))
+            previous = change
 
-            for field, field_diff in diff_fields.items():
-                change = get_formatted_change_object(
-                    field, field_diff, changelog, timestamp
-                )
+        self.changelog_entries.all().delete()
+        NimbusChangeLogEntry.objects.bulk_create(entries, batch_size=500)
 
-                changes_by_date[changelog.changed_on.date()].append(change)
+        self._has_changelog_entries = True
+        NimbusExperiment.objects.filter(id=self.id).update(_has_changelog_entries=True)
+        return len(entries)
 
-        if changelogs:
-            creation_log = changelogs[-1]
-            first_local_timestamp = timezone.localtime(creation_log.changed_on)
-            first_timestamp = first_local_timestamp.strftime(date_option)
-            if self.parent:
-                message = (
-                    f"{creation_log.changed_by} "
-                    f"cloned this experiment from {self.parent.name}"
-                )
-            else:
-                message = f"{creation_log.changed_by} created this experiment"
-            change = {
-                "event": ChangeEventType.CREATION.name,
-                "event_message": message,
-                "changed_by": creation_log.changed_by,
-                "timestamp": first_timestamp,
-            }
-            changes_by_date[creation_log.changed_on.date()].append(change)
+    def get_changelogs_by_date(self, entries=None):
+        if entries is None:
+            entries = self.get_changelog_entries()
+
+        changes_by_date = defaultdict(list)
+        for entry in entries:
+            changes_by_date[entry.changed_on.date()].append(entry.get_formatted_change())
 
-        transformed_changelogs = [
+        return [
             {"date": date, "changes": changes}
             for date, changes in changes_by_date.items()
         ]
 
-        return transformed_changelogs
-
     @property
     def get_channel_display(self):
         if self.is_desktop and self.channels:
@@ -2857,6 +3012,26 @@ class NimbusExperiment(NimbusConstants, TargetingConstants, FilterMixin, models.
         if self.application_config:
             return self.application_config.get_kinto_collection_for_experiment(self)
 
+    def get_stored_kinto_collection(self):
+        # Stored in _kinto_collection so that the kinto queues can filter by
+        # collection in the database. Feature configs can only be related once
+        # the experiment is saved, and experiments targeting several collections
+        # are never queued.
+        try:
+            if self.pk is None:
+                if self.application_config:
+                    return self.application_config.get_kinto_collection_for_feature_ids(
+                        [], self.firefox_min_version
+                    )
+            else:
+                return self.kinto_collection
+        except TargetingMultipleKintoCollectionsError as e:
+            logger.warning(
+                f"Experiment {self.slug} targets multiple kinto collections and "
+                f"will not be queued: {e.target_collections}"
+            )
+            return None
+
     @property
     def conclusion_recommendation_labels(self):
         return [
@@ -3505,6 +3680,92 @@ class NimbusVersionedSchemaManager(models.Manager["NimbusVersionedSchema"]):
             return self.order_by("-version__major", "-version__minor", "-version__patch")
         return self.order_by("version__major", "version__minor", "version__patch")
 
+    def update_schema_diffs(self, feature_config_ids, changed_ids=()):
+        """
+        Stores how much each schema of the given feature configs changed from the
+        previous version's schema. Only schemas that are new, whose previous
+        version is now a different schema, or that (or whose previous schema)
+        are in changed_ids are diffed again.
+        """
+        schemas = list(
+            self.filter(feature_config_id__in=feature_config_ids)
+            .only("feature_config", "previous_schema", "schema_changes")
+            .order_by(
+                "feature_config_id", "version__major", "version__minor", "version__patch"
+            )
+        )
+
+        stale = []
+        for previous, schema in zip([None, *schemas], schemas, strict=False):
+            if previous is not None and previous.feature_config_id != (
+                schema.feature_config_id
+            ):
+                previous = None
+
+            previous_id = previous.id if previous is not None else None
+            if (
+                schema.schema_changes is None
+                or schema.previous_schema_id != previous_id
+                or schema.id in changed_ids
+                or previous_id in changed_ids
+            ):
+                schema.previous_schema_id = previous_id
+                stale.append(schema)
+
+        diffed_ids = {
+            schema_id
+            for schema in stale
+            for schema_id in (schema.id, schema.previous_schema_id)
+            if schema_id is not None
+        }
+        documents = {}
+        for schema_id, document in self.filter(id__in=diffed_ids).values_list(
+            "id", "schema"
+        ):
+            # Unparsable schemas are left out so that their diffs are labelled invalid
+            with contextlib.suppress(json.JSONDecodeError):
+                documents[schema_id] = json.loads(document) if document else None
+
+        thresholds = SCHEMA_DIFF_SIZE_CONFIG["thresholds"]
+        for schema in stale:
+            if schema.previous_schema_id is None:
+                schema.schema_changes = 0
+                schema.schema_change_size = "first_version"
+                continue
+
+            if schema.id not in documents or schema.previous_schema_id not in documents:
+                schema.schema_changes = 0
+                schema.schema_change_size = "invalid"
+                continue
+
+            diff = DeepDiff(
+                documents[schema.previous_schema_id],
+                documents[schema.id],
+                ignore_order=True,
+            )
+            schema.schema_changes = sum(
+                len(diff.get(change, ()))
+                for change in (
+                    "dictionary_item_added",
+                    "dictionary_item_removed",
+                    "values_changed",
+                    "type_changes",
+                )
+            )
+
+            if schema.schema_changes == 0:
+                schema.schema_change_size = "no_changes"
+            elif schema.schema_changes <= thresholds["small"]:
+                schema.schema_change_size = "small"
+            elif schema.schema_changes <= thresholds["medium"]:
+                schema.schema_change_size = "medium"
+            else:
+                schema.schema_change_size = "large"
+
+        self.bulk_update(
+            stale, ["previous_schema", "schema_changes", "schema_change_size"]
+        )
+
 
 class NimbusVersionedSchema(models.Model):
     feature_config = models.ForeignKey(
@@ -3526,6 +3787,28 @@ class NimbusVersionedSchema(models.Model):
     is_early_startup = models.BooleanField(null=False, default=False)
     has_remote_schema = models.BooleanField(null=False, default=False)
 
+    # How the schema changed from the previous version's schema, kept up to date
+    # by NimbusVersionedSchema.objects.update_schema_diffs().
+    previous_schema = models.ForeignKey(
+        "self",
+        related_name="+",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        help_text="Schema of the previous version of the feature",
+    )
+    schema_changes = models.IntegerField(
+        null=True,
+        blank=True,
+        help_text="Number of changes from the previous version's schema",
+    )
+    schema_change_size = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        help_text="Size label of the changes from the previous version's schema",
+    )
+
     objects = NimbusVersionedSchemaManager()
 
     class Meta:
@@ -3550,9 +3833,32 @@ class NimbusVersionedSchema(models.Model):
         return as_str
 
 
+class NimbusFeatureManifestFile(models.Model):
+    path = models.CharField(
+        max_length=1024,
+        unique=True,
+        help_text="Path of the manifest or schema file under the feature manifests",
+    )
+    content_hash = models.CharField(
+        max_length=64, help_text="SHA-256 of the file when it was last loaded"
+    )
+    schema_paths = models.JSONField[list[str]](
+        default=list,
+        blank=True,
+        help_text="Paths of the schema files the features of a manifest reference",
+    )
+
+    class Meta:
+        verbose_name = "Nimbus Feature Manifest File"
+        verbose_name_plural = "Nimbus Feature Manifest Files"
+
+    def __str__(self):  # pragma: no cover
+        return self.path
+
+
 class NimbusChangeLogManager(models.Manager["NimbusChangeLog"]):
     def latest_change(self):
-        return self.all().order_by("-changed_on").first()
+        return self.all().select_related("checkpoint").order_by("-changed_on").first()
 
     def latest_review_request(self):
         return (
@@ -3609,13 +3915,44 @@ class NimbusChangeLog(FilterMixin, models.Model):
         max_length=255, choices=NimbusExperiment.PublishStatus.choices
     )
     message = models.TextField(blank=True, null=True)
-    experiment_data = models.JSONField[dict[str, Any]](
-        encoder=DjangoJSONEncoder, blank=True, null=True
+    _experiment_data = models.JSONField[dict[str, Any]](
+        "Experiment Data",
+        encoder=DjangoJSONEncoder,
+        blank=True,
+        null=True,
+        db_column="experiment_data",
+        help_text=(
+            "The serialized experiment, or only the fields that differ from the "
+            "checkpoint's when a checkpoint is set"
+        ),
+    )
+    checkpoint = models.ForeignKey(
+        "self",
+        related_name="deltas",
+        on_delete=models.RESTRICT,
+        blank=True,
+        null=True,
+        help_text="Change log holding the full experiment data this change is based on",
+    )
+    removed_fields = ArrayField(
+        models.CharField(max_length=255),
+        default=list,
+        blank=True,
+        help_text="Fields of the checkpoint's experiment data that this change lacks",
     )
     published_dto_changed = models.BooleanField(default=False)
 
     objects = NimbusChangeLogManager()
 
+    # Changes only store the fields that differ from the latest checkpoint, so that
+    # large fields like published_dto and the feature schemas are not copied into
+    # every change. A change is stored in full again once the checkpoint has this
+    # many deltas.
+    CHECKPOINT_INTERVAL = 20
+
+    # Stored in every delta so that they can be filtered on in the database
+    QUERYABLE_FIELDS = ("is_paused", "is_rollout_dirty")
+
     class Meta:
         verbose_name = "Nimbus Experiment Change Log"
         verbose_name_plural = "Nimbus Experiment Change Logs"
@@ -3629,7 +3966,7 @@ class NimbusChangeLog(FilterMixin, models.Model):
         IS_UPDATE_REVIEW_REQUEST = Q(
             old_publish_status=NimbusExperiment.PublishStatus.IDLE,
             new_publish_status=NimbusExperiment.PublishStatus.REVIEW,
-            experiment_data__is_rollout_dirty=True,
+            _experiment_data__is_rollout_dirty=True,
         )
         IS_REJECTION = Q(
             Q(old_status=F("new_status")),
@@ -3653,7 +3990,7 @@ class NimbusChangeLog(FilterMixin, models.Model):
             ),
             new_publish_status__in=(NimbusExperiment.PublishStatus.IDLE,),
             published_dto_changed=False,
-            experiment_data__is_rollout_dirty=True,
+            _experiment_data__is_rollout_dirty=True,
         )
         IS_TIMEOUT = Q(
             Q(old_status=F("new_status")),
@@ -3661,7 +3998,7 @@ class NimbusChangeLog(FilterMixin, models.Model):
             new_publish_status=NimbusExperiment.PublishStatus.REVIEW,
         )
         IS_APPROVED_PAUSE = Q(
-            experiment_data__is_paused=True,
+            _experiment_data__is_paused=True,
             new_status=NimbusExperiment.Status.LIVE,
             new_status_next=None,
             new_publish_status=NimbusExperiment.PublishStatus.IDLE,
@@ -3692,6 +4029,239 @@ class NimbusChangeLog(FilterMixin, models.Model):
             f"by {self.changed_by} on {self.changed_on}"
         )
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        if adding and self.checkpoint_id is None:
+            self.store_as_delta()
+
+        replaced_experiment_data = self.__dict__.pop("_replaced_experiment_data", None)
+        experiment_data_changed = self.__dict__.pop("_experiment_data_changed", False)
+
+        with transaction.atomic():
+            saved_changed_on = None
+            if not adding:
+                saved_changed_on = (
+                    NimbusChangeLog.objects.filter(id=self.id)
+                    .values_list("changed_on", flat=True)
+                    .first()
+                )
+
+            super().save(*args, **kwargs)
+
+            if replaced_experiment_data is not None:
+                self.rebase_deltas(replaced_experiment_data)
+
+            # A change inserted, moved or edited changes what the change after it is
+            # diffed against, both where it is now and where it was before
+            if adding:
+                self.store_entries()
+                stale_changes = [self.get_following_change(self.changed_on)]
+            elif experiment_data_changed or saved_changed_on != self.changed_on:
+                stale_changes = [self, self.get_following_change(self.changed_on)]
+                if saved_changed_on not in (None, self.changed_on):
+                    stale_changes.append(self.get_following_change(saved_changed_on))
+            else:
+                stale_changes = []
+
+            for change in {c.id: c for c in stale_changes if c is not None}.values():
+                change.entries.all().delete()
+                change.store_entries()
+
+    @property
+    def experiment_data(self):
+        if self.checkpoint_id is None or self._experiment_data is None:
+            return self._experiment_data
+        return self.apply_delta(
+            self.checkpoint._experiment_data, self._experiment_data, self.removed_fields
+        )
+
+    @experiment_data.setter
+    def experiment_data(self, experiment_data):
+        # The deltas of a checkpoint are rebased on its new data when it is saved
+        if (
+            self.pk is not None
+            and self.checkpoint_id is None
+            and "_replaced_experiment_data" not in self.__dict__
+        ):
+            self.__dict__["_replaced_experiment_data"] = self._experiment_data
+
+        self.__dict__["_experiment_data_changed"] = True
+        self._experiment_data = experiment_data
+        self.checkpoint = None
+        self.removed_fields = []
+
+    @staticmethod
+    def apply_delta(experiment_data, delta, removed_fields):
+        experiment_data = {
+            field: value
+            for field, value in experiment_data.items()
+            if field not in removed_fields
+        }
+        experiment_data.update(delta)
+        return experiment_data
+
+    @classmethod
+    def get_delta(cls, base, experiment_data):
+        # Returns the fields of experiment_data that differ from base and the
+        # fields of base it lacks, or None if it is better stored in full
+        if not isinstance(base, dict) or not isinstance(experiment_data, dict):
+            return None
+
+        delta = {
+            field: value
+            for field, value in experiment_data.items()
+            if field in cls.QUERYABLE_FIELDS or field not in base or base[field] != value
+        }
+        removed_fields = [field for field in base if field not in experiment_data]
+
+        if len(delta) + len(removed_fields) > len(experiment_data) / 2:
+            return None
+
+        return delta, removed_fields
+
+    def store_as_delta(self):
+        if self._experiment_data is None:
+            return
+
+        self.store_as_delta_of(
+            NimbusChangeLog.objects.filter(
+                experiment_id=self.experiment_id,
+                checkpoint=None,
+                _experiment_data__isnull=False,
+            )
+            .annotate(num_deltas=models.Count("deltas"))
+            .order_by("-changed_on", "-id")
+            .first()
+        )
+
+    def store_as_delta_of(self, checkpoint):
+        # The checkpoint is annotated with its number of deltas
+        if checkpoint is None or checkpoint.num_deltas + 1 >= self.CHECKPOINT_INTERVAL:
+            return
+
+        # Compare the values as they will be loaded from the database
+        experiment_data = json.loads(
+            json.dumps(self._experiment_data, cls=DjangoJSONEncoder)
+        )
+        if delta := self.get_delta(checkpoint._experiment_data, experiment_data):
+            self.checkpoint = checkpoint
+            self._experiment_data, self.removed_fields = delta
+
+    def get_following_change(self, changed_on):
+        # The change log that would follow this one if it were made at changed_on
+        return (
+            NimbusChangeLog.objects.filter(
+                Q(changed_on__gt=changed_on) | Q(changed_on=changed_on, id__gt=self.id),
+                experiment_id=self.experiment_id,
+            )
+            .exclude(id=self.id)
+            .select_related("checkpoint", "changed_by")
+            .order_by("changed_on", "id")
+            .first()
+        )
+
+    def store_entries(self):
+        previous = (
+            NimbusChangeLog.objects.filter(
+                Q(changed_on__lt=self.changed_on)
+                | Q(changed_on=self.changed_on, id__lt=self.id),
+                experiment_id=self.experiment_id,
+            )
+            .select_related("checkpoint")
+            .order_by("-changed_on", "-id")
+            .first()
+        )
+        NimbusChangeLogEntry.objects.bulk_create(self.get_entries(previous))
+
+    def get_entries(self, previous, related_names=None):
+        # Inline import to prevent circular import
+        from experimenter.experiments.changelog_utils import get_formatted_changes
+
+        # Entries are listed newest first by id, so the changes are stored in
+        # reverse to be listed in the order they were found
+        return [
+            NimbusChangeLogEntry(
+                changelog=self,
+                experiment_id=self.experiment_id,
+                changed_on=self.changed_on,
+                **change,
+            )
+            for change in reversed(get_formatted_changes(self, previous, related_names))
+        ]
+
+    def rebase_deltas(self, replaced_experiment_data):
+        deltas = list(self.deltas.all())
+        base = json.loads(json.dumps(self._experiment_data, cls=DjangoJSONEncoder))
+
+        for change in deltas:
+            experiment_data = self.apply_delta(
+                replaced_experiment_data, change._experiment_data, change.removed_fields
+            )
+            if delta := self.get_delta(base, experiment_data):
+                change._experiment_data, change.removed_fields = delta
+            else:
+                change.checkpoint = None
+                change._experiment_data = experiment_data
+                change.removed_fields = []
+
+        NimbusChangeLog.objects.bulk_update(
+            deltas, ["checkpoint", "_experiment_data", "removed_fields"]
+        )
+
+
+class NimbusChangeLogEntry(models.Model):
+    changelog = models.ForeignKey(
+        NimbusChangeLog,
+        related_name="entries",
+        on_delete=models.CASCADE,
+        help_text="Change log this entry describes",
+    )
+    experiment = models.ForeignKey(
+        NimbusExperiment,
+        related_name="changelog_entries",
+        on_delete=models.CASCADE,
+        help_text="Experiment of the change log, to page through its history",
+    )
+    changed_on = models.DateTimeField(help_text="When the change log was made")
+    event = models.CharField(
+        max_length=255, choices=[(event.name, event.value) for event in ChangeEventType]
+    )
+    field_name = models.CharField(max_length=255, blank=True)
+    event_message = models.TextField()
+    old_value = models.JSONField(encoder=DjangoJSONEncoder, blank=True, null=True)
+    new_value = models.JSONField(encoder=DjangoJSONEncoder, blank=True, null=True)
+
+    class Meta:
+        verbose_name = "Nimbus Experiment Change Log Entry"
+        verbose_name_plural = "Nimbus Experiment Change Log Entries"
+        ordering = ("-changed_on", "-id")
+        indexes = [
+            models.Index(
+                fields=("experiment", "-changed_on", "-id"),
+                name="changelog_entry_history_idx",
+            )
+        ]
+
+    def __str__(self):  # pragma: no cover
+        return self.event_message
+
+    def get_formatted_change(self):
+        change = {
+            "event": self.event,
+            "event_message": self.event_message,
+            "changed_by": self.changelog.changed_by,
+            "timestamp": timezone.localtime(self.changed_on).strftime("%I:%M %p %Z"),
+        }
+        if self.event != ChangeEventType.CREATION.name:
+            change.update(
+                {
+                    "id": str(self.id),
+                    "old_value": self.old_value,
+                    "new_value": self.new_value,
+                }
+            )
+        return change
+
 
 class NimbusEmail(models.Model):
     experiment = models.ForeignKey(
@@ -3748,6 +4318,182 @@ class NimbusAlert(models.Model):
         ).exists()
 
 
+class NimbusExperimentPayloadManager(models.Manager["NimbusExperimentPayload"]):
+    def load_payload(self, experiment, kind):
+        if experiment.pk is None:
+            return None
+
+        prefetched = experiment.__dict__.get(f"prefetched_{kind}")
+        if prefetched is not None:
+            return prefetched[0].get_data() if prefetched else None
+
+        payload = self.filter(experiment=experiment, kind=kind).only("data").first()
+        return payload.get_data() if payload is not None else None
+
+    def load_content_hash(self, experiment, kind):
+        if experiment.pk is None:
+            return None
+
+        prefetched = experiment.__dict__.get(f"prefetched_{kind}")
+        if prefetched is not None:
+            return prefetched[0].content_hash if prefetched else None
+
+        return (
+            self.filter(experiment=experiment, kind=kind)
+            .values_list("content_hash", flat=True)
+            .first()
+        )
+
+    def save_payloads(self, experiments, kinds):
+        payloads = []
+        cleared = Q()
+        for experiment in experiments:
+            for kind in kinds:
+                data = getattr(experiment, kind)
+                if data is None:
+                    cleared |= Q(experiment=experiment, kind=kind)
+                else:
+                    payloads.append(
+                        self.model(experiment=experiment, kind=kind).set_data(data)
+                    )
+
+        if cleared:
+            self.filter(cleared).delete()
+
+        if payloads:
+            self.bulk_create(
+                payloads,
+                update_conflicts=True,
+                unique_fields=["experiment", "kind"],
+                update_fields=["data", "content_hash", "updated_at"],
+            )
+
+
+class NimbusExperimentPayload(models.Model):
+    class Kind(models.TextChoices):
+        PUBLISHED_DTO = "published_dto"
+        RESULTS_DATA = "results_data"
+        MONITORING_DATA = "monitoring_data"
+
+    experiment = models.ForeignKey(
+        NimbusExperiment,
+        on_delete=models.CASCADE,
+        related_name="payloads",
+        help_text="Experiment the payload belongs to",
+    )
+    kind = models.CharField(max_length=255, choices=Kind.choices)
+    data = models.BinaryField(help_text="zlib compressed JSON")
+    content_hash = models.CharField(
+        max_length=64, help_text="SHA-256 of the canonical JSON"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = NimbusExperimentPayloadManager()
+
+    class Meta:
+        verbose_name = "Nimbus Experiment Payload"
+        verbose_name_plural = "Nimbus Experiment Payloads"
+        unique_together = (("experiment", "kind"),)
+
+    def __str__(self):
+        return f"{self.experiment.slug} - {self.kind}"
+
+    @staticmethod
+    def encode(data):
+        return json.dumps(
+            data, cls=DjangoJSONEncoder, sort_keys=True, separators=(",", ":")
+        ).encode()
+
+    @classmethod
+    def get_content_hash(cls, data):
+        if data is None:
+            return None
+        return hashlib.sha256(cls.encode(data)).hexdigest()
+
+    @classmethod
+    def prefetch(cls, kind):
+        return Prefetch(
+            "payloads",
+            queryset=cls.objects.filter(kind=kind),
+            to_attr=f"prefetched_{kind}",
+        )
+
+    def get_data(self):
+        return json.loads(zlib.decompress(self.data))
+
+    def set_data(self, data):
+        encoded = self.encode(data)
+        self.data = zlib.compress(encoded)
+        self.content_hash = hashlib.sha256(encoded).hexdigest()
+        return self
+
+
+class NimbusAnalysisFile(models.Model):
+    experiment = models.ForeignKey(
+        NimbusExperiment,
+        on_delete=models.CASCADE,
+        related_name="analysis_files",
+        help_text="Experiment the analysis file belongs to",
+    )
+    name = models.CharField(
+        max_length=1024, help_text="Path of the file in the analysis bucket"
+    )
+    generation = models.BigIntegerField(
+        help_text="Storage generation of the file when it was last ingested"
+    )
+    etag = models.CharField(max_length=255, help_text="ETag of the ingested file")
+    updated = models.DateTimeField(
+        help_text="When the ingested file was last modified in the analysis bucket"
+    )
+
+    class Meta:
+        verbose_name = "Nimbus Analysis File"
+        verbose_name_plural = "Nimbus Analysis Files"
+        unique_together = (("experiment", "name"),)
+
+    def __str__(self):
+        return f"{self.experiment.slug} - {self.name}"
+
+
+@receiver(m2m_changed, sender=NimbusExperiment.feature_configs.through)
+def update_stored_kinto_collection(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == "pre_clear":
+        # post_clear has no pk_set, and the experiments are no longer related
+        # to the feature config by then
+        instance._cleared_experiment_ids = list(
+            instance.nimbusexperiment_set.values_list("id", flat=True)
+        )
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if reverse:
+        experiment_ids = (
+            instance.__dict__.pop("_cleared_experiment_ids", [])
+            if action == "post_clear"
+            else pk_set
+        )
+        NimbusExperiment.objects.filter(id__in=experiment_ids).update_kinto_collections()
+    else:
+        instance._kinto_collection = instance.get_stored_kinto_collection()
+        NimbusExperiment.objects.filter(pk=instance.pk).update(
+            _kinto_collection=instance._kinto_collection
+        )
+
+
+@receiver(post_save, sender=NimbusExperiment)
+@receiver(post_delete, sender=NimbusExperiment)
+@receiver(post_save, sender=NimbusChangeLog)
+def invalidate_api_fragments(sender, instance, **kwargs):
+    experiment_id = instance.id if sender is NimbusExperiment else instance.experiment_id
+    invalidate_experiment_fragments([experiment_id])
+
+    # Again once committed, so that a fragment rendered from the old data in
+    # between is dropped too
+    transaction.on_commit(lambda: invalidate_experiment_fragments([experiment_id]))
+
+
 def make_sticky_targeting_expression(is_desktop, is_rollout, expressions, slug):
     if is_desktop:
         if is_rollout:
@@ -0,0 +1,80 @@
+import json
+from unittest import mock
+
+import jsonschema
+from django.test import TestCase
+
+from experimenter.experiments.api.v5.serializers import (
+    NestedRefResolver,
+    get_schema_validator,
+)
+
+SCHEMA = json.dumps(
+    {
+        "$id": "resource://test/schema.json",
+        "type": "object",
+        "properties": {
+            "enabled": {"type": "boolean"},
+            "message": {"$ref": "resource://test/schema.json#/$defs/Message"},
+        },
+        "$defs": {
+            "Message": {
+                "type": "object",
+                "properties": {"text": {"type": "string"}},
+                "required": ["text"],
+            },
+        },
+        "additionalProperties": False,
+    }
+)
+
+
+class TestSchemaValidator(TestCase):
+    def setUp(self):
+        get_schema_validator.cache_clear()
+        self.addCleanup(get_schema_validator.cache_clear)
+
+    def test_best_match_returns_none_for_valid_value(self):
+        validator = get_schema_validator(SCHEMA)
+
+        self.assertIsNone(
+            validator.best_match({"enabled": True, "message": {"text": "hi"}})
+        )
+
+    def test_best_match_returns_the_error_validate_raises(self):
+        validator = get_schema_validator(SCHEMA)
+        schema = json.loads(SCHEMA)
+
+        for value in (
+            {"enabled": "yes"},
+            {"message": {}},
+            {"other": 1},
+            [],
+        ):
+            with self.assertRaises(jsonschema.ValidationError) as e:
+                jsonschema.validate(value, schema, resolver=NestedRefResolver(schema))
+
+            self.assertEqual(validator.best_match(value).message, e.exception.message)
+
+    def test_schema_is_only_checked_once(self):
+        with mock.patch.object(
+            jsonschema.Draft202012Validator,
+            "check_schema",
+            wraps=jsonschema.Draft202012Validator.check_schema,
+        ) as check_schema:
+            validator = get_schema_validator(SCHEMA)
+
+            self.assertIs(get_schema_validator(json.dumps(json.loads(SCHEMA))), validator)
+            self.assertIsNone(validator.best_match({"enabled": False}))
+            self.assertIsNotNone(validator.best_match({"enabled": 1}))
+
+        check_schema.assert_called_once()
+
+    def test_invalid_schema_is_not_cached(self):
+        schema = json.dumps({"type": "not-a-type"})
+
+        for _ in range(2):
+            with self.assertRaises(jsonschema.SchemaError):
+                get_schema_validator(schema)
+
+        self.assertEqual(get_schema_validator.cache_info().currsize, 0)
@@ -4,13 +4,20 @@ import json
 import yaml
 from django.conf import settings
 from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from experimenter.base.models import Country, Language, Locale
+from experimenter.experiments.api.cache import get_etag
 from experimenter.experiments.api.v5.serializers import NimbusExperimentCsvSerializer
 from experimenter.experiments.api.v5.views import NimbusExperimentCsvRenderer
-from experimenter.experiments.models import NimbusExperiment, Tag
+from experimenter.experiments.models import (
+    NimbusExperiment,
+    NimbusExperimentPayload,
+    Tag,
+)
 from experimenter.experiments.tests.api.v5.test_serializers.mixins import (
     MockFmlErrorMixin,
 )
@@ -115,6 +122,24 @@ class TestNimbusExperimentCsvListView(TestCase):
         )
         self.assertEqual(csv_data, expected_csv_data)
 
+    def test_get_answers_not_modified_for_cached_etag(self):
+        NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+        )
+        url = reverse("nimbus-experiments-csv")
+
+        response = self.client.get(
+            url, **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"}
+        )
+        self.assertEqual(response["ETag"], get_etag([response.content]))
+
+        response = self.client.get(
+            url,
+            headers={"if-none-match": response["ETag"]},
+            **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+        self.assertEqual(response.status_code, 304)
+
 
 @override_settings(
     CACHES={
@@ -153,6 +178,28 @@ class TestNimbusExperimentYamlListView(TestCase):
         self.assertIsNone(parsed["next"])
         self.assertIsNone(parsed["previous"])
 
+    def test_results_data_is_loaded_in_one_query(self):
+        for slug in ("experiment-1", "experiment-2", "experiment-3"):
+            NimbusExperimentFactory.create_with_lifecycle(
+                NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
+                slug=slug,
+                results_data={"v3": {"overall": {}}},
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(len(self._get_yaml()), 3)
+
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in queries
+                    if NimbusExperimentPayload._meta.db_table in query["sql"]
+                ]
+            ),
+            1,
+        )
+
     def test_sorted_by_start_date_descending(self):
         application = NimbusExperiment.Application.DESKTOP
         feature_config = NimbusFeatureConfigFactory.create(application=application)
@@ -1,17 +1,21 @@
+import gzip
 import json
+from unittest import mock
 
 from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
-from experimenter.experiments.api.cache import get_api_cache_key
 from experimenter.experiments.api.v6.serializers import NimbusExperimentSerializer
+from experimenter.experiments.cache_utils import get_fragment_cache_keys
+from experimenter.experiments.changelog_utils import generate_nimbus_changelogs
 from experimenter.experiments.models import NimbusExperiment
 from experimenter.experiments.tasks import warm_api_caches
 from experimenter.experiments.tests.factories import (
     NimbusExperimentFactory,
     NimbusFeatureConfigFactory,
 )
+from experimenter.openidc.tests.factories import UserFactory
 
 
 @override_settings(
@@ -40,7 +44,13 @@ class NimbusExperimentFilterMixin:
     def assert_returned_slugs(self, response, expected_slugs):
         self.assertEqual(response.status_code, 200)
 
-        recipes = json.loads(response.content)
+        # Lists longer than a chunk are streamed when they are not cached yet
+        content = (
+            b"".join(response.streaming_content)
+            if response.streaming
+            else response.content
+        )
+        recipes = json.loads(content)
         self.assertEqual(
             sorted(recipe["slug"] for recipe in recipes),
             sorted(expected_slugs),
@@ -313,41 +323,143 @@ class TestNimbusExperimentFirstRunViewSet(NimbusExperimentFilterMixin, CachedVie
 class TestCachedListBehavior(CachedViewSetTest):
     """Tests for the CachedListMixin serving responses from the warm cache."""
 
-    def test_list_serves_from_warmed_cache(self):
+    def test_list_serves_cached_fragments(self):
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
             slug="cached-experiment",
+            name="Cached Experiment",
         )
 
         warm_api_caches()
 
-        # Delete the experiment so the cache is the only source of data
-        experiment.delete()
+        # Bypass the signals so the cached fragment is the only source of the name
+        NimbusExperiment.objects.filter(id=experiment.id).update(name="Updated")
 
         response = self.client.get(reverse("nimbus-experiment-rest-v6-list"))
         self.assertEqual(response.status_code, 200)
 
         recipes = json.loads(response.content)
-        slugs = [recipe["slug"] for recipe in recipes]
-        self.assertIn("cached-experiment", slugs)
+        self.assertEqual(
+            [recipe["userFacingName"] for recipe in recipes], ["Cached Experiment"]
+        )
 
-    def test_list_populates_cache_on_miss(self):
-        NimbusExperimentFactory.create_with_lifecycle(
+    def test_list_populates_fragments_on_miss(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
             slug="fresh-experiment",
         )
+        cache_keys = get_fragment_cache_keys(NimbusExperimentSerializer, [experiment.id])
+        self.assertEqual(cache.get_many(cache_keys.values()), {})
+
+        response = self.client.get(reverse("nimbus-experiment-rest-v6-list"))
+        self.assertEqual(response.status_code, 200)
+
+        cached = cache.get(cache_keys[experiment.id])
+        self.assertEqual(json.loads(cached)["slug"], "fresh-experiment")
+        self.assertEqual(response.content, b"[" + cached + b"]")
+
+    def test_list_shows_saved_changes(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            slug="changed-experiment",
+            name="Old Name",
+        )
+        self.client.get(reverse("nimbus-experiment-rest-v6-list"))
+
+        experiment.name = "New Name"
+        experiment.save()
+
+        response = self.client.get(reverse("nimbus-experiment-rest-v6-list"))
+        recipes = json.loads(response.content)
+        self.assertEqual([recipe["userFacingName"] for recipe in recipes], ["New Name"])
+
+    def test_list_shows_changes_recorded_in_changelogs(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            slug="changed-experiment",
+            name="Old Name",
+        )
+        self.client.get(reverse("nimbus-experiment-rest-v6-list"))
+
+        NimbusExperiment.objects.filter(id=experiment.id).update(name="New Name")
+        generate_nimbus_changelogs([experiment], UserFactory.create(), "test message")
+
+        response = self.client.get(reverse("nimbus-experiment-rest-v6-list"))
+        recipes = json.loads(response.content)
+        self.assertEqual([recipe["userFacingName"] for recipe in recipes], ["New Name"])
+
+    def test_list_drops_deleted_experiments(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            slug="deleted-experiment",
+        )
+        warm_api_caches()
 
-        cache_key = get_api_cache_key("v6:experiments")
-        self.assertIsNone(cache.get(cache_key))
+        experiment.delete()
 
         response = self.client.get(reverse("nimbus-experiment-rest-v6-list"))
+        self.assertEqual(json.loads(response.content), [])
+
+    def test_list_answers_not_modified_for_current_etag(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            slug="etag-experiment",
+        )
+        url = reverse("nimbus-experiment-rest-v6-list")
+
+        response = self.client.get(url)
+        etag = response["ETag"]
+
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+        experiment.name = "New Name"
+        experiment.save()
+
+        response = self.client.get(url, headers={"if-none-match": etag})
         self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_serves_gzip_when_accepted(self):
+        NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            slug="gzip-experiment",
+        )
+        url = reverse("nimbus-experiment-rest-v6-list")
+
+        response = self.client.get(url)
+        self.assertNotIn("Content-Encoding", response)
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+        compressed = self.client.get(url, headers={"accept-encoding": "gzip, br"})
+        self.assertEqual(compressed.status_code, 200)
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertEqual(compressed["ETag"], response["ETag"])
+        self.assertEqual(gzip.decompress(compressed.content), response.content)
+
+    @mock.patch("experimenter.experiments.api.cache.DEFAULT_STREAM_CHUNK_SIZE", 1)
+    def test_list_streams_uncached_lists_larger_than_a_chunk(self):
+        for slug in ("streamed-experiment-1", "streamed-experiment-2"):
+            NimbusExperimentFactory.create_with_lifecycle(
+                NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING, slug=slug
+            )
+        url = reverse("nimbus-experiment-rest-v6-list")
+
+        response = self.client.get(url, headers={"accept-encoding": "gzip"})
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        content = gzip.decompress(b"".join(response.streaming_content))
+        self.assertEqual(
+            [recipe["slug"] for recipe in json.loads(content)],
+            ["streamed-experiment-1", "streamed-experiment-2"],
+        )
 
-        cached = cache.get(cache_key)
-        self.assertIsNotNone(cached)
-        data = json.loads(cached)
-        slugs = [exp["slug"] for exp in data]
-        self.assertIn("fresh-experiment", slugs)
+        # Cached once the stream is complete
+        response = self.client.get(url)
+        self.assertFalse(response.streaming)
+        self.assertEqual(response.content, content)
 
     def test_list_caches_filtered_requests_separately(self):
         NimbusExperimentFactory.create_with_lifecycle(
@@ -34,7 +34,13 @@ class NimbusExperimentFilterMixin:
     def assert_returned_slugs(self, response, expected_slugs):
         self.assertEqual(response.status_code, 200)
 
-        recipes = json.loads(response.content)
+        # Lists longer than a chunk are streamed when they are not cached yet
+        content = (
+            b"".join(response.streaming_content)
+            if response.streaming
+            else response.content
+        )
+        recipes = json.loads(content)
         self.assertEqual(
             sorted(recipe["slug"] for recipe in recipes),
             sorted(expected_slugs),
@@ -1,16 +1,20 @@
 import datetime
 from unittest import mock
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from experimenter.experiments.api.v6.serializers import NimbusExperimentSerializer
 from experimenter.experiments.changelog_utils import (
     NimbusExperimentChangeLogSerializer,
     generate_nimbus_changelog,
+    generate_nimbus_changelogs,
     get_formatted_change_object,
+    get_formatted_changes,
 )
-from experimenter.experiments.models import NimbusExperiment
+from experimenter.experiments.models import NimbusChangeLog, NimbusExperiment
 from experimenter.experiments.tests.factories import (
     NimbusChangeLogFactory,
     NimbusExperimentFactory,
@@ -472,3 +476,104 @@ class TestGenerateNimbusChangeLog(TestCase):
         )
 
         self.assertIsNone(change_object)
+
+
+class TestGenerateNimbusChangeLogs(TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.user = UserFactory.create()
+        self.mock_metrics = mock.patch(
+            "experimenter.experiments.changelog_utils.metrics"
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def create_experiments(self, count):
+        return [
+            NimbusExperimentFactory.create_with_lifecycle(
+                NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+                projects=[ProjectFactory.create()],
+                tags=[TagFactory.create()],
+            )
+            for _ in range(count)
+        ]
+
+    def test_generates_same_changelogs_as_generate_nimbus_changelog(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            published_dto={"id": "experiment", "test": False},
+        )
+        experiment.published_dto = {"id": "experiment", "test": True}
+        experiment.save()
+        latest_change = experiment.changes.latest_change()
+
+        (change,) = generate_nimbus_changelogs(
+            [experiment, experiment], self.user, "test message"
+        )
+
+        change = NimbusChangeLog.objects.select_related("checkpoint").get(id=change.id)
+        self.assertEqual(change.message, "test message")
+        self.assertEqual(change.changed_by, self.user)
+        self.assertEqual(change.old_status, latest_change.new_status)
+        self.assertEqual(change.old_publish_status, latest_change.new_publish_status)
+        self.assertEqual(change.new_status, experiment.status)
+        self.assertEqual(change.new_publish_status, experiment.publish_status)
+        self.assertTrue(change.published_dto_changed)
+        self.assertIsNotNone(change.checkpoint)
+        self.assertEqual(
+            change.experiment_data,
+            dict(NimbusExperimentChangeLogSerializer(experiment).data),
+        )
+        self.assertEqual(
+            [
+                {
+                    "event": entry.event,
+                    "field_name": entry.field_name,
+                    "event_message": entry.event_message,
+                    "old_value": entry.old_value,
+                    "new_value": entry.new_value,
+                }
+                for entry in change.entries.all()
+            ],
+            get_formatted_changes(change, latest_change),
+        )
+
+    def test_creates_entries_for_new_experiments(self):
+        experiment = NimbusExperimentFactory.create()
+
+        (change,) = generate_nimbus_changelogs([experiment], self.user, "test message")
+
+        self.assertEqual(
+            [entry.get_formatted_change() for entry in change.entries.all()],
+            [
+                {
+                    "event": "CREATION",
+                    "event_message": f"{self.user} created this experiment",
+                    "changed_by": self.user,
+                    "timestamp": timezone.localtime(change.changed_on).strftime(
+                        "%I:%M %p %Z"
+                    ),
+                }
+            ],
+        )
+
+    def test_number_of_queries_does_not_grow_with_experiments(self):
+        experiments = self.create_experiments(1)
+        with CaptureQueriesContext(connection) as one_experiment:
+            generate_nimbus_changelogs(experiments, self.user, "test message")
+
+        experiments = self.create_experiments(3)
+        with CaptureQueriesContext(connection) as three_experiments:
+            generate_nimbus_changelogs(experiments, self.user, "test message")
+
+        self.assertEqual(len(three_experiments), len(one_experiment))
+        self.mock_metrics.histogram.assert_any_call(
+            "generate_nimbus_changelogs.queries", len(three_experiments)
+        )
+        self.mock_metrics.histogram.assert_any_call(
+            "generate_nimbus_changelogs.experiments", 3
+        )
+
+    def test_does_nothing_without_experiments(self):
+        self.assertEqual(generate_nimbus_changelogs([], self.user, "test message"), [])
+        self.mock_metrics.histogram.assert_not_called()
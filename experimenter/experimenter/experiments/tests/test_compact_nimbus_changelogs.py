@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from experimenter.experiments.models import NimbusChangeLog
+from experimenter.experiments.tests.factories import (
+    NimbusChangeLogFactory,
+    NimbusExperimentFactory,
+)
+
+
+class TestCompactNimbusChangelogs(TestCase):
+    def get_experiment_data(self, name):
+        return {
+            "name": name,
+            "slug": "experiment",
+            "description": "Description",
+            "is_paused": False,
+            "published_dto": {"id": "experiment"},
+        }
+
+    def test_stores_full_change_logs_as_deltas(self):
+        experiment = NimbusExperimentFactory.create()
+        with mock.patch.object(NimbusChangeLog, "CHECKPOINT_INTERVAL", 1):
+            changes = [
+                NimbusChangeLogFactory.create(
+                    experiment=experiment,
+                    experiment_data=self.get_experiment_data(f"Name {i}"),
+                )
+                for i in range(3)
+            ]
+        NimbusChangeLogFactory.create(experiment=experiment, experiment_data=None)
+        self.assertFalse(NimbusChangeLog.objects.filter(checkpoint__isnull=False))
+
+        call_command("compact_nimbus_changelogs")
+
+        compacted = list(NimbusChangeLog.objects.filter(experiment=experiment))
+        self.assertEqual(
+            [change.checkpoint for change in compacted],
+            [None, changes[0], changes[0], None],
+        )
+        self.assertEqual(
+            compacted[1]._experiment_data, {"name": "Name 1", "is_paused": False}
+        )
+        self.assertEqual(
+            [change.experiment_data for change in compacted],
+            [self.get_experiment_data(f"Name {i}") for i in range(3)] + [None],
+        )
+
+    def test_compacting_twice_keeps_experiment_data(self):
+        experiment = NimbusExperimentFactory.create()
+        for i in range(3):
+            NimbusChangeLogFactory.create(
+                experiment=experiment,
+                experiment_data=self.get_experiment_data(f"Name {i}"),
+            )
+
+        call_command("compact_nimbus_changelogs")
+        call_command("compact_nimbus_changelogs")
+
+        self.assertEqual(
+            [
+                change.experiment_data
+                for change in NimbusChangeLog.objects.filter(experiment=experiment)
+            ],
+            [self.get_experiment_data(f"Name {i}") for i in range(3)],
+        )
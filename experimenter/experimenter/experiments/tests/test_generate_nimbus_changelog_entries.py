@@ -0,0 +1,33 @@
+from django.core.management import call_command
+from django.test import TestCase
+
+from experimenter.experiments.models import NimbusChangeLogEntry
+from experimenter.experiments.tests.factories import NimbusExperimentFactory
+
+
+class TestGenerateNimbusChangelogEntries(TestCase):
+    def test_regenerates_entries_of_every_change_log(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING
+        )
+        changelogs = experiment.get_changelogs_by_date()
+        NimbusChangeLogEntry.objects.all().delete()
+
+        call_command("generate_nimbus_changelog_entries")
+
+        self.assertEqual(
+            [
+                [
+                    {key: value for key, value in change.items() if key != "id"}
+                    for change in changelog["changes"]
+                ]
+                for changelog in experiment.get_changelogs_by_date()
+            ],
+            [
+                [
+                    {key: value for key, value in change.items() if key != "id"}
+                    for change in changelog["changes"]
+                ]
+                for changelog in changelogs
+            ],
+        )
@@ -97,3 +97,130 @@ class TestUnwedgeRolloutUpdateReviewMigration(MigratorTestCase):
         self.assertEqual(non_rollout.status, "Live")
         self.assertEqual(non_rollout.status_next, "Live")
         self.assertEqual(non_rollout.publish_status, "Review")
+
+
+class TestNimbusExperimentKintoCollectionMigration(MigratorTestCase):
+    migrate_from = (
+        "experiments",
+        "0337_nimbusexperiment_sizing_data",
+    )
+    migrate_to = (
+        "experiments",
+        "0338_nimbusexperiment_kinto_collection",
+    )
+
+    def prepare(self):
+        User = self.old_state.apps.get_model("auth", "User")
+        NimbusExperiment = self.old_state.apps.get_model(
+            "experiments", "NimbusExperiment"
+        )
+        NimbusFeatureConfig = self.old_state.apps.get_model(
+            "experiments", "NimbusFeatureConfig"
+        )
+
+        owner, _ = User.objects.get_or_create(
+            username="test@example.com",
+            defaults={"email": "test@example.com"},
+        )
+        prefflips_feature = NimbusFeatureConfig.objects.create(
+            slug="prefFlips",
+            name="prefFlips",
+            application="firefox-desktop",
+        )
+        test_feature = NimbusFeatureConfig.objects.create(
+            slug="test-feature",
+            name="test-feature",
+            application="firefox-desktop",
+        )
+
+        NimbusExperiment.objects.create(
+            slug="desktop",
+            name="Desktop",
+            application="firefox-desktop",
+            owner=owner,
+        ).feature_configs.add(test_feature)
+        NimbusExperiment.objects.create(
+            slug="secure",
+            name="Secure",
+            application="firefox-desktop",
+            owner=owner,
+        ).feature_configs.add(prefflips_feature)
+        NimbusExperiment.objects.create(
+            slug="conflicting",
+            name="Conflicting",
+            application="firefox-desktop",
+            owner=owner,
+        ).feature_configs.add(test_feature, prefflips_feature)
+        NimbusExperiment.objects.create(
+            slug="mobile",
+            name="Mobile",
+            application="fenix",
+            owner=owner,
+        )
+
+    def test_migration(self):
+        NimbusExperiment = self.new_state.apps.get_model(
+            "experiments", "NimbusExperiment"
+        )
+
+        self.assertEqual(
+            NimbusExperiment.objects.get(slug="desktop")._kinto_collection,
+            "nimbus-desktop-experiments",
+        )
+        self.assertEqual(
+            NimbusExperiment.objects.get(slug="secure")._kinto_collection,
+            "nimbus-secure-experiments",
+        )
+        self.assertIsNone(
+            NimbusExperiment.objects.get(slug="conflicting")._kinto_collection
+        )
+        self.assertEqual(
+            NimbusExperiment.objects.get(slug="mobile")._kinto_collection,
+            "nimbus-mobile-experiments",
+        )
+
+
+class TestNimbusExperimentHasChangelogEntriesMigration(MigratorTestCase):
+    migrate_from = (
+        "experiments",
+        "0344_nimbusversionedschema_schema_diffs",
+    )
+    migrate_to = (
+        "experiments",
+        "0345_nimbusexperiment_has_changelog_entries",
+    )
+
+    def prepare(self):
+        User = self.old_state.apps.get_model("auth", "User")
+        NimbusExperiment = self.old_state.apps.get_model(
+            "experiments", "NimbusExperiment"
+        )
+
+        owner, _ = User.objects.get_or_create(
+            username="test@example.com",
+            defaults={"email": "test@example.com"},
+        )
+        NimbusExperiment.objects.create(
+            slug="existing",
+            name="Existing",
+            application="firefox-desktop",
+            owner=owner,
+        )
+
+    def test_migration(self):
+        User = self.new_state.apps.get_model("auth", "User")
+        NimbusExperiment = self.new_state.apps.get_model(
+            "experiments", "NimbusExperiment"
+        )
+
+        self.assertFalse(
+            NimbusExperiment.objects.get(slug="existing")._has_changelog_entries
+        )
+        self.assertTrue(
+            NimbusExperiment.objects.create(
+                slug="new",
+                name="New",
+                application="firefox-desktop",
+                owner=User.objects.get(username="test@example.com"),
+            )._has_changelog_entries
+        )
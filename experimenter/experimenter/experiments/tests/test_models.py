@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest import mock
 
 import packaging
+from deepdiff import DeepDiff
 from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
@@ -23,7 +24,10 @@ from experimenter.base.tests.factories import (
     LocaleFactory,
 )
 from experimenter.experiments.api.v6.serializers import NimbusExperimentSerializer
-from experimenter.experiments.changelog_utils import generate_nimbus_changelog
+from experimenter.experiments.changelog_utils import (
+    NimbusExperimentChangeLogSerializer,
+    generate_nimbus_changelog,
+)
 from experimenter.experiments.constants import (
     APPLICATION_CONFIG_DESKTOP,
     APPLICATION_CONFIG_IOS,
@@ -38,9 +42,11 @@ from experimenter.experiments.models import (
     NimbusBranch,
     NimbusBranchScreenshot,
     NimbusBucketRange,
+    NimbusChangeLog,
     NimbusExperiment,
     NimbusExperimentBranchThroughExcluded,
     NimbusExperimentBranchThroughRequired,
+    NimbusExperimentPayload,
     NimbusFeatureConfig,
     NimbusFeatureVersion,
     NimbusIsolationGroup,
@@ -1815,7 +1821,7 @@ class TestNimbusExperiment(TestCase):
             start_date=datetime.date.today() - datetime.timedelta(days=expected_days),
         )
 
-        experiment.changes.filter(experiment_data__is_paused=True).update(
+        experiment.changes.filter(_experiment_data__is_paused=True).update(
             changed_on=datetime.datetime.now()
         )
 
@@ -1868,7 +1874,7 @@ class TestNimbusExperiment(TestCase):
             proposed_enrollment=expected_days,
         )
 
-        experiment.changes.filter(experiment_data__is_paused=True).update(
+        experiment.changes.filter(_experiment_data__is_paused=True).update(
             changed_on=datetime.datetime.now()
         )
         self.assertEqual(
@@ -1882,8 +1888,8 @@ class TestNimbusExperiment(TestCase):
             NimbusExperimentFactory.Lifecycles.LIVE_PAUSED,
             proposed_enrollment=expected_days,
         )
-        experiment.changes.filter(experiment_data__is_paused=True).update(
-            experiment_data={}
+        experiment.changes.filter(_experiment_data__is_paused=True).update(
+            _experiment_data={}
         )
         self.assertEqual(
             experiment.computed_enrollment_days,
@@ -1896,8 +1902,8 @@ class TestNimbusExperiment(TestCase):
             NimbusExperimentFactory.Lifecycles.LIVE_PAUSED,
             proposed_enrollment=expected_days,
         )
-        experiment.changes.filter(experiment_data__is_paused=True).update(
-            experiment_data=None
+        experiment.changes.filter(_experiment_data__is_paused=True).update(
+            _experiment_data=None
         )
         self.assertEqual(
             experiment.computed_enrollment_days,
@@ -1916,7 +1922,7 @@ class TestNimbusExperiment(TestCase):
             proposed_enrollment=7,
         )
 
-        experiment.changes.filter(experiment_data__is_paused=True).update(
+        experiment.changes.filter(_experiment_data__is_paused=True).update(
             changed_on=enrollment_end_date
         )
 
@@ -4887,6 +4893,146 @@ class TestNimbusExperiment(TestCase):
             ],
         )
 
+    def test_get_changelogs_resolves_related_names(self):
+        experiment = NimbusExperimentFactory.create(countries=[], locales=[])
+        user = UserFactory.create()
+        country_ca = CountryFactory.create(code="CA")
+        country_us = CountryFactory.create(code="US")
+        locale = LocaleFactory.create()
+        generate_nimbus_changelog(experiment, user, "created")
+
+        experiment.countries.set([country_ca, country_us])
+        experiment.locales.set([locale])
+        generate_nimbus_changelog(experiment, user, "targeting change")
+
+        changes = {
+            change["event_message"]: change
+            for change in experiment.get_changelogs_by_date()[0]["changes"]
+        }
+
+        self.assertEqual(
+            json.loads(
+                changes[f"{user} changed value of Supported Countries"]["new_value"]
+            ),
+            sorted([country_ca.name, country_us.name]),
+        )
+        self.assertEqual(
+            json.loads(
+                changes[f"{user} changed value of Supported Locales"]["new_value"]
+            ),
+            [locale.name],
+        )
+
+    def test_get_changelogs_diffs_change_inserted_before_later_changes(self):
+        experiment = NimbusExperimentFactory.create(
+            publish_status=NimbusExperiment.PublishStatus.IDLE
+        )
+        user = UserFactory.create()
+        now = timezone.now()
+        generate_nimbus_changelog(
+            experiment, user, "created", now - datetime.timedelta(hours=2)
+        )
+
+        experiment.publish_status = NimbusExperiment.PublishStatus.WAITING
+        experiment.save()
+        generate_nimbus_changelog(experiment, user, "waiting", now)
+
+        experiment.publish_status = NimbusExperiment.PublishStatus.REVIEW
+        generate_nimbus_changelog(
+            experiment, user, "review", now - datetime.timedelta(hours=1)
+        )
+
+        self.assertEqual(
+            [
+                (change["old_value"], change["new_value"])
+                for changelog in experiment.get_changelogs_by_date()
+                for change in changelog["changes"]
+                if change["event"] == ChangeEventType.STATE.name
+            ],
+            [("Review", "Waiting"), ("Idle", "Review")],
+        )
+
+    def test_get_changelogs_diffs_change_moved_between_other_changes(self):
+        experiment = NimbusExperimentFactory.create(
+            publish_status=NimbusExperiment.PublishStatus.IDLE
+        )
+        user = UserFactory.create()
+        now = timezone.now()
+        generate_nimbus_changelog(
+            experiment, user, "created", now - datetime.timedelta(hours=3)
+        )
+
+        experiment.publish_status = NimbusExperiment.PublishStatus.REVIEW
+        generate_nimbus_changelog(
+            experiment, user, "review", now - datetime.timedelta(hours=2)
+        )
+
+        experiment.publish_status = NimbusExperiment.PublishStatus.WAITING
+        waiting_change = generate_nimbus_changelog(experiment, user, "waiting", now)
+
+        waiting_change.changed_on = now - datetime.timedelta(hours=2, minutes=30)
+        waiting_change.save()
+
+        self.assertEqual(
+            [
+                (change["old_value"], change["new_value"])
+                for changelog in experiment.get_changelogs_by_date()
+                for change in changelog["changes"]
+                if change["event"] == ChangeEventType.STATE.name
+            ],
+            [("Waiting", "Review"), ("Idle", "Waiting")],
+        )
+        self.assertEqual(
+            set(waiting_change.entries.values_list("changed_on", flat=True)),
+            {waiting_change.changed_on},
+        )
+
+    def test_get_changelogs_diffs_change_after_edited_change(self):
+        experiment = NimbusExperimentFactory.create(
+            publish_status=NimbusExperiment.PublishStatus.IDLE
+        )
+        user = UserFactory.create()
+        now = timezone.now()
+        created_change = generate_nimbus_changelog(
+            experiment, user, "created", now - datetime.timedelta(hours=1)
+        )
+
+        experiment.publish_status = NimbusExperiment.PublishStatus.REVIEW
+        generate_nimbus_changelog(experiment, user, "review", now)
+
+        created_change.experiment_data = {
+            **created_change.experiment_data,
+            "publish_status": NimbusExperiment.PublishStatus.WAITING,
+        }
+        created_change.save()
+
+        self.assertEqual(
+            [
+                (change["old_value"], change["new_value"])
+                for changelog in experiment.get_changelogs_by_date()
+                for change in changelog["changes"]
+                if change["event"] == ChangeEventType.STATE.name
+            ],
+            [("Waiting", "Review")],
+        )
+
+    def test_get_changelog_entries_pages_by_keyset(self):
+        experiment = NimbusExperimentFactory.create()
+        user = UserFactory.create()
+        now = timezone.now()
+        for hours, publish_status in enumerate(NimbusExperiment.PublishStatus):
+            experiment.publish_status = publish_status
+            generate_nimbus_changelog(
+                experiment, user, publish_status, now + datetime.timedelta(hours=hours)
+            )
+
+        entries = list(experiment.get_changelog_entries())
+        first_page = list(experiment.get_changelog_entries()[:2])
+        second_page = list(experiment.get_changelog_entries(before=first_page[-1]))
+
+        self.assertEqual(first_page + second_page, entries)
+        self.assertEqual(entries[-1].event, ChangeEventType.CREATION.name)
+
     def test_get_live_excluded_experiments(self):
         experiments = {
             slug: NimbusExperimentFactory.create_with_lifecycle(
@@ -6377,6 +6523,145 @@ class TestNimbusChangeLog(TestCase):
         )
         self.assertEqual(str(changelog), f"Draft > Preview by {user.email} on {now}")
 
+    def get_experiment_data(self, **kwargs):
+        return {
+            "name": "Experiment",
+            "slug": "experiment",
+            "description": "Description",
+            "owner": "owner@example.com",
+            "channel": NimbusExperiment.Channel.RELEASE,
+            "is_paused": False,
+            "is_rollout_dirty": False,
+            "published_dto": {"id": "experiment", "branches": ["control"]},
+            "status": NimbusExperiment.Status.DRAFT,
+            **kwargs,
+        }
+
+    def test_stores_changes_as_deltas_of_checkpoint(self):
+        experiment = NimbusExperimentFactory.create()
+        checkpoint = NimbusChangeLogFactory.create(
+            experiment=experiment, experiment_data=self.get_experiment_data()
+        )
+        change = NimbusChangeLogFactory.create(
+            experiment=experiment,
+            experiment_data=self.get_experiment_data(name="Renamed"),
+        )
+
+        change = NimbusChangeLog.objects.get(id=change.id)
+        self.assertIsNone(NimbusChangeLog.objects.get(id=checkpoint.id).checkpoint)
+        self.assertEqual(change.checkpoint, checkpoint)
+        self.assertEqual(
+            change._experiment_data,
+            {"name": "Renamed", "is_paused": False, "is_rollout_dirty": False},
+        )
+        self.assertEqual(change.experiment_data, self.get_experiment_data(name="Renamed"))
+
+    def test_stores_removed_fields_of_checkpoint(self):
+        experiment = NimbusExperimentFactory.create()
+        NimbusChangeLogFactory.create(
+            experiment=experiment, experiment_data=self.get_experiment_data()
+        )
+        experiment_data = self.get_experiment_data()
+        experiment_data.pop("description")
+        change = NimbusChangeLogFactory.create(
+            experiment=experiment, experiment_data=experiment_data
+        )
+
+        change = NimbusChangeLog.objects.get(id=change.id)
+        self.assertEqual(change.removed_fields, ["description"])
+        self.assertEqual(change.experiment_data, experiment_data)
+
+    def test_stores_mostly_changed_data_in_full(self):
+        experiment = NimbusExperimentFactory.create()
+        NimbusChangeLogFactory.create(
+            experiment=experiment, experiment_data=self.get_experiment_data()
+        )
+        change = NimbusChangeLogFactory.create(
+            experiment=experiment, experiment_data={"name": "Replaced"}
+        )
+
+        change = NimbusChangeLog.objects.get(id=change.id)
+        self.assertIsNone(change.checkpoint)
+        self.assertEqual(change.experiment_data, {"name": "Replaced"})
+
+    @mock.patch.object(NimbusChangeLog, "CHECKPOINT_INTERVAL", 3)
+    def test_stores_new_checkpoint_after_interval(self):
+        experiment = NimbusExperimentFactory.create()
+        changes = [
+            NimbusChangeLogFactory.create(
+                experiment=experiment,
+                experiment_data=self.get_experiment_data(name=f"Name {i}"),
+            )
+            for i in range(5)
+        ]
+
+        self.assertEqual(
+            [change.checkpoint for change in changes],
+            [None, changes[0], changes[0], None, changes[3]],
+        )
+        self.assertEqual(
+            [
+                change.experiment_data["name"]
+                for change in NimbusChangeLog.objects.filter(experiment=experiment)
+            ],
+            [f"Name {i}" for i in range(5)],
+        )
+
+    def test_queryable_fields_are_filtered_in_deltas(self):
+        experiment = NimbusExperimentFactory.create()
+        NimbusChangeLogFactory.create(
+            experiment=experiment, experiment_data=self.get_experiment_data()
+        )
+        change = NimbusChangeLogFactory.create(
+            experiment=experiment,
+            experiment_data=self.get_experiment_data(is_paused=True),
+        )
+        NimbusChangeLogFactory.create(
+            experiment=experiment,
+            experiment_data=self.get_experiment_data(name="Renamed", is_paused=True),
+        )
+
+        self.assertEqual(
+            experiment.changes.filter(_experiment_data__is_paused=True).count(), 2
+        )
+        self.assertTrue(
+            experiment.changes.filter(
+                id=change.id, _experiment_data__is_rollout_dirty=False
+            ).exists()
+        )
+
+    def test_rebases_deltas_when_checkpoint_data_changes(self):
+        experiment = NimbusExperimentFactory.create()
+        checkpoint = NimbusChangeLogFactory.create(
+            experiment=experiment, experiment_data=self.get_experiment_data()
+        )
+        change = NimbusChangeLogFactory.create(
+            experiment=experiment,
+            experiment_data=self.get_experiment_data(name="Renamed"),
+        )
+
+        checkpoint.experiment_data = self.get_experiment_data(description="Changed")
+        checkpoint.save()
+
+        change = NimbusChangeLog.objects.get(id=change.id)
+        self.assertEqual(change.checkpoint, checkpoint)
+        self.assertEqual(change.experiment_data, self.get_experiment_data(name="Renamed"))
+
+    def test_latest_change_returns_full_experiment_data(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING
+        )
+        change = generate_nimbus_changelog(experiment, experiment.owner, "test message")
+        self.assertIsNotNone(change.checkpoint)
+
+        with self.assertNumQueries(1):
+            experiment_data = experiment.changes.latest_change().experiment_data
+
+        self.assertEqual(
+            experiment_data,
+            dict(NimbusExperimentChangeLogSerializer(experiment).data),
+        )
+
 
 class TestNimbusBranchScreenshot(TestCase):
     def setUp(self):
@@ -6853,6 +7138,126 @@ class ApplicationConfigTests(TestCase):
             else:
                 self.assertEqual(experiment.kinto_collection, kinto_collection)
 
+    def test_stored_kinto_collection_tracks_feature_configs(self):
+        with mock.patch.object(
+            self.application_config,
+            "kinto_collections_by_feature_id",
+            {"feature-2": "collection-2"},
+        ):
+            experiment = self._create_experiment(
+                ["feature-1"], NimbusExperiment.Version.FIREFOX_100
+            )
+            experiment.refresh_from_db()
+            self.assertEqual(
+                experiment._kinto_collection,
+                self.application_config.default_kinto_collection,
+            )
+
+            experiment.feature_configs.add(self.features["feature-2"])
+            experiment.refresh_from_db()
+            self.assertIsNone(experiment._kinto_collection)
+
+            self.features["feature-1"].nimbusexperiment_set.remove(experiment)
+            experiment.refresh_from_db()
+            self.assertEqual(experiment._kinto_collection, "collection-2")
+
+            experiment.feature_configs.clear()
+            experiment.refresh_from_db()
+            self.assertEqual(
+                experiment._kinto_collection,
+                self.application_config.default_kinto_collection,
+            )
+
+    def test_stored_kinto_collection_tracks_firefox_min_version(self):
+        with mock.patch.object(
+            self.application_config,
+            "kinto_collections_by_feature_id",
+            {"feature-1": "collection-1"},
+        ):
+            experiment = self._create_experiment(
+                ["feature-1", "feature-2"], NimbusExperiment.Version.FIREFOX_141
+            )
+            experiment.refresh_from_db()
+            self.assertIsNone(experiment._kinto_collection)
+
+            experiment.firefox_min_version = NimbusExperiment.Version.FIREFOX_142
+            experiment.save()
+            experiment.refresh_from_db()
+            self.assertEqual(experiment._kinto_collection, "collection-1")
+
+    def test_stored_kinto_collection_tracks_queryset_update(self):
+        with mock.patch.object(
+            self.application_config,
+            "kinto_collections_by_feature_id",
+            {"feature-1": "collection-1"},
+        ):
+            experiment = self._create_experiment(
+                ["feature-1", "feature-2"], NimbusExperiment.Version.FIREFOX_141
+            )
+
+            NimbusExperiment.objects.filter(
+                firefox_min_version=NimbusExperiment.Version.FIREFOX_141
+            ).update(firefox_min_version=NimbusExperiment.Version.FIREFOX_142)
+            experiment.refresh_from_db()
+            self.assertEqual(experiment._kinto_collection, "collection-1")
+
+    def test_stored_kinto_collection_tracks_reverse_clear(self):
+        with mock.patch.object(
+            self.application_config,
+            "kinto_collections_by_feature_id",
+            {"feature-2": "collection-2"},
+        ):
+            experiment = self._create_experiment(
+                ["feature-1", "feature-2"], NimbusExperiment.Version.FIREFOX_100
+            )
+            experiment.refresh_from_db()
+            self.assertIsNone(experiment._kinto_collection)
+
+            self.features["feature-1"].nimbusexperiment_set.clear()
+            experiment.refresh_from_db()
+            self.assertEqual(experiment._kinto_collection, "collection-2")
+
+    def test_save_only_recomputes_kinto_collection_when_its_fields_change(self):
+        experiment = self._create_experiment(
+            ["feature-1"], NimbusExperiment.Version.FIREFOX_100
+        )
+        experiment = NimbusExperiment.objects.get(id=experiment.id)
+
+        with mock.patch.object(
+            NimbusExperiment,
+            "get_stored_kinto_collection",
+            autospec=True,
+            side_effect=NimbusExperiment.get_stored_kinto_collection,
+        ) as get_stored_kinto_collection:
+            experiment.name = "new name"
+            experiment.save()
+            get_stored_kinto_collection.assert_not_called()
+
+            experiment.firefox_min_version = NimbusExperiment.Version.FIREFOX_142
+            experiment.save(update_fields=["firefox_min_version"])
+            get_stored_kinto_collection.assert_called_once()
+
+            experiment.save()
+            get_stored_kinto_collection.assert_called_once()
+
+    def test_stored_kinto_collection_logs_multiple_collections(self):
+        with mock.patch.object(
+            self.application_config,
+            "kinto_collections_by_feature_id",
+            {"feature-2": "collection-2"},
+        ):
+            experiment = self._create_experiment(
+                ["feature-1"], NimbusExperiment.Version.FIREFOX_100
+            )
+
+            with self.assertLogs("experimenter.experiments.models", "WARNING") as logs:
+                experiment.feature_configs.add(self.features["feature-2"])
+
+            self.assertIn(
+                f"Experiment {experiment.slug} targets multiple kinto collections",
+                logs.output[0],
+            )
+
     @parameterized.expand(
         [
             (None, {"default-collection"}),
@@ -6965,6 +7370,204 @@ class TestNimbusAlert(TestCase):
         )
 
 
+class TestNimbusExperimentPayload(TestCase):
+    def test_payloads_are_stored_compressed_outside_the_experiment_row(self):
+        results_data = {"v3": {"overall": {"enrollments": {"all": {}}}}}
+        experiment = NimbusExperimentFactory.create(results_data=results_data)
+
+        payload = NimbusExperimentPayload.objects.get(
+            experiment=experiment, kind=NimbusExperimentPayload.Kind.RESULTS_DATA
+        )
+        self.assertEqual(payload.get_data(), results_data)
+        self.assertEqual(
+            payload.content_hash,
+            NimbusExperimentPayload.get_content_hash(results_data),
+        )
+        self.assertEqual(
+            NimbusExperiment.objects.get(id=experiment.id).results_data, results_data
+        )
+        self.assertEqual(str(payload), f"{experiment.slug} - results_data")
+
+    def test_payloads_are_loaded_lazily(self):
+        experiment = NimbusExperimentFactory.create(results_data={"v3": {}})
+
+        with self.assertNumQueries(1):
+            experiment = NimbusExperiment.objects.get(id=experiment.id)
+        with self.assertNumQueries(1):
+            self.assertEqual(experiment.results_data, {"v3": {}})
+        with self.assertNumQueries(0):
+            self.assertEqual(experiment.results_data, {"v3": {}})
+
+    def test_content_hash_ignores_key_order(self):
+        self.assertEqual(
+            NimbusExperimentPayload.get_content_hash({"a": 1, "b": [1, 2]}),
+            NimbusExperimentPayload.get_content_hash({"b": [1, 2], "a": 1}),
+        )
+        self.assertIsNone(NimbusExperimentPayload.get_content_hash(None))
+
+    def test_setting_payload_to_none_deletes_it(self):
+        experiment = NimbusExperimentFactory.create(published_dto={"id": "slug"})
+
+        experiment.published_dto = None
+        experiment.save()
+
+        self.assertFalse(
+            experiment.payloads.filter(
+                kind=NimbusExperimentPayload.Kind.PUBLISHED_DTO
+            ).exists()
+        )
+        experiment.refresh_from_db()
+        self.assertIsNone(experiment.published_dto)
+
+    def test_save_with_update_fields_writes_payloads(self):
+        experiment = NimbusExperimentFactory.create(monitoring_data={})
+        updated_at = timezone.now()
+
+        experiment.monitoring_data = {"total_enrollments": 10}
+        experiment.monitoring_data_updated_at = updated_at
+        experiment.save(update_fields=["monitoring_data", "monitoring_data_updated_at"])
+
+        experiment = NimbusExperiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.monitoring_data, {"total_enrollments": 10})
+        self.assertEqual(experiment.monitoring_data_updated_at, updated_at)
+        self.assertEqual(
+            experiment.get_payload_hash(NimbusExperimentPayload.Kind.MONITORING_DATA),
+            NimbusExperimentPayload.get_content_hash({"total_enrollments": 10}),
+        )
+
+    def test_refresh_from_db_reloads_payloads(self):
+        experiment = NimbusExperimentFactory.create(published_dto={"id": "old"})
+        self.assertEqual(experiment.published_dto, {"id": "old"})
+        other = NimbusExperiment.objects.get(id=experiment.id)
+        other.published_dto = {"id": "new"}
+        other.save()
+
+        experiment.refresh_from_db()
+
+        self.assertEqual(experiment.published_dto, {"id": "new"})
+
+    def test_with_related_prefetches_published_dto(self):
+        for _ in range(3):
+            NimbusExperimentFactory.create_with_lifecycle(
+                NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE
+            )
+        experiments = list(NimbusExperiment.objects.with_related())
+
+        with self.assertNumQueries(0):
+            for experiment in experiments:
+                self.assertIsNotNone(experiment.published_dto)
+                self.assertIsNotNone(
+                    experiment.get_payload_hash(
+                        NimbusExperimentPayload.Kind.PUBLISHED_DTO
+                    )
+                )
+
+    def test_clone_does_not_share_payloads(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_APPROVE_APPROVE,
+            results_data={"v3": {"overall": {"enrollments": {"all": {}}}}},
+        )
+
+        child = experiment.clone("Child Experiment", experiment.owner)
+
+        self.assertIsNone(child.results_data)
+        self.assertFalse(child.has_displayable_results)
+        self.assertFalse(child.payloads.exists())
+        self.assertTrue(experiment.has_displayable_results)
+        self.assertIsNotNone(NimbusExperiment.objects.get(id=experiment.id).published_dto)
+
+
+class TestNimbusVersionedSchemaManager(TestCase):
+    def setUp(self):
+        self.feature_config = NimbusFeatureConfigFactory.create()
+        self.feature_config.schemas.all().delete()
+
+    def create_schema(self, major, schema):
+        return NimbusVersionedSchemaFactory.create(
+            feature_config=self.feature_config,
+            version=(
+                NimbusFeatureVersion.objects.create(major=major, minor=0, patch=0)
+                if major is not None
+                else None
+            ),
+            schema=schema,
+        )
+
+    def test_update_schema_diffs_diffs_each_version_against_the_previous_one(self):
+        schema_120 = self.create_schema(120, '{"a": 1, "b": 2}')
+        schema_121 = self.create_schema(121, '{"a": 1, "b": 2}')
+        schema_122 = self.create_schema(122, '{"a": 2, "c": 3}')
+        unversioned = self.create_schema(None, '{"a": 2, "c": 3, "d": 4}')
+
+        NimbusVersionedSchema.objects.update_schema_diffs([self.feature_config.id])
+
+        for schema, previous_schema, changes, size in (
+            (schema_120, None, 0, "first_version"),
+            (schema_121, schema_120, 0, "no_changes"),
+            (schema_122, schema_121, 3, "small"),
+            (unversioned, schema_122, 1, "small"),
+        ):
+            schema.refresh_from_db()
+            self.assertEqual(schema.previous_schema, previous_schema)
+            self.assertEqual(schema.schema_changes, changes)
+            self.assertEqual(schema.schema_change_size, size)
+
+    def test_update_schema_diffs_labels_diffs_of_unparsable_schemas_invalid(self):
+        schema_120 = self.create_schema(120, "not json")
+        schema_121 = self.create_schema(121, '{"a": 1}')
+        schema_122 = self.create_schema(122, '{"a": 2}')
+
+        NimbusVersionedSchema.objects.update_schema_diffs([self.feature_config.id])
+
+        for schema, changes, size in (
+            (schema_120, 0, "first_version"),
+            (schema_121, 0, "invalid"),
+            (schema_122, 1, "small"),
+        ):
+            schema.refresh_from_db()
+            self.assertEqual(schema.schema_changes, changes)
+            self.assertEqual(schema.schema_change_size, size)
+
+    def test_update_schema_diffs_only_diffs_stale_schemas(self):
+        schema_120 = self.create_schema(120, '{"a": 1}')
+        schema_122 = self.create_schema(122, '{"a": 1}')
+        schema_123 = self.create_schema(123, '{"a": 1}')
+        NimbusVersionedSchema.objects.update_schema_diffs([self.feature_config.id])
+
+        schema_121 = self.create_schema(121, '{"a": 2}')
+        NimbusVersionedSchema.objects.filter(id=schema_120.id).update(schema='{"b": 1}')
+
+        with mock.patch(
+            "experimenter.experiments.models.DeepDiff", wraps=DeepDiff
+        ) as deep_diff:
+            NimbusVersionedSchema.objects.update_schema_diffs([self.feature_config.id])
+
+        self.assertEqual(deep_diff.call_count, 2)
+        schema_120.refresh_from_db()
+        self.assertEqual(schema_120.schema_change_size, "first_version")
+        schema_121.refresh_from_db()
+        self.assertEqual(schema_121.previous_schema, schema_120)
+        schema_122.refresh_from_db()
+        self.assertEqual(schema_122.previous_schema, schema_121)
+        self.assertEqual(schema_122.schema_changes, 1)
+        schema_123.refresh_from_db()
+        self.assertEqual(schema_123.schema_change_size, "no_changes")
+
+    def test_update_schema_diffs_rediffs_changed_schemas(self):
+        schema_120 = self.create_schema(120, '{"a": 1}')
+        schema_121 = self.create_schema(121, '{"a": 1}')
+        NimbusVersionedSchema.objects.update_schema_diffs([self.feature_config.id])
+
+        NimbusVersionedSchema.objects.filter(id=schema_120.id).update(schema='{"a": 2}')
+        NimbusVersionedSchema.objects.update_schema_diffs(
+            [self.feature_config.id], changed_ids={schema_120.id}
+        )
+
+        schema_121.refresh_from_db()
+        self.assertEqual(schema_121.schema_changes, 1)
+        self.assertEqual(schema_121.schema_change_size, "small")
+
+
 class TestNimbusRolloutPhase(TestCase):
     def test_str(self):
         phase = NimbusRolloutPhaseFactory.create(population_percent=25)
@@ -1,3 +1,4 @@
+import gzip
 import json
 from unittest import mock
 
@@ -7,14 +8,20 @@ from rest_framework.renderers import JSONRenderer
 
 from experimenter.experiments.api.cache import (
     get_api_cache_key,
-    stream_render_queryset,
+    get_etag,
+    get_experiment_fragment_keys,
+    get_fragments_response_cache_key,
+    render_experiment_fragments,
+    stream_experiment_fragments,
 )
 from experimenter.experiments.api.cache import warm_api_cache as real_warm_api_cache
 from experimenter.experiments.api.v8.serializers import (
     NimbusExperimentSerializer as V8NimbusExperimentSerializer,
 )
 from experimenter.experiments.api.v8.views import NimbusExperimentViewSet as V8ViewSet
+from experimenter.experiments.cache_utils import get_fragment_cache_keys
 from experimenter.experiments.tasks import (
+    _get_warm_cache_endpoint,
     _get_warm_cache_endpoints,
     warm_api_cache_endpoint,
     warm_api_caches,
@@ -36,6 +43,19 @@ class TestWarmApiCaches(TestCase):
         super().setUp()
         cache.clear()
 
+    def get_cached_fragments(self, queryset, serializer_class):
+        cache_keys = get_fragment_cache_keys(
+            serializer_class, queryset.prefetch_related(None).values_list("id", flat=True)
+        )
+        return cache.get_many(cache_keys.values())
+
+    def render_endpoint(self, key_prefix):
+        _, queryset, serializer_class, _ = _get_warm_cache_endpoint(key_prefix)
+        with mock.patch.object(
+            serializer_class, "to_representation", side_effect=AssertionError
+        ):
+            return json.loads(render_experiment_fragments(queryset, serializer_class))
+
     def test_warm_api_caches_populates_cache_for_all_endpoints(self):
         NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
@@ -48,10 +68,14 @@ class TestWarmApiCaches(TestCase):
 
         warm_api_caches()
 
-        for key_prefix, _, _, _ in _get_warm_cache_endpoints():
-            cache_key = get_api_cache_key(key_prefix)
-            cached = cache.get(cache_key)
-            self.assertIsNotNone(cached, f"Cache for {key_prefix} should be populated")
+        self.assertIsNotNone(cache.get(get_api_cache_key("v5:csv")))
+        for key_prefix, queryset, serializer_class, _ in _get_warm_cache_endpoints():
+            if key_prefix != "v5:csv":
+                self.assertEqual(
+                    len(self.get_cached_fragments(queryset, serializer_class)),
+                    queryset.count(),
+                    f"Fragments for {key_prefix} should be populated",
+                )
 
     def test_warm_api_caches_contains_correct_experiments(self):
         NimbusExperimentFactory.create_with_lifecycle(
@@ -66,13 +90,13 @@ class TestWarmApiCaches(TestCase):
         warm_api_caches()
 
         # v6:experiments should contain the live experiment but not the draft
-        v6_data = json.loads(cache.get(get_api_cache_key("v6:experiments")))
+        v6_data = self.render_endpoint("v6:experiments")
         v6_slugs = [exp["slug"] for exp in v6_data]
         self.assertIn("live-experiment", v6_slugs)
         self.assertNotIn("draft-experiment", v6_slugs)
 
         # v6:draft-experiments should contain the draft but not the live
-        v6_draft_data = json.loads(cache.get(get_api_cache_key("v6:draft-experiments")))
+        v6_draft_data = self.render_endpoint("v6:draft-experiments")
         v6_draft_slugs = [exp["slug"] for exp in v6_draft_data]
         self.assertIn("draft-experiment", v6_draft_slugs)
         self.assertNotIn("live-experiment", v6_draft_slugs)
@@ -85,7 +109,7 @@ class TestWarmApiCaches(TestCase):
 
         warm_api_caches()
 
-        v6_data = json.loads(cache.get(get_api_cache_key("v6:experiments")))
+        v6_data = self.render_endpoint("v6:experiments")
         self.assertEqual(len([e for e in v6_data if e["slug"] == "experiment-1"]), 1)
 
         # Add another experiment and re-warm
@@ -96,7 +120,7 @@ class TestWarmApiCaches(TestCase):
 
         warm_api_caches()
 
-        v6_data = json.loads(cache.get(get_api_cache_key("v6:experiments")))
+        v6_data = self.render_endpoint("v6:experiments")
         slugs = [exp["slug"] for exp in v6_data]
         self.assertIn("experiment-1", slugs)
         self.assertIn("experiment-2", slugs)
@@ -104,10 +128,10 @@ class TestWarmApiCaches(TestCase):
     def test_warm_api_caches_empty_db(self):
         warm_api_caches()
 
+        self.assertIsNotNone(cache.get(get_api_cache_key("v5:csv")))
         for key_prefix, _, _, _ in _get_warm_cache_endpoints():
-            cache_key = get_api_cache_key(key_prefix)
-            cached = cache.get(cache_key)
-            self.assertIsNotNone(cached)
+            if key_prefix != "v5:csv":
+                self.assertEqual(self.render_endpoint(key_prefix), [])
 
     def test_warm_api_caches_json_endpoints_produce_valid_json(self):
         NimbusExperimentFactory.create_with_lifecycle(
@@ -121,10 +145,7 @@ class TestWarmApiCaches(TestCase):
             p for p, _, _, _ in _get_warm_cache_endpoints() if not p.startswith("v5:")
         ]
         for key_prefix in json_prefixes:
-            cache_key = get_api_cache_key(key_prefix)
-            cached = cache.get(cache_key)
-            data = json.loads(cached)
-            for exp in data:
+            for exp in self.render_endpoint(key_prefix):
                 self.assertIn("slug", exp)
                 self.assertIn("branches", exp)
 
@@ -138,8 +159,27 @@ class TestWarmApiCaches(TestCase):
 
         cached = cache.get(get_api_cache_key("v5:csv"))
         self.assertIsNotNone(cached)
-        content = cached.decode("utf-8") if isinstance(cached, bytes) else cached
+        content = gzip.decompress(cached["gzip"]).decode("utf-8")
         self.assertIn("csv-experiment", content)
+        self.assertEqual(cached["etag"], get_etag([content.encode("utf-8")]))
+
+    def test_warm_api_caches_compresses_unfiltered_json_responses(self):
+        NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            slug="compressed-experiment",
+        )
+
+        warm_api_caches()
+
+        _, queryset, serializer_class, _ = _get_warm_cache_endpoint("v8:experiments")
+        cache_keys = get_experiment_fragment_keys(queryset, serializer_class)
+        etag = get_etag(cache_keys.values())
+        cached = cache.get(get_fragments_response_cache_key(etag))
+        self.assertEqual(cached["etag"], etag)
+        self.assertEqual(
+            json.loads(gzip.decompress(cached["gzip"])),
+            self.render_endpoint("v8:experiments"),
+        )
 
     def test_warm_api_caches_dispatches_one_subtask_per_endpoint(self):
         with mock.patch(
@@ -167,16 +207,14 @@ class TestWarmApiCaches(TestCase):
         ):
             warm_api_caches()
 
-        self.assertIsNone(cache.get(get_api_cache_key("v6:experiments")))
-        for key_prefix in (
-            "v5:csv",
-            "v6:draft-experiments",
-            "v7:experiments",
-            "v8:experiments",
-            "v8:draft-experiments",
-        ):
-            self.assertIsNotNone(
-                cache.get(get_api_cache_key(key_prefix)),
+        _, queryset, serializer_class, _ = _get_warm_cache_endpoint("v6:experiments")
+        self.assertEqual(self.get_cached_fragments(queryset, serializer_class), {})
+        self.assertIsNotNone(cache.get(get_api_cache_key("v5:csv")))
+        for key_prefix in ("v7:experiments", "v8:experiments"):
+            _, queryset, serializer_class, _ = _get_warm_cache_endpoint(key_prefix)
+            self.assertEqual(
+                len(self.get_cached_fragments(queryset, serializer_class)),
+                1,
                 f"{key_prefix} should still be warmed when v6:experiments fails",
             )
 
@@ -195,18 +233,70 @@ class TestWarmApiCaches(TestCase):
         ):
             warm_api_cache_endpoint("v6:experiments")
 
-    def test_stream_render_queryset_matches_drf_json_renderer(self):
-        for slug in ("eq-experiment-1", "eq-experiment-2", "eq-experiment-3"):
+    def test_warm_api_caches_renders_only_changed_experiments(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            slug="changed-experiment",
+        )
+        NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+            slug="unchanged-experiment",
+        )
+        warm_api_caches()
+
+        experiment.save()
+
+        with mock.patch.object(
+            V8NimbusExperimentSerializer,
+            "to_representation",
+            autospec=True,
+            side_effect=lambda serializer, instance: {"slug": instance.slug},
+        ) as mock_to_representation:
+            warm_api_cache_endpoint("v8:experiments")
+
+        self.assertEqual(
+            [call.args[1].slug for call in mock_to_representation.call_args_list],
+            ["changed-experiment"],
+        )
+
+    def test_stream_experiment_fragments_yields_a_chunk_at_a_time(self):
+        for slug in ("chunk-experiment-1", "chunk-experiment-2", "chunk-experiment-3"):
             NimbusExperimentFactory.create_with_lifecycle(
                 NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
                 slug=slug,
             )
 
         queryset = V8ViewSet.queryset
-        streamed = stream_render_queryset(queryset, V8NimbusExperimentSerializer)
+        chunks = list(
+            stream_experiment_fragments(
+                queryset, V8NimbusExperimentSerializer, chunk_size=2
+            )
+        )
+
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(
+            b"".join(chunks),
+            JSONRenderer().render(
+                V8NimbusExperimentSerializer(queryset.all(), many=True).data
+            ),
+        )
+
+    def test_render_experiment_fragments_matches_drf_json_renderer(self):
+        for slug in ("eq-experiment-1", "eq-experiment-2", "eq-experiment-3"):
+            NimbusExperimentFactory.create_with_lifecycle(
+                NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING,
+                slug=slug,
+            )
 
+        queryset = V8ViewSet.queryset
         rendered = JSONRenderer().render(
             V8NimbusExperimentSerializer(queryset.all(), many=True).data
         )
 
-        self.assertEqual(streamed, rendered)
+        # Rendered from the database, then from the cached fragments
+        self.assertEqual(
+            render_experiment_fragments(queryset, V8NimbusExperimentSerializer), rendered
+        )
+        self.assertEqual(
+            render_experiment_fragments(queryset, V8NimbusExperimentSerializer), rendered
+        )
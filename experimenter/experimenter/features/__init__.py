@@ -1,6 +1,9 @@
+import hashlib
 import json
+import os
 import re
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -30,6 +33,27 @@ FEATURE_PYTHON_TYPES = {
     FeatureVariableType.BOOLEAN: bool,
 }
 
+# The LibYAML loader is an order of magnitude faster than the pure Python one.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+VERSION_RE = re.compile(r"^v(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)")
+
+
+def get_file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@dataclass(frozen=True)
+class FeatureManifest:
+    application_slug: str
+    path: Path
+    version: Version | None = None
+
+    @property
+    def name(self) -> str:
+        """The path of the manifest relative to FEATURE_MANIFESTS_PATH."""
+        return self.path.relative_to(settings.FEATURE_MANIFESTS_PATH).as_posix()
+
 
 @dataclass
 class Feature:
@@ -38,15 +62,21 @@ class Feature:
     model: SdkFeature | DesktopFeature
     version: Version | None = None
 
+    @classmethod
+    def get_remote_jsonschema_path(
+        cls, application_slug: str, feature_model: DesktopFeature
+    ) -> Path:
+        return (
+            settings.FEATURE_MANIFESTS_PATH
+            / application_slug
+            / "schemas"
+            / feature_model.json_schema.path
+        )
+
     @classmethod
     def load_remote_jsonschema(cls, application_slug: str, feature_model: DesktopFeature):
         if feature_model.json_schema is not None:
-            schema_path = (
-                settings.FEATURE_MANIFESTS_PATH
-                / application_slug
-                / "schemas"
-                / feature_model.json_schema.path
-            )
+            schema_path = cls.get_remote_jsonschema_path(application_slug, feature_model)
 
             with schema_path.open() as f:
                 try:
@@ -83,6 +113,16 @@ class Feature:
             isinstance(self.model, DesktopFeature) and self.model.json_schema is not None
         )
 
+    @property
+    def remote_schema_name(self) -> str | None:
+        """The path of the remote schema relative to FEATURE_MANIFESTS_PATH."""
+        if self.has_remote_schema:
+            return (
+                self.get_remote_jsonschema_path(self.application_slug, self.model)
+                .relative_to(settings.FEATURE_MANIFESTS_PATH)
+                .as_posix()
+            )
+
     def get_jsonschema(self):
         if self.has_remote_schema:
             return self.load_remote_jsonschema(self.application_slug, self.model)
@@ -100,8 +140,8 @@ class Features:
         manifest_path: Path,
         version: Version = None,
     ):
-        with manifest_path.open() as manifest_file:
-            application_data = yaml.safe_load(manifest_file)
+        with manifest_path.open("rb") as manifest_file:
+            application_data = yaml.load(manifest_file, Loader=YAML_LOADER)
 
             if application.slug == NimbusConstants.Application.DESKTOP:
                 manifest_cls = DesktopFeatureManifest
@@ -119,33 +159,81 @@ class Features:
                 )
 
     @classmethod
-    def _load_features(cls):
-        features = []
-        version_re = re.compile(r"^v(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)")
+    def manifests(cls) -> list[FeatureManifest]:
+        """Every feature manifest on disk."""
+        manifests = []
 
         for application in NimbusConstants.APPLICATION_CONFIGS.values():
             application_dir: Path = settings.FEATURE_MANIFESTS_PATH / application.slug
             application_yaml_path = application_dir / "experimenter.yaml"
 
             if application_yaml_path.exists():
-                features.extend(cls._read_manifest(application, application_yaml_path))
+                manifests.append(FeatureManifest(application.slug, application_yaml_path))
 
-                for child in application_dir.iterdir():
+                for child in sorted(application_dir.iterdir()):
                     if not child.is_dir():
                         continue
 
-                    if m := version_re.match(child.name):
+                    if m := VERSION_RE.match(child.name):
                         version = Version.from_match(m.groupdict())
 
                         application_yaml_path = child / "experimenter.yaml"
                         if application_yaml_path.exists():
-                            features.extend(
-                                cls._read_manifest(
-                                    application, application_yaml_path, version
+                            manifests.append(
+                                FeatureManifest(
+                                    application.slug, application_yaml_path, version
                                 )
                             )
 
-        return features
+        return manifests
+
+    @classmethod
+    def schema_paths(cls) -> list[Path]:
+        """Every remote JSON schema that features can reference."""
+        return [
+            path
+            for application in NimbusConstants.APPLICATION_CONFIGS.values()
+            for path in sorted(
+                (settings.FEATURE_MANIFESTS_PATH / application.slug / "schemas").rglob(
+                    "*"
+                )
+            )
+            if path.is_file()
+        ]
+
+    @classmethod
+    def read_manifest(cls, manifest: FeatureManifest) -> list[Feature]:
+        return list(
+            cls._read_manifest(
+                NimbusConstants.APPLICATION_CONFIGS[manifest.application_slug],
+                manifest.path,
+                manifest.version,
+            )
+        )
+
+    @classmethod
+    def read_manifests(
+        cls, manifests: list[FeatureManifest], max_workers: int = 1
+    ) -> list[list[Feature]]:
+        """
+        Parses the given manifests, spreading them over a pool of processes when
+        there is more than one to parse and more than one CPU to parse them on, and
+        returns their features in the same order as the manifests.
+        """
+        max_workers = min(max_workers, len(manifests), os.cpu_count() or 1)
+        if max_workers <= 1:
+            return [cls.read_manifest(manifest) for manifest in manifests]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(cls.read_manifest, manifests))
+
+    @classmethod
+    def _load_features(cls):
+        return [
+            feature
+            for features in cls.read_manifests(cls.manifests())
+            for feature in features
+        ]
 
     @classmethod
     def clear_cache(cls):
@@ -2,6 +2,7 @@ import itertools
 import logging
 from typing import Optional, Union
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from mozilla_nimbus_schemas.experimenter_apis.experiments.feature_manifests import (
@@ -12,10 +13,11 @@ from mozilla_nimbus_schemas.experimenter_apis.experiments.feature_manifests impo
 from experimenter.experiments.constants import NO_FEATURE_SLUG, Application
 from experimenter.experiments.models import (
     NimbusFeatureConfig,
+    NimbusFeatureManifestFile,
     NimbusFeatureVersion,
     NimbusVersionedSchema,
 )
-from experimenter.features import Features
+from experimenter.features import Feature, FeatureManifest, Features, get_file_hash
 from manifesttool.version import Version
 
 logger = logging.getLogger()
@@ -24,10 +26,63 @@ logger = logging.getLogger()
 class Command(BaseCommand):
     help = "Load Feature Configs from remote sources"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Load every manifest, even those that have not changed since the "
+            "last load",
+        )
+
     @transaction.atomic
     def handle(self, *args, **options):
         logger.info("Loading Features")
 
+        # The manifest index records the hash of every manifest and schema file
+        # as of the last load, so only the manifests whose contents (or whose
+        # schemas' contents) have changed since then have to be parsed and
+        # written. Without an index every manifest is loaded.
+        index: dict[str, NimbusFeatureManifestFile] = {
+            f.path: f for f in NimbusFeatureManifestFile.objects.all()
+        }
+        full = options["full"] or not index
+
+        manifests = Features.manifests()
+        hashes = {
+            name: get_file_hash(path)
+            for name, path in itertools.chain(
+                ((m.name, m.path) for m in manifests),
+                (
+                    (path.relative_to(settings.FEATURE_MANIFESTS_PATH).as_posix(), path)
+                    for path in Features.schema_paths()
+                ),
+            )
+        }
+
+        changed_manifests = [
+            manifest
+            for manifest in manifests
+            if full or _is_manifest_changed(manifest, index, hashes)
+        ]
+        logger.info(f"Loading {len(changed_manifests)} of {len(manifests)} manifests")
+        manifest_features = Features.read_manifests(
+            changed_manifests, max_workers=settings.FEATURE_MANIFEST_MAX_WORKERS
+        )
+        features: list[Feature] = list(itertools.chain.from_iterable(manifest_features))
+
+        # Applications whose unversioned manifest was loaded or removed, and so
+        # whose feature configs have to be enabled or disabled again.
+        loaded_applications = {
+            m.application_slug for m in changed_manifests if m.version is None
+        }
+        loaded_applications.update(
+            application_slug
+            for application_slug, _, name in (
+                path.partition("/") for path in index.keys() - hashes.keys()
+            )
+            if name == "experimenter.yaml"
+        )
+
         # A mapping of (application slug, feature slug) to feature configs.
         #
         # Features will include multiples of the same feature, each with a
@@ -38,7 +93,9 @@ class Command(BaseCommand):
             (fc.application, fc.slug): fc for fc in NimbusFeatureConfig.objects.all()
         }
 
-        features_to_disable = set(feature_configs.keys())
+        features_to_disable = {
+            key for key in feature_configs if full or key[0] in loaded_applications
+        }
 
         # Iterate through the unversioned features first for the initial
         #
@@ -48,9 +105,32 @@ class Command(BaseCommand):
         # When we are ingesting versioned Features, we want to update the
         # NimbusFeatureConfig objects with the most up-to-date description.
         updated: set[tuple[str, str]] = set()
+        if not full:
+            # Manifests that were not loaded already provided their descriptions,
+            # so the versioned features only take over a description when no
+            # unversioned or newer versioned manifest has the feature.
+            updated.update(
+                key
+                for key, feature_config in feature_configs.items()
+                if feature_config.enabled and key[0] not in loaded_applications
+            )
+            newest_versions = _get_newest_versions()
+            updated.update(
+                key
+                for feature in features
+                if feature.version is not None
+                and (key := (feature.application_slug, feature.slug)) in feature_configs
+                and newest_versions.get(feature_configs[key].id, feature.version)
+                > feature.version
+            )
+
         for feature in itertools.chain(
-            Features.unversioned(),
-            sorted(Features.versioned(), key=lambda f: f.version, reverse=True),
+            (f for f in features if f.version is None),
+            sorted(
+                (f for f in features if f.version is not None),
+                key=lambda f: f.version,
+                reverse=True,
+            ),
         ):
             key = (feature.application_slug, feature.slug)
             if key in updated:
@@ -122,10 +202,8 @@ class Command(BaseCommand):
         }
 
         versions_to_create = []
-        for feature in Features.versioned():
-            assert feature.version is not None
-
-            if feature.version in versions:
+        for feature in features:
+            if feature.version is None or feature.version in versions:
                 continue
 
             version = versions[feature.version] = NimbusFeatureVersion(
@@ -140,7 +218,11 @@ class Command(BaseCommand):
         # A mapping of (feature_config.id, version.id) to NimbusVersionedSchemas.
         schemas: dict[tuple[int, Optional[int]], NimbusVersionedSchema] = {
             (schema.feature_config_id, schema.version_id): schema
-            for schema in NimbusVersionedSchema.objects.all()
+            for schema in NimbusVersionedSchema.objects.filter(
+                feature_config__in={
+                    feature_configs[(f.application_slug, f.slug)] for f in features
+                }
+            )
         }
 
         # If we call .save() on a newly created model, Django will not properly
@@ -148,7 +230,8 @@ class Command(BaseCommand):
         # faster to call save() only for updates and use bulk_create() for
         # inserts.
         schemas_to_create = []
-        for feature in Features.all():
+        changed_schemas = []
+        for feature in features:
             feature_config = feature_configs[(feature.application_slug, feature.slug)]
             is_early_startup = (
                 isinstance(feature.model, DesktopFeature)
@@ -209,6 +292,9 @@ class Command(BaseCommand):
             elif dirty_fields:
                 schema.save(update_fields=dirty_fields)
 
+                if "schema" in dirty_fields:
+                    changed_schemas.append(schema)
+
             logger.info(
                 f"Feature Loaded: {feature.application_slug}/{feature.slug} "
                 f"(version {feature.version})"
@@ -216,9 +302,93 @@ class Command(BaseCommand):
 
         NimbusVersionedSchema.objects.bulk_create(schemas_to_create)
 
+        # New and changed schemas change the diffs shown on the features page, for
+        # themselves and for the next version of their feature.
+        NimbusVersionedSchema.objects.update_schema_diffs(
+            {
+                schema.feature_config_id
+                for schema in itertools.chain(schemas_to_create, changed_schemas)
+            },
+            changed_ids={schema.id for schema in changed_schemas},
+        )
+
+        _update_index(index, hashes, changed_manifests, manifest_features)
+
         logger.info("Features Updated")
 
 
+def _is_manifest_changed(
+    manifest: FeatureManifest,
+    index: dict[str, NimbusFeatureManifestFile],
+    hashes: dict[str, str],
+) -> bool:
+    indexed = index.get(manifest.name)
+    return (
+        indexed is None
+        or indexed.content_hash != hashes[manifest.name]
+        or any(
+            path not in index or index[path].content_hash != hashes.get(path)
+            for path in indexed.schema_paths
+        )
+    )
+
+
+def _get_newest_versions() -> dict[int, Version]:
+    """A mapping of feature config ids to the newest version they have a schema for."""
+    newest_versions: dict[int, Version] = {}
+    for feature_config_id, *version in NimbusVersionedSchema.objects.filter(
+        version__isnull=False
+    ).values_list(
+        "feature_config_id", "version__major", "version__minor", "version__patch"
+    ):
+        version = Version(*version)
+        if feature_config_id not in newest_versions or (
+            version > newest_versions[feature_config_id]
+        ):
+            newest_versions[feature_config_id] = version
+
+    return newest_versions
+
+
+def _update_index(
+    index: dict[str, NimbusFeatureManifestFile],
+    hashes: dict[str, str],
+    manifests: list[FeatureManifest],
+    manifest_features: list[list[Feature]],
+):
+    schema_paths = {
+        manifest.name: sorted(
+            {f.remote_schema_name for f in features if f.has_remote_schema}
+        )
+        for manifest, features in zip(manifests, manifest_features, strict=True)
+    }
+
+    files_to_create = []
+    files_to_update = []
+    for path, content_hash in hashes.items():
+        indexed = index.get(path)
+        if indexed is None:
+            files_to_create.append(
+                NimbusFeatureManifestFile(
+                    path=path,
+                    content_hash=content_hash,
+                    schema_paths=schema_paths.get(path, []),
+                )
+            )
+        elif indexed.content_hash != content_hash or path in schema_paths:
+            indexed.content_hash = content_hash
+            indexed.schema_paths = schema_paths.get(path, indexed.schema_paths)
+            files_to_update.append(indexed)
+
+    NimbusFeatureManifestFile.objects.bulk_create(files_to_create)
+    NimbusFeatureManifestFile.objects.bulk_update(
+        files_to_update, ["content_hash", "schema_paths"]
+    )
+    NimbusFeatureManifestFile.objects.filter(
+        path__in=index.keys() - hashes.keys()
+    ).delete()
+
+
 def _set_pref_name(v: Union[SetPref, str]) -> str:
     if isinstance(v, SetPref):
         return v.pref
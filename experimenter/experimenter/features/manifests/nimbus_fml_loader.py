@@ -1,7 +1,11 @@
+import hashlib
 import logging
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Hashable, Iterable
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from django.conf import settings
 from nimbus_megazord.fml import FmlClient, FmlError, FmlLoaderConfig
@@ -12,7 +16,59 @@ from experimenter.experiments.models import NimbusFeatureVersion
 logger = logging.getLogger()
 
 
+class LRUCache:
+    """A thread safe cache that evicts its least recently used entry when full."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_set(self, key: Hashable, default: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        value = default()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1024)
+def _get_manifest_hash(file_path: Path, mtime_ns: int, size: int) -> str:
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def get_manifest_hash(file_path: Path) -> str:
+    """The SHA-256 of a manifest, cached for as long as the file is unmodified."""
+    stat = file_path.stat()
+    return _get_manifest_hash(file_path, stat.st_mtime_ns, stat.st_size)
+
+
 class NimbusFmlLoader:
+    # Many versions of an application ship byte-identical manifests, so the
+    # parsed manifests and the errors for a feature value are shared between
+    # all of the versions with the same manifest contents.
+    FML_CLIENT_CACHE_SIZE = 16
+    FML_ERRORS_CACHE_SIZE = 1024
+
+    fml_clients = LRUCache(FML_CLIENT_CACHE_SIZE)
+    fml_errors = LRUCache(FML_ERRORS_CACHE_SIZE)
+
     def __init__(self, application: str, channel: str):
         self.application: str = (
             application if application in NimbusConstants.Application else None
@@ -26,6 +82,12 @@ class NimbusFmlLoader:
         # FML loader.
         return cls(application, channel)
 
+    @classmethod
+    def clear_cache(cls):
+        cls.create_loader.cache_clear()
+        cls.fml_clients.clear()
+        cls.fml_errors.clear()
+
     def file_path(self, version: NimbusFeatureVersion = None):
         """Get path to release feature manifest from experimenter (local)."""
 
@@ -46,23 +108,34 @@ class NimbusFmlLoader:
             )
         return None
 
-    @lru_cache  # noqa: B019
+    def manifest_hash(self, version: Optional[NimbusFeatureVersion] = None):
+        """The content hash of the given version of the feature manifest."""
+        file_path = self.file_path(version)
+        if file_path is not None:
+            return get_manifest_hash(file_path)
+
     def fml_client(self, version: Optional[NimbusFeatureVersion] = None) -> FmlClient:
         """The FmlClient for the given version of the feature manifest.
 
-        There is a single FmlClient for each combination of application, app version,
-        and channel.
+        There is a single FmlClient for each combination of application, channel,
+        and manifest contents, shared by every app version with that manifest.
         """
         file_path = self.file_path(version)
         if file_path is not None:
-            return NimbusFmlLoader.get_fml_client_uncached(
-                str(file_path),
-                self.channel,
-            )
+            return self._get_fml_client(file_path, get_manifest_hash(file_path))
         else:
             logger.error("Nimbus FML Loader: Failed to get FmlClient.")
             return None
 
+    def _get_fml_client(self, file_path: Path, manifest_hash: str) -> FmlClient:
+        return self.fml_clients.get_or_set(
+            (manifest_hash, self.channel),
+            lambda: NimbusFmlLoader.get_fml_client_uncached(
+                str(file_path),
+                self.channel,
+            ),
+        )
+
     @staticmethod
     def get_fml_client_uncached(file_path: Path, channel: str) -> FmlClient:
         try:
@@ -99,13 +172,61 @@ class NimbusFmlLoader:
             A list of feature manifest errors.
         """
         if self.application is not None:
-            errors = []
-            if client := self.fml_client(version):
-                if inspector := client.get_feature_inspector(feature_id):
-                    if errs := inspector.get_errors(blob):
-                        errors.extend(errs)
-                return errors
+            file_path = self.file_path(version)
+            if file_path is None:
+                logger.error("Nimbus FML Loader: Failed to get FmlClient.")
+                return []
+
+            # The client is only needed when the errors for this value are not
+            # already cached, so it is looked up lazily on a cache miss.
+            manifest_hash = get_manifest_hash(file_path)
+
+            def inspect():
+                if client := self._get_fml_client(file_path, manifest_hash):
+                    return self._inspect(client, blob, feature_id)
+                return []
+
+            return list(
+                self.fml_errors.get_or_set(
+                    (
+                        manifest_hash,
+                        self.channel,
+                        feature_id,
+                        hashlib.sha256(blob.encode()).hexdigest(),
+                    ),
+                    inspect,
+                )
+            )
         logger.error(
             "Nimbus FML Loader: Invalid application. Failed to fetch FML errors."
         )
         return []
+
+    def get_fml_errors_by_manifest(
+        self,
+        blob: str,
+        feature_id: str,
+        versions: Iterable[Optional[NimbusFeatureVersion]],
+    ):
+        """Fetch errors from the FML once for each distinct manifest.
+
+        Returns:
+            A list of (versions, errors) tuples, one for each distinct manifest
+            among the given versions.
+        """
+        versions_by_manifest = defaultdict(list)
+        for version in versions:
+            versions_by_manifest[self.manifest_hash(version)].append(version)
+
+        return [
+            (versions, self.get_fml_errors(blob, feature_id, versions[0]))
+            for versions in versions_by_manifest.values()
+        ]
+
+    @staticmethod
+    def _inspect(client: FmlClient, blob: str, feature_id: str):
+        errors = []
+        if inspector := client.get_feature_inspector(feature_id):
+            if errs := inspector.get_errors(blob):
+                errors.extend(errs)
+        return errors
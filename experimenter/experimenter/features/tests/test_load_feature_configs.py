@@ -1,4 +1,5 @@
 import json
+from unittest import mock
 
 from django.core.management import call_command
 from django.test import TestCase
@@ -6,7 +7,9 @@ from django.test import TestCase
 from experimenter.experiments.models import (
     NimbusExperiment,
     NimbusFeatureConfig,
+    NimbusFeatureManifestFile,
     NimbusFeatureVersion,
+    NimbusVersionedSchema,
 )
 from experimenter.experiments.tests.factories import (
     NimbusFeatureConfigFactory,
@@ -372,3 +375,141 @@ class TestLoadVersionedFeatureConfigs(TestCase):
         self.assertEqual(feature_2.name, "feature-2")
         self.assertEqual(feature_2.description, "Feature 2 for version 120.1.0")
         self.assertFalse(feature_2.enabled)
+
+    def test_load_feature_configs_stores_schema_diffs(self):
+        call_command("load_feature_configs")
+
+        feature_1 = NimbusFeatureConfig.objects.get(slug="feature-1")
+        schema_120_0_0 = feature_1.schemas.get(version__minor=0)
+        schema_120_1_0 = feature_1.schemas.get(version__minor=1)
+        unversioned = feature_1.schemas.get(version=None)
+
+        self.assertIsNone(schema_120_0_0.previous_schema)
+        self.assertEqual(schema_120_0_0.schema_change_size, "first_version")
+        self.assertEqual(schema_120_1_0.previous_schema, schema_120_0_0)
+        self.assertEqual(unversioned.previous_schema, schema_120_1_0)
+        self.assertFalse(
+            feature_1.schemas.filter(schema_change_size__isnull=True).exists()
+        )
+
+
+@mock_versioned_features
+class TestLoadFeatureConfigsIncrementally(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        Features.clear_cache()
+
+    def setUp(self):
+        super().setUp()
+        call_command("load_feature_configs")
+
+    def load_feature_configs(self, *args):
+        with mock.patch.object(
+            Features, "read_manifests", wraps=Features.read_manifests
+        ) as read_manifests:
+            call_command("load_feature_configs", *args)
+
+        (manifests,), _ = read_manifests.call_args
+        return [manifest.name for manifest in manifests]
+
+    def test_indexes_every_manifest(self):
+        self.assertEqual(
+            set(NimbusFeatureManifestFile.objects.values_list("path", flat=True)),
+            {
+                "firefox-desktop/experimenter.yaml",
+                "firefox-desktop/v120.0.0/experimenter.yaml",
+                "firefox-desktop/v120.1.0/experimenter.yaml",
+            },
+        )
+
+    def test_unchanged_manifests_are_not_loaded(self):
+        self.assertEqual(self.load_feature_configs(), [])
+        self.assertEqual(NimbusFeatureConfig.objects.count(), 2)
+        self.assertTrue(NimbusFeatureConfig.objects.get(slug="feature-1").enabled)
+
+    def test_changed_manifest_is_loaded(self):
+        NimbusFeatureManifestFile.objects.filter(
+            path="firefox-desktop/v120.0.0/experimenter.yaml"
+        ).update(content_hash="stale")
+        NimbusVersionedSchema.objects.filter(version__isnull=False).update(schema="stale")
+
+        self.assertEqual(
+            self.load_feature_configs(), ["firefox-desktop/v120.0.0/experimenter.yaml"]
+        )
+
+        self.assertFalse(
+            NimbusVersionedSchema.objects.filter(
+                version__major=120, version__minor=0, schema="stale"
+            ).exists()
+        )
+        self.assertEqual(
+            NimbusVersionedSchema.objects.filter(
+                version__major=120, version__minor=1, schema="stale"
+            ).count(),
+            2,
+        )
+        self.assertFalse(
+            NimbusFeatureManifestFile.objects.filter(content_hash="stale").exists()
+        )
+
+        feature_1 = NimbusFeatureConfig.objects.get(slug="feature-1")
+        self.assertEqual(feature_1.description, "Unversioned Feature 1")
+        self.assertTrue(feature_1.enabled)
+        feature_2 = NimbusFeatureConfig.objects.get(slug="feature-2")
+        self.assertEqual(feature_2.description, "Feature 2 for version 120.1.0")
+        self.assertFalse(feature_2.enabled)
+
+    def test_removed_unversioned_manifest_disables_features(self):
+        NimbusFeatureManifestFile.objects.create(
+            path="fenix/experimenter.yaml", content_hash="removed"
+        )
+        fenix_feature = NimbusFeatureConfigFactory.create(
+            application=NimbusExperiment.Application.FENIX, enabled=True
+        )
+
+        self.assertEqual(self.load_feature_configs(), [])
+
+        fenix_feature.refresh_from_db()
+        self.assertFalse(fenix_feature.enabled)
+        self.assertFalse(
+            NimbusFeatureManifestFile.objects.filter(
+                path="fenix/experimenter.yaml"
+            ).exists()
+        )
+
+    def test_full_loads_every_manifest(self):
+        self.assertEqual(
+            self.load_feature_configs("--full"),
+            [
+                "firefox-desktop/experimenter.yaml",
+                "firefox-desktop/v120.0.0/experimenter.yaml",
+                "firefox-desktop/v120.1.0/experimenter.yaml",
+            ],
+        )
+
+
+@mock_remote_schema_features
+class TestLoadRemoteSchemaFeatureConfigsIncrementally(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        Features.clear_cache()
+
+    def test_changed_schema_reloads_manifests_that_reference_it(self):
+        call_command("load_feature_configs")
+
+        schema_path = "firefox-desktop/schemas/path/to/schema.json"
+        manifest_file = NimbusFeatureManifestFile.objects.get(
+            path="firefox-desktop/experimenter.yaml"
+        )
+        self.assertEqual(manifest_file.schema_paths, [schema_path])
+
+        NimbusFeatureManifestFile.objects.filter(path=schema_path).update(
+            content_hash="stale"
+        )
+        NimbusVersionedSchema.objects.update(schema="stale")
+
+        call_command("load_feature_configs")
+
+        self.assertFalse(NimbusVersionedSchema.objects.filter(schema="stale").exists())
@@ -1,14 +1,16 @@
 import json
+import shutil
+import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
 from django.conf import settings
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from nimbus_megazord.fml import FmlClient, FmlError
 from parameterized import parameterized
 
 from experimenter.experiments.constants import NimbusConstants
-from experimenter.features.manifests.nimbus_fml_loader import NimbusFmlLoader
+from experimenter.features.manifests.nimbus_fml_loader import LRUCache, NimbusFmlLoader
 from experimenter.features.tests import (
     FML_DIR,
     mock_fml_features,
@@ -20,8 +22,7 @@ class TestNimbusFmlLoader(TestCase):
     maxDiff = None
 
     def setUp(self):
-        NimbusFmlLoader.create_loader.cache_clear()
-        NimbusFmlLoader.fml_client.cache_clear()
+        NimbusFmlLoader.clear_cache()
 
     def create_loader(
         self,
@@ -243,17 +244,102 @@ class TestNimbusFmlLoader(TestCase):
                 log.output[0],
             )
 
+    def mock_identical_manifests(self, *versions):
+        manifest_path = FML_DIR / "versioned_features" / "fenix" / "v119.0.0"
+        manifests_path = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, manifests_path)
+
+        for version in versions:
+            version_path = manifests_path / "fenix" / f"v{version}"
+            version_path.mkdir(parents=True)
+            shutil.copy(
+                manifest_path / "release.fml.yaml", version_path / "release.fml.yaml"
+            )
+
+        return manifests_path
+
+    def test_fml_client_is_shared_by_identical_manifests(self):
+        manifests_path = self.mock_identical_manifests("119.0.0", "120.0.0")
+        loader = self.create_loader()
+
+        with (
+            override_settings(FEATURE_MANIFESTS_PATH=manifests_path),
+            patch(
+                "nimbus_megazord.fml.FmlClient.new_with_config",
+                wraps=FmlClient.new_with_config,
+            ) as new_with_config,
+        ):
+            client = loader.fml_client("119.0.0")
+
+            self.assertIs(loader.fml_client("120.0.0"), client)
+            new_with_config.assert_called_once()
+
+    def test_get_fml_errors_by_manifest_validates_once_per_manifest(self):
+        manifests_path = self.mock_identical_manifests("119.0.0", "120.0.0", "121.0.0")
+        with (manifests_path / "fenix" / "v121.0.0" / "release.fml.yaml").open("a") as f:
+            f.write("\n# A change to the manifest\n")
+        loader = self.create_loader()
+        test_blob = json.dumps({"features": {"new-feature": {"enabled": "false"}}})
+
+        with (
+            override_settings(FEATURE_MANIFESTS_PATH=manifests_path),
+            patch.object(
+                NimbusFmlLoader, "_inspect", wraps=NimbusFmlLoader._inspect
+            ) as inspect,
+        ):
+            result = loader.get_fml_errors_by_manifest(
+                test_blob, "cookie-banners", ["119.0.0", "120.0.0", "121.0.0"]
+            )
+            loader.get_fml_errors_by_manifest(
+                test_blob, "cookie-banners", ["119.0.0", "120.0.0", "121.0.0"]
+            )
+
+        self.assertEqual(inspect.call_count, 2)
+        self.assertEqual(
+            [versions for versions, _ in result],
+            [["119.0.0", "120.0.0"], ["121.0.0"]],
+        )
+        expected_error = 'Invalid property "features"; did you mean "sections-enabled"?'
+        for _, errors in result:
+            self.assertIn(expected_error, errors[0].message)
+
+    def test_get_fml_errors_does_not_build_client_for_cached_errors(self):
+        loader = self.create_loader()
+        test_blob = json.dumps({"features": {"new-feature": {"enabled": "false"}}})
+        errors = loader.get_fml_errors(test_blob, "cookie-banners")
+        NimbusFmlLoader.fml_clients.clear()
+
+        with patch(
+            "nimbus_megazord.fml.FmlClient.new_with_config",
+            wraps=FmlClient.new_with_config,
+        ) as new_with_config:
+            result = loader.get_fml_errors(test_blob, "cookie-banners")
+
+        new_with_config.assert_not_called()
+        self.assertEqual(
+            [error.message for error in result], [error.message for error in errors]
+        )
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.get_or_set("a", lambda: 1)
+        cache.get_or_set("b", lambda: 2)
+        cache.get_or_set("a", lambda: 3)
+        cache.get_or_set("c", lambda: 4)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get_or_set("a", lambda: 5), 1)
+        self.assertEqual(cache.get_or_set("b", lambda: 6), 6)
+
 
 class FeatureManifestTests(TestCase):
     @classmethod
     def setUpClass(cls):
-        NimbusFmlLoader.create_loader.cache_clear()
-        NimbusFmlLoader.fml_client.cache_clear()
+        NimbusFmlLoader.clear_cache()
 
     @classmethod
     def tearDownClass(cls):
-        NimbusFmlLoader.create_loader.cache_clear()
-        NimbusFmlLoader.fml_client.cache_clear()
+        NimbusFmlLoader.clear_cache()
 
     @staticmethod
     def _discover_fml_files(application):
@@ -1,14 +1,17 @@
+import codecs
 import functools
 import json
 import logging
+import re
+import time
 import tomllib
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from itertools import chain
 from pathlib import Path
 from typing import Any
 
-import sentry_sdk
+import markus
 from django.conf import settings
 from django.core.files.storage import storages
 from django.utils import timezone
@@ -18,25 +21,30 @@ from mozilla_nimbus_schemas.jetstream import (
     AnalysisErrors,
     Metadata,
     SampleSizes,
-    Statistics,
 )
-from pydantic import ValidationError
+from mozilla_nimbus_schemas.jetstream import Statistic as JetstreamStatisticResult
+from pydantic import TypeAdapter, ValidationError
 
 from experimenter.experiments.models import NimbusExperiment
+from experimenter.jetstream.columnar import (
+    EMPTY_TABLE,
+    StatisticsTable,
+    get_segment_results,
+)
 from experimenter.jetstream.models import (
     METRIC_GROUP,
+    RETENTION_2_WEEKS_WINDOW_INDEX,
     AnalysisWindow,
     Group,
-    JetstreamData,
     Metric,
     Segment,
     Statistic,
-    create_results_object_model,
 )
 from experimenter.outcomes import Metric as OutcomeMetric
 from experimenter.outcomes import Outcomes
 
 logger = logging.getLogger(__name__)
+metrics = markus.get_metrics("jetstream.client")
 
 STATISTICS_FOLDER = "statistics"
 METADATA_FOLDER = "metadata"
@@ -53,26 +61,184 @@ ALL_STATISTICS = {
     Statistic.LINEAR_MODEL_MEAN,
 }
 
+STREAM_CHUNK_SIZE = 64 * 1024
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+JSON_NUMBER_TAIL = re.compile(r"[0-9eE.+-]*")
+# Built once and reused for every statistics file
+STATISTIC_ADAPTER = TypeAdapter(JetstreamStatisticResult)
+
 analysis_storage = storages["analysis"]
 
 
 def load_data_from_gcs(path):
-    if analysis_storage.exists(path):
-        return json.loads(analysis_storage.open(path).read())
-    else:
-        raise RuntimeError(f"Could not find data in analysis bucket at path {path}")
-
-
-def validate_data(data_json):
-    if data_json:
-        Statistics.model_validate(data_json)
-    return data_json
+    # Opening a missing file raises, so there is no need to check that it exists
+    # first with a separate request
+    start_time = time.monotonic()
+    try:
+        content = analysis_storage.open(path).read()
+    except FileNotFoundError as e:
+        raise RuntimeError(
+            f"Could not find data in analysis bucket at path {path}"
+        ) from e
+
+    tags = [f"folder:{Path(path).parts[0]}"]
+    metrics.timing(
+        "load_data_from_gcs.latency", (time.monotonic() - start_time) * 1000, tags=tags
+    )
+    metrics.histogram("load_data_from_gcs.bytes", len(content), tags=tags)
+    return json.loads(content)
+
+
+def load_concurrently(loaders):
+    """
+    Calls every loader on a bounded thread pool sharing the analysis storage
+    client, and returns a future for each. Reading a future's result raises the
+    error its loader raised, so errors can still be handled in a fixed order.
+    """
+    with ThreadPoolExecutor(
+        max_workers=min(settings.ANALYSIS_FETCH_MAX_WORKERS, len(loaders)),
+        thread_name_prefix="analysis-fetch",
+    ) as executor:
+        return {key: executor.submit(loader) for key, loader in loaders.items()}
+
+
+def iter_json_array(read, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yields the items of a JSON array one at a time, reading the document in chunks
+    so that it never has to be held in memory as a whole.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    at_end = False
+
+    def read_more():
+        nonlocal buffer, position, at_end
+        chunk = read(chunk_size)
+        at_end = not chunk
+        if isinstance(chunk, bytes):
+            chunk = text_decoder.decode(chunk, final=at_end)
+        buffer = buffer[position:] + chunk
+        position = 0
+
+    def next_character():
+        nonlocal position
+        while True:
+            position = JSON_WHITESPACE.match(buffer, position).end()
+            if position < len(buffer):
+                return buffer[position]
+            if at_end:
+                raise json.JSONDecodeError("Unexpected end of data", buffer, position)
+            read_more()
+
+    if next_character() != "[":
+        raise ValueError("Expected a JSON array")
+    position += 1
+    if next_character() == "]":
+        return
+
+    while True:
+        next_character()
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if at_end:
+                raise
+            read_more()
+            continue
+
+        # A number at the end of the buffer may continue in the next chunk
+        if not at_end and JSON_NUMBER_TAIL.match(buffer, end).end() == len(buffer):
+            read_more()
+            continue
+
+        position = end
+        yield item
+
+        delimiter = next_character()
+        position += 1
+        if delimiter == "]":
+            return
+        if delimiter != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position - 1)
+
+
+def stream_data_from_gcs(path):
+    start_time = time.monotonic()
+    try:
+        file = analysis_storage.open(path)
+    except FileNotFoundError as e:
+        raise RuntimeError(
+            f"Could not find data in analysis bucket at path {path}"
+        ) from e
+
+    size = 0
+
+    def read(chunk_size):
+        nonlocal size
+        chunk = file.read(chunk_size)
+        size += len(chunk)
+        return chunk
+
+    # The file is closed when the items are exhausted, and also when the caller
+    # stops early, which closes the generator
+    with file:
+        yield from iter_json_array(read)
+
+    tags = [f"folder:{Path(path).parts[0]}"]
+    metrics.timing(
+        "load_data_from_gcs.latency", (time.monotonic() - start_time) * 1000, tags=tags
+    )
+    metrics.histogram("load_data_from_gcs.bytes", size, tags=tags)
+
+
+def validate_statistics(points):
+    """
+    Validates each point as it is read, along with the check for duplicate points
+    that the Statistics schema runs over the whole list.
+    """
+    seen = set()
+    for index, point in enumerate(points):
+        statistic = STATISTIC_ADAPTER.validate_python(point)
+        key = (
+            statistic.metric,
+            statistic.statistic,
+            statistic.branch,
+            statistic.parameter,
+            statistic.comparison,
+            statistic.comparison_to_branch,
+            statistic.ci_width,
+            statistic.segment,
+            statistic.analysis_basis,
+            statistic.window_index,
+        )
+        if key in seen:
+            raise ValidationError.from_exception_data(
+                "Statistics",
+                [
+                    {
+                        "type": "value_error",
+                        "loc": (index,),
+                        "input": point,
+                        "ctx": {
+                            "error": ValueError(
+                                "List of Statistic objects has duplicate(s)."
+                            )
+                        },
+                    }
+                ],
+            )
+        seen.add(key)
+        yield point
 
 
 def get_data(slug, window):
     filename = f"statistics_{slug}_{window}.json"
     path = Path(STATISTICS_FOLDER, filename)
-    return validate_data(load_data_from_gcs(str(path)))
+    return StatisticsTable.from_records(
+        validate_statistics(stream_data_from_gcs(str(path)))
+    )
 
 
 def validate_metadata(metadata_json):
@@ -123,38 +289,51 @@ def get_population_estimates_data():
     return load_data_from_gcs(str(path))
 
 
-def get_results_filenames():
-    filenames_by_folder = {}
+def get_results_files():
+    """
+    Lists the statistics, metadata and errors folders once, returning the
+    generation, etag and modification time of every file keyed by folder and
+    filename so that changed files can be found without reading them.
+    """
+    files_by_folder = {}
     for folder in [STATISTICS_FOLDER, METADATA_FOLDER, ERRORS_FOLDER]:
-        _, filenames = analysis_storage.listdir(folder)
-        filenames_by_folder[folder] = set(filenames)
-    return filenames_by_folder
-
-
-def _parse_analysis_start_time(metadata):
-    start_time = metadata.get("analysis_start_time") if metadata else None
-    return datetime.fromisoformat(start_time) if start_time else None
+        files_by_folder[folder] = {
+            Path(blob.name).name: {
+                "generation": blob.generation,
+                "etag": blob.etag,
+                "updated": blob.updated,
+            }
+            for blob in analysis_storage.bucket.list_blobs(
+                prefix=f"{folder}/", delimiter="/"
+            )
+        }
+    return files_by_folder
 
 
-def get_latest_analysis_start_time(experiment_slug):
+def get_experiment_results_files(experiment_slug, results_files):
+    """
+    Returns the listed files that get_experiment_data reads for an experiment,
+    keyed by their path in the analysis bucket.
+    """
     recipe_slug = experiment_slug.replace("-", "_")
-    try:
-        metadata = get_metadata(recipe_slug)
-    except RuntimeError:
-        return None
-    except ValidationError as e:
-        sentry_sdk.capture_exception(e)
-        logger.warning(
-            f"Skipping {experiment_slug}, metadata failed schema validation: {e}"
-        )
-        return None
-    return _parse_analysis_start_time(metadata)
-
-
-def get_stored_analysis_start_time(experiment):
-    results_data = experiment.results_data or {}
-    metadata = (results_data.get("v3") or {}).get("metadata")
-    return _parse_analysis_start_time(metadata)
+    filenames_by_folder = {
+        STATISTICS_FOLDER: [
+            f"statistics_{recipe_slug}_{window}.json"
+            for window in (
+                AnalysisWindow.DAILY,
+                AnalysisWindow.WEEKLY,
+                AnalysisWindow.OVERALL,
+            )
+        ],
+        METADATA_FOLDER: [f"metadata_{recipe_slug}.json"],
+        ERRORS_FOLDER: [f"errors_{recipe_slug}.json"],
+    }
+    return {
+        str(Path(folder, filename)): results_files[folder][filename]
+        for folder, filenames in filenames_by_folder.items()
+        for filename in filenames
+        if filename in results_files[folder]
+    }
 
 
 def expected_windows(experiment):
@@ -166,7 +345,7 @@ def expected_windows(experiment):
     return windows
 
 
-def has_missing_expected_results(experiment, results_filenames):
+def has_missing_expected_results(experiment, results_files):
     if experiment.computed_end_date and (
         experiment.computed_end_date
         + timedelta(days=NimbusExperiment.DAYS_ANALYSIS_BUFFER)
@@ -175,7 +354,7 @@ def has_missing_expected_results(experiment, results_filenames):
         return False
 
     recipe_slug = experiment.slug.replace("-", "_")
-    statistics_files = results_filenames[STATISTICS_FOLDER]
+    statistics_files = results_files[STATISTICS_FOLDER]
     return any(
         f"statistics_{recipe_slug}_{window}.json" not in statistics_files
         for window in expected_windows(experiment)
@@ -183,7 +362,7 @@ def has_missing_expected_results(experiment, results_filenames):
 
 
 def get_results_metrics_map(
-    data: JetstreamData,
+    metric_statistics: list[tuple[str, str]],
     primary_outcome_slugs: list[str],
     secondary_outcome_slugs: list[str],
     outcomes_metadata,
@@ -235,7 +414,7 @@ def get_results_metrics_map(
         results_metrics_map[outcome_slug] = ALL_STATISTICS
 
     other_metrics_map, other_metrics = get_other_metrics_names_and_map(
-        data, results_metrics_map
+        metric_statistics, results_metrics_map
     )
     results_metrics_map |= other_metrics_map
 
@@ -243,7 +422,8 @@ def get_results_metrics_map(
 
 
 def get_other_metrics_names_and_map(
-    data: JetstreamData, results_metrics_map: dict[str, set[Statistic]]
+    metric_statistics: list[tuple[str, str]],
+    results_metrics_map: dict[str, set[Statistic]],
 ):
     # These are metrics sent from Jetstream that are not explicitly chosen
     # by users to be either primary or secondary
@@ -258,14 +438,8 @@ def get_other_metrics_names_and_map(
         Statistic.PER_CLIENT_DAU_IMPACT,
         Statistic.POPULATION_RATIO,
     ]
-    other_data = [
-        data_point for data_point in data if data_point.metric not in results_metrics_map
-    ]
-    for jetstream_data_point in other_data:
-        metric = jetstream_data_point.metric
-        statistic = jetstream_data_point.statistic
-
-        if statistic in priority_stats:
+    for metric, statistic in metric_statistics:
+        if metric not in results_metrics_map and statistic in priority_stats:
             metric_title = " ".join([word.title() for word in metric.split("_")])
             group_name = METRIC_GROUP.get(metric, Group.OTHER)
             if group_name not in other_metrics_names:
@@ -293,10 +467,21 @@ def get_experiment_data(experiment: NimbusExperiment):
         AnalysisWindow.OVERALL: {},
     }
 
+    analysis_files = load_concurrently(
+        {
+            METADATA_FOLDER: functools.partial(get_metadata, recipe_slug),
+            ERRORS_FOLDER: functools.partial(get_analysis_errors, recipe_slug),
+            **{
+                window: functools.partial(get_data, recipe_slug, window)
+                for window in windows
+            },
+        }
+    )
+
     runtime_errors = []
     experiment_metadata = None
     try:
-        experiment_metadata = get_metadata(recipe_slug)
+        experiment_metadata = analysis_files[METADATA_FOLDER].result()
     except RuntimeError as e:
         runtime_errors.append(str(e))
 
@@ -306,7 +491,7 @@ def get_experiment_data(experiment: NimbusExperiment):
 
     experiment_errors = None
     try:
-        experiment_errors = get_analysis_errors(recipe_slug)
+        experiment_errors = analysis_files[ERRORS_FOLDER].result()
     except RuntimeError as e:
         runtime_errors.append(str(e))
 
@@ -317,9 +502,9 @@ def get_experiment_data(experiment: NimbusExperiment):
     expected = expected_windows(experiment)
     for window in windows:
         experiment_data[window] = {}
-        data_from_jetstream = []
+        table = EMPTY_TABLE
         try:
-            data_from_jetstream = get_data(recipe_slug, window)
+            table = analysis_files[window].result()
         except RuntimeError as e:
             # only store runtime errors for weekly/overall windows if we expect those
             # results (overall also lags by one day so there is time for analysis to
@@ -327,56 +512,51 @@ def get_experiment_data(experiment: NimbusExperiment):
             if window in expected:
                 runtime_errors.append(str(e))
 
-        segment_points_enrollments = defaultdict(list)
-        segment_points_exposures = defaultdict(list)
-
-        for point in data_from_jetstream:
-            segment_key = point["segment"]
-            if point["analysis_basis"] == AnalysisBasis.ENROLLMENTS:
-                segment_points_enrollments[segment_key].append(point)
-                experiment_data[window][AnalysisBasis.ENROLLMENTS] = {}
-                raw_data[window][AnalysisBasis.ENROLLMENTS] = {}
-            elif point["analysis_basis"] == AnalysisBasis.EXPOSURES:
-                segment_points_exposures[segment_key].append(point)
-                experiment_data[window][AnalysisBasis.EXPOSURES] = {}
-                raw_data[window][AnalysisBasis.EXPOSURES] = {}
-
-        for segment, segment_data in segment_points_enrollments.items():
-            raw_segment_data = JetstreamData(segment_data)
-            raw_data[window][AnalysisBasis.ENROLLMENTS][segment] = raw_segment_data
-            data = raw_segment_data.model_copy(deep=True)
-            (
-                result_metrics,
-                primary_metrics_set,
-                other_metrics,
-            ) = get_results_metrics_map(
-                data,
-                experiment.primary_outcomes,
-                experiment.secondary_outcomes,
-                outcomes_metadata,
-            )
+        for analysis_basis in (AnalysisBasis.ENROLLMENTS, AnalysisBasis.EXPOSURES):
+            segment_tables = table.get_segments(analysis_basis)
+            if not segment_tables:
+                continue
+
+            experiment_data[window][analysis_basis] = {}
+            raw_data[window][analysis_basis] = segment_tables
+
+            for segment, segment_table in segment_tables.items():
+                (
+                    result_metrics,
+                    primary_metrics_set,
+                    other_metrics,
+                ) = get_results_metrics_map(
+                    segment_table.get_metric_statistics(),
+                    experiment.primary_outcomes,
+                    experiment.secondary_outcomes,
+                    outcomes_metadata,
+                )
 
-            if segment == Segment.ALL:
-                experiment_data["other_metrics"] = other_metrics
+                if segment == Segment.ALL:
+                    if analysis_basis == AnalysisBasis.ENROLLMENTS:
+                        experiment_data["other_metrics"] = other_metrics
+                    else:
+                        experiment_data["other_metrics"].update(other_metrics)
 
-            if data and window == AnalysisWindow.OVERALL:
-                # Append some values onto the incoming Jetstream data
-                data.append_population_percentages()
-                weekly_data = (
-                    raw_data.get(AnalysisWindow.WEEKLY, {})
-                    .get(AnalysisBasis.ENROLLMENTS, {})
-                    .get(segment)
-                )
-                week_2_retention = data.get_retention_by_window(
-                    2,
-                    weekly_data,
-                    Metric.RETENTION,
+                weekly_table = (
+                    raw_data[AnalysisWindow.WEEKLY].get(analysis_basis, {}).get(segment)
                 )
-                has_retention = any(
-                    point.metric == Metric.RETENTION for point in weekly_data or []
+                daily_table = (
+                    raw_data[AnalysisWindow.DAILY].get(analysis_basis, {}).get(segment)
                 )
 
-                if has_retention and not week_2_retention and segment == Segment.ALL:
+                if (
+                    window == AnalysisWindow.OVERALL
+                    and analysis_basis == AnalysisBasis.ENROLLMENTS
+                    and segment == Segment.ALL
+                    and weekly_table is not None
+                    and weekly_table.has_metric(Metric.RETENTION)
+                    and not len(
+                        weekly_table.get_retention_by_window(
+                            RETENTION_2_WEEKS_WINDOW_INDEX, (Metric.RETENTION,)
+                        )
+                    )
+                ):
                     runtime_errors.append(
                         AnalysisError(
                             experiment=experiment.slug,
@@ -391,123 +571,17 @@ def get_experiment_data(experiment: NimbusExperiment):
                             timestamp=timezone.now(),
                         )
                     )
-                data.extend(week_2_retention)
-                # Append 3-day retention from daily data
-                data.append_retention_3_days(
-                    raw_data.get(AnalysisWindow.DAILY, {})
-                    .get(AnalysisBasis.ENROLLMENTS, {})
-                    .get(segment)
-                )
-                # Create the output object (overall data)
-                ResultsObjectModel = create_results_object_model(data)
-
-                data = ResultsObjectModel(result_metrics, data, experiment)
-                data.append_conversion_count(primary_metrics_set)
-
-            elif data and window == AnalysisWindow.WEEKLY:
-                data.replace_retention_weeks(
-                    raw_data.get(AnalysisWindow.WEEKLY, {})
-                    .get(AnalysisBasis.ENROLLMENTS, {})
-                    .get(segment)
-                )
-
-                # Append 3-day retention from daily data
-                data.append_retention_3_days(
-                    raw_data.get(AnalysisWindow.DAILY, {})
-                    .get(AnalysisBasis.ENROLLMENTS, {})
-                    .get(segment)
-                )
-
-                ResultsObjectModel = create_results_object_model(data)
-
-                data = ResultsObjectModel(result_metrics, data, experiment, window)
-            elif data and window == AnalysisWindow.DAILY:
-                # Replace the daily 3-day retention data with only the correct fourth
-                # window (if it exists)
-                data.replace_retention_3_days(
-                    raw_data.get(AnalysisWindow.DAILY, {})
-                    .get(AnalysisBasis.ENROLLMENTS, {})
-                    .get(segment)
-                )
-                ResultsObjectModel = create_results_object_model(data)
-
-                data = ResultsObjectModel(result_metrics, data, experiment, window)
-
-            # Convert output object to dict and put into the final object
-            transformed_data = data.model_dump(exclude_none=True) or None
-            experiment_data[window][AnalysisBasis.ENROLLMENTS][segment] = transformed_data
-
-        for segment, segment_data in segment_points_exposures.items():
-            raw_segment_data = JetstreamData(segment_data)
-            raw_data[window][AnalysisBasis.EXPOSURES][segment] = raw_segment_data
-            data = raw_segment_data.model_copy(deep=True)
-            (
-                result_metrics,
-                primary_metrics_set,
-                other_metrics,
-            ) = get_results_metrics_map(
-                data,
-                experiment.primary_outcomes,
-                experiment.secondary_outcomes,
-                outcomes_metadata,
-            )
 
-            if segment == Segment.ALL:
-                experiment_data["other_metrics"].update(other_metrics)
-
-            if data and window == AnalysisWindow.OVERALL:
-                # Append some values onto Jetstream data
-                data.append_population_percentages()
-                data.append_retention_data(
-                    raw_data.get(AnalysisWindow.WEEKLY, {})
-                    .get(AnalysisBasis.EXPOSURES, {})
-                    .get(segment)
-                )
-                # Append 3-day retention from daily data
-                data.append_retention_3_days(
-                    raw_data.get(AnalysisWindow.DAILY, {})
-                    .get(AnalysisBasis.EXPOSURES, {})
-                    .get(segment)
-                )
-
-                ResultsObjectModel = create_results_object_model(data)
-
-                data = ResultsObjectModel(result_metrics, data, experiment)
-                data.append_conversion_count(primary_metrics_set)
-
-            elif data and window == AnalysisWindow.WEEKLY:
-                data.replace_retention_weeks(
-                    raw_data.get(AnalysisWindow.WEEKLY, {})
-                    .get(AnalysisBasis.EXPOSURES, {})
-                    .get(segment)
-                )
-
-                # Append 3-day retention from daily data
-                data.append_retention_3_days(
-                    raw_data.get(AnalysisWindow.DAILY, {})
-                    .get(AnalysisBasis.EXPOSURES, {})
-                    .get(segment)
-                )
-
-                ResultsObjectModel = create_results_object_model(data)
-
-                data = ResultsObjectModel(result_metrics, data, experiment, window)
-            elif data and window == AnalysisWindow.DAILY:
-                # Replace the daily 3-day retention data with only the correct fourth
-                # window (if it exists)
-                data.replace_retention_3_days(
-                    raw_data.get(AnalysisWindow.DAILY, {})
-                    .get(AnalysisBasis.EXPOSURES, {})
-                    .get(segment)
+                experiment_data[window][analysis_basis][segment] = get_segment_results(
+                    window,
+                    segment_table,
+                    weekly_table,
+                    daily_table,
+                    result_metrics,
+                    primary_metrics_set,
+                    experiment.reference_branch.slug,
                 )
 
-                ResultsObjectModel = create_results_object_model(data)
-
-                data = ResultsObjectModel(result_metrics, data, experiment, window)
-
-            transformed_data = data.model_dump(exclude_none=True) or None
-            experiment_data[window][AnalysisBasis.EXPOSURES][segment] = transformed_data
-
     errors_by_metric = {}
     errors_experiment_overall = []
 
@@ -0,0 +1,475 @@
+"""
+A columnar engine that turns Jetstream statistics into the v3 results format.
+
+Statistics files are loaded once into typed NumPy columns. Segments, retention
+windows and the statistics each metric reports are then selected with vectorized
+masks, and significance and population percentages are computed over whole
+columns. The output is built as plain dicts: for each branch, whether it is the
+control and its branch_data, which maps each metric group and metric to the
+absolute, difference and uplift data points and the significance of the metric.
+Each comparison keeps all of its data points and a copy of the first one.
+"""
+
+from collections.abc import Iterable
+from enum import Enum
+from typing import Any
+
+import numpy as np
+from mozilla_nimbus_schemas.jetstream import AnalysisBasis
+from numpy.dtypes import StringDType
+
+from experimenter.jetstream.models import (
+    METRIC_GROUP,
+    RETENTION_2_WEEKS_WINDOW_INDEX,
+    RETENTION_3_DAYS_METRICS,
+    RETENTION_3_DAYS_WINDOW_INDEX,
+    AnalysisWindow,
+    BranchComparison,
+    Group,
+    Metric,
+    Segment,
+    Significance,
+    Statistic,
+)
+
+STRING_DTYPE = StringDType(na_object=None)
+STRING_COLUMNS = (
+    "metric",
+    "statistic",
+    "branch",
+    "comparison",
+    "comparison_to_branch",
+    "segment",
+    "analysis_basis",
+    "window_index",
+)
+FLOAT_COLUMNS = ("point", "lower", "upper")
+SIGNIFICANCES = (Significance.NEGATIVE, Significance.POSITIVE, Significance.NEUTRAL)
+
+
+class StatisticsTable:
+    """
+    The rows of a Jetstream statistics file stored column by column. String
+    columns use a nullable NumPy string dtype and numeric columns are float64,
+    with NaN standing in for a missing value.
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray]):
+        self.columns = columns
+
+    # The number of records buffered as Python values before they are converted
+    # to arrays, which bounds the memory used for a file beyond its columns.
+    BLOCK_SIZE = 10_000
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> "StatisticsTable":
+        """
+        Builds a table in a single pass over the records, so that they can be
+        streamed in without holding them all at once. Records are converted to
+        arrays a block at a time and the blocks are concatenated at the end.
+        """
+        blocks = []
+        values = {name: [] for name in STRING_COLUMNS + FLOAT_COLUMNS}
+        for record in records:
+            for name, column_values in values.items():
+                value = record.get(name)
+                column_values.append(value.value if isinstance(value, Enum) else value)
+
+            if len(values["metric"]) >= cls.BLOCK_SIZE:
+                blocks.append(cls._from_values(values))
+                values = {name: [] for name in values}
+
+        if values["metric"] or not blocks:
+            blocks.append(cls._from_values(values))
+
+        return blocks[0] if len(blocks) == 1 else cls.concatenate(blocks)
+
+    @classmethod
+    def _from_values(cls, values: dict[str, list[Any]]) -> "StatisticsTable":
+        return cls(
+            {
+                name: np.array(
+                    column_values,
+                    dtype=STRING_DTYPE if name in STRING_COLUMNS else np.float64,
+                )
+                for name, column_values in values.items()
+            }
+        )
+
+    @classmethod
+    def from_columns(cls, length: int, **columns: Any) -> "StatisticsTable":
+        """A table whose columns are the given arrays, or constants when scalar."""
+        return cls(
+            {
+                name: (
+                    np.asarray(columns[name], dtype=dtype)
+                    if isinstance(columns.get(name), np.ndarray)
+                    else np.full(length, columns.get(name), dtype=dtype)
+                )
+                for names, dtype in (
+                    (STRING_COLUMNS, STRING_DTYPE),
+                    (FLOAT_COLUMNS, np.float64),
+                )
+                for name in names
+            }
+        )
+
+    @classmethod
+    def concatenate(cls, tables: list["StatisticsTable"]) -> "StatisticsTable":
+        return cls(
+            {
+                name: np.concatenate([table[name] for table in tables])
+                for name in STRING_COLUMNS + FLOAT_COLUMNS
+            }
+        )
+
+    def __len__(self):
+        return len(self["metric"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def select(self, rows: np.ndarray) -> "StatisticsTable":
+        return StatisticsTable(
+            {name: column[rows] for name, column in self.columns.items()}
+        )
+
+    def get_segments(self, analysis_basis: AnalysisBasis) -> dict[str, "StatisticsTable"]:
+        """The rows of an analysis basis split by segment, in file order."""
+        basis_rows = self["analysis_basis"] == analysis_basis.value
+        segments, first_rows = np.unique(self["segment"][basis_rows], return_index=True)
+        return {
+            segment: self.select(basis_rows & (self["segment"] == segment))
+            for segment in segments[np.argsort(first_rows)].tolist()
+        }
+
+    def get_metric_statistic_codes(self) -> tuple[list[tuple[str, str]], np.ndarray]:
+        """
+        Every distinct (metric, statistic) pair in the table, and the index of each
+        row's pair in that list.
+        """
+        metrics, metric_codes = np.unique(self["metric"], return_inverse=True)
+        statistics, statistic_codes = np.unique(self["statistic"], return_inverse=True)
+        pair_codes, row_pairs = np.unique(
+            metric_codes * len(statistics) + statistic_codes, return_inverse=True
+        )
+        pairs = list(
+            zip(
+                metrics[pair_codes // max(len(statistics), 1)].tolist(),
+                statistics[pair_codes % max(len(statistics), 1)].tolist(),
+                strict=True,
+            )
+        )
+        return pairs, row_pairs
+
+    def get_metric_statistics(self) -> list[tuple[str, str]]:
+        return self.get_metric_statistic_codes()[0]
+
+    def has_metric(self, metric: str) -> bool:
+        return bool(np.any(self["metric"] == metric))
+
+    def exclude_metrics(self, metrics: tuple[str, ...]) -> "StatisticsTable":
+        return self.select(~np.isin(self["metric"], list(metrics)))
+
+    def get_retention_by_window(
+        self, window_index: int, metrics: tuple[str, ...]
+    ) -> "StatisticsTable":
+        """The rows of each metric at a window index, grouped in the given order."""
+        window_rows = self["window_index"] == str(window_index)
+        return self.select(
+            np.concatenate(
+                [np.flatnonzero(window_rows & (self["metric"] == m)) for m in metrics]
+            )
+        )
+
+    def get_population_percentages(self) -> "StatisticsTable":
+        """
+        One percentage row per branch with that branch's share of the enrolled
+        population, using the last user count reported for each branch.
+        """
+        user_count_rows = np.flatnonzero(self["metric"] == Metric.USER_COUNT)[::-1]
+        branches, last_rows = np.unique(
+            self["branch"][user_count_rows], return_index=True
+        )
+        user_counts = self["point"][user_count_rows[last_rows]]
+        total_population = np.nansum(user_counts)
+        percentages = (
+            np.round(user_counts / total_population * 100)
+            if total_population > 0
+            else np.zeros(len(branches))
+        )
+        segment = (self["segment"][0] if len(self) else None) or Segment.ALL
+        return StatisticsTable.from_columns(
+            len(branches),
+            metric=Metric.USER_COUNT,
+            statistic=Statistic.PERCENT,
+            branch=branches,
+            segment=segment,
+            analysis_basis=AnalysisBasis.ENROLLMENTS,
+            point=percentages,
+        )
+
+
+EMPTY_TABLE = StatisticsTable.from_records([])
+
+
+def to_list(column: np.ndarray) -> list[Any]:
+    if column.dtype != np.float64:
+        return column.tolist()
+    values = column.astype(object)
+    values[np.isnan(column)] = None
+    return values.tolist()
+
+
+def create_metric_data(branches: list[str]) -> dict[str, Any]:
+    return {
+        BranchComparison.ABSOLUTE: {"all": [], "first": {}},
+        BranchComparison.DIFFERENCE: {
+            branch: {"all": [], "first": {}} for branch in branches
+        },
+        BranchComparison.UPLIFT: {
+            branch: {"all": [], "first": {}} for branch in branches
+        },
+        "significance": {
+            branch: {window: {} for window in AnalysisWindow} for branch in branches
+        },
+    }
+
+
+def append_data_point(comparison_data: dict[str, Any], data_point: dict[str, Any]):
+    if not comparison_data["all"]:
+        comparison_data["first"] = dict(data_point)
+    comparison_data["all"].append(data_point)
+
+
+def get_included_rows(
+    table: StatisticsTable, result_metrics: dict[str, set[Statistic]]
+) -> np.ndarray:
+    """
+    The rows whose statistic is shown for their metric. LINEAR_MODEL_MEAN supersedes
+    MEAN for metrics that report both.
+    """
+    if not len(table):
+        return np.zeros(0, dtype=bool)
+
+    pairs, row_pairs = table.get_metric_statistic_codes()
+    linear_model_metrics = {
+        metric for metric, statistic in pairs if statistic == Statistic.LINEAR_MODEL_MEAN
+    }
+    included_pairs = np.array(
+        [
+            statistic in result_metrics.get(metric, ())
+            and not (
+                statistic == Statistic.MEAN
+                and Statistic.LINEAR_MODEL_MEAN in result_metrics[metric]
+                and metric in linear_model_metrics
+            )
+            for metric, statistic in pairs
+        ],
+        dtype=bool,
+    )
+    return included_pairs[row_pairs]
+
+
+def get_significance(table: StatisticsTable) -> list[Significance | None]:
+    """
+    The significance of every difference with bounds compared to another branch,
+    None for the other rows.
+    """
+    lower = table["lower"]
+    upper = table["upper"]
+    has_significance = (
+        (table["comparison"] == BranchComparison.DIFFERENCE)
+        & ~np.equal(table["comparison_to_branch"], None)
+        & ~np.isnan(lower)
+        & ~np.isnan(upper)
+        & (lower != 0)
+        & (upper != 0)
+    )
+    significance_codes = np.select(
+        [(lower <= 0) & (upper <= 0), (lower >= 0) & (upper >= 0)], [0, 1], 2
+    )
+    return [
+        SIGNIFICANCES[code] if significant else None
+        for code, significant in zip(
+            significance_codes.tolist(), has_significance.tolist(), strict=True
+        )
+    ]
+
+
+def get_results(
+    table: StatisticsTable,
+    window: AnalysisWindow,
+    result_metrics: dict[str, set[Statistic]],
+    reference_branch: str,
+) -> dict[str, Any]:
+    branches = np.unique(table["branch"]).tolist()
+    results = {
+        branch: {
+            "is_control": False,
+            "branch_data": {group: {} for group in Group},
+        }
+        for branch in branches
+    }
+    for metric in np.unique(table["metric"]).tolist():
+        for branch in branches:
+            results[branch]["branch_data"][METRIC_GROUP.get(metric, Group.OTHER)][
+                metric
+            ] = create_metric_data(branches)
+
+    table = table.select(get_included_rows(table, result_metrics))
+
+    # Overall should always be window 1 because there is only ever one overall
+    # window, except retained data which is pulled from week 2.
+    window_index = table["window_index"]
+    if window == AnalysisWindow.OVERALL:
+        window_index = np.where(table["metric"] == Metric.RETENTION, window_index, "1")
+    is_percent = (table["metric"] == Metric.USER_COUNT) & (
+        table["statistic"] == Statistic.PERCENT
+    )
+
+    for (
+        metric,
+        branch,
+        comparison,
+        comparison_to_branch,
+        lower,
+        upper,
+        point,
+        row_window_index,
+        row_is_percent,
+        significance,
+    ) in zip(
+        *(
+            to_list(table[name])
+            for name in (
+                "metric",
+                "branch",
+                "comparison",
+                "comparison_to_branch",
+                "lower",
+                "upper",
+                "point",
+            )
+        ),
+        window_index.tolist(),
+        is_percent.tolist(),
+        get_significance(table),
+        strict=True,
+    ):
+        branch_results = results[branch]
+        branch_results["is_control"] = reference_branch == branch
+        metric_data = branch_results["branch_data"][
+            METRIC_GROUP.get(metric, Group.OTHER)
+        ][metric]
+
+        if row_is_percent:
+            metric_data["percent"] = point
+            if point is None:
+                del metric_data["percent"]
+            continue
+
+        if significance is not None:
+            metric_data["significance"][comparison_to_branch][window][
+                row_window_index
+            ] = significance
+
+        data_point = {
+            field: value
+            for field, value in (
+                ("lower", lower),
+                ("upper", upper),
+                ("point", point),
+                ("window_index", row_window_index),
+            )
+            if value is not None
+        }
+
+        branch_comparison = (
+            BranchComparison.ABSOLUTE if comparison is None else comparison
+        )
+        comparison_data = metric_data[branch_comparison]
+        if branch_comparison == BranchComparison.ABSOLUTE:
+            append_data_point(comparison_data, data_point)
+
+        if comparison_to_branch is not None:
+            append_data_point(comparison_data[comparison_to_branch], data_point)
+
+    return results
+
+
+def append_conversion_count(results: dict[str, Any], primary_metrics_set: set[str]):
+    for branch_results in results.values():
+        branch_data = branch_results["branch_data"]
+        for primary_metric in primary_metrics_set:
+            absolute_user_counts = branch_data[Group.OTHER][Metric.USER_COUNT][
+                BranchComparison.ABSOLUTE
+            ]
+            primary_metric_data = branch_data[
+                METRIC_GROUP.get(primary_metric, Group.OTHER)
+            ].get(primary_metric)
+            if primary_metric_data is None:
+                continue
+
+            absolute_primary_metric_vals = primary_metric_data[BranchComparison.ABSOLUTE]
+            if not absolute_primary_metric_vals["all"]:
+                continue
+
+            population_count = absolute_user_counts["first"].get("point")
+            conversion_percent = absolute_primary_metric_vals["first"].get("point")
+
+            conversion_count = 0.0
+            if None not in (population_count, conversion_percent):
+                conversion_count = population_count * conversion_percent
+
+            absolute_primary_metric_vals["first"]["count"] = conversion_count
+            absolute_primary_metric_vals["all"][0]["count"] = conversion_count
+
+
+def get_segment_results(
+    window: AnalysisWindow,
+    table: StatisticsTable,
+    weekly_table: StatisticsTable | None,
+    daily_table: StatisticsTable | None,
+    result_metrics: dict[str, set[Statistic]],
+    primary_metrics_set: set[str],
+    reference_branch: str,
+) -> dict[str, Any] | None:
+    """
+    The v3 results of one segment of a window. Overall results gain population
+    percentages, week 2 retention and conversion counts, weekly results keep only
+    week 2 retention, and every window takes 3-day retention from the fourth daily
+    window.
+    """
+    weekly_table = weekly_table or EMPTY_TABLE
+    daily_table = daily_table or EMPTY_TABLE
+    week_2_retention = weekly_table.get_retention_by_window(
+        RETENTION_2_WEEKS_WINDOW_INDEX, (Metric.RETENTION,)
+    )
+    retention_3_days = daily_table.get_retention_by_window(
+        RETENTION_3_DAYS_WINDOW_INDEX, RETENTION_3_DAYS_METRICS
+    )
+
+    if window == AnalysisWindow.OVERALL:
+        tables = [
+            table,
+            table.get_population_percentages(),
+            week_2_retention,
+            retention_3_days,
+        ]
+    elif window == AnalysisWindow.WEEKLY:
+        tables = [
+            table.exclude_metrics((Metric.RETENTION,)),
+            week_2_retention,
+            retention_3_days,
+        ]
+    else:
+        tables = [table.exclude_metrics(RETENTION_3_DAYS_METRICS), retention_3_days]
+
+    results = get_results(
+        StatisticsTable.concatenate(tables), window, result_metrics, reference_branch
+    )
+    if window == AnalysisWindow.OVERALL:
+        append_conversion_count(results, primary_metrics_set)
+
+    return results or None
@@ -1,13 +1,20 @@
+import dataclasses
+import hashlib
+import json
 from collections import defaultdict
 from enum import StrEnum
 from itertools import zip_longest
 from typing import Any
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
 
 from experimenter.experiments.constants import (
     NimbusConstants,
 )
 from experimenter.metrics import MetricAreas
-from experimenter.nimbus_ui.constants import NimbusUIConstants
+from experimenter.nimbus_ui.constants import METRICS_MIN_BOUNDS_WIDTH, NimbusUIConstants
 from experimenter.outcomes import Outcomes
 
 
@@ -19,17 +26,235 @@ class MetricSignificance(StrEnum):
     UNKNOWN = "unknown"
 
 
+def get_results_view_cache_key(
+    experiment_id, results_hash, config_hash, analysis_basis, segment, reference_branch
+):
+    """Build the cache key of a results page view model.
+
+    The key contains the hash of the results it was built from and the hash of the
+    experiment configuration it was laid out with, so entries for older results or
+    configurations are never read again once either changes and simply expire.
+    """
+    params = urlencode(
+        {
+            "analysis_basis": analysis_basis,
+            "segment": segment,
+            "reference_branch": reference_branch,
+        }
+    )
+    param_hash = hashlib.md5(params.encode()).hexdigest()
+    return f"nimbus:results:{experiment_id}:{results_hash}:{config_hash}:{param_hash}"
+
+
 class ExperimentResultsManager:
     def __init__(self, experiment):
         self.experiment = experiment
 
-    def get_branch_data(self, analysis_basis, selected_segment, window="overall"):
-        enrollment_results = self.get_window_results(
-            "enrollments", selected_segment, window
+    def get_view_model(self, analysis_basis, segment, reference_branch):
+        """Build the parts of the results page that only depend on the results.
+
+        Without an analysis basis, exposures are shown when every branch has them
+        and enrollments otherwise.
+        """
+        analysis_data = (self.experiment.results_data or {}).get("v3", {})
+        metadata = analysis_data.get("metadata") or {}
+
+        exposures_status = self.experiment.has_exposures
+        if not analysis_basis:
+            analysis_basis = (
+                "exposures"
+                if exposures_status == NimbusUIConstants.ExposuresStatus.VALID
+                else "enrollments"
+            )
+
+        displayed_window = "overall"
+        for window in ("overall", "weekly", "daily"):
+            if self.get_window_results(analysis_basis, segment, window):
+                displayed_window = window
+                break
+
+        all_metrics = self.get_metric_data(
+            analysis_basis, segment, reference_branch, window=displayed_window
         )
-        exposure_results = self.get_window_results("exposures", selected_segment, window)
 
-        branch_data = []
+        return {
+            "analysis_basis": analysis_basis,
+            "exposures_status": exposures_status,
+            "results_errors": analysis_data.get("errors") or {},
+            "analysis_start_time": metadata.get("analysis_start_time"),
+            "external_config": metadata.get("external_config"),
+            "displayed_window": displayed_window,
+            "segments": list(
+                analysis_data.get(displayed_window, {}).get("enrollments", {}).keys()
+            ),
+            "metric_area_data": all_metrics,
+            "overall_exposure_rate": self.exposure_rate(segment),
+            "branch_metrics": self.get_branch_metrics(segment, displayed_window),
+            "relative_metric_changes": self.get_relative_metric_changes(
+                all_metrics, analysis_basis, segment, reference_branch, displayed_window
+            ),
+            "all_weekly_metric_data": self.build_window_metric_breakdown(
+                analysis_basis, segment, reference_branch, "weekly"
+            ),
+            "all_daily_metric_data": self.build_window_metric_breakdown(
+                analysis_basis, segment, reference_branch, "daily"
+            ),
+        }
+
+    def get_config_hash(self):
+        """Hash of everything besides the results that the view model depends on:
+        the experiment's outcomes and branches, and the deployed outcome, metric
+        area and KPI configurations.
+        """
+        application = self.experiment.application
+        outcomes = {}
+        for slug in (
+            *self.experiment.primary_outcomes,
+            *self.experiment.secondary_outcomes,
+        ):
+            outcome = Outcomes.get_by_slug_and_application(slug, application)
+            outcomes[slug] = dataclasses.asdict(outcome) if outcome else None
+
+        config = {
+            "primary_outcomes": list(self.experiment.primary_outcomes),
+            "secondary_outcomes": list(self.experiment.secondary_outcomes),
+            "branches": [branch.slug for branch in self.experiment.get_sorted_branches()],
+            "outcomes": outcomes,
+            "metric_areas": MetricAreas.all().get(application.replace("-", "_")),
+            "kpi_metrics": NimbusConstants.KPI_METRICS,
+        }
+        return hashlib.md5(
+            json.dumps(config, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def get_cached_view_model(self, analysis_basis, segment, reference_branch):
+        analysis_basis = analysis_basis or ""
+        results_hash = self.experiment.results_data_hash
+        if results_hash is None:
+            return self.get_view_model(analysis_basis, segment, reference_branch)
+
+        cache_key = get_results_view_cache_key(
+            self.experiment.id,
+            results_hash,
+            self.get_config_hash(),
+            analysis_basis,
+            segment,
+            reference_branch,
+        )
+        view_model = cache.get(cache_key)
+        if view_model is None:
+            view_model = self.get_view_model(analysis_basis, segment, reference_branch)
+            cache.set(cache_key, view_model, timeout=settings.RESULTS_VIEW_CACHE_TTL)
+        return view_model
+
+    def warm_view_model_cache(self):
+        """Cache the view model of every analysis basis, including the default one,
+        and segment of the stored results against the experiment's reference
+        branch, which is what the results page shows unless another reference
+        branch is picked.
+        """
+        results_hash = self.experiment.results_data_hash
+        if results_hash is None or self.experiment.reference_branch is None:
+            return
+
+        analysis_data = (self.experiment.results_data or {}).get("v3", {})
+        segments = {"all"}
+        for window in ("overall", "weekly", "daily"):
+            for analysis_basis_results in (analysis_data.get(window) or {}).values():
+                segments.update(analysis_basis_results)
+
+        reference_branch = self.experiment.reference_branch.slug
+        config_hash = self.get_config_hash()
+        view_models = {}
+        for analysis_basis in ("", "enrollments", "exposures"):
+            for segment in sorted(segments):
+                view_models[
+                    get_results_view_cache_key(
+                        self.experiment.id,
+                        results_hash,
+                        config_hash,
+                        analysis_basis,
+                        segment,
+                        reference_branch,
+                    )
+                ] = self.get_view_model(analysis_basis, segment, reference_branch)
+
+        cache.set_many(view_models, timeout=settings.RESULTS_VIEW_CACHE_TTL)
+
+    def get_relative_metric_changes(
+        self, all_metrics, analysis_basis, segment, reference_branch, window
+    ):
+        relative_metric_changes = {}
+
+        for metric_data in all_metrics.values():
+            metadata = metric_data.get("metrics", {})
+
+            # Prepare relative metric changes for UI rendering
+            for metric_metadata in metadata:
+                if not metric_metadata.get("has_data"):
+                    continue
+
+                data = (
+                    metric_data.get("data", {})
+                    .get(window, {})
+                    .get(metric_metadata["slug"], {})
+                )
+                metric_ui_properties = {}
+                extreme_bound = self.get_max_metric_value(
+                    analysis_basis,
+                    segment,
+                    reference_branch,
+                    metric_metadata["group"],
+                    metric_metadata["slug"],
+                    window=window,
+                )
+
+                for branch_slug, branch_data in data.items():
+                    if not (relative := branch_data.get("relative")):
+                        continue
+
+                    if not (lower := relative[0].get("lower")) or not (
+                        upper := relative[0].get("upper")
+                    ):
+                        continue
+
+                    lower *= 100
+                    upper *= 100
+
+                    confidence_range = round(extreme_bound * 1000) / 10
+                    full_width = confidence_range * 2 if confidence_range != 0 else 1
+                    bar_width = ((upper - lower) / full_width) * 100
+                    left_percent = (abs(lower - confidence_range * -1) / full_width) * 100
+                    left_bounds_percent = left_percent
+
+                    num_digits = len(str(round(lower, 1)).replace(".", "")) + len(
+                        str(round(upper, 1)).replace(".", "")
+                    )
+
+                    if bar_width < METRICS_MIN_BOUNDS_WIDTH:
+                        left_bounds_percent -= (METRICS_MIN_BOUNDS_WIDTH - bar_width) / 2
+
+                    metric_ui_properties[branch_slug] = {
+                        "bar_width": bar_width,
+                        "left_percent": left_percent,
+                        "left_bounds_percent": left_bounds_percent - num_digits * 1.5,
+                        "bounds_width": (
+                            max(bar_width, METRICS_MIN_BOUNDS_WIDTH) + num_digits * 3
+                        ),
+                    }
+
+                    relative_metric_changes[metric_metadata["slug"]] = (
+                        metric_ui_properties
+                    )
+
+        return relative_metric_changes
+
+    def get_branch_metrics(self, segment, window="overall"):
+        """The client counts and exposure rate of each branch, by branch slug."""
+        enrollment_results = self.get_window_results("enrollments", segment, window)
+        exposure_results = self.get_window_results("exposures", segment, window)
+
+        branch_metrics = {}
 
         for branch in self.experiment.get_sorted_branches():
             slug = branch.slug
@@ -56,20 +281,31 @@ class ExperimentResultsManager:
                 .get("point", 0)
             )
 
-            branch_data.append(
-                {
-                    "slug": slug,
-                    "name": branch.name,
-                    "screenshots": branch.screenshots.all,
-                    "description": branch.description,
-                    "percentage": enrolled_client_metrics.get("percent"),
-                    "num_enrolled_clients": num_enrolled_clients,
-                    "num_exposed_clients": num_exposed_clients,
-                    "exposure_rate": self.exposure_rate(selected_segment, slug),
-                },
-            )
+            branch_metrics[slug] = {
+                "percentage": enrolled_client_metrics.get("percent"),
+                "num_enrolled_clients": num_enrolled_clients,
+                "num_exposed_clients": num_exposed_clients,
+                "exposure_rate": self.exposure_rate(segment, slug),
+            }
 
-        return branch_data
+        return branch_metrics
+
+    def get_branch_data(
+        self, analysis_basis, selected_segment, window="overall", branch_metrics=None
+    ):
+        if branch_metrics is None:
+            branch_metrics = self.get_branch_metrics(selected_segment, window)
+
+        return [
+            {
+                "slug": branch.slug,
+                "name": branch.name,
+                "screenshots": branch.screenshots.all,
+                "description": branch.description,
+                **branch_metrics[branch.slug],
+            }
+            for branch in self.experiment.get_sorted_branches()
+        ]
 
     def get_max_metric_value(
         self,
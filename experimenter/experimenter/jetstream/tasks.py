@@ -3,24 +3,33 @@ import sentry_sdk
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 from pydantic import ValidationError
 
 from experimenter.celery import app
-from experimenter.experiments.changelog_utils import generate_nimbus_changelog
+from experimenter.experiments.changelog_utils import (
+    generate_nimbus_changelog,
+    generate_nimbus_changelogs,
+)
 from experimenter.experiments.constants import NimbusConstants
-from experimenter.experiments.models import NimbusChangeLog, NimbusExperiment
+from experimenter.experiments.models import (
+    NimbusAnalysisFile,
+    NimbusChangeLog,
+    NimbusExperiment,
+    NimbusExperimentPayload,
+)
 from experimenter.jetstream.client import (
     get_enrollment_funnel_data,
     get_experiment_data,
-    get_latest_analysis_start_time,
+    get_experiment_results_files,
     get_monitoring_data,
     get_population_estimates_data,
     get_population_sizing_data,
-    get_results_filenames,
-    get_stored_analysis_start_time,
+    get_results_files,
     has_missing_expected_results,
 )
+from experimenter.jetstream.results_manager import ExperimentResultsManager
 from experimenter.kinto.tasks import get_kinto_user
 
 logger = get_task_logger(__name__)
@@ -46,6 +55,34 @@ def strip_errors(data):
     }
 
 
+def update_analysis_files(experiment, results_files):
+    """
+    Records the analysis files an experiment's results are about to be fetched
+    from, so that later runs only fetch them again once they change.
+    """
+    with transaction.atomic():
+        experiment.analysis_files.exclude(name__in=results_files.keys()).delete()
+        NimbusAnalysisFile.objects.bulk_create(
+            [
+                NimbusAnalysisFile(experiment=experiment, name=name, **results_file)
+                for name, results_file in results_files.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["experiment", "name"],
+            update_fields=["generation", "etag", "updated"],
+        )
+
+
+def has_changed_analysis_files(experiment, results_files):
+    ingested_generations = {
+        analysis_file.name: analysis_file.generation
+        for analysis_file in experiment.analysis_files.all()
+    }
+    return ingested_generations != {
+        name: results_file["generation"] for name, results_file in results_files.items()
+    }
+
+
 @app.task
 @metrics.timer_decorator("fetch_experiment_data")
 def fetch_experiment_data(experiment_id):
@@ -53,12 +90,15 @@ def fetch_experiment_data(experiment_id):
     experiment = None
     try:
         experiment = NimbusExperiment.objects.get(id=experiment_id)
-        old_results_data = experiment.results_data
         new_results_data = get_experiment_data(experiment)
 
-        if old_results_data != new_results_data:
+        if experiment.get_payload_hash(
+            NimbusExperimentPayload.Kind.RESULTS_DATA
+        ) != NimbusExperimentPayload.get_content_hash(new_results_data):
+            old_results_data = experiment.results_data
             experiment.results_data = new_results_data
             experiment.save()
+            ExperimentResultsManager(experiment).warm_view_model_cache()
 
             old_normalized = strip_errors(old_results_data)
             new_normalized = strip_errors(new_results_data)
@@ -72,11 +112,14 @@ def fetch_experiment_data(experiment_id):
 
         metrics.incr("fetch_experiment_data.completed")
     except ValidationError as e:
+        # Forget the ingested files so that the next run tries them again
+        NimbusAnalysisFile.objects.filter(experiment_id=experiment_id).delete()
         metrics.incr("fetch_experiment_data.skipped")
         sentry_sdk.capture_exception(e)
         slug = experiment.slug if experiment is not None else experiment_id
         logger.warning(f"Skipping results for {slug}, failed schema validation: {e}")
     except Exception as e:
+        NimbusAnalysisFile.objects.filter(experiment_id=experiment_id).delete()
         metrics.incr("fetch_experiment_data.failed")
         failure_message = f"Fetching experiment data for {experiment_id} "
         if experiment is not None and hasattr(experiment, "slug"):
@@ -89,31 +132,32 @@ def fetch_experiment_data(experiment_id):
 @app.task
 @metrics.timer_decorator("fetch_jetstream_data")
 def fetch_jetstream_data():
+    """
+    A scheduled task that lists the analysis bucket once and fetches the results
+    of every live or complete experiment whose analysis files changed since they
+    were last ingested, or that is still missing results it should have.
+    """
     metrics.incr("fetch_jetstream_data.started")
     try:
-        results_filenames = get_results_filenames()
+        results_files = get_results_files()
         for experiment in NimbusExperiment.objects.filter(
             status__in=[NimbusExperiment.Status.COMPLETE, NimbusExperiment.Status.LIVE]
-        ):
-            latest_analysis_start_time = get_latest_analysis_start_time(experiment.slug)
-            needs_missing_results = has_missing_expected_results(
-                experiment, results_filenames
+        ).prefetch_related("analysis_files"):
+            experiment_results_files = get_experiment_results_files(
+                experiment.slug, results_files
             )
-
-            if latest_analysis_start_time is None and not needs_missing_results:
-                metrics.incr("fetch_jetstream_data.skipped")
-                continue
-
-            stored_analysis_start_time = get_stored_analysis_start_time(experiment)
-            has_newer_results = latest_analysis_start_time is not None and (
-                stored_analysis_start_time is None
-                or stored_analysis_start_time < latest_analysis_start_time
+            has_changed_files = has_changed_analysis_files(
+                experiment, experiment_results_files
+            )
+            needs_missing_results = has_missing_expected_results(
+                experiment, results_files
             )
 
-            if has_newer_results or needs_missing_results:
+            if has_changed_files or needs_missing_results:
                 logger.info(
                     f"Fetching Jetstream data for {experiment.name} ({experiment.slug})"
                 )
+                update_analysis_files(experiment, experiment_results_files)
                 fetch_experiment_data.delay(experiment.id)
                 metrics.incr("fetch_jetstream_data.completed")
             else:
@@ -238,7 +282,9 @@ def fetch_monitoring_data():
                     "enrollment_funnel": funnel_by_slug.get(exp_slug, []),
                 }
 
-                if experiment.monitoring_data != merged:
+                if experiment.get_payload_hash(
+                    NimbusExperimentPayload.Kind.MONITORING_DATA
+                ) != NimbusExperimentPayload.get_content_hash(merged):
                     experiment.monitoring_data = merged
                     experiment.monitoring_data_updated_at = timezone.now()
                     experiment.save(
@@ -287,7 +333,7 @@ def update_holdback_enrollment_period():
         minimum_days = (
             settings.HOLDBACK_OBSERVATION_DAYS + settings.HOLDBACK_MINIMUM_ENROLLMENT_DAYS
         )
-        updated_count = 0
+        updated_experiments = []
         for experiment in experiments:
             days_since_start = (today - experiment.start_date).days
             if (
@@ -308,15 +354,17 @@ def update_holdback_enrollment_period():
                 save_fields.append("do_rerun")
             experiment.do_rerun_timestamp = now
             experiment.save(update_fields=save_fields)
-            generate_nimbus_changelog(
-                experiment,
-                get_kinto_user(),
-                message=NimbusChangeLog.Messages.HOLDBACK_ENROLLMENT_UPDATED,
-            )
-            updated_count += 1
+            updated_experiments.append(experiment)
+
+        generate_nimbus_changelogs(
+            updated_experiments,
+            get_kinto_user(),
+            message=NimbusChangeLog.Messages.HOLDBACK_ENROLLMENT_UPDATED,
+        )
 
         logger.info(
-            f"update_holdback_enrollment_period: updated {updated_count} experiments"
+            "update_holdback_enrollment_period: "
+            f"updated {len(updated_experiments)} experiments"
         )
         metrics.incr("update_holdback_enrollment_period.completed")
 
@@ -1,15 +1,15 @@
 from copy import deepcopy
 from functools import cache
 
+from mozilla_nimbus_schemas.jetstream import AnalysisBasis
+from mozilla_nimbus_schemas.jetstream import Statistic as JetstreamStatisticResult
 from pydantic import Field, create_model
 
 from experimenter.jetstream.models import (
-    AnalysisBasis,
     BranchComparison,
     BranchComparisonData,
     DataPoint,
     Group,
-    JetstreamDataPoint,
     Metric,
     MetricData,
     Segment,
@@ -111,7 +111,7 @@ class JetstreamTestData:
 
     @classmethod
     def get_identity_row(cls):
-        return JetstreamDataPoint(
+        return JetstreamStatisticResult(
             point=12,
             upper=13,
             lower=10,
@@ -380,7 +380,7 @@ class JetstreamTestData:
                 ] = cls.get_metric_data(data_point_daily)
 
                 data.append(
-                    JetstreamDataPoint(
+                    JetstreamStatisticResult(
                         **range_data.model_dump(exclude_none=True),
                         metric=primary_metric,
                         branch=branch,
@@ -433,7 +433,7 @@ class JetstreamTestData:
                 ] = cls.get_metric_data(data_point_daily)
 
                 data.append(
-                    JetstreamDataPoint(
+                    JetstreamStatisticResult(
                         **range_data.model_dump(exclude_none=True),
                         metric=primary_metric,
                         branch=branch,
@@ -1516,7 +1516,7 @@ class JetstreamTestData:
 class ZeroJetstreamTestData(JetstreamTestData):
     @classmethod
     def get_identity_row(cls):
-        return JetstreamDataPoint(
+        return JetstreamStatisticResult(
             point=0,
             upper=0,
             lower=0,
@@ -1753,7 +1753,7 @@ class ZeroJetstreamTestData(JetstreamTestData):
                 ] = cls.get_metric_data(data_point_daily)
 
                 data.append(
-                    JetstreamDataPoint(
+                    JetstreamStatisticResult(
                         **range_data.model_dump(exclude_none=True),
                         metric=primary_metric,
                         branch=branch,
@@ -1768,7 +1768,7 @@ class ZeroJetstreamTestData(JetstreamTestData):
 class NonePointJetstreamTestData(ZeroJetstreamTestData):
     @classmethod
     def get_identity_row(cls):
-        return JetstreamDataPoint(
+        return JetstreamStatisticResult(
             point=None,
             upper=None,
             lower=None,
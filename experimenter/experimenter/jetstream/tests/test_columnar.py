@@ -0,0 +1,280 @@
+from unittest import mock
+
+from django.test import TestCase
+from mozilla_nimbus_schemas.jetstream import AnalysisBasis
+
+from experimenter.jetstream.columnar import (
+    StatisticsTable,
+    get_results,
+    get_segment_results,
+)
+from experimenter.jetstream.models import (
+    AnalysisWindow,
+    BranchComparison,
+    Metric,
+    Segment,
+    Significance,
+    Statistic,
+)
+
+
+def create_row(**kwargs):
+    return {
+        "metric": Metric.USER_COUNT,
+        "statistic": Statistic.COUNT,
+        "branch": "control",
+        "point": 10.0,
+        "segment": Segment.ALL,
+        "analysis_basis": AnalysisBasis.ENROLLMENTS,
+        **kwargs,
+    }
+
+
+def get_points(table):
+    return list(
+        zip(
+            table["metric"].tolist(),
+            table["branch"].tolist(),
+            table["window_index"].tolist(),
+            table["point"].tolist(),
+            strict=True,
+        )
+    )
+
+
+class TestStatisticsTable(TestCase):
+    def test_from_records_stores_missing_values(self):
+        table = StatisticsTable.from_records(
+            [create_row(lower=None, upper=2, window_index="1"), create_row()]
+        )
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table["window_index"].tolist(), ["1", None])
+        self.assertEqual(table["comparison"].tolist(), [None, None])
+        self.assertEqual(table["analysis_basis"].tolist(), ["enrollments"] * 2)
+        self.assertEqual(table["upper"][0], 2.0)
+        self.assertTrue(all(value != value for value in table["lower"].tolist()))
+
+    def test_from_records_concatenates_blocks(self):
+        records = [create_row(point=point, window_index=str(point)) for point in range(5)]
+
+        with mock.patch.object(StatisticsTable, "BLOCK_SIZE", 2):
+            table = StatisticsTable.from_records(iter(records))
+
+        self.assertEqual(len(table), 5)
+        self.assertEqual(table["point"].tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(table["window_index"].tolist(), ["0", "1", "2", "3", "4"])
+        self.assertEqual(table["analysis_basis"].tolist(), ["enrollments"] * 5)
+
+    def test_from_records_without_records(self):
+        table = StatisticsTable.from_records([])
+
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table["point"].dtype, "float64")
+
+    def test_get_segments_splits_analysis_basis_by_segment_in_file_order(self):
+        table = StatisticsTable.from_records(
+            [
+                create_row(segment="some_segment", point=1),
+                create_row(analysis_basis=AnalysisBasis.EXPOSURES, point=2),
+                create_row(point=3),
+                create_row(segment="some_segment", point=4),
+            ]
+        )
+
+        segments = table.get_segments(AnalysisBasis.ENROLLMENTS)
+
+        self.assertEqual(list(segments), ["some_segment", Segment.ALL])
+        self.assertEqual(segments["some_segment"]["point"].tolist(), [1.0, 4.0])
+        self.assertEqual(segments[Segment.ALL]["point"].tolist(), [3.0])
+        self.assertEqual(table.get_segments(AnalysisBasis.EXPOSURES).keys(), {"all"})
+
+    def test_get_metric_statistics_returns_distinct_pairs(self):
+        table = StatisticsTable.from_records(
+            [
+                create_row(metric="some_count", statistic=Statistic.MEAN),
+                create_row(metric="some_count", statistic=Statistic.MEAN, branch="b"),
+                create_row(metric="some_count", statistic=Statistic.LINEAR_MODEL_MEAN),
+                create_row(),
+            ]
+        )
+
+        self.assertEqual(
+            set(table.get_metric_statistics()),
+            {
+                ("some_count", Statistic.MEAN),
+                ("some_count", Statistic.LINEAR_MODEL_MEAN),
+                (Metric.USER_COUNT, Statistic.COUNT),
+            },
+        )
+
+    def test_get_population_percentages_uses_last_count_per_branch(self):
+        table = StatisticsTable.from_records(
+            [
+                create_row(branch="variant", point=10),
+                create_row(branch="control", point=10),
+                create_row(branch="variant", point=30),
+                create_row(metric="some_count", branch="control", point=100),
+            ]
+        )
+
+        self.assertEqual(
+            get_points(table.get_population_percentages()),
+            [
+                (Metric.USER_COUNT, "control", None, 25.0),
+                (Metric.USER_COUNT, "variant", None, 75.0),
+            ],
+        )
+
+    def test_get_population_percentages_without_population(self):
+        table = StatisticsTable.from_records([create_row(point=0)])
+
+        self.assertEqual(
+            table.get_population_percentages()["point"].tolist(),
+            [0.0],
+        )
+
+    def test_get_retention_by_window_groups_rows_by_metric(self):
+        table = StatisticsTable.from_records(
+            [
+                create_row(metric=Metric.RETENTION_3_DAYS_LEGACY, window_index="4"),
+                create_row(metric=Metric.RETENTION_3_DAYS, window_index="3"),
+                create_row(metric=Metric.RETENTION_3_DAYS, window_index="4"),
+            ]
+        )
+
+        retention = table.get_retention_by_window(
+            4, (Metric.RETENTION_3_DAYS, Metric.RETENTION_3_DAYS_LEGACY)
+        )
+
+        self.assertEqual(
+            retention["metric"].tolist(),
+            [Metric.RETENTION_3_DAYS, Metric.RETENTION_3_DAYS_LEGACY],
+        )
+
+
+class TestGetResults(TestCase):
+    def test_linear_model_mean_supersedes_mean(self):
+        table = StatisticsTable.from_records(
+            [
+                create_row(metric=Metric.SEARCH, statistic=Statistic.MEAN, point=1),
+                create_row(
+                    metric=Metric.SEARCH,
+                    statistic=Statistic.LINEAR_MODEL_MEAN,
+                    point=2,
+                ),
+            ]
+        )
+
+        results = get_results(
+            table,
+            AnalysisWindow.OVERALL,
+            {Metric.SEARCH: {Statistic.MEAN, Statistic.LINEAR_MODEL_MEAN}},
+            "control",
+        )
+
+        self.assertEqual(
+            results["control"]["branch_data"]["search_metrics"][Metric.SEARCH][
+                BranchComparison.ABSOLUTE
+            ]["all"],
+            [{"point": 2.0, "window_index": "1"}],
+        )
+
+    def test_computes_significance_of_differences(self):
+        table = StatisticsTable.from_records(
+            [
+                create_row(
+                    branch="variant",
+                    metric=metric,
+                    statistic=Statistic.BINOMIAL,
+                    comparison=BranchComparison.DIFFERENCE,
+                    comparison_to_branch="control",
+                    lower=lower,
+                    upper=upper,
+                    window_index="1",
+                )
+                for metric, lower, upper in (
+                    ("positive", 1, 2),
+                    ("negative", -2, -1),
+                    ("neutral", -1, 1),
+                    ("unbounded", 0, 1),
+                )
+            ]
+            + [create_row(branch="control")]
+        )
+
+        results = get_results(
+            table,
+            AnalysisWindow.WEEKLY,
+            {
+                metric: {Statistic.BINOMIAL}
+                for metric in ("positive", "negative", "neutral", "unbounded")
+            },
+            "control",
+        )
+
+        other_metrics = results["variant"]["branch_data"]["other_metrics"]
+        self.assertEqual(
+            {
+                metric: other_metrics[metric]["significance"]["control"]["weekly"]
+                for metric in ("positive", "negative", "neutral", "unbounded")
+            },
+            {
+                "positive": {"1": Significance.POSITIVE},
+                "negative": {"1": Significance.NEGATIVE},
+                "neutral": {"1": Significance.NEUTRAL},
+                "unbounded": {},
+            },
+        )
+        self.assertFalse(results["variant"]["is_control"])
+
+    def test_get_segment_results_appends_overall_values(self):
+        table = StatisticsTable.from_records(
+            [
+                create_row(branch="control", point=10),
+                create_row(branch="variant", point=30),
+                create_row(
+                    metric="conversion",
+                    statistic=Statistic.BINOMIAL,
+                    branch="control",
+                    point=0.5,
+                ),
+            ]
+        )
+        weekly_table = StatisticsTable.from_records(
+            [
+                create_row(
+                    metric=Metric.RETENTION,
+                    statistic=Statistic.BINOMIAL,
+                    point=0.25,
+                    window_index=window_index,
+                )
+                for window_index in ("1", "2")
+            ]
+        )
+
+        results = get_segment_results(
+            AnalysisWindow.OVERALL,
+            table,
+            weekly_table,
+            None,
+            {
+                Metric.USER_COUNT: {Statistic.COUNT, Statistic.PERCENT},
+                Metric.RETENTION: {Statistic.BINOMIAL},
+                "conversion": {Statistic.BINOMIAL},
+            },
+            {"conversion"},
+            "control",
+        )
+
+        control_metrics = results["control"]["branch_data"]["other_metrics"]
+        self.assertTrue(results["control"]["is_control"])
+        self.assertEqual(control_metrics[Metric.USER_COUNT]["percent"], 25.0)
+        self.assertEqual(
+            control_metrics[Metric.RETENTION][BranchComparison.ABSOLUTE]["all"],
+            [{"point": 0.25, "window_index": "2"}],
+        )
+        self.assertEqual(
+            control_metrics["conversion"][BranchComparison.ABSOLUTE]["first"],
+            {"point": 0.5, "window_index": "1", "count": 5.0},
+        )
@@ -1,6 +1,7 @@
 from unittest import mock
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from parameterized.parameterized import parameterized
 
 from experimenter.experiments.models import (
@@ -13,9 +14,11 @@ from experimenter.experiments.tests.factories import (
 from experimenter.jetstream.results_manager import (
     ExperimentResultsManager,
     MetricSignificance,
+    get_results_view_cache_key,
 )
 from experimenter.metrics import MetricAreas
 from experimenter.metrics.tests import mock_valid_metrics
+from experimenter.nimbus_ui.constants import NimbusUIConstants
 from experimenter.outcomes import Outcomes
 from experimenter.outcomes.tests import mock_valid_outcomes
 
@@ -3213,3 +3216,188 @@ class TestExperimentResultsManager(TestCase):
             ),
             expected_significance,
         )
+
+
+@mock_valid_outcomes
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    },
+)
+class TestExperimentResultsViewModelCache(TestCase):
+    def setUp(self):
+        Outcomes.clear_cache()
+        cache.clear()
+        self.experiment = NimbusExperimentFactory.create(
+            application=NimbusExperiment.Application.DESKTOP,
+            primary_outcomes=[],
+            secondary_outcomes=[],
+        )
+        self.experiment.delete_branches()
+        self.experiment.reference_branch = NimbusBranchFactory.create(
+            experiment=self.experiment, name="Branch A", slug="branch-a"
+        )
+        self.experiment.results_data = self.get_results_data(100)
+        self.experiment.save()
+        self.results_manager = ExperimentResultsManager(self.experiment)
+
+    def get_results_data(self, client_count):
+        identity = {
+            "branch-a": {
+                "branch_data": {
+                    "other_metrics": {
+                        "identity": {"absolute": {"first": {"point": client_count}}}
+                    }
+                }
+            }
+        }
+        return {
+            "v3": {
+                "overall": {
+                    "enrollments": {"all": identity, "mobile": identity},
+                    "exposures": {"all": identity},
+                }
+            }
+        }
+
+    def test_get_cached_view_model_builds_view_model_once(self):
+        with mock.patch.object(
+            ExperimentResultsManager,
+            "get_view_model",
+            wraps=self.results_manager.get_view_model,
+        ) as mock_get_view_model:
+            view_model = self.results_manager.get_cached_view_model(
+                "enrollments", "all", "branch-a"
+            )
+            cached_view_model = self.results_manager.get_cached_view_model(
+                "enrollments", "all", "branch-a"
+            )
+
+        mock_get_view_model.assert_called_once_with("enrollments", "all", "branch-a")
+        self.assertEqual(cached_view_model, view_model)
+        self.assertEqual(view_model["displayed_window"], "overall")
+        self.assertEqual(view_model["segments"], ["all", "mobile"])
+
+    def test_get_cached_view_model_rebuilds_for_new_results(self):
+        self.results_manager.get_cached_view_model("enrollments", "all", "branch-a")
+
+        self.experiment.results_data = self.get_results_data(200)
+        self.experiment.save()
+
+        with mock.patch.object(
+            ExperimentResultsManager, "get_view_model", return_value={}
+        ) as mock_get_view_model:
+            self.results_manager.get_cached_view_model("enrollments", "all", "branch-a")
+
+        mock_get_view_model.assert_called_once_with("enrollments", "all", "branch-a")
+
+    @parameterized.expand(
+        [
+            ("primary_outcomes", ["new_outcome"]),
+            ("secondary_outcomes", ["new_outcome"]),
+        ]
+    )
+    def test_get_cached_view_model_rebuilds_for_new_outcomes(self, field, outcomes):
+        self.results_manager.get_cached_view_model("enrollments", "all", "branch-a")
+
+        setattr(self.experiment, field, outcomes)
+        self.experiment.save()
+
+        with mock.patch.object(
+            ExperimentResultsManager, "get_view_model", return_value={}
+        ) as mock_get_view_model:
+            self.results_manager.get_cached_view_model("enrollments", "all", "branch-a")
+
+        mock_get_view_model.assert_called_once_with("enrollments", "all", "branch-a")
+
+    def test_get_cached_view_model_rebuilds_for_new_branches(self):
+        self.results_manager.get_cached_view_model("enrollments", "all", "branch-a")
+
+        NimbusBranchFactory.create(
+            experiment=self.experiment, name="Branch B", slug="branch-b"
+        )
+
+        with mock.patch.object(
+            ExperimentResultsManager, "get_view_model", return_value={}
+        ) as mock_get_view_model:
+            self.results_manager.get_cached_view_model("enrollments", "all", "branch-a")
+
+        mock_get_view_model.assert_called_once_with("enrollments", "all", "branch-a")
+
+    def test_get_cached_view_model_rebuilds_for_new_metric_areas(self):
+        self.results_manager.get_cached_view_model("enrollments", "all", "branch-a")
+
+        with (
+            mock.patch.object(
+                MetricAreas, "all", return_value={"firefox_desktop": {"new_area": []}}
+            ),
+            mock.patch.object(
+                ExperimentResultsManager, "get_view_model", return_value={}
+            ) as mock_get_view_model,
+        ):
+            self.results_manager.get_cached_view_model("enrollments", "all", "branch-a")
+
+        mock_get_view_model.assert_called_once_with("enrollments", "all", "branch-a")
+
+    def test_get_cached_view_model_without_results_is_not_cached(self):
+        self.experiment.results_data = None
+        self.experiment.save()
+
+        with mock.patch.object(
+            ExperimentResultsManager, "get_view_model", return_value={}
+        ) as mock_get_view_model:
+            self.results_manager.get_cached_view_model("enrollments", "all", "branch-a")
+            self.results_manager.get_cached_view_model("enrollments", "all", "branch-a")
+
+        self.assertEqual(mock_get_view_model.call_count, 2)
+
+    @parameterized.expand(
+        [
+            (100, "exposures", NimbusUIConstants.ExposuresStatus.VALID),
+            (0, "enrollments", NimbusUIConstants.ExposuresStatus.NO_EXPOSURES),
+        ]
+    )
+    def test_get_view_model_resolves_default_analysis_basis(
+        self, client_count, analysis_basis, exposures_status
+    ):
+        self.experiment.results_data = self.get_results_data(client_count)
+        self.experiment.save()
+
+        view_model = self.results_manager.get_view_model("", "all", "branch-a")
+
+        self.assertEqual(view_model["analysis_basis"], analysis_basis)
+        self.assertEqual(view_model["exposures_status"], exposures_status)
+
+    def test_get_view_model_includes_branch_metrics(self):
+        view_model = self.results_manager.get_view_model("enrollments", "all", "branch-a")
+
+        self.assertEqual(
+            view_model["branch_metrics"],
+            self.results_manager.get_branch_metrics("all", "overall"),
+        )
+        self.assertEqual(
+            view_model["branch_metrics"]["branch-a"]["num_enrolled_clients"], 100
+        )
+
+    def test_warm_view_model_cache_caches_every_segment(self):
+        self.results_manager.warm_view_model_cache()
+
+        for analysis_basis in ("", "enrollments", "exposures"):
+            for segment in ("all", "mobile"):
+                self.assertEqual(
+                    cache.get(
+                        get_results_view_cache_key(
+                            self.experiment.id,
+                            self.experiment.results_data_hash,
+                            self.results_manager.get_config_hash(),
+                            analysis_basis,
+                            segment,
+                            "branch-a",
+                        )
+                    ),
+                    self.results_manager.get_view_model(
+                        analysis_basis, segment, "branch-a"
+                    ),
+                )
@@ -1,6 +1,7 @@
 import datetime
+import io
 import json
-from unittest.mock import patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 from django.conf import settings
@@ -22,14 +23,19 @@ from experimenter.jetstream.client import (
     expected_windows,
     get_data,
     get_enrollment_funnel_data,
+    get_experiment_results_files,
     get_featmon_slugs,
-    get_latest_analysis_start_time,
     get_monitoring_data,
-    get_results_filenames,
-    get_stored_analysis_start_time,
+    get_results_files,
     has_missing_expected_results,
+    iter_json_array,
+    load_concurrently,
+    load_data_from_gcs,
+    stream_data_from_gcs,
 )
+from experimenter.jetstream.columnar import StatisticsTable
 from experimenter.jetstream.models import AnalysisWindow, Group, Metric
+from experimenter.jetstream.results_manager import ExperimentResultsManager
 from experimenter.jetstream.tests import mock_valid_outcomes
 from experimenter.jetstream.tests.constants import (
     JetstreamTestData,
@@ -834,14 +840,10 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 )
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
-        with (
-            patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
-        ):
+        with patch("experimenter.jetstream.client.analysis_storage.open") as mock_open:
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             tasks.fetch_experiment_data(experiment.id)
             experiment = NimbusExperiment.objects.get(id=experiment.id)
@@ -1057,7 +1059,9 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
             patch("experimenter.jetstream.client.get_metadata") as mock_get_metadata,
             patch("experimenter.jetstream.client.get_analysis_errors") as mock_get_errors,
         ):
-            mock_get_data.side_effect = mock_jetstream_data_by_window
+            mock_get_data.side_effect = lambda slug, window: StatisticsTable.from_records(
+                mock_jetstream_data_by_window(slug, window)
+            )
             mock_get_metadata.return_value = None
             mock_get_errors.return_value = None
             tasks.fetch_experiment_data(experiment.id)
@@ -1101,7 +1105,9 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
             patch("experimenter.jetstream.client.get_metadata") as mock_get_metadata,
             patch("experimenter.jetstream.client.get_analysis_errors") as mock_get_errors,
         ):
-            mock_get_data.side_effect = mock_jetstream_data_by_window
+            mock_get_data.side_effect = lambda slug, window: StatisticsTable.from_records(
+                mock_jetstream_data_by_window(slug, window)
+            )
             mock_get_metadata.return_value = None
             mock_get_errors.return_value = None
 
@@ -1228,18 +1234,14 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                         }
                     ]
                 else:
-                    ret_json = ""
+                    ret_json = []
                 return json.dumps(ret_json)
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
-        with (
-            patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
-        ):
+        with patch("experimenter.jetstream.client.analysis_storage.open") as mock_open:
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             if not error_timestamp:
                 with self.assertRaises(Exception):
@@ -1302,7 +1304,7 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
             patch("experimenter.jetstream.client.get_metadata") as mock_get_metadata,
             patch("experimenter.jetstream.client.get_analysis_errors") as mock_get_errors,
         ):
-            mock_get_data.return_value = []
+            mock_get_data.return_value = StatisticsTable.from_records([])
             mock_get_metadata.return_value = {
                 "analysis_start_time": "2026-05-18T04:30:03+00:00",
                 "outcomes": {},
@@ -1389,14 +1391,10 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 )
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
-        with (
-            patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
-        ):
+        with patch("experimenter.jetstream.client.analysis_storage.open") as mock_open:
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             tasks.fetch_experiment_data(experiment.id)
             experiment = NimbusExperiment.objects.get(id=experiment.id)
@@ -1771,14 +1769,10 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 )
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
-        with (
-            patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
-        ):
+        with patch("experimenter.jetstream.client.analysis_storage.open") as mock_open:
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             tasks.fetch_experiment_data(experiment.id)
             experiment = NimbusExperiment.objects.get(id=experiment.id)
@@ -1830,14 +1824,10 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 return "[]" if "errors" in self.name else json.dumps(DAILY_DATA)
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
-        with (
-            patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
-        ):
+        with patch("experimenter.jetstream.client.analysis_storage.open") as mock_open:
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             experiment = NimbusExperiment.objects.get(id=experiment.id)
             self.assertIsNone(experiment.results_data)
@@ -3185,14 +3175,10 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 return "[]" if "errors" in self.name else json.dumps(RESULTS_DATA)
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
-        with (
-            patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
-        ):
+        with patch("experimenter.jetstream.client.analysis_storage.open") as mock_open:
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             experiment = NimbusExperiment.objects.get(id=experiment.id)
             self.assertIsNone(experiment.results_data)
@@ -3225,10 +3211,12 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         now = timezone.now()
 
         with (
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
+            patch(
+                "experimenter.jetstream.client.analysis_storage.open",
+                side_effect=FileNotFoundError,
+            ),
             patch("experimenter.jetstream.client.timezone") as mock_timezone,
         ):
-            mock_exists.return_value = False
             mock_timezone.now.return_value = now
 
             experiment_errors = [
@@ -3416,14 +3404,10 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 )
 
         def open_file(filename):
-            return File(filename)
+            return io.StringIO(File(filename).read())
 
-        with (
-            patch("experimenter.jetstream.client.analysis_storage.open") as mock_open,
-            patch("experimenter.jetstream.client.analysis_storage.exists") as mock_exists,
-        ):
+        with patch("experimenter.jetstream.client.analysis_storage.open") as mock_open:
             mock_open.side_effect = open_file
-            mock_exists.return_value = True
 
             tasks.fetch_experiment_data(experiment.id)
             experiment = NimbusExperiment.objects.get(id=experiment.id)
@@ -3431,6 +3415,31 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
                 experiment.results_data.get("v3", {}).get("other_metrics"), OTHER_METRICS
             )
 
+    def get_results_files(self, experiment, generation=1):
+        recipe_slug = experiment.slug.replace("-", "_")
+        return {
+            STATISTICS_FOLDER: {
+                f"statistics_{recipe_slug}_daily.json": {
+                    "generation": generation,
+                    "etag": f"statistics-{generation}",
+                    "updated": timezone.now(),
+                },
+            },
+            METADATA_FOLDER: {
+                f"metadata_{recipe_slug}.json": {
+                    "generation": generation,
+                    "etag": f"metadata-{generation}",
+                    "updated": timezone.now(),
+                },
+                "metadata_other_experiment.json": {
+                    "generation": generation,
+                    "etag": f"other-{generation}",
+                    "updated": timezone.now(),
+                },
+            },
+            ERRORS_FOLDER: {},
+        }
+
     @parameterized.expand(
         [
             (NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,),
@@ -3438,137 +3447,163 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         ]
     )
     @patch("experimenter.jetstream.tasks.has_missing_expected_results")
-    @patch("experimenter.jetstream.tasks.get_stored_analysis_start_time")
-    @patch("experimenter.jetstream.tasks.get_latest_analysis_start_time")
-    @patch("experimenter.jetstream.tasks.get_results_filenames")
+    @patch("experimenter.jetstream.tasks.get_results_files")
     @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_fetch_jetstream_data_fetches_when_analysis_start_time_is_newer(
+    def test_fetch_jetstream_data_fetches_when_analysis_files_are_new(
         self,
         lifecycle,
         mock_delay,
-        mock_get_results_filenames,
-        mock_get_latest_analysis_start_time,
-        mock_get_stored_analysis_start_time,
+        mock_get_results_files,
         mock_has_missing_expected_results,
     ):
-        latest_time = timezone.now()
-
         experiment = NimbusExperimentFactory.create_with_lifecycle(lifecycle)
+        recipe_slug = experiment.slug.replace("-", "_")
 
-        mock_get_latest_analysis_start_time.return_value = latest_time
-        mock_get_stored_analysis_start_time.return_value = (
-            latest_time - datetime.timedelta(days=1)
-        )
+        mock_get_results_files.return_value = self.get_results_files(experiment)
         mock_has_missing_expected_results.return_value = False
         tasks.fetch_jetstream_data()
 
-        mock_get_latest_analysis_start_time.assert_called_once_with(experiment.slug)
+        mock_get_results_files.assert_called_once_with()
         mock_delay.assert_called_once_with(experiment.id)
+        self.assertEqual(
+            {
+                analysis_file.name: analysis_file.generation
+                for analysis_file in experiment.analysis_files.all()
+            },
+            {
+                f"{STATISTICS_FOLDER}/statistics_{recipe_slug}_daily.json": 1,
+                f"{METADATA_FOLDER}/metadata_{recipe_slug}.json": 1,
+            },
+        )
 
     @patch("experimenter.jetstream.tasks.has_missing_expected_results")
-    @patch("experimenter.jetstream.tasks.get_stored_analysis_start_time")
-    @patch("experimenter.jetstream.tasks.get_latest_analysis_start_time")
-    @patch("experimenter.jetstream.tasks.get_results_filenames")
+    @patch("experimenter.jetstream.tasks.get_results_files")
     @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_fetch_jetstream_data_skips_when_analysis_start_time_is_not_newer(
+    def test_fetch_jetstream_data_skips_when_analysis_files_are_unchanged(
         self,
         mock_delay,
-        mock_get_results_filenames,
-        mock_get_latest_analysis_start_time,
-        mock_get_stored_analysis_start_time,
+        mock_get_results_files,
         mock_has_missing_expected_results,
     ):
-        current_time = timezone.now()
-
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
         )
 
-        mock_get_latest_analysis_start_time.return_value = current_time
-        mock_get_stored_analysis_start_time.return_value = current_time
+        mock_get_results_files.return_value = self.get_results_files(experiment)
         mock_has_missing_expected_results.return_value = False
+        tasks.fetch_jetstream_data()
+        mock_delay.reset_mock()
+
         tasks.fetch_jetstream_data()
 
-        mock_get_latest_analysis_start_time.assert_called_once_with(experiment.slug)
         mock_delay.assert_not_called()
 
     @patch("experimenter.jetstream.tasks.has_missing_expected_results")
-    @patch("experimenter.jetstream.tasks.get_stored_analysis_start_time")
-    @patch("experimenter.jetstream.tasks.get_latest_analysis_start_time")
-    @patch("experimenter.jetstream.tasks.get_results_filenames")
+    @patch("experimenter.jetstream.tasks.get_results_files")
     @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_fetch_jetstream_data_fetches_when_stored_analysis_start_time_is_missing(
+    def test_fetch_jetstream_data_fetches_when_analysis_file_generation_changes(
         self,
         mock_delay,
-        mock_get_results_filenames,
-        mock_get_latest_analysis_start_time,
-        mock_get_stored_analysis_start_time,
+        mock_get_results_files,
         mock_has_missing_expected_results,
     ):
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
-            results_data=None,
         )
+        recipe_slug = experiment.slug.replace("-", "_")
 
-        mock_get_latest_analysis_start_time.return_value = timezone.now()
-        mock_get_stored_analysis_start_time.return_value = None
+        mock_get_results_files.return_value = self.get_results_files(experiment)
         mock_has_missing_expected_results.return_value = False
         tasks.fetch_jetstream_data()
+        mock_delay.reset_mock()
+
+        results_files = self.get_results_files(experiment, generation=2)
+        del results_files[STATISTICS_FOLDER][f"statistics_{recipe_slug}_daily.json"]
+        mock_get_results_files.return_value = results_files
+        tasks.fetch_jetstream_data()
 
-        mock_get_latest_analysis_start_time.assert_called_once_with(experiment.slug)
         mock_delay.assert_called_once_with(experiment.id)
+        self.assertEqual(
+            {
+                analysis_file.name: (analysis_file.generation, analysis_file.etag)
+                for analysis_file in experiment.analysis_files.all()
+            },
+            {f"{METADATA_FOLDER}/metadata_{recipe_slug}.json": (2, "metadata-2")},
+        )
 
     @patch("experimenter.jetstream.tasks.has_missing_expected_results")
-    @patch("experimenter.jetstream.tasks.get_stored_analysis_start_time")
-    @patch("experimenter.jetstream.tasks.get_latest_analysis_start_time")
-    @patch("experimenter.jetstream.tasks.get_results_filenames")
+    @patch("experimenter.jetstream.tasks.get_results_files")
     @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
-    def test_fetch_jetstream_data_skips_when_no_analysis_start_time_exists(
+    def test_fetch_jetstream_data_skips_when_no_analysis_files_exist(
         self,
         mock_delay,
-        mock_get_results_filenames,
-        mock_get_latest_analysis_start_time,
-        mock_get_stored_analysis_start_time,
+        mock_get_results_files,
         mock_has_missing_expected_results,
     ):
-        experiment = NimbusExperimentFactory.create_with_lifecycle(
+        NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
         )
 
-        mock_get_latest_analysis_start_time.return_value = None
+        mock_get_results_files.return_value = {
+            STATISTICS_FOLDER: {},
+            METADATA_FOLDER: {},
+            ERRORS_FOLDER: {},
+        }
         mock_has_missing_expected_results.return_value = False
         tasks.fetch_jetstream_data()
 
-        mock_get_latest_analysis_start_time.assert_called_once_with(experiment.slug)
         mock_delay.assert_not_called()
 
     @patch("experimenter.jetstream.tasks.has_missing_expected_results")
-    @patch("experimenter.jetstream.tasks.get_stored_analysis_start_time")
-    @patch("experimenter.jetstream.tasks.get_latest_analysis_start_time")
-    @patch("experimenter.jetstream.tasks.get_results_filenames")
+    @patch("experimenter.jetstream.tasks.get_results_files")
     @patch("experimenter.jetstream.tasks.fetch_experiment_data.delay")
     def test_fetch_jetstream_data_fetches_when_expecting_missing_results(
         self,
         mock_delay,
-        mock_get_results_filenames,
-        mock_get_latest_analysis_start_time,
-        mock_get_stored_analysis_start_time,
+        mock_get_results_files,
         mock_has_missing_expected_results,
     ):
-        current_time = timezone.now()
-
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
         )
 
-        mock_get_latest_analysis_start_time.return_value = current_time
-        mock_get_stored_analysis_start_time.return_value = current_time
+        mock_get_results_files.return_value = self.get_results_files(experiment)
+        mock_has_missing_expected_results.return_value = False
+        tasks.fetch_jetstream_data()
+        mock_delay.reset_mock()
+
         mock_has_missing_expected_results.return_value = True
         tasks.fetch_jetstream_data()
 
-        mock_has_missing_expected_results.assert_called_once()
+        mock_has_missing_expected_results.assert_called_with(
+            experiment, mock_get_results_files.return_value
+        )
         mock_delay.assert_called_once_with(experiment.id)
 
+    @patch("experimenter.jetstream.tasks.get_experiment_data")
+    def test_fetch_experiment_data_failure_resets_analysis_files(
+        self, mock_get_experiment_data
+    ):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
+        )
+        tasks.update_analysis_files(
+            experiment,
+            {
+                f"{METADATA_FOLDER}/metadata.json": {
+                    "generation": 1,
+                    "etag": "etag",
+                    "updated": timezone.now(),
+                }
+            },
+        )
+        mock_get_experiment_data.side_effect = Exception
+
+        with self.assertRaises(Exception):
+            tasks.fetch_experiment_data(experiment.id)
+
+        self.assertFalse(experiment.analysis_files.exists())
+
     @patch("experimenter.jetstream.tasks.get_experiment_data")
     def test_exception_for_fetch_experiment_data(self, mock_get_experiment_data):
         experiment = NimbusExperimentFactory.create_with_lifecycle(
@@ -3578,31 +3613,148 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         with self.assertRaises(Exception):
             tasks.fetch_experiment_data(experiment.id)
 
-    @patch("experimenter.jetstream.client.validate_data")
-    @patch("experimenter.jetstream.client.load_data_from_gcs")
-    def test_builds_statistics_filename(
-        self, mock_load_data_from_gcs, mock_validate_data
-    ):
+    @patch("experimenter.jetstream.client.stream_data_from_gcs")
+    def test_builds_statistics_filename(self, mock_stream_data_from_gcs):
         lifecycle = NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE
         offset = NimbusExperiment.DAYS_ANALYSIS_BUFFER + 1
         experiment = NimbusExperimentFactory.create_with_lifecycle(
             lifecycle, end_date=datetime.date.today() - datetime.timedelta(days=offset)
         )
 
-        mock_validate_data.return_value = True
+        mock_stream_data_from_gcs.return_value = iter([])
 
         recipe_slug = experiment.slug.replace("-", "_")
         window = AnalysisWindow.OVERALL
         get_data(recipe_slug, AnalysisWindow.OVERALL)
         filename = f"statistics/statistics_{recipe_slug}_{window}.json"
-        mock_load_data_from_gcs.assert_called_with(filename)
+        mock_stream_data_from_gcs.assert_called_with(filename)
 
         assert "AnalysisWindow" not in filename
         assert "overall" in filename
 
+    @patch("experimenter.jetstream.client.metrics")
     @patch("experimenter.jetstream.client.analysis_storage.open")
-    @patch("experimenter.jetstream.client.analysis_storage.exists")
-    def test_sizing_data_parsed_and_stored(self, mock_exists, mock_open):
+    def test_load_data_from_gcs_records_size_and_latency(self, mock_open, mock_metrics):
+        mock_open.return_value.read.return_value = '{"key": "value"}'
+
+        self.assertEqual(
+            load_data_from_gcs("statistics/statistics_slug_daily.json"),
+            {"key": "value"},
+        )
+
+        mock_open.assert_called_once_with("statistics/statistics_slug_daily.json")
+        mock_metrics.timing.assert_called_once_with(
+            "load_data_from_gcs.latency", ANY, tags=["folder:statistics"]
+        )
+        mock_metrics.histogram.assert_called_once_with(
+            "load_data_from_gcs.bytes", 16, tags=["folder:statistics"]
+        )
+
+    @patch(
+        "experimenter.jetstream.client.analysis_storage.open",
+        side_effect=FileNotFoundError,
+    )
+    def test_load_data_from_gcs_raises_for_missing_file(self, mock_open):
+        with self.assertRaisesMessage(
+            RuntimeError,
+            "Could not find data in analysis bucket at path metadata/missing.json",
+        ):
+            load_data_from_gcs("metadata/missing.json")
+
+    @parameterized.expand(
+        [
+            ('[{"a": [1, "é"]}, 12.5e-3 , null,"b"]'.encode(),),
+            ('[{"a": [1, "é"]}, 12.5e-3 , null,"b"]',),
+        ]
+    )
+    def test_iter_json_array_reads_items_across_chunks(self, document):
+        for chunk_size in range(1, len(document) + 1):
+            self.assertEqual(
+                list(
+                    iter_json_array(
+                        (io.BytesIO if isinstance(document, bytes) else io.StringIO)(
+                            document
+                        ).read,
+                        chunk_size,
+                    )
+                ),
+                [{"a": [1, "é"]}, 12.5e-3, None, "b"],
+            )
+
+    @parameterized.expand([("{}",), ("[1, 2",), ("[1 2]",), ("[1,]",), ("",)])
+    def test_iter_json_array_raises_for_invalid_array(self, document):
+        with self.assertRaises(ValueError):
+            list(iter_json_array(io.StringIO(document).read, 2))
+
+    @patch("experimenter.jetstream.client.metrics")
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_stream_data_from_gcs_records_size_and_latency(self, mock_open, mock_metrics):
+        mock_open.return_value = io.BytesIO(b'[{"key": "value"}]')
+
+        self.assertEqual(
+            list(stream_data_from_gcs("statistics/statistics_slug_daily.json")),
+            [{"key": "value"}],
+        )
+
+        mock_open.assert_called_once_with("statistics/statistics_slug_daily.json")
+        mock_metrics.timing.assert_called_once_with(
+            "load_data_from_gcs.latency", ANY, tags=["folder:statistics"]
+        )
+        mock_metrics.histogram.assert_called_once_with(
+            "load_data_from_gcs.bytes", 18, tags=["folder:statistics"]
+        )
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_stream_data_from_gcs_closes_file(self, mock_open):
+        exhausted_file = io.BytesIO(b'[{"key": "value"}]')
+        abandoned_file = io.BytesIO(b'[{"key": "value"}, {"key": "other"}]')
+        mock_open.side_effect = [exhausted_file, abandoned_file]
+
+        list(stream_data_from_gcs("statistics/statistics_slug_daily.json"))
+        items = stream_data_from_gcs("statistics/statistics_slug_weekly.json")
+        next(items)
+        items.close()
+
+        self.assertTrue(exhausted_file.closed)
+        self.assertTrue(abandoned_file.closed)
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_get_data_raises_for_invalid_statistics(self, mock_open):
+        mock_open.return_value = io.StringIO(
+            json.dumps([{"metric": "retained", "branch": "control"}])
+        )
+
+        with self.assertRaises(ValidationError):
+            get_data("slug", AnalysisWindow.DAILY)
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_get_data_raises_for_duplicate_statistics(self, mock_open):
+        point = {
+            "metric": "retained",
+            "statistic": "binomial",
+            "branch": "control",
+            "point": 0.5,
+            "window_index": "1",
+        }
+        mock_open.return_value = io.StringIO(json.dumps([point, point]))
+
+        with self.assertRaisesMessage(
+            ValidationError, "List of Statistic objects has duplicate(s)."
+        ):
+            get_data("slug", AnalysisWindow.DAILY)
+
+    def test_load_concurrently_returns_results_and_errors_by_key(self):
+        def fail():
+            raise RuntimeError("missing")
+
+        futures = load_concurrently({"value": lambda: 1, "error": fail})
+
+        self.assertEqual(futures["value"].result(), 1)
+        with self.assertRaisesMessage(RuntimeError, "missing"):
+            futures["error"].result()
+
+    @patch("experimenter.jetstream.client.analysis_storage.open")
+    def test_sizing_data_parsed_and_stored(self, mock_open):
         sizing_test_data = SampleSizesFactory.build().json()
 
         class File:
@@ -3616,7 +3768,6 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
             return File(filename)
 
         mock_open.side_effect = open_file
-        mock_exists.return_value = True
 
         sizing_results = cache.get(settings.SIZING_DATA_KEY)
         self.assertIsNone(sizing_results)
@@ -3630,8 +3781,7 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         )
 
     @patch("experimenter.jetstream.client.analysis_storage.open")
-    @patch("experimenter.jetstream.client.analysis_storage.exists")
-    def test_empty_fetch_population_sizing_data(self, mock_exists, mock_open):
+    def test_empty_fetch_population_sizing_data(self, mock_open):
         class File:
             def __init__(self, filename):
                 self.name = filename
@@ -3643,7 +3793,6 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
             return File(filename)
 
         mock_open.side_effect = open_file
-        mock_exists.return_value = True
 
         sizing_results = cache.get(settings.SIZING_DATA_KEY)
         self.assertIsNone(sizing_results)
@@ -3653,8 +3802,7 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         self.assertEqual(sizing_results, "{}")
 
     @patch("experimenter.jetstream.client.analysis_storage.open")
-    @patch("experimenter.jetstream.client.analysis_storage.exists")
-    def test_fetch_population_sizing_data_invalid(self, mock_exists, mock_open):
+    def test_fetch_population_sizing_data_invalid(self, mock_open):
         class File:
             def __init__(self, filename):
                 self.name = filename
@@ -3670,64 +3818,63 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
             return File(filename)
 
         mock_open.side_effect = open_file
-        mock_exists.return_value = True
         with self.assertRaises(Exception):
             tasks.fetch_population_sizing_data()
 
-    def test_get_stored_analysis_start_time_returns_parsed_time(self):
-        analysis_start_time = "2022-08-31T04:30:03+00:00"
-        experiment = NimbusExperimentFactory.create(
-            results_data={
-                "v3": {"metadata": {"analysis_start_time": analysis_start_time}}
-            },
-        )
-
-        self.assertEqual(
-            get_stored_analysis_start_time(experiment),
-            datetime.datetime.fromisoformat(analysis_start_time),
-        )
-
-    def test_get_stored_analysis_start_time_none_when_no_results_data(self):
-        experiment = NimbusExperimentFactory.create(results_data=None)
+    @patch("experimenter.jetstream.client.analysis_storage")
+    def test_get_results_files_returns_files_by_folder(self, mock_analysis_storage):
+        updated = timezone.now()
 
-        self.assertIsNone(get_stored_analysis_start_time(experiment))
+        def list_blobs(prefix, delimiter):
+            blobs = []
+            for index in range(2):
+                blob = Mock(generation=index, etag=f"{prefix}{index}", updated=updated)
+                # name is a Mock constructor argument, so it is set afterwards
+                blob.name = f"{prefix}{prefix.rstrip('/')}_{index}.json"
+                blobs.append(blob)
+            return blobs
 
-    def test_get_stored_analysis_start_time_none_when_no_metadata(self):
-        experiment = NimbusExperimentFactory.create(results_data={"v3": {}})
-
-        self.assertIsNone(get_stored_analysis_start_time(experiment))
-
-    @patch("experimenter.jetstream.client.get_metadata")
-    def test_get_latest_analysis_start_time_returns_parsed_time(self, mock_get_metadata):
-        analysis_start_time = "2022-08-31T04:30:03+00:00"
-        mock_get_metadata.return_value = {"analysis_start_time": analysis_start_time}
+        mock_analysis_storage.bucket.list_blobs.side_effect = list_blobs
 
         self.assertEqual(
-            get_latest_analysis_start_time("test-experiment-slug"),
-            datetime.datetime.fromisoformat(analysis_start_time),
+            get_results_files(),
+            {
+                folder: {
+                    f"{folder}_{index}.json": {
+                        "generation": index,
+                        "etag": f"{folder}/{index}",
+                        "updated": updated,
+                    }
+                    for index in range(2)
+                }
+                for folder in (STATISTICS_FOLDER, METADATA_FOLDER, ERRORS_FOLDER)
+            },
+        )
+        mock_analysis_storage.bucket.list_blobs.assert_any_call(
+            prefix=f"{STATISTICS_FOLDER}/", delimiter="/"
         )
 
-    @patch("experimenter.jetstream.client.get_metadata")
-    def test_get_latest_analysis_start_time_none_when_metadata_missing(
-        self, mock_get_metadata
-    ):
-        mock_get_metadata.side_effect = RuntimeError
-
-        self.assertIsNone(get_latest_analysis_start_time("test-experiment-slug"))
-
-    @patch("experimenter.jetstream.client.analysis_storage.listdir")
-    def test_get_results_filenames_returns_filenames_by_folder(self, mock_listdir):
-        def listdir(folder):
-            return ([], [f"{folder}_a.json", f"{folder}_b.json"])
-
-        mock_listdir.side_effect = listdir
+    def test_get_experiment_results_files_returns_experiment_files_by_path(self):
+        file_info = {"generation": 1, "etag": "etag", "updated": timezone.now()}
+        results_files = {
+            STATISTICS_FOLDER: {
+                "statistics_my_slug_daily.json": file_info,
+                "statistics_my_slug_overall.json": file_info,
+                "statistics_my_slug_extra_daily.json": file_info,
+            },
+            METADATA_FOLDER: {
+                "metadata_my_slug.json": file_info,
+                "metadata_other_slug.json": file_info,
+            },
+            ERRORS_FOLDER: {},
+        }
 
         self.assertEqual(
-            get_results_filenames(),
+            get_experiment_results_files("my-slug", results_files),
             {
-                STATISTICS_FOLDER: {"statistics_a.json", "statistics_b.json"},
-                METADATA_FOLDER: {"metadata_a.json", "metadata_b.json"},
-                ERRORS_FOLDER: {"errors_a.json", "errors_b.json"},
+                f"{STATISTICS_FOLDER}/statistics_my_slug_daily.json": file_info,
+                f"{STATISTICS_FOLDER}/statistics_my_slug_overall.json": file_info,
+                f"{METADATA_FOLDER}/metadata_my_slug.json": file_info,
             },
         )
 
@@ -3814,10 +3961,14 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
         new_results_data = {"v3": {"metadata": {"analysis_start_time": "new"}}}
 
         mock_get_experiment_data.return_value = new_results_data
-        tasks.fetch_experiment_data(experiment.id)
+        with patch.object(
+            ExperimentResultsManager, "warm_view_model_cache"
+        ) as mock_warm_view_model_cache:
+            tasks.fetch_experiment_data(experiment.id)
         experiment = NimbusExperiment.objects.get(id=experiment.id)
 
         self.assertEqual(experiment.results_data, new_results_data)
+        mock_warm_view_model_cache.assert_called_once_with()
 
     @patch("experimenter.jetstream.tasks.get_experiment_data")
     def test_fetch_experiment_data_does_not_save_when_results_unchanged(
@@ -3834,21 +3985,18 @@ class TestFetchJetstreamDataTask(MockSizingDataMixin, TestCase):
 
         mock_save.assert_not_called()
 
-    @patch("experimenter.jetstream.tasks.get_results_filenames")
-    @patch("experimenter.jetstream.tasks.get_latest_analysis_start_time")
-    def test_fetch_jetstream_data_raises_exception(
-        self, mock_get_latest_analysis_start_time, mock_get_results_filenames
-    ):
-        experiment = NimbusExperimentFactory.create_with_lifecycle(
+    @patch("experimenter.jetstream.tasks.get_results_files")
+    def test_fetch_jetstream_data_raises_exception(self, mock_get_results_files):
+        NimbusExperimentFactory.create_with_lifecycle(
             NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
         )
 
-        mock_get_latest_analysis_start_time.side_effect = Exception
+        mock_get_results_files.side_effect = Exception
 
         with self.assertRaises(Exception):
             tasks.fetch_jetstream_data()
 
-        mock_get_latest_analysis_start_time.assert_called_once_with(experiment.slug)
+        mock_get_results_files.assert_called_once_with()
 
 
 @pytest.fixture
@@ -4369,26 +4517,6 @@ class TestSkipInvalidResults(TestCase):
         "outcomes": {},
     }
 
-    def test_get_latest_analysis_start_time_skips_and_reports(self):
-        try:
-            Metadata.model_validate(self.INVALID_METADATA)
-        except ValidationError as e:
-            validation_error = e
-
-        with (
-            patch(
-                "experimenter.jetstream.client.get_metadata",
-                side_effect=validation_error,
-            ),
-            patch(
-                "experimenter.jetstream.client.sentry_sdk.capture_exception"
-            ) as mock_capture,
-        ):
-            result = get_latest_analysis_start_time("my-experiment")
-
-        self.assertIsNone(result)
-        mock_capture.assert_called_once()
-
     def test_fetch_experiment_data_skips_and_reports(self):
         experiment = NimbusExperimentFactory.create()
         experiment.results_data = {"v3": {"existing": True}}
@@ -4414,54 +4542,34 @@ class TestSkipInvalidResults(TestCase):
         experiment.refresh_from_db()
         self.assertEqual(experiment.results_data, {"v3": {"existing": True}})
 
-    def test_fetch_jetstream_data_continues_when_one_experiment_has_invalid_metadata(
-        self,
-    ):
-        invalid_experiment = NimbusExperimentFactory.create_with_lifecycle(
-            NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
-            results_data=None,
-        )
-        valid_experiment = NimbusExperimentFactory.create_with_lifecycle(
-            NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
-            results_data=None,
+    def test_fetch_experiment_data_skip_resets_analysis_files(self):
+        experiment = NimbusExperimentFactory.create()
+        tasks.update_analysis_files(
+            experiment,
+            {
+                f"{METADATA_FOLDER}/metadata.json": {
+                    "generation": 1,
+                    "etag": "etag",
+                    "updated": timezone.now(),
+                }
+            },
         )
-        invalid_recipe_slug = invalid_experiment.slug.replace("-", "_")
 
-        def fake_get_metadata(recipe_slug):
-            if recipe_slug == invalid_recipe_slug:
-                Metadata.model_validate(self.INVALID_METADATA)
-            return {"analysis_start_time": "2026-07-27T00:00:00+00:00"}
+        try:
+            Metadata.model_validate(self.INVALID_METADATA)
+        except ValidationError as e:
+            validation_error = e
 
         with (
             patch(
-                "experimenter.jetstream.client.get_metadata",
-                side_effect=fake_get_metadata,
-            ),
-            patch(
-                "experimenter.jetstream.client.sentry_sdk.capture_exception"
-            ) as mock_capture,
-            patch(
-                "experimenter.jetstream.tasks.get_results_filenames",
-                return_value={
-                    STATISTICS_FOLDER: set(),
-                    METADATA_FOLDER: set(),
-                    ERRORS_FOLDER: set(),
-                },
-            ),
-            patch(
-                "experimenter.jetstream.tasks.has_missing_expected_results",
-                return_value=False,
+                "experimenter.jetstream.tasks.get_experiment_data",
+                side_effect=validation_error,
             ),
-            patch(
-                "experimenter.jetstream.tasks.fetch_experiment_data.delay"
-            ) as mock_delay,
+            patch("experimenter.jetstream.tasks.sentry_sdk.capture_exception"),
         ):
-            tasks.fetch_jetstream_data()
+            tasks.fetch_experiment_data(experiment.id)
 
-        fetched_experiment_ids = {call.args[0] for call in mock_delay.call_args_list}
-        self.assertIn(valid_experiment.id, fetched_experiment_ids)
-        self.assertNotIn(invalid_experiment.id, fetched_experiment_ids)
-        mock_capture.assert_called_once()
+        self.assertFalse(experiment.analysis_files.exists())
 
 
 class TestFetchPopulationEstimatesDataTask(TestCase):
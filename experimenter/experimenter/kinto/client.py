@@ -1,5 +1,8 @@
+from functools import cache
+
 import kinto_http
 from django.conf import settings
+from kinto_http import KintoException
 
 KINTO_REVIEW_STATUS = "to-review"
 KINTO_REJECTED_STATUS = "work-in-progress"
@@ -7,15 +10,23 @@ KINTO_ROLLBACK_STATUS = "to-rollback"
 KINTO_SIGN_STATUS = "to-sign"
 
 
+@cache
+def get_kinto_http_client():
+    # Shared by every KintoClient in the process so that tasks reuse the pooled
+    # HTTP connections of a single session instead of reconnecting each run
+    return kinto_http.Client(
+        server_url=settings.KINTO_HOST,
+        auth=(settings.KINTO_USER, settings.KINTO_PASS),
+    )
+
+
 class KintoClient:
     def __init__(self, collection, review=True):
         self.collection = collection
-        self.kinto_http_client = kinto_http.Client(
-            server_url=settings.KINTO_HOST,
-            auth=(settings.KINTO_USER, settings.KINTO_PASS),
-        )
+        self.kinto_http_client = get_kinto_http_client()
         self.review = review
         self.collection_data = None
+        self.main_records = None
         self.read_bucket = (
             settings.KINTO_BUCKET_WORKSPACE if not review else settings.KINTO_BUCKET_MAIN
         )
@@ -93,10 +104,63 @@ class KintoClient:
             bucket=settings.KINTO_BUCKET_WORKSPACE,
         )
 
-    def get_main_records(self):
+    def fetch_collection(self):
+        """
+        Reads the workspace collection metadata and the published records in a
+        single batch request, so that later status checks and get_main_records
+        calls need no further requests.
+        """
+        batch_response, _ = self.kinto_http_client.session.request(
+            "post",
+            self.kinto_http_client.endpoints.get("batch"),
+            payload={
+                "requests": [
+                    {
+                        "method": "GET",
+                        "path": (
+                            f"/buckets/{settings.KINTO_BUCKET_WORKSPACE}"
+                            f"/collections/{self.collection}"
+                        ),
+                    },
+                    {
+                        "method": "GET",
+                        "path": (
+                            f"/buckets/{self.read_bucket}"
+                            f"/collections/{self.collection}/records"
+                        ),
+                    },
+                ]
+            },
+        )
+        collection_response, records_response = batch_response["responses"]
+
+        for response in (collection_response, records_response):
+            if not 200 <= response["status"] < 300:
+                raise KintoException(f"{response['status']} - {response['body']}")
+
+        self.collection_data = collection_response["body"]["data"]
+
+        # The batch API cannot follow pagination, so a collection larger than a
+        # single page is read again with the paginated records endpoint
+        if "next-page" in map(str.lower, records_response.get("headers", {})):
+            self.main_records = self._get_main_records()
+        else:
+            self.main_records = {r["id"]: r for r in records_response["body"]["data"]}
+
+    def _get_main_records(self):
         return {
             r["id"]: r
             for r in self.kinto_http_client.get_records(
                 bucket=self.read_bucket, collection=self.collection
             )
         }
+
+    def get_main_records(self):
+        if self.main_records is not None:
+            return self.main_records
+        return self._get_main_records()
+
+    def get_main_records_since(self, timestamp):
+        return self.kinto_http_client.get_records(
+            bucket=self.read_bucket, collection=self.collection, _since=timestamp
+        )
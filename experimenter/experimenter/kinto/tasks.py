@@ -1,20 +1,32 @@
+import datetime
+from collections import defaultdict
+
 import markus
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 from kinto_http import KintoException
 
 from experimenter.celery import app
 from experimenter.experiments.api.v6.serializers import NimbusExperimentSerializer
-from experimenter.experiments.changelog_utils import generate_nimbus_changelog
+from experimenter.experiments.changelog_utils import (
+    generate_nimbus_changelog,
+    generate_nimbus_changelogs,
+)
 from experimenter.experiments.constants import NimbusConstants
 from experimenter.experiments.email import (
     nimbus_send_enrollment_ending_email,
     nimbus_send_experiment_ending_email,
 )
-from experimenter.experiments.models import NimbusAlert, NimbusChangeLog, NimbusExperiment
+from experimenter.experiments.models import (
+    NimbusAlert,
+    NimbusChangeLog,
+    NimbusExperiment,
+    NimbusExperimentPayload,
+)
 from experimenter.kinto.client import KintoClient
 from experimenter.slack.constants import SlackConstants
 from experimenter.slack.notification import send_threaded_success_message
@@ -71,6 +83,7 @@ def nimbus_check_kinto_push_queue_by_collection(collection):
         if collection in application.kinto_collections
     ]
     kinto_client = KintoClient(collection)
+    kinto_client.fetch_collection()
 
     should_rollback = False
     if kinto_client.has_pending_review():
@@ -94,16 +107,16 @@ def nimbus_check_kinto_push_queue_by_collection(collection):
     handle_ending_experiments(applications, records, collection)
     handle_waiting_experiments(applications, records, collection)
 
-    if queued_launch_experiment := next(
-        NimbusExperiment.objects.launch_queue(applications, collection), None
+    if queued_launch_experiment := (
+        NimbusExperiment.objects.launch_queue(applications, collection).first()
     ):
         nimbus_push_experiment_to_kinto.delay(collection, queued_launch_experiment.id)
-    elif queued_end_experiment := next(
-        NimbusExperiment.objects.end_queue(applications, collection), None
+    elif queued_end_experiment := (
+        NimbusExperiment.objects.end_queue(applications, collection).first()
     ):
         nimbus_end_experiment_in_kinto.delay(collection, queued_end_experiment.id)
-    elif queued_pause_experiment := next(
-        NimbusExperiment.objects.update_queue(applications, collection), None
+    elif queued_pause_experiment := (
+        NimbusExperiment.objects.update_queue(applications, collection).first()
     ):
         nimbus_update_experiment_in_kinto.delay(collection, queued_pause_experiment.id)
 
@@ -111,9 +124,7 @@ def nimbus_check_kinto_push_queue_by_collection(collection):
 
 
 def handle_pending_review(applications, collection):
-    if experiment := next(
-        NimbusExperiment.objects.waiting(applications, collection), None
-    ):
+    if experiment := NimbusExperiment.objects.waiting(applications, collection).first():
         if experiment.should_timeout:
             with transaction.atomic():
                 experiment.publish_status = NimbusExperiment.PublishStatus.REVIEW
@@ -136,9 +147,9 @@ def handle_pending_review(applications, collection):
 
 def handle_rejection(applications, kinto_client):
     collection_data = kinto_client.get_rejected_collection_data()
-    if experiment := next(
-        NimbusExperiment.objects.waiting(applications, kinto_client.collection), None
-    ):
+    if experiment := NimbusExperiment.objects.waiting(
+        applications, kinto_client.collection
+    ).first():
         with transaction.atomic():
             if (
                 experiment.is_rollout is True
@@ -575,10 +586,7 @@ def nimbus_synchronize_preview_experiments_in_kinto():
                 updated = NimbusExperiment.objects.filter(
                     pk=experiment.pk,
                     status=NimbusExperiment.Status.PREVIEW,
-                ).update(
-                    published_dto=data,
-                    published_date=timezone.now(),
-                )
+                ).update(published_date=timezone.now())
 
                 if not updated:
                     logger.info(
@@ -587,6 +595,8 @@ def nimbus_synchronize_preview_experiments_in_kinto():
                     )
                     continue
 
+                experiment.published_dto = data
+                experiment.save(update_fields=["published_dto"])
                 experiment.refresh_from_db()
                 generate_nimbus_changelog(
                     experiment,
@@ -633,13 +643,14 @@ def nimbus_synchronize_preview_experiments_in_kinto():
             kinto_client.delete_record(experiment.slug)
 
             with transaction.atomic():
-                NimbusExperiment.objects.filter(
+                updated = NimbusExperiment.objects.filter(
                     pk=experiment.pk,
                     status=NimbusExperiment.Status.DRAFT,
-                ).update(
-                    published_date=None,
-                    published_dto=None,
-                )
+                ).update(published_date=None)
+
+                if updated:
+                    experiment.published_dto = None
+                    experiment.save(update_fields=["published_dto"])
 
                 experiment.refresh_from_db()
                 generate_nimbus_changelog(
@@ -697,6 +708,58 @@ def nimbus_send_emails():
     metrics.incr("nimbus_send_emails.completed")
 
 
+def get_cached_main_records(kinto_client):
+    """
+    Returns the published records of a collection keyed by id. When a snapshot of
+    the collection from a previous run is cached, only the records changed since
+    then are read and merged into it. The collection is read in full again once
+    the snapshot is older than KINTO_MAIN_RECORDS_CACHE_TTL.
+    """
+    cache_key = settings.KINTO_MAIN_RECORDS_CACHE_KEY.format(
+        collection=kinto_client.collection
+    )
+    cached = cache.get(cache_key)
+    now = timezone.now()
+
+    # Every run renews the cached snapshot, so its age is tracked separately
+    if cached is not None and (
+        cached.get("fetched_on") is None
+        or now - cached["fetched_on"]
+        >= datetime.timedelta(seconds=settings.KINTO_MAIN_RECORDS_CACHE_TTL)
+    ):
+        cached = None
+
+    if cached is None:
+        records = kinto_client.get_main_records()
+        changes = records.values()
+        timestamp = None
+        fetched_on = now
+    else:
+        records = cached["records"]
+        changes = kinto_client.get_main_records_since(cached["timestamp"])
+        timestamp = cached["timestamp"]
+        fetched_on = cached["fetched_on"]
+        for record in changes:
+            if record.get("deleted"):
+                records.pop(record["id"], None)
+            else:
+                records[record["id"]] = record
+
+    # Deriving the timestamp from the records read, rather than from a separate
+    # request, means changes published in between are picked up next run
+    timestamp = max(
+        (int(record["last_modified"]) for record in changes), default=timestamp
+    )
+    if timestamp is not None:
+        cache.set(
+            cache_key,
+            {"timestamp": timestamp, "fetched_on": fetched_on, "records": records},
+            settings.KINTO_MAIN_RECORDS_CACHE_TTL,
+        )
+
+    return records
+
+
 @app.task
 @metrics.timer_decorator("nimbus_sync_published_dto")
 def nimbus_sync_published_dto(experiment_id=None):
@@ -717,42 +780,61 @@ def nimbus_sync_published_dto(experiment_id=None):
     try:
         experiments = NimbusExperiment.objects.filter(
             status=NimbusExperiment.Status.LIVE,
+        ).prefetch_related(
+            NimbusExperimentPayload.prefetch(NimbusExperimentPayload.Kind.PUBLISHED_DTO)
         )
         if experiment_id:
             experiments = experiments.filter(id=experiment_id)
 
+        experiments_by_collection = defaultdict(list)
         for experiment in experiments:
             collection = experiment.kinto_collection
-            if collection is None:
-                continue
+            if collection is not None:
+                experiments_by_collection[collection].append(experiment)
 
-            records = kinto_clients[collection].get_main_records()
+        resynced_experiments = []
+        for collection, collection_experiments in experiments_by_collection.items():
+            records = get_cached_main_records(kinto_clients[collection])
 
-            if experiment.slug not in records:
-                logger.info(f"Experiment {experiment.slug} not found in Remote Settings")
-                metrics.incr("nimbus_sync_published_dto.not_found")
-                continue
-
-            published_record = records[experiment.slug].copy()
-            published_record.pop("last_modified", None)
+            for experiment in collection_experiments:
+                if experiment.slug not in records:
+                    logger.info(
+                        f"Experiment {experiment.slug} not found in Remote Settings"
+                    )
+                    metrics.incr("nimbus_sync_published_dto.not_found")
+                    continue
 
-            stored_record = (experiment.published_dto or {}).copy()
-            stored_record.pop("last_modified", None)
+                published_record = records[experiment.slug].copy()
+                published_record.pop("last_modified", None)
 
-            if published_record != stored_record:
-                logger.info(f"Resynchronizing {experiment.slug} from Remote Settings")
+                stored_record = (experiment.published_dto or {}).copy()
+                stored_record.pop("last_modified", None)
 
-                with transaction.atomic():
+                if published_record != stored_record:
+                    logger.info(f"Resynchronizing {experiment.slug} from Remote Settings")
                     experiment.published_dto = published_record
-                    experiment.save()
+                    resynced_experiments.append(experiment)
 
-                    generate_nimbus_changelog(
-                        experiment,
-                        get_kinto_user(),
-                        message=NimbusChangeLog.Messages.RESYNCHRONIZED_FROM_RS,
-                    )
+        if resynced_experiments:
+            updated_date_time = timezone.now()
+            for experiment in resynced_experiments:
+                experiment._updated_date_time = updated_date_time
+
+            with transaction.atomic():
+                NimbusExperiment.objects.bulk_update(
+                    resynced_experiments, ["_updated_date_time"]
+                )
+                NimbusExperimentPayload.objects.save_payloads(
+                    resynced_experiments, [NimbusExperimentPayload.Kind.PUBLISHED_DTO]
+                )
+
+                generate_nimbus_changelogs(
+                    resynced_experiments,
+                    get_kinto_user(),
+                    message=NimbusChangeLog.Messages.RESYNCHRONIZED_FROM_RS,
+                )
 
-                metrics.incr("nimbus_sync_published_dto.resynced")
+            metrics.incr("nimbus_sync_published_dto.resynced", len(resynced_experiments))
 
         metrics.incr("nimbus_sync_published_dto.completed")
 
@@ -1,6 +1,10 @@
 from unittest import mock
 
-from experimenter.kinto.client import KINTO_REJECTED_STATUS, KINTO_REVIEW_STATUS
+from experimenter.kinto.client import (
+    KINTO_REJECTED_STATUS,
+    KINTO_REVIEW_STATUS,
+    get_kinto_http_client,
+)
 
 
 class MockKintoClientMixin:
@@ -12,9 +16,29 @@ class MockKintoClientMixin:
         )
         self.mock_kinto_client_creator = mock_kinto_client_patcher.start()
         self.mock_kinto_client = mock.Mock()
+        self.mock_kinto_client.session.request.side_effect = self.mock_batch_request
         self.mock_kinto_client_creator.return_value = self.mock_kinto_client
         self.addCleanup(mock_kinto_client_patcher.stop)
 
+        get_kinto_http_client.cache_clear()
+        self.addCleanup(get_kinto_http_client.cache_clear)
+
+    def mock_batch_request(self, method, endpoint, payload):
+        # Answers batch requests from the get_collection and get_records mocks
+        # so that tests can set up a collection the same way for either
+        collection = self.mock_kinto_client.get_collection()
+        records = self.mock_kinto_client.get_records()
+        return {
+            "responses": [
+                {"status": 200, "body": collection, "headers": {}},
+                {
+                    "status": 200,
+                    "body": {"data": records if isinstance(records, list) else []},
+                    "headers": {},
+                },
+            ]
+        }, {}
+
     def setup_kinto_pending_review(self):
         self.mock_kinto_client.get_collection.return_value = {
             "data": {"status": KINTO_REVIEW_STATUS}
@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.test import TestCase
+from kinto_http import KintoException
 from parameterized import parameterized
 
 from experimenter.kinto.client import (
@@ -132,6 +133,106 @@ class TestKintoClient(MockKintoClientMixin, TestCase):
         self.setup_kinto_get_main_records([])
         self.assertEqual(self.client.get_main_records(), {})
 
+    def test_returns_records_since_timestamp(self):
+        self.mock_kinto_client.get_records.return_value = [
+            {"id": "test-slug", "last_modified": "10", "deleted": True}
+        ]
+        self.assertEqual(
+            self.client.get_main_records_since(5),
+            [{"id": "test-slug", "last_modified": "10", "deleted": True}],
+        )
+        self.mock_kinto_client.get_records.assert_called_with(
+            bucket=settings.KINTO_BUCKET_MAIN,
+            collection=self.collection,
+            _since=5,
+        )
+
+    def test_reuses_kinto_http_client(self):
+        KintoClient(self.collection)
+        KintoClient(self.collection, review=False)
+
+        self.mock_kinto_client_creator.assert_called_once_with(
+            server_url=settings.KINTO_HOST,
+            auth=(settings.KINTO_USER, settings.KINTO_PASS),
+        )
+
+    def test_fetch_collection_reads_collection_and_records_in_one_batch(self):
+        slug = "test-slug"
+        self.setup_kinto_pending_review()
+        self.setup_kinto_get_main_records([slug])
+
+        self.client.fetch_collection()
+
+        self.mock_kinto_client.session.request.assert_called_once_with(
+            "post",
+            self.mock_kinto_client.endpoints.get.return_value,
+            payload={
+                "requests": [
+                    {
+                        "method": "GET",
+                        "path": (
+                            f"/buckets/{settings.KINTO_BUCKET_WORKSPACE}"
+                            f"/collections/{self.collection}"
+                        ),
+                    },
+                    {
+                        "method": "GET",
+                        "path": (
+                            f"/buckets/{settings.KINTO_BUCKET_MAIN}"
+                            f"/collections/{self.collection}/records"
+                        ),
+                    },
+                ]
+            },
+        )
+        self.assertTrue(self.client.has_pending_review())
+        self.assertEqual(
+            self.client.get_main_records(), {slug: {"id": slug, "last_modified": "0"}}
+        )
+        self.assertEqual(self.mock_kinto_client.session.request.call_count, 1)
+
+    def test_fetch_collection_reads_paginated_records(self):
+        slug = "test-slug"
+        self.mock_kinto_client.session.request.side_effect = None
+        self.mock_kinto_client.session.request.return_value = (
+            {
+                "responses": [
+                    {"status": 200, "body": {"data": {"status": "anything"}}},
+                    {
+                        "status": 200,
+                        "body": {"data": [{"id": "first-page"}]},
+                        "headers": {"Next-Page": "next-page-url"},
+                    },
+                ]
+            },
+            {},
+        )
+        self.setup_kinto_get_main_records([slug])
+
+        self.client.fetch_collection()
+
+        self.assertEqual(
+            self.client.get_main_records(), {slug: {"id": slug, "last_modified": "0"}}
+        )
+        self.mock_kinto_client.get_records.assert_called_once_with(
+            bucket=settings.KINTO_BUCKET_MAIN, collection=self.collection
+        )
+
+    def test_fetch_collection_raises_for_failed_request(self):
+        self.mock_kinto_client.session.request.side_effect = None
+        self.mock_kinto_client.session.request.return_value = (
+            {
+                "responses": [
+                    {"status": 404, "body": {"message": "not found"}},
+                    {"status": 200, "body": {"data": []}},
+                ]
+            },
+            {},
+        )
+
+        with self.assertRaises(KintoException):
+            self.client.fetch_collection()
+
     def test_returns_nothing_when_not_rejects(self):
         self.setup_kinto_no_pending_review()
         self.assertIsNone(self.client.get_rejected_collection_data())
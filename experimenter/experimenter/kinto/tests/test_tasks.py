@@ -1,7 +1,9 @@
+import datetime
 from unittest import mock
 
 from django.conf import settings
 from django.core import mail
+from django.core.cache import cache
 from django.test import TestCase
 from django.test.utils import override_settings
 from django.utils import timezone
@@ -2139,7 +2141,18 @@ class TestNimbusSendEmails(MockKintoClientMixin, TestCase):
         self.assertEqual(len(mail.outbox), 1)
 
 
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    },
+)
 class TestNimbusSyncPublishedDto(MockKintoClientMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     @parameterized.expand(
         [
             NimbusExperiment.Application.DESKTOP,
@@ -2345,3 +2358,118 @@ class TestNimbusSyncPublishedDto(MockKintoClientMixin, TestCase):
 
         with self.assertRaises(Exception):
             tasks.nimbus_sync_published_dto()
+
+    def test_fetches_each_collection_once(self):
+        experiments = [
+            NimbusExperimentFactory.create_with_lifecycle(
+                NimbusExperimentFactory.Lifecycles.LAUNCH_APPROVE_APPROVE,
+                application=NimbusExperiment.Application.DESKTOP,
+                published_dto=None,
+            )
+            for _ in range(3)
+        ]
+
+        self.setup_kinto_get_main_records([e.slug for e in experiments])
+
+        tasks.nimbus_sync_published_dto()
+
+        self.mock_kinto_client.get_records.assert_called_once_with(
+            bucket=settings.KINTO_BUCKET_MAIN,
+            collection=settings.KINTO_COLLECTION_NIMBUS_DESKTOP,
+        )
+        for experiment in experiments:
+            experiment.refresh_from_db()
+            self.assertEqual(experiment.published_dto, {"id": experiment.slug})
+            self.assertEqual(
+                experiment.changes.latest_change().message,
+                NimbusChangeLog.Messages.RESYNCHRONIZED_FROM_RS,
+            )
+
+    def test_reads_changes_since_previous_run(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LAUNCH_APPROVE_APPROVE,
+            application=NimbusExperiment.Application.DESKTOP,
+            published_dto=None,
+        )
+        other_experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LAUNCH_APPROVE_APPROVE,
+            application=NimbusExperiment.Application.DESKTOP,
+            published_dto=None,
+        )
+
+        self.mock_kinto_client.get_records.return_value = [
+            {"id": experiment.slug, "last_modified": "10"},
+            {"id": other_experiment.slug, "last_modified": "20"},
+        ]
+
+        tasks.nimbus_sync_published_dto()
+
+        self.mock_kinto_client.get_records.return_value = [
+            {"id": experiment.slug, "updated": True, "last_modified": "30"},
+            {"id": other_experiment.slug, "last_modified": "40", "deleted": True},
+        ]
+        other_changes_before = other_experiment.changes.count()
+
+        tasks.nimbus_sync_published_dto()
+
+        self.mock_kinto_client.get_records.assert_called_with(
+            bucket=settings.KINTO_BUCKET_MAIN,
+            collection=settings.KINTO_COLLECTION_NIMBUS_DESKTOP,
+            _since=20,
+        )
+
+        experiment.refresh_from_db()
+        self.assertEqual(
+            experiment.published_dto, {"id": experiment.slug, "updated": True}
+        )
+
+        other_experiment.refresh_from_db()
+        self.assertEqual(other_experiment.published_dto, {"id": other_experiment.slug})
+        self.assertEqual(other_experiment.changes.count(), other_changes_before)
+        self.assertEqual(
+            cache.get(
+                settings.KINTO_MAIN_RECORDS_CACHE_KEY.format(
+                    collection=settings.KINTO_COLLECTION_NIMBUS_DESKTOP
+                )
+            )["timestamp"],
+            40,
+        )
+
+    def test_reads_all_records_once_cached_records_expire(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LAUNCH_APPROVE_APPROVE,
+            application=NimbusExperiment.Application.DESKTOP,
+        )
+        self.mock_kinto_client.get_records.return_value = [
+            {"id": experiment.slug, "last_modified": "10"},
+        ]
+        cache_key = settings.KINTO_MAIN_RECORDS_CACHE_KEY.format(
+            collection=settings.KINTO_COLLECTION_NIMBUS_DESKTOP
+        )
+
+        tasks.nimbus_sync_published_dto()
+        tasks.nimbus_sync_published_dto()
+
+        self.mock_kinto_client.get_records.assert_called_with(
+            bucket=settings.KINTO_BUCKET_MAIN,
+            collection=settings.KINTO_COLLECTION_NIMBUS_DESKTOP,
+            _since=10,
+        )
+        fetched_on = cache.get(cache_key)["fetched_on"]
+
+        cache.set(
+            cache_key,
+            {
+                **cache.get(cache_key),
+                "fetched_on": fetched_on
+                - datetime.timedelta(seconds=settings.KINTO_MAIN_RECORDS_CACHE_TTL),
+            },
+        )
+
+        tasks.nimbus_sync_published_dto()
+
+        self.mock_kinto_client.get_records.assert_called_with(
+            bucket=settings.KINTO_BUCKET_MAIN,
+            collection=settings.KINTO_COLLECTION_NIMBUS_DESKTOP,
+        )
+        self.assertGreater(cache.get(cache_key)["fetched_on"], fetched_on)
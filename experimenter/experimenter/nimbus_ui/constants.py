@@ -626,6 +626,10 @@ def _get_schema_diff_size_config():
                 "text": "First Version",
                 "badge_class": "badge bg-secondary",
             },
+            "invalid": {
+                "text": "Invalid Schema",
+                "badge_class": "badge bg-dark",
+            },
         },
     }
 
@@ -357,8 +357,8 @@ class HomeSortChoices(models.TextChoices):
     VERSIONS_DOWN = "-_firefox_min_version_parsed", "Versions"
     FEATURES_UP = "feature_configs__slug", "Features"
     FEATURES_DOWN = "-feature_configs__slug", "Features"
-    RESULTS_UP = "results_data", "Results"
-    RESULTS_DOWN = "-results_data", "Results"
+    RESULTS_UP = "_has_displayable_results", "Results"
+    RESULTS_DOWN = "-_has_displayable_results", "Results"
 
     @staticmethod
     def sortable_headers():
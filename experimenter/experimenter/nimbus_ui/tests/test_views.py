@@ -1,10 +1,11 @@
 import datetime
 import io
 import json
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
@@ -25,6 +26,7 @@ from experimenter.experiments.models import (
     NimbusExperimentBranchThroughRequired,
     NimbusFeatureConfig,
     NimbusFeatureVersion,
+    NimbusVersionedSchema,
     Tag,
 )
 from experimenter.experiments.tests.factories import (
@@ -35,6 +37,7 @@ from experimenter.experiments.tests.factories import (
     NimbusVersionedSchemaFactory,
     TagFactory,
 )
+from experimenter.jetstream.results_manager import ExperimentResultsManager
 from experimenter.kinto.tasks import (
     nimbus_check_kinto_push_queue_by_collection,
     nimbus_synchronize_preview_experiments_in_kinto,
@@ -120,6 +123,79 @@ class NimbusChangeLogsViewTest(AuthTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context["experiment"], experiment)
 
+    @override_settings(CHANGELOG_ENTRIES_PAGINATE_BY=2)
+    def test_pages_through_changelog_entries(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING
+        )
+        entries = list(experiment.get_changelog_entries())
+        url = reverse("nimbus-ui-history", kwargs={"slug": experiment.slug})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["is_first_page"])
+        self.assertEqual(response.context["next_before"], entries[1].id)
+        self.assertEqual(
+            response.context["changelogs"],
+            experiment.get_changelogs_by_date(entries[:2]),
+        )
+
+        response = self.client.get(url, {"before": entries[1].id})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.context["is_first_page"])
+        self.assertEqual(
+            response.context["changelogs"],
+            experiment.get_changelogs_by_date(entries[2:4]),
+        )
+
+    def test_generates_changelog_entries_predating_stored_entries(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING
+        )
+        changelogs = experiment.get_changelogs_by_date()
+        # Only the latest change log was made once its entries were stored
+        latest_change = experiment.changes.latest_change()
+        experiment.changelog_entries.exclude(changelog=latest_change).delete()
+        NimbusExperiment.objects.filter(id=experiment.id).update(
+            _has_changelog_entries=False
+        )
+
+        response = self.client.get(
+            reverse("nimbus-ui-history", kwargs={"slug": experiment.slug})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [
+                [change["event_message"] for change in changelog["changes"]]
+                for changelog in response.context["changelogs"]
+            ],
+            [
+                [change["event_message"] for change in changelog["changes"]]
+                for changelog in changelogs
+            ],
+        )
+
+        experiment.refresh_from_db()
+        self.assertTrue(experiment._has_changelog_entries)
+
+    def test_does_not_regenerate_stored_changelog_entries(self):
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.LIVE_ENROLLING
+        )
+
+        with patch.object(
+            NimbusExperiment, "generate_changelog_entries"
+        ) as generate_changelog_entries:
+            response = self.client.get(
+                reverse("nimbus-ui-history", kwargs={"slug": experiment.slug})
+            )
+
+        self.assertEqual(response.status_code, 200)
+        generate_changelog_entries.assert_not_called()
+
 
 class NimbusExperimentsListViewTest(AuthTestCase):
     def test_render_to_response(self):
@@ -3673,6 +3749,90 @@ class TestResultsView(AuthTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "nimbus_experiments/results-fragment.html")
 
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+        },
+    )
+    def test_results_fragment_served_from_cached_view_model(self):
+        cache.clear()
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
+        )
+        experiment.results_data = {
+            "v3": {
+                "other_metrics": {},
+                "metadata": {"metrics": {}},
+                "overall": {"enrollments": {"all": {}}, "exposures": {"all": {}}},
+            }
+        }
+        experiment.save()
+        ExperimentResultsManager(experiment).warm_view_model_cache()
+
+        with (
+            patch.object(
+                ExperimentResultsManager, "get_view_model"
+            ) as mock_get_view_model,
+            patch.object(
+                NimbusExperiment, "results_data", new_callable=PropertyMock
+            ) as mock_results_data,
+        ):
+            response = self.client.get(
+                reverse(
+                    "nimbus-ui-results",
+                    kwargs={"slug": experiment.slug},
+                    query={"segment": "all", "analysis_basis": "exposures"},
+                ),
+                headers={"Hx-Request": "true"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "nimbus_experiments/results-fragment.html")
+        self.assertEqual(response.context["displayed_window"], "overall")
+        self.assertEqual(response.context["selected_analysis_basis"], "exposures")
+        mock_get_view_model.assert_not_called()
+        mock_results_data.assert_not_called()
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+        },
+    )
+    def test_results_default_analysis_basis_served_from_cached_view_model(self):
+        cache.clear()
+        experiment = NimbusExperimentFactory.create_with_lifecycle(
+            NimbusExperimentFactory.Lifecycles.ENDING_APPROVE_APPROVE,
+        )
+        experiment.results_data = {
+            "v3": {
+                "other_metrics": {},
+                "metadata": {"metrics": {}},
+                "overall": {"enrollments": {"all": {}}, "exposures": {"all": {}}},
+            }
+        }
+        experiment.save()
+        ExperimentResultsManager(experiment).warm_view_model_cache()
+
+        with patch.object(
+            NimbusExperiment, "results_data", new_callable=PropertyMock
+        ) as mock_results_data:
+            response = self.client.get(
+                reverse("nimbus-ui-results", kwargs={"slug": experiment.slug}),
+                headers={"Hx-Request": "true"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["selected_analysis_basis"], "enrollments")
+        self.assertEqual(
+            response.context["exposures_status"],
+            NimbusUIConstants.ExposuresStatus.NO_EXPOSURES,
+        )
+        mock_results_data.assert_not_called()
+
     @parameterized.expand(
         [
             (
@@ -5692,6 +5852,46 @@ class TestNimbusFeaturesView(AuthTestCase):
         self.assertEqual(feature_schemas[3]["size_label"], "No Changes")
         self.assertEqual(feature_schemas[4]["size_label"], "First Version")
 
+    def test_features_view_uses_stored_schema_diffs(self):
+        application = NimbusExperiment.Application.DESKTOP
+        feature_config = self.feature_configs["feature-desktop"]
+        feature_config.schemas.all().delete()
+
+        for num in range(3):
+            NimbusVersionedSchemaFactory.create(
+                feature_config=feature_config,
+                version=NimbusFeatureVersion.objects.create(
+                    major=120 + num, minor=0, patch=0
+                ),
+                schema=f'{{"field": "value{num}"}}',
+            )
+        NimbusVersionedSchema.objects.update_schema_diffs([feature_config.id])
+
+        with patch.object(
+            NimbusVersionedSchema.objects, "update_schema_diffs"
+        ) as update_schema_diffs:
+            response = self.client.get(
+                reverse("nimbus-ui-features"),
+                {
+                    "application": application.value,
+                    "feature_configs": feature_config.id,
+                    "sort": "-change_size",
+                },
+            )
+
+        update_schema_diffs.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["schemas_with_changes"], 2)
+        feature_schemas = response.context["feature_schemas"]
+        self.assertEqual(
+            [item["schema"].version.major for item in feature_schemas], [122, 121, 120]
+        )
+        self.assertEqual(
+            [item["size_label"] for item in feature_schemas],
+            ["Small", "Small", "First Version"],
+        )
+        self.assertEqual(feature_schemas[0]["previous_json"], '{"field": "value1"}')
+
     def test_features_view_tables_reset_on_new_request_after_loading(self):
         application = NimbusExperiment.Application.DESKTOP
         feature_config = NimbusFeatureConfigFactory.create(
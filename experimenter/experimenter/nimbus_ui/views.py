@@ -1,7 +1,4 @@
-import json
-
 import requests
-from deepdiff import DeepDiff
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.paginator import Paginator
@@ -17,13 +14,13 @@ from django_filters.views import FilterView
 from experimenter.experiments.constants import EXTERNAL_URLS, RISK_QUESTIONS
 from experimenter.experiments.models import (
     NimbusExperiment,
+    NimbusExperimentPayload,
     NimbusFeatureConfig,
     NimbusVersionedSchema,
     Tag,
 )
 from experimenter.jetstream.results_manager import ExperimentResultsManager
 from experimenter.nimbus_ui.constants import (
-    METRICS_MIN_BOUNDS_WIDTH,
     SCHEMA_DIFF_SIZE_CONFIG,
     NimbusUIConstants,
 )
@@ -245,6 +242,28 @@ class NimbusChangeLogsView(
 ):
     template_name = "changelog/overview.html"
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        experiment = self.object
+
+        before = None
+        if (before_id := self.request.GET.get("before", "")).isdigit():
+            before = experiment.changelog_entries.filter(id=before_id).first()
+
+        if not experiment._has_changelog_entries:
+            # Change logs made before their entries were stored are diffed once here
+            experiment.generate_changelog_entries()
+
+        page_size = settings.CHANGELOG_ENTRIES_PAGINATE_BY
+        entries = list(experiment.get_changelog_entries(before)[: page_size + 1])
+
+        context["changelogs"] = experiment.get_changelogs_by_date(entries[:page_size])
+        context["is_first_page"] = before is None
+        context["next_before"] = (
+            entries[page_size - 1].id if len(entries) > page_size else None
+        )
+        return context
+
 
 class NimbusExperimentsListView(NimbusExperimentViewMixin, FilterView):
     queryset = (
@@ -807,8 +826,6 @@ class ResultsView(PrefetchExperimentQuerysetMixin, NimbusExperimentViewMixin, De
 
         context["experiment_context"] = build_experiment_context(self.object)
 
-        analysis_data = (experiment.results_data or {}).get("v3", {})
-
         selected_reference_branch = self.request.GET.get(
             "reference_branch", experiment.reference_branch.slug
         )
@@ -817,33 +834,25 @@ class ResultsView(PrefetchExperimentQuerysetMixin, NimbusExperimentViewMixin, De
         selected_segment = self.request.GET.get("segment", "all")
         context["selected_segment"] = selected_segment
 
-        analysis_basis = self.request.GET.get(
-            "analysis_basis",
-            "exposures"
-            if experiment.has_exposures == NimbusUIConstants.ExposuresStatus.VALID
-            else "enrollments",
-        )
-        context["selected_analysis_basis"] = analysis_basis
-
         context["valid_exposure_status"] = NimbusUIConstants.ExposuresStatus.VALID
         context["invalid_exposure_status"] = NimbusUIConstants.ExposuresStatus.INVALID
 
-        displayed_window = "overall"
-        for window in ("overall", "weekly", "daily"):
-            if results_manager.get_window_results(
-                analysis_basis, selected_segment, window
-            ):
-                displayed_window = window
-                break
-
-        context["displayed_window"] = displayed_window
-        segments = list(
-            analysis_data.get(displayed_window, {}).get("enrollments", {}).keys()
+        # Everything derived from the results is built once per results and cached,
+        # so that a cached page never loads the results, see
+        # ExperimentResultsManager.get_cached_view_model
+        view_model = results_manager.get_cached_view_model(
+            self.request.GET.get("analysis_basis"),
+            selected_segment,
+            selected_reference_branch,
         )
-        context["segments"] = segments
+        context.update(view_model)
+        context["selected_analysis_basis"] = view_model["analysis_basis"]
 
         context["branch_data"] = results_manager.get_branch_data(
-            analysis_basis, selected_segment, window=displayed_window
+            view_model["analysis_basis"],
+            selected_segment,
+            window=view_model["displayed_window"],
+            branch_metrics=view_model["branch_metrics"],
         )
 
         context["edit_outcome_summary_form"] = EditOutcomeSummaryForm(instance=experiment)
@@ -854,89 +863,8 @@ class ResultsView(PrefetchExperimentQuerysetMixin, NimbusExperimentViewMixin, De
         }
         context["branch_leading_screenshot_forms"] = branch_leading_screenshot_forms
 
-        all_metrics = results_manager.get_metric_data(
-            analysis_basis,
-            selected_segment,
-            selected_reference_branch,
-            window=displayed_window,
-        )
-        context["metric_area_data"] = all_metrics
-
         context["ask_experimenter_slack_link"] = settings.ASK_EXPERIMENTER_SLACK_LINK
 
-        relative_metric_changes = {}
-
-        context["overall_exposure_rate"] = results_manager.exposure_rate(selected_segment)
-
-        for metric_data in all_metrics.values():
-            metadata = metric_data.get("metrics", {})
-
-            # Prepare relative metric changes for UI rendering
-            for metric_metadata in metadata:
-                if not metric_metadata.get("has_data"):
-                    continue
-
-                data = (
-                    metric_data.get("data", {})
-                    .get(displayed_window, {})
-                    .get(metric_metadata["slug"], {})
-                )
-                metric_ui_properties = {}
-                extreme_bound = results_manager.get_max_metric_value(
-                    analysis_basis,
-                    selected_segment,
-                    selected_reference_branch,
-                    metric_metadata["group"],
-                    metric_metadata["slug"],
-                    window=displayed_window,
-                )
-
-                for branch_slug, branch_data in data.items():
-                    if not (relative := branch_data.get("relative")):
-                        continue
-
-                    if not (lower := relative[0].get("lower")) or not (
-                        upper := relative[0].get("upper")
-                    ):
-                        continue
-
-                    lower *= 100
-                    upper *= 100
-
-                    confidence_range = round(extreme_bound * 1000) / 10
-                    full_width = confidence_range * 2 if confidence_range != 0 else 1
-                    bar_width = ((upper - lower) / full_width) * 100
-                    left_percent = (abs(lower - confidence_range * -1) / full_width) * 100
-                    left_bounds_percent = left_percent
-
-                    num_digits = len(str(round(lower, 1)).replace(".", "")) + len(
-                        str(round(upper, 1)).replace(".", "")
-                    )
-
-                    if bar_width < METRICS_MIN_BOUNDS_WIDTH:
-                        left_bounds_percent -= (METRICS_MIN_BOUNDS_WIDTH - bar_width) / 2
-
-                    metric_ui_properties[branch_slug] = {
-                        "bar_width": bar_width,
-                        "left_percent": left_percent,
-                        "left_bounds_percent": left_bounds_percent - num_digits * 1.5,
-                        "bounds_width": (
-                            max(bar_width, METRICS_MIN_BOUNDS_WIDTH) + num_digits * 3
-                        ),
-                    }
-
-                    relative_metric_changes[metric_metadata["slug"]] = (
-                        metric_ui_properties
-                    )
-
-        context["relative_metric_changes"] = relative_metric_changes
-        context["all_weekly_metric_data"] = results_manager.build_window_metric_breakdown(
-            analysis_basis, selected_segment, selected_reference_branch, "weekly"
-        )
-        context["all_daily_metric_data"] = results_manager.build_window_metric_breakdown(
-            analysis_basis, selected_segment, selected_reference_branch, "daily"
-        )
-
         return context
 
 
@@ -961,6 +889,11 @@ class NimbusFeaturesView(TemplateView):
         qs = (
             NimbusExperiment.objects.with_merged_channel()
             .filter(is_archived=False, application=self.app)
+            .prefetch_related(
+                NimbusExperimentPayload.prefetch(
+                    NimbusExperimentPayload.Kind.MONITORING_DATA
+                )
+            )
             .order_by("-_updated_date_time")
         )
 
@@ -1048,92 +981,62 @@ class NimbusFeaturesView(TemplateView):
             feature_changes_sortable_headers + feature_changes_non_sortable_headers
         )
 
-        # Get feature schema versions with their diffs
-        feature_schemas = []
-        thresholds = SCHEMA_DIFF_SIZE_CONFIG["thresholds"]
+        # Get feature schema versions with the diffs that were computed when they
+        # were loaded, so only the page being shown has to be fetched.
+        schemas = NimbusVersionedSchema.objects.none()
         labels = SCHEMA_DIFF_SIZE_CONFIG["labels"]
-        total_changes = 0
 
         if selected_feature_config:
             sort = self.request.GET.get("sort", "")
 
-            if sort == "change_version":
-                queryset = NimbusVersionedSchema.objects.with_version_ordering(
-                    descending=False
-                )
-            else:
-                queryset = NimbusVersionedSchema.objects.with_version_ordering(
-                    descending=True
+            schemas = NimbusVersionedSchema.objects.filter(
+                feature_config=selected_feature_config
+            )
+            if schemas.filter(schema_change_size__isnull=True).exists():
+                NimbusVersionedSchema.objects.update_schema_diffs(
+                    [selected_feature_config.id]
                 )
 
-            schemas = list(
-                queryset.filter(feature_config_id=self.feature_id).select_related(
-                    "version"
-                )
-            )
+            schemas_with_changes = schemas.filter(schema_changes__gt=0).count()
 
-            schema_cache = []
-            for schema in schemas:
-                schema_cache.append(json.loads(schema.schema))
-
-            # Pair each schema with its previous version
-            for i, schema in enumerate(schemas):
-                current_json = schema.schema
-                previous_json = schemas[i + 1].schema if i + 1 < len(schemas) else '"{}"'
-
-                if i + 1 < len(schemas):
-                    diff = DeepDiff(
-                        schema_cache[i + 1],
-                        schema_cache[i],
-                        ignore_order=True,
-                    )
-
-                    total_changes = sum(
-                        [
-                            len(diff.get("dictionary_item_added", [])),
-                            len(diff.get("dictionary_item_removed", [])),
-                            len(diff.get("values_changed", {})),
-                            len(diff.get("type_changes", {})),
-                        ]
-                    )
-
-                    if total_changes == 0:
-                        size_label = labels["no_changes"]
-                    elif total_changes <= thresholds["small"]:
-                        size_label = labels["small"]
-                    elif total_changes <= thresholds["medium"]:
-                        size_label = labels["medium"]
-                    else:
-                        size_label = labels["large"]
-
-                    if total_changes > 0:
-                        schemas_with_changes += 1
-                else:
-                    total_changes = 0
-                    size_label = labels["first_version"]
-
-                feature_schemas.append(
-                    {
-                        "schema": schema,
-                        "current_json": current_json,
-                        "previous_json": previous_json,
-                        "size_label": size_label.get("text"),
-                        "size_badge": size_label.get("badge_class"),
-                        "total_changes": total_changes,
-                    }
-                )
+            if sort == "change_version":
+                ordering = ["version__major", "version__minor", "version__patch"]
+            else:
+                ordering = ["-version__major", "-version__minor", "-version__patch"]
 
             if sort == "change_size":
-                feature_schemas.sort(key=lambda x: x["total_changes"])
+                ordering.insert(0, "schema_changes")
             elif sort == "-change_size":
-                feature_schemas.sort(key=lambda x: x["total_changes"], reverse=True)
+                ordering.insert(0, "-schema_changes")
+
+            schemas = schemas.select_related("version", "previous_schema").order_by(
+                *ordering
+            )
 
-        feature_changes_pagination = Paginator(feature_schemas, 5)
+        feature_changes_pagination = Paginator(schemas, 5)
         feature_changes_page_number = self.request.GET.get("feature_changes") or 1
         feature_changes_page_obj = feature_changes_pagination.get_page(
             feature_changes_page_number
         )
 
+        feature_schemas = []
+        for schema in feature_changes_page_obj.object_list:
+            size_label = labels[schema.schema_change_size]
+            feature_schemas.append(
+                {
+                    "schema": schema,
+                    "current_json": schema.schema,
+                    "previous_json": (
+                        schema.previous_schema.schema
+                        if schema.previous_schema is not None
+                        else '"{}"'
+                    ),
+                    "size_label": size_label.get("text"),
+                    "size_badge": size_label.get("badge_class"),
+                    "total_changes": schema.schema_changes,
+                }
+            )
+
         context = {
             "form": form,
             "EXTERNAL_URLS": EXTERNAL_URLS,
@@ -1149,7 +1052,7 @@ class NimbusFeaturesView(TemplateView):
             "deliveries_non_sortable_header": deliveries_non_sortable_fields,
             "qa_runs_sortable_header": qa_runs_sortable_header,
             "qa_runs_non_sortable_header": qa_runs_non_sortable_fields,
-            "feature_schemas": feature_changes_page_obj.object_list,
+            "feature_schemas": feature_schemas,
             "feature_changes_page_obj": feature_changes_page_obj,
             "schemas_with_changes": schemas_with_changes,
             "feature_changes_headers": feature_change_headers,
@@ -310,6 +310,9 @@ CORS_ORIGIN_ALLOW_ALL = True
 
 # Experiments list pagination
 EXPERIMENTS_PAGINATE_BY = config("EXPERIMENTS_PAGINATE_BY", default=10, cast=int)
+CHANGELOG_ENTRIES_PAGINATE_BY = config(
+    "CHANGELOG_ENTRIES_PAGINATE_BY", default=100, cast=int
+)
 
 
 # Automated email destinations
@@ -379,6 +382,7 @@ CACHES = {
 }
 API_CACHE_DURATION = 60 * 60
 API_CACHE_WARMING_TTL = 60 * 60 * 24
+RESULTS_VIEW_CACHE_TTL = 60 * 60 * 24 * 7
 SIZING_DATA_KEY = "population_sizing"
 
 HOLDBACK_OBSERVATION_DAYS = 21
@@ -528,11 +532,17 @@ KINTO_COLLECTION_NIMBUS_PREVIEW = "nimbus-preview"
 KINTO_COLLECTION_NIMBUS_WEB_PREVIEW = "nimbus-web-preview"
 KINTO_ADMIN_URL = config("KINTO_ADMIN_URL", default=urljoin(KINTO_HOST, "/admin/"))
 KINTO_REVIEW_TIMEOUT = config("KINTO_REVIEW_TIMEOUT", cast=int)
+KINTO_MAIN_RECORDS_CACHE_KEY = "kinto_main_records:{collection}"
+# Tombstones can be purged from Remote Settings, so the cached records are
+# periodically discarded and read again in full
+KINTO_MAIN_RECORDS_CACHE_TTL = 60 * 60 * 24
 
 # Jetstream GCS Bucket data
 ANALYSIS_FILE_STORAGE = "storages.backends.gcloud.GoogleCloudStorage"
 ANALYSIS_GS_PROJECT_ID = "experiments-analysis"
 ANALYSIS_GS_BUCKET_NAME = "mozanalysis"
+# Files of an experiment's analysis that are read from the bucket concurrently
+ANALYSIS_FETCH_MAX_WORKERS = config("ANALYSIS_FETCH_MAX_WORKERS", default=5, cast=int)
 
 # GCS bucket for user uploads, e.g. branch screenshots
 UPLOADS_GS_BUCKET_NAME = config("UPLOADS_GS_BUCKET_NAME", default=None)
@@ -586,6 +596,8 @@ METRIC_HUB_METRICS_PATH_DEFAULT = (
 
 # Feature Manifest path
 FEATURE_MANIFESTS_PATH = BASE_DIR / "features" / "manifests"
+# Processes that changed feature manifests are parsed on concurrently
+FEATURE_MANIFEST_MAX_WORKERS = config("FEATURE_MANIFEST_MAX_WORKERS", default=4, cast=int)
 
 SKIP_REVIEW_ACCESS_CONTROL_FOR_DEV_USER = config(
     "SKIP_REVIEW_ACCESS_CONTROL_FOR_DEV_USER", default=False, cast=bool